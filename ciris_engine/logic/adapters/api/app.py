@@ -5,8 +5,9 @@ This module creates and configures the FastAPI application with all routes.
 """
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 # Import all route modules from adapter
 from .routes import (
@@ -17,8 +18,19 @@ from .routes import (
 # Import auth service
 from .services.auth_service import APIAuthService
 
-# Import rate limiting middleware
+# Import rate limiting and response caching middleware
 from .middleware.rate_limiter import RateLimitMiddleware
+from .middleware.response_cache import ResponseCache, ResponseCacheMiddleware
+
+from ciris_engine.utils import serialization
+
+
+class SerializedJSONResponse(JSONResponse):
+    """JSON response rendered with the configured serialization backend."""
+
+    def render(self, content: Any) -> bytes:
+        return serialization.dumps_bytes(content)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -44,9 +56,21 @@ def create_app(runtime: Any = None, adapter_config: Any = None) -> FastAPI:
         title="CIRIS API v1",
         description="Autonomous AI Agent Interaction and Observability API (Pre-Beta)",
         version="1.0.0",
-        lifespan=lifespan
+        lifespan=lifespan,
+        default_response_class=SerializedJSONResponse
     )
 
+    # Add response caching for read-heavy routes if enabled in config.
+    # Added first so it runs innermost: CORS headers are computed per request
+    # and cache hits are still rate limited.
+    if adapter_config and getattr(adapter_config, 'response_cache_enabled', False):
+        app.state.response_cache = ResponseCache(route_ttls=adapter_config.response_cache_ttls)
+        response_cache_middleware = ResponseCacheMiddleware(app.state.response_cache)
+
+        @app.middleware("http")
+        async def response_cache_wrapper(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+            return await response_cache_middleware(request, call_next)
+
     # Add CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -65,7 +89,7 @@ def create_app(runtime: Any = None, adapter_config: Any = None) -> FastAPI:
         
         # Add middleware using a wrapper function
         @app.middleware("http")
-        async def rate_limit_wrapper(request: Request, call_next: Callable) -> Response:
+        async def rate_limit_wrapper(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
             return await rate_limit_middleware(request, call_next)
         
         print(f"Rate limiting enabled: {rate_limit} requests per minute")
@@ -1,7 +1,10 @@
 """Configuration schema for API adapter."""
 
+from typing import Dict
+
 from pydantic import BaseModel, Field
 from ciris_engine.constants import DEFAULT_API_HOST, DEFAULT_API_PORT
+from .constants import DEFAULT_RESPONSE_CACHE_TTLS
 
 class APIAdapterConfig(BaseModel):
     """Configuration for the API adapter.
@@ -32,6 +35,12 @@ class APIAdapterConfig(BaseModel):
     rate_limit_per_minute: int = Field(default=60, description="Requests per minute limit")
     
     auth_enabled: bool = Field(default=True, description="Enable authentication")
+
+    response_cache_enabled: bool = Field(default=True, description="Cache responses of read-heavy GET routes")
+    response_cache_ttls: Dict[str, float] = Field(
+        default_factory=lambda: dict(DEFAULT_RESPONSE_CACHE_TTLS),
+        description="Response cache TTL in seconds by route path"
+    )
     
     # Timeout configuration
     interaction_timeout: float = Field(default=55.0, description="Timeout for agent interactions in seconds")
@@ -63,6 +72,10 @@ class APIAdapterConfig(BaseModel):
         if env_auth is not None:
             self.auth_enabled = env_auth.lower() in ("true", "1", "yes", "on")
             
+        env_cache = get_env_var("CIRIS_API_RESPONSE_CACHE_ENABLED")
+        if env_cache is not None:
+            self.response_cache_enabled = env_cache.lower() in ("true", "1", "yes", "on")
+            
         env_timeout = get_env_var("CIRIS_API_INTERACTION_TIMEOUT")
         if env_timeout:
             try:
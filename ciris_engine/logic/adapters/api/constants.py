@@ -5,6 +5,15 @@ This module defines constants used across the API adapter to avoid
 duplicate string literals and improve maintainability.
 """
 
+# Response cache TTLs in seconds for read-heavy dashboard routes
+DEFAULT_RESPONSE_CACHE_TTLS = {
+    "/v1/system/health": 2.0,
+    "/v1/agent/status": 2.0,
+    "/v1/system/services": 5.0,
+    "/v1/telemetry/overview": 5.0,
+    "/v1/memory/stats": 10.0,
+}
+
 # Error Messages
 ERROR_ADAPTER_MANAGER_NOT_AVAILABLE = "Adapter manager not available"
 ERROR_AUDIT_SERVICE_NOT_AVAILABLE = "Audit service not available"
@@ -0,0 +1,241 @@
+"""
+Short-TTL response cache for read-heavy API routes.
+
+Dashboards poll a handful of GET endpoints whose handlers fan out to several
+services and run table-wide aggregate queries. For each route with a TTL
+this middleware:
+
+- serves a stored 200 response until its TTL lapses;
+- answers ``If-None-Match`` with 304 Not Modified while the ETag matches;
+- coalesces concurrent identical misses, so one handler run serves them all;
+- keys entries by path, query string and the caller's role, so a response
+  computed for one role is never served to another.
+
+Requests whose Authorization header does not resolve to a valid API key
+bypass the cache and reach the route, which rejects them as before. The
+cached routes are gated by role alone, not by per-user permissions.
+"""
+import asyncio
+import hashlib
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, cast
+
+from fastapi import Request, Response
+
+from ciris_engine.schemas.api.telemetry import ResponseCacheStats, RouteCacheStats
+
+from ..constants import DEFAULT_RESPONSE_CACHE_TTLS
+
+DEFAULT_MAX_ENTRIES = 512
+ANONYMOUS_ROLE = "ANONYMOUS"
+
+CacheKey = Tuple[str, str, str]
+
+
+@dataclass
+class CachedResponse:
+    """A captured response body with the headers needed to replay it."""
+    body: bytes
+    status_code: int
+    headers: Dict[str, str]
+    etag: str
+    expires_at: float
+
+
+class ResponseCache:
+    """Bounded LRU of captured responses with per-route TTLs and single-flight misses."""
+
+    def __init__(
+        self,
+        route_ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            route_ttls: Seconds to keep responses, by exact request path
+            max_entries: Responses kept before the least recently used is evicted
+            clock: Monotonic clock in seconds
+        """
+        self.route_ttls = dict(DEFAULT_RESPONSE_CACHE_TTLS if route_ttls is None else route_ttls)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self._inflight: Dict[CacheKey, "asyncio.Future[Optional[CachedResponse]]"] = {}
+        self._route_hits: Dict[str, int] = {}
+        self._route_misses: Dict[str, int] = {}
+        self.coalesced = 0
+        self.not_modified = 0
+        self.bypassed = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """TTL for a path, or None when the path is not cached."""
+        return self.route_ttls.get(path)
+
+    def remaining(self, entry: CachedResponse) -> float:
+        return max(0.0, entry.expires_at - self._clock())
+
+    def invalidate(self, path: Optional[str] = None) -> None:
+        """Drop stored responses for one path, or all of them."""
+        if path is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == path]:
+            del self._entries[key]
+
+    async def fetch(
+        self,
+        key: CacheKey,
+        ttl: float,
+        compute: Callable[[], Awaitable[CachedResponse]],
+    ) -> Tuple[CachedResponse, str]:
+        """Return a fresh stored response, or compute one once for all concurrent callers.
+
+        Only 200 responses are stored; concurrent callers still share the
+        leader's result whatever its status. If the leader fails or is
+        cancelled, each waiting caller computes its own response.
+
+        Returns:
+            The response and how it was obtained: "HIT", "MISS" or "COALESCED"
+        """
+        path = key[0]
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self._route_hits[path] = self._route_hits.get(path, 0) + 1
+                return entry, "HIT"
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            shared = await asyncio.shield(inflight)
+            if shared is not None:
+                self.coalesced += 1
+                self._route_hits[path] = self._route_hits.get(path, 0) + 1
+                return shared, "COALESCED"
+
+        self._route_misses[path] = self._route_misses.get(path, 0) + 1
+        future: "asyncio.Future[Optional[CachedResponse]]" = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            entry = await compute()
+        except BaseException:
+            future.set_result(None)
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+        entry.expires_at = self._clock() + ttl
+        if entry.status_code == 200:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        future.set_result(entry)
+        return entry, "MISS"
+
+    def get_stats(self) -> ResponseCacheStats:
+        hits = sum(self._route_hits.values())
+        misses = sum(self._route_misses.values())
+        return ResponseCacheStats(
+            entries=len(self._entries),
+            hits=hits,
+            misses=misses,
+            coalesced=self.coalesced,
+            not_modified=self.not_modified,
+            bypassed=self.bypassed,
+            hit_rate=hits / (hits + misses) if hits + misses else 0.0,
+            routes={
+                path: RouteCacheStats(
+                    ttl_seconds=ttl,
+                    hits=self._route_hits.get(path, 0),
+                    misses=self._route_misses.get(path, 0),
+                )
+                for path, ttl in self.route_ttls.items()
+            },
+        )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ResponseCacheMiddleware:
+    """FastAPI middleware serving cached GET responses for configured routes."""
+
+    def __init__(self, cache: ResponseCache):
+        """
+        Initialize middleware.
+
+        Args:
+            cache: Shared response cache
+        """
+        self.cache = cache
+
+    async def __call__(self, request: Request, call_next: Callable[..., Any]) -> Response:
+        """Serve the request from the cache when the route allows it."""
+        ttl = self.cache.ttl_for(request.url.path) if request.method == "GET" else None
+        if ttl is None:
+            return cast(Response, await call_next(request))
+
+        role = self._resolve_role(request)
+        if role is None:
+            self.cache.bypassed += 1
+            return cast(Response, await call_next(request))
+
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        key: CacheKey = (request.url.path, query, role)
+
+        async def compute() -> CachedResponse:
+            response = cast(Response, await call_next(request))
+            body = b"".join([
+                chunk if isinstance(chunk, bytes) else chunk.encode("utf-8")
+                async for chunk in response.body_iterator  # type: ignore[attr-defined]
+            ])
+            headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+            etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"' if response.status_code == 200 else ""
+            return CachedResponse(body=body, status_code=response.status_code, headers=headers, etag=etag, expires_at=0.0)
+
+        entry, outcome = await self.cache.fetch(key, ttl, compute)
+
+        if entry.status_code != 200:
+            return Response(content=entry.body, status_code=entry.status_code, headers=entry.headers)
+
+        cache_headers = {
+            "ETag": entry.etag,
+            "Cache-Control": f"private, max-age={math.ceil(self.cache.remaining(entry))}",
+            "Vary": "Authorization",
+            "X-Cache": outcome,
+        }
+        if _etag_matches(request.headers.get("if-none-match"), entry.etag):
+            self.cache.not_modified += 1
+            return Response(status_code=304, headers=cache_headers)
+
+        response = Response(content=entry.body, status_code=200, headers=entry.headers)
+        response.headers.update(cache_headers)
+        return response
+
+    @staticmethod
+    def _resolve_role(request: Request) -> Optional[str]:
+        """Role the route would authorize, ANONYMOUS without credentials, None if invalid."""
+        authorization = request.headers.get("authorization")
+        if not authorization:
+            return ANONYMOUS_ROLE
+        auth_service = getattr(request.app.state, "auth_service", None)
+        if not authorization.startswith("Bearer ") or auth_service is None:
+            return None
+        key_info = auth_service.validate_api_key(authorization[7:])
+        return key_info.role.value if key_info else None
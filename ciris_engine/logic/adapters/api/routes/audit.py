@@ -2,7 +2,7 @@
 Audit service endpoints for CIRIS API v3 (Simplified).
 
 Provides access to the immutable audit trail for system observability.
-Simplified to 3 core endpoints: query, get specific entry, and export.
+Core endpoints: query, get specific entry, export and chain verification.
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timezone
@@ -17,6 +17,7 @@ from ciris_engine.schemas.services.graph.audit import AuditQuery, VerificationRe
 from ..dependencies.auth import require_observer, require_admin, AuthContext
 from ciris_engine.protocols.services.graph.audit import AuditServiceProtocol
 from ciris_engine.schemas.api.audit import AuditContext, EntryVerification
+from ciris_engine.schemas.audit.verification import VerificationProgress
 from ..constants import DESC_RESULTS_OFFSET, ERROR_AUDIT_SERVICE_NOT_AVAILABLE, DESC_START_TIME, DESC_END_TIME
 
 router = APIRouter(prefix="/audit", tags=["audit"])
@@ -51,6 +52,12 @@ class AuditEntriesResponse(BaseModel):
     total: int = Field(..., description="Total matching entries")
     offset: int = Field(0, description=DESC_RESULTS_OFFSET)
     limit: int = Field(100, description="Results limit")
+    cursor: Optional[str] = Field(None, description="Cursor for the next page")
+    has_more: bool = Field(False, description="Whether more entries match")
+
+class AuditCountResponse(BaseModel):
+    """Number of audit entries matching a query."""
+    total: int = Field(..., description="Total matching entries")
 
 class AuditExportResponse(BaseModel):
     """Audit export response."""
@@ -124,13 +131,16 @@ async def query_audit_entries(
     outcome: Optional[str] = Query(None, description="Filter by outcome (success, failure)"),
     # Pagination
     limit: int = Query(100, ge=1, le=1000, description="Maximum results"),
-    offset: int = Query(0, ge=0, description=DESC_RESULTS_OFFSET)
+    offset: int = Query(0, ge=0, description=DESC_RESULTS_OFFSET),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    include_total: bool = Query(True, description="Count all matching entries")
 ) -> SuccessResponse[AuditEntriesResponse]:
     """
     Query audit entries with flexible filtering.
 
     Combines time-based queries, entity filtering, and text search into a single endpoint.
-    Returns paginated results sorted by timestamp (newest first).
+    Returns paginated results sorted by timestamp (newest first). Pass the returned
+    cursor to fetch the next page; deep pages are as cheap as the first.
 
     Requires OBSERVER role or higher.
     """
@@ -148,26 +158,30 @@ async def query_audit_entries(
         outcome=outcome,
         limit=limit,
         offset=offset,
+        cursor=cursor,
         order_by="timestamp",
         order_desc=True
     )
 
     try:
-        entries = await audit_service.query_audit_trail(query)
+        page = await audit_service.query_audit_page(query)
 
         # Convert to response format
-        response_entries = [_convert_audit_entry(entry) for entry in entries]
+        response_entries = [_convert_audit_entry(entry) for entry in page.entries]
 
-        # Get total count (in production, service would return this)
-        # For now, if we got limit results, assume there are more
-        total = len(entries) if len(entries) < limit else offset + len(entries) + 1
+        if include_total:
+            total = await audit_service.count_audit_entries(query)
+        else:
+            total = offset + len(page.entries) + (1 if page.has_more else 0)
 
         return SuccessResponse(
             data=AuditEntriesResponse(
                 entries=response_entries,
                 total=total,
                 offset=offset,
-                limit=limit
+                limit=limit,
+                cursor=page.next_cursor,
+                has_more=page.has_more
             ),
             metadata=ResponseMetadata(
                 timestamp=datetime.now(timezone.utc),
@@ -175,6 +189,41 @@ async def query_audit_entries(
                 duration_ms=0
             )
         )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/entries/count", response_model=SuccessResponse[AuditCountResponse])
+async def count_audit_entries(
+    request: Request,
+    auth: AuthContext = Depends(require_observer),
+    start_time: Optional[datetime] = Query(None, description=DESC_START_TIME),
+    end_time: Optional[datetime] = Query(None, description=DESC_END_TIME),
+    actor: Optional[str] = Query(None, description="Filter by actor"),
+    event_type: Optional[str] = Query(None, description="Filter by event type"),
+    entity_id: Optional[str] = Query(None, description="Filter by entity ID"),
+    search: Optional[str] = Query(None, description="Search in audit details")
+) -> SuccessResponse[AuditCountResponse]:
+    """
+    Count audit entries matching the same filters as /entries, without loading them.
+
+    Requires OBSERVER role or higher.
+    """
+    audit_service = _get_audit_service(request)
+
+    query = AuditQuery(
+        start_time=start_time,
+        end_time=end_time,
+        actor=actor,
+        event_type=event_type,
+        entity_id=entity_id,
+        search_text=search
+    )
+
+    try:
+        total = await audit_service.count_audit_entries(query)
+        return SuccessResponse(data=AuditCountResponse(total=total))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -306,9 +355,52 @@ async def search_audit_trails(
         severity=severity,
         outcome=outcome,
         limit=limit,
-        offset=offset
+        offset=offset,
+        cursor=None,
+        include_total=True
     )
 
+@router.post("/verify", response_model=SuccessResponse[VerificationProgress])
+async def start_audit_verification(
+    request: Request,
+    auth: AuthContext = Depends(require_admin),
+    resume: bool = Query(True, description="Resume after the last verified checkpoint instead of starting at genesis")
+) -> SuccessResponse[VerificationProgress]:
+    """
+    Start a full verification of the audit hash chain.
+
+    The chain is streamed and verified in the background; poll
+    GET /audit/verify for progress and the final result. If a run is
+    already in progress its progress is returned instead.
+
+    Requires ADMIN role or higher.
+    """
+    audit_service = _get_audit_service(request)
+
+    try:
+        progress = await audit_service.start_integrity_verification(resume=resume)
+        return SuccessResponse(data=progress)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/verify", response_model=SuccessResponse[VerificationProgress])
+async def get_audit_verification_progress(
+    request: Request,
+    auth: AuthContext = Depends(require_admin)
+) -> SuccessResponse[VerificationProgress]:
+    """
+    Get progress of the current or last audit chain verification.
+
+    Requires ADMIN role or higher.
+    """
+    audit_service = _get_audit_service(request)
+
+    try:
+        progress = await audit_service.get_verification_progress()
+        return SuccessResponse(data=progress)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @router.post("/verify/{entry_id}", response_model=SuccessResponse[VerificationReport])
 async def verify_audit_entry(
     request: Request,
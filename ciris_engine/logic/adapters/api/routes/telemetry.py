@@ -12,10 +12,12 @@ from pydantic import BaseModel, Field, field_serializer
 from collections import defaultdict
 
 from ciris_engine.schemas.api.responses import SuccessResponse, ResponseMetadata
+from ciris_engine.schemas.services.graph.audit import AuditQuery
+from ciris_engine.schemas.telemetry.core import LatencySummary
 from ..dependencies.auth import require_observer, require_admin, AuthContext
 from ciris_engine.schemas.api.telemetry import (
     MetricTags, ServiceMetricValue, ThoughtStep, LogContext,
-    TelemetryQueryFilters, QueryResult, TimeSyncStatus, ServiceMetrics
+    TelemetryQueryFilters, QueryResult, TimeSyncStatus, ServiceMetrics, ResponseCacheStats
 )
 from ..constants import ERROR_TELEMETRY_SERVICE_NOT_AVAILABLE, DESC_START_TIME, DESC_END_TIME, DESC_CURRENT_COGNITIVE_STATE
 
@@ -95,6 +97,11 @@ class DetailedMetric(BaseModel):
 class MetricsResponse(BaseModel):
     """Detailed metrics response."""
     metrics: List[DetailedMetric] = Field(..., description="Detailed metrics")
+    latency: Dict[str, Dict[str, LatencySummary]] = Field(
+        default_factory=dict,
+        description="Latency percentiles by category (service, handler, bus) and name"
+    )
+    response_cache: Optional[ResponseCacheStats] = Field(None, description="API response cache counters, when enabled")
     timestamp: datetime = Field(..., description="Response timestamp")
 
     @field_serializer('timestamp')
@@ -584,8 +591,16 @@ async def get_detailed_metrics(
                     )
                     metrics.append(metric)
 
+        latency = {}
+        if hasattr(telemetry_service, 'get_latency_percentiles'):
+            latency = telemetry_service.get_latency_percentiles()
+
+        response_cache = getattr(request.app.state, 'response_cache', None)
+
         response = MetricsResponse(
             metrics=metrics,
+            latency=latency,
+            response_cache=response_cache.get_stats() if response_cache else None,
             timestamp=now
         )
 
@@ -623,38 +638,39 @@ async def get_reasoning_traces(
     # Try to get from visibility service first
     if visibility_service:
         try:
-            # Get recent task history
-            if hasattr(visibility_service, 'get_task_history'):
+            # Get recent task history and all of its traces in one batch
+            if hasattr(visibility_service, 'get_task_history') and hasattr(visibility_service, 'get_reasoning_traces'):
                 task_history = await visibility_service.get_task_history(limit=limit)
+                reasoning_traces = await visibility_service.get_reasoning_traces([task.task_id for task in task_history])
 
                 for task in task_history:
-                    # Get reasoning trace for each task
-                    if hasattr(visibility_service, 'get_reasoning_trace'):
-                        trace = await visibility_service.get_reasoning_trace(task.task_id)
-                        if trace:
-                            trace_data = ReasoningTraceData(
-                                trace_id=f"trace_{task.task_id}",
-                                task_id=task.task_id,
-                                task_description=task.description,
-                                start_time=task.created_at,
-                                duration_ms=(task.completed_at - task.created_at).total_seconds() * 1000 if task.completed_at else 0,
-                                thought_count=len(trace.thought_steps),
-                                decision_count=len(trace.decisions) if hasattr(trace, 'decisions') else 0,
-                                reasoning_depth=trace.max_depth,
-                                thoughts=[
-                                    ThoughtStep(
-                                        step=i,
-                                        content=thought.content,
-                                        timestamp=thought.timestamp,
-                                        depth=thought.depth,
-                                        action=getattr(thought, 'action', None),
-                                        confidence=getattr(thought, 'confidence', None)
-                                    )
-                                    for i, thought in enumerate(trace.thought_steps)
-                                ],
-                                outcome=trace.outcome if hasattr(trace, 'outcome') else None
+                    trace = reasoning_traces.get(task.task_id)
+                    if not trace:
+                        continue
+                    steps = [step.thought for step in trace.thought_steps]
+                    trace_data = ReasoningTraceData(
+                        trace_id=f"trace_{task.task_id}",
+                        task_id=task.task_id,
+                        task_description=task.description,
+                        start_time=datetime.fromisoformat(task.created_at),
+                        duration_ms=trace.processing_time_ms,
+                        thought_count=trace.total_thoughts,
+                        decision_count=len(trace.actions_taken),
+                        reasoning_depth=max((thought.thought_depth for thought in steps), default=0),
+                        thoughts=[
+                            ThoughtStep(
+                                step=i,
+                                content=thought.content,
+                                timestamp=datetime.fromisoformat(thought.created_at),
+                                depth=thought.thought_depth,
+                                action=thought.final_action.action_type if thought.final_action else None,
+                                confidence=None
                             )
-                            traces.append(trace_data)
+                            for i, thought in enumerate(steps)
+                        ],
+                        outcome=task.outcome.summary if task.outcome else None
+                    )
+                    traces.append(trace_data)
 
             # If no task history, try current reasoning
             if not traces and hasattr(visibility_service, 'get_current_reasoning'):
@@ -769,14 +785,17 @@ async def get_system_logs(
 
     if audit_service:
         try:
-            # Query audit entries as logs
-            entries = await audit_service.query_entries(
+            # Query audit entries as logs; time range and paging run in SQL
+            entries = await audit_service.query_audit_trail(AuditQuery(
                 start_time=start_time,
                 end_time=end_time,
-                limit=limit * 2  # Get extra for filtering
-            )
+                limit=limit * 2  # Get extra for level/service filtering
+            ))
 
             for entry in entries:
+                context = dict(entry.context.additional_data or {})
+                context.setdefault('correlation_id', entry.context.correlation_id)
+
                 # Determine log level from action
                 log_level = "INFO"
                 if "error" in entry.action.lower() or "fail" in entry.action.lower():
@@ -804,16 +823,16 @@ async def get_system_logs(
                     timestamp=entry.timestamp,
                     level=log_level,
                     service=log_service,
-                    message=f"{entry.action}: {entry.context.get('description', '')}".strip(': '),
+                    message=f"{entry.action}: {context.get('description', '')}".strip(': '),
                     context=LogContext(
-                        trace_id=entry.context.get('trace_id'),
-                        correlation_id=entry.context.get('correlation_id'),
-                        user_id=entry.context.get('user_id'),
-                        entity_id=entry.context.get('entity_id'),
-                        error_details=entry.context.get('error_details', {}) if 'error' in log_level.lower() else None,
-                        metadata=entry.context
+                        trace_id=context.get('trace_id'),
+                        correlation_id=context.get('correlation_id'),
+                        user_id=context.get('user_id'),
+                        entity_id=context.get('entity_id'),
+                        error_details={'error': context['error']} if 'error' in log_level.lower() and 'error' in context else None,
+                        metadata=context
                     ),
-                    trace_id=entry.context.get('trace_id') or entry.context.get('correlation_id')
+                    trace_id=context.get('trace_id') or context.get('correlation_id')
                 )
                 logs.append(log)
 
@@ -928,11 +947,11 @@ async def query_telemetry(
         elif query.query_type == "logs":
             # Query logs
             if audit_service:
-                log_entries = await audit_service.query_entries(
+                log_entries = await audit_service.query_audit_trail(AuditQuery(
                     start_time=query.start_time,
                     end_time=query.end_time,
                     limit=query.limit
-                )
+                ))
 
                 for entry in log_entries:
                     # Apply filters
@@ -952,7 +971,7 @@ async def query_telemetry(
                             "timestamp": entry.timestamp.isoformat(),
                             "service": entry.actor,
                             "action": entry.action,
-                            "context": entry.context
+                            "context": entry.context.model_dump()
                         }
                     ))
 
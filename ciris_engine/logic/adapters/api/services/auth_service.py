@@ -16,6 +16,7 @@ from ciris_engine.schemas.services.authority_core import WARole
 from ciris_engine.schemas.runtime.api import APIRole
 from ciris_engine.schemas.services.authority.wise_authority import WAUpdate
 from ciris_engine.protocols.services.infrastructure.authentication import AuthenticationServiceProtocol
+from ciris_engine.logic.utils.crypto_executor import run_crypto
 
 # Permission constants to avoid duplication
 PERMISSION_SYSTEM_READ = "system.read"
@@ -176,10 +177,11 @@ class APIAuthService:
             )
             
             # Update with password hash
+            password_hash = await self._hash_password_async("ciris_admin_password")
             await self._auth_service.update_wa(
                 wa_cert.wa_id,
                 updates=None,
-                password_hash=self._hash_password("ciris_admin_password")
+                password_hash=password_hash
             )
             
             # Add to cache
@@ -191,7 +193,7 @@ class APIAuthService:
                 wa_role=WARole.ROOT,
                 created_at=wa_cert.created_at,
                 is_active=True,
-                password_hash=self._hash_password("ciris_admin_password")
+                password_hash=password_hash
             )
             self._users[admin_user.wa_id] = admin_user
             
@@ -340,14 +342,22 @@ class APIAuthService:
         except Exception:
             # If verification fails (e.g., invalid hash format), return False
             return False
+
+    async def _hash_password_async(self, password: str) -> str:
+        """Hash a password on the shared crypto executor."""
+        return await run_crypto("bcrypt_hash", self._hash_password, password)
+
+    async def _verify_password_async(self, password: str, password_hash: str) -> bool:
+        """Verify a password on the shared crypto executor."""
+        return await run_crypto("bcrypt_verify", self._verify_password, password, password_hash)
     
     async def verify_user_password(self, username: str, password: str) -> Optional[User]:
         """Verify a user's password and return the user if valid."""
         user = self.get_user_by_username(username)
-        if not user:
+        if not user or not user.password_hash:
             return None
         
-        if self._verify_password(password, user.password_hash):
+        if await self._verify_password_async(password, user.password_hash):
             return user
         return None
     
@@ -378,6 +388,7 @@ class APIAuthService:
             APIRole.OBSERVER: WARole.OBSERVER
         }
         wa_role = wa_role_map.get(api_role, WARole.OBSERVER)
+        password_hash = await self._hash_password_async(password)
         
         # If we have an auth service, create in database
         if self._auth_service:
@@ -394,7 +405,7 @@ class APIAuthService:
                 await self._auth_service.update_wa(
                     wa_cert.wa_id,
                     updates=None,
-                    password_hash=self._hash_password(password)
+                    password_hash=password_hash
                 )
                 
                 # Create user object
@@ -406,7 +417,7 @@ class APIAuthService:
                     wa_role=wa_role,
                     created_at=wa_cert.created_at,
                     is_active=True,
-                    password_hash=self._hash_password(password)
+                    password_hash=password_hash
                 )
                 
                 # Store in cache
@@ -427,7 +438,7 @@ class APIAuthService:
             api_role=api_role,
             created_at=now,
             is_active=True,
-            password_hash=self._hash_password(password)
+            password_hash=password_hash
         )
         
         # Store user
@@ -612,22 +623,21 @@ class APIAuthService:
         
         # Verify current password unless skip_current_check is True
         if not skip_current_check and current_password:
-            if not self._verify_password(current_password, user.password_hash):
+            if not user.password_hash or not await self._verify_password_async(current_password, user.password_hash):
                 return False
         
         # Update password
-        user.password_hash = self._hash_password(new_password)
+        user.password_hash = await self._hash_password_async(new_password)
         self._users[user_id] = user
         
         # Also update in database if we have auth service
         if self._auth_service:
             try:
-                import asyncio
-                asyncio.run(self._auth_service.update_wa(
+                await self._auth_service.update_wa(
                     user_id,
                     updates=None,
-                    password_hash=self._hash_password(new_password)
-                ))
+                    password_hash=user.password_hash
+                )
             except Exception as e:
                 print(f"Error updating password in database: {e}")
         
@@ -0,0 +1,796 @@
+"""
+Layout computation and caching for the memory graph visualizer.
+
+Building the NetworkX graph, loading edges and running spring or
+hierarchical layouts is CPU- and I/O-bound work that used to run inside the
+request handler. Here it runs on a small dedicated worker pool, and results
+are cached per view (scope, node type, layout, time window, node limit and
+canvas size) and graph version, so a dashboard polling an unchanged graph
+re-serves the stored layout and SVG without touching the graph tables
+beyond the version probe.
+
+When the graph version moves but only a few nodes were added or removed,
+force layouts are updated incrementally: surviving nodes keep their
+positions and only the new ones are placed.
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+
+from ciris_engine.constants import UTC_TIMEZONE_SUFFIX
+from ciris_engine.logic.persistence.db.core import get_db_connection
+from ciris_engine.logic.persistence.models.graph import count_graph_nodes
+from ciris_engine.schemas.services.graph_core import GraphEdge, GraphNode, GraphScope, NodeType
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+logger = logging.getLogger(__name__)
+
+MARKER_END = '</marker>'
+
+LAYOUT_WORKERS = 2
+LAYOUT_CACHE_SIZE = 32
+# Windowed views slide with the clock; their layouts are reused within this many seconds
+WINDOW_BUCKET_SECONDS = 60
+# Incremental force layout when at most this many nodes (or 10%) changed
+INCREMENTAL_MAX_CHANGES = 25
+INCREMENTAL_ITERATIONS = 15
+
+
+class LayoutView(NamedTuple):
+    """Everything that selects and shapes a visualization, except the graph version."""
+    scope: str
+    node_type: Optional[str]
+    layout: str
+    hours: Optional[int]
+    window_bucket: Optional[int]
+    limit: int
+    include_metrics: bool
+    width: int
+    height: int
+
+
+@dataclass
+class GraphLayout:
+    """A computed layout: the graph, edges and canvas positions of one view."""
+    view: LayoutView
+    graph_version: str
+    graph: "nx.DiGraph"
+    edges: List[GraphEdge]
+    positions: Dict[str, Tuple[float, float]]
+    # Unscaled spring-layout coordinates, kept to seed incremental updates
+    raw_positions: Dict[str, Tuple[float, float]]
+    computed_at: datetime
+    incremental: bool = False
+    _svg: Optional[str] = field(default=None, repr=False)
+
+    def svg(self) -> str:
+        """SVG for this layout, rendered once."""
+        if self._svg is None:
+            self._svg = _generate_svg(
+                self.graph, self.positions, self.view.width, self.view.height,
+                self.view.layout, self.view.hours, self.edges
+            )
+        return self._svg
+
+
+class LayoutCache:
+    """Most recent layout per view, bounded LRU."""
+
+    def __init__(self, max_views: int = LAYOUT_CACHE_SIZE) -> None:
+        self.max_views = max_views
+        self._layouts: "OrderedDict[LayoutView, GraphLayout]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.incremental_updates = 0
+
+    def get(self, view: LayoutView, graph_version: str) -> Optional[GraphLayout]:
+        """The cached layout if it was computed for this graph version."""
+        layout = self._layouts.get(view)
+        if layout is None or layout.graph_version != graph_version:
+            self.misses += 1
+            return None
+        self._layouts.move_to_end(view)
+        self.hits += 1
+        return layout
+
+    def latest(self, view: LayoutView) -> Optional[GraphLayout]:
+        """The last layout of this view, whatever its version."""
+        return self._layouts.get(view)
+
+    def put(self, layout: GraphLayout) -> None:
+        self._layouts[layout.view] = layout
+        self._layouts.move_to_end(layout.view)
+        if layout.incremental:
+            self.incremental_updates += 1
+        while len(self._layouts) > self.max_views:
+            self._layouts.popitem(last=False)
+
+    def clear(self) -> None:
+        self._layouts.clear()
+
+
+layout_cache = LayoutCache()
+_layout_pool = ThreadPoolExecutor(max_workers=LAYOUT_WORKERS, thread_name_prefix="graph-layout")
+
+
+def make_view(
+    scope: GraphScope,
+    node_type: Optional[NodeType],
+    layout: str,
+    hours: Optional[int],
+    limit: int,
+    include_metrics: bool,
+    width: int,
+    height: int,
+    now: Optional[datetime] = None,
+) -> LayoutView:
+    """Cache key for a visualization request; windowed views include a clock bucket."""
+    window_bucket = None
+    if hours:
+        timestamp = (now or datetime.now(timezone.utc)).timestamp()
+        window_bucket = int(timestamp // WINDOW_BUCKET_SECONDS)
+    return LayoutView(
+        scope=scope.value,
+        node_type=node_type.value if node_type else None,
+        layout=layout,
+        hours=hours,
+        window_bucket=window_bucket,
+        limit=limit,
+        include_metrics=include_metrics,
+        width=width,
+        height=height,
+    )
+
+
+def get_graph_version(scope: str, db_path: Optional[str] = None) -> str:
+    """Cheap fingerprint of one scope's nodes and edges.
+
+    Changes whenever a node or edge in the scope is added or removed, or a
+    node is updated.
+    """
+    node_count = count_graph_nodes(scope=scope, db_path=db_path)
+    with get_db_connection(db_path=db_path) as conn:
+        last_update = conn.execute(
+            "SELECT MAX(updated_at) FROM graph_nodes WHERE scope = ?", (scope,)
+        ).fetchone()
+        edges = conn.execute(
+            "SELECT COUNT(*), MAX(created_at) FROM graph_edges WHERE scope = ?", (scope,)
+        ).fetchone()
+    return f"{node_count}:{last_update[0]}:{edges[0]}:{edges[1]}"
+
+
+def _node_attributes(node: GraphNode) -> Dict[str, Any]:
+    return {
+        'label': node.id[:30] + '...' if len(node.id) > 30 else node.id,
+        'type': node.type.value,
+        'scope': node.scope.value,
+        'title': node.attributes.get('title', '') if isinstance(node.attributes, dict) else '',
+        'created_at': (node.attributes.get('created_at') or node.attributes.get('timestamp') or str(getattr(node, 'updated_at', ''))) if isinstance(node.attributes, dict) else str(getattr(node.attributes, 'created_at', getattr(node, 'updated_at', ''))),
+        'color': _get_node_color(node.type),
+        'size': _get_node_size(node)
+    }
+
+
+def _load_edges(G: "nx.DiGraph", nodes: List[GraphNode], db_path: Optional[str]) -> List[GraphEdge]:
+    """Add edges between the visualized nodes to ``G`` and return them.
+
+    Edges are fetched with one batched query per scope rather than one
+    query per node.
+    """
+    from ciris_engine.logic.persistence.models.graph import get_edges_for_nodes
+
+    node_ids = {node.id for node in nodes}
+    ids_by_scope: Dict[GraphScope, List[str]] = {}
+    for node in nodes:
+        ids_by_scope.setdefault(node.scope, []).append(node.id)
+
+    edges: List[GraphEdge] = []
+    edge_set = set()  # To avoid duplicate edges
+    for scope, scope_ids in ids_by_scope.items():
+        for edge in get_edges_for_nodes(scope_ids, scope, db_path=db_path):
+            # Only include edges where both nodes are in our visualization
+            if edge.source in node_ids and edge.target in node_ids:
+                edge_key = (edge.source, edge.target, edge.relationship)
+                if edge_key not in edge_set:
+                    edge_set.add(edge_key)
+                    edges.append(edge)
+                    G.add_edge(edge.source, edge.target,
+                               relationship=edge.relationship,
+                               weight=edge.weight,
+                               attributes=edge.attributes)
+    return edges
+
+
+def _spring_positions(
+    G: "nx.DiGraph",
+    k: float,
+    iterations: int,
+    previous: Optional[GraphLayout],
+) -> Tuple[Dict[str, Tuple[float, float]], bool]:
+    """Spring layout, seeded from ``previous`` when only a few nodes changed.
+
+    Returns:
+        Unscaled positions and whether the layout was incremental
+    """
+    import networkx as nx
+
+    if previous is not None and previous.raw_positions:
+        kept = [node for node in G.nodes if node in previous.raw_positions]
+        changed = len(G) - len(kept) + len(set(previous.raw_positions) - set(G.nodes))
+        if kept and changed <= max(INCREMENTAL_MAX_CHANGES, len(G) // 10):
+            seed = {node: previous.raw_positions[node] for node in kept}
+            if len(kept) == len(G):
+                return seed, True
+            pos = nx.spring_layout(G, k=k, pos=seed, fixed=kept, iterations=INCREMENTAL_ITERATIONS)
+            return {node: (float(x), float(y)) for node, (x, y) in pos.items()}, True
+
+    pos = nx.spring_layout(G, k=k, iterations=iterations)
+    return {node: (float(x), float(y)) for node, (x, y) in pos.items()}, False
+
+
+def build_layout(
+    view: LayoutView,
+    graph_version: str,
+    nodes: List[GraphNode],
+    db_path: Optional[str] = None,
+    previous: Optional[GraphLayout] = None,
+) -> GraphLayout:
+    """Build the graph for ``nodes``, load their edges and lay them out.
+
+    Blocking; run it through ``compute_layout``.
+    """
+    import networkx as nx
+
+    G = nx.DiGraph()
+    for node in nodes:
+        G.add_node(node.id, **_node_attributes(node))
+    edges = _load_edges(G, nodes, db_path)
+    logger.debug(f"Found {len(edges)} edges connecting {len(nodes)} nodes")
+
+    width, height = view.width, view.height
+    raw: Dict[str, Tuple[float, float]] = {}
+    incremental = False
+    if view.layout == "timeline" and view.hours:
+        pos = _calculate_timeline_layout(G, nodes, width, height, view.hours)
+    else:
+        if view.layout == "hierarchical":
+            # Try to use hierarchical layout if the graph has a tree-like structure
+            try:
+                if nx.is_tree(G.to_undirected()):
+                    # Find root nodes (nodes with no incoming edges)
+                    root_nodes = [n for n in G.nodes() if G.in_degree(n) == 0]
+                    if root_nodes:
+                        # Use the first root node for hierarchical layout
+                        raw = _hierarchy_pos(G, root_nodes[0])
+                    else:
+                        raw, incremental = _spring_positions(G, 2, 50, previous)
+                else:
+                    # For non-tree graphs, use spring layout with higher k value
+                    raw, incremental = _spring_positions(G, 3, 50, previous)
+            except (nx.NetworkXError, ValueError, TypeError, AttributeError, KeyError):
+                # Fallback to spring layout if hierarchical fails
+                raw, incremental = _spring_positions(G, 2, 50, None)
+        else:  # force layout
+            raw, incremental = _spring_positions(G, 1.5, 30, previous)
+        # Scale to fit canvas
+        pos = {node: (x * (width - 100) + 50, y * (height - 100) + 50) for node, (x, y) in raw.items()}
+
+    return GraphLayout(
+        view=view,
+        graph_version=graph_version,
+        graph=G,
+        edges=edges,
+        positions=pos,
+        raw_positions=raw,
+        computed_at=datetime.now(timezone.utc),
+        incremental=incremental,
+    )
+
+
+async def compute_layout(
+    view: LayoutView,
+    graph_version: str,
+    nodes: List[GraphNode],
+    db_path: Optional[str] = None,
+    cache: Optional[LayoutCache] = None,
+) -> GraphLayout:
+    """Lay out ``nodes`` on the worker pool and store the result in the cache."""
+    cache = cache or layout_cache
+    previous = cache.latest(view)
+    layout = await asyncio.get_running_loop().run_in_executor(
+        _layout_pool, build_layout, view, graph_version, nodes, db_path, previous
+    )
+    cache.put(layout)
+    return layout
+
+
+def empty_svg(width: int, height: int) -> str:
+    """Placeholder SVG for a view with no nodes."""
+    return f'''<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">
+                <rect width="{width}" height="{height}" fill="#f8f9fa"/>
+                <text x="{width//2}" y="{height//2}" text-anchor="middle" font-family="Arial" font-size="16" fill="#6c757d">
+                    No memories found
+                </text>
+            </svg>'''
+
+
+def get_edge_color(relationship: str) -> str:
+    """Get color for edge based on relationship type."""
+    # Define color mapping for common relationship types
+    color_map = {
+        "created": "#4CAF50",        # Green - creation relationships
+        "updated": "#2196F3",        # Blue - update relationships
+        "references": "#FF9800",     # Orange - reference relationships
+        "part_of": "#9C27B0",        # Purple - hierarchical relationships
+        "related_to": "#607D8B",     # Blue Grey - general relationships
+        "follows": "#00BCD4",        # Cyan - temporal relationships
+        "responds_to": "#E91E63",    # Pink - response relationships
+        "depends_on": "#F44336",     # Red - dependency relationships
+        "contains": "#795548",       # Brown - containment relationships
+        "tagged_with": "#FFC107",    # Amber - tagging relationships
+    }
+    
+    # Check if relationship contains any of the mapped types (case-insensitive)
+    relationship_lower = relationship.lower()
+    for key, color in color_map.items():
+        if key in relationship_lower:
+            return color
+    
+    return "#999999"  # Default grey for unknown relationships
+
+
+def _get_edge_style(relationship: str) -> str:
+    """Get dash style for edge based on relationship type."""
+    # Define style mapping for relationship types
+    style_map = {
+        "weak": "5,5",          # Dotted for weak relationships
+        "strong": "0",          # Solid for strong relationships
+        "temporal": "10,5",     # Long dash for temporal relationships
+        "inferred": "2,2",      # Short dash for inferred relationships
+        "potential": "5,10",    # Dash-dot for potential relationships
+    }
+    
+    # Check if relationship contains any style keywords
+    relationship_lower = relationship.lower()
+    for key, style in style_map.items():
+        if key in relationship_lower:
+            return style
+    
+    # Default styles for common relationships
+    if any(word in relationship_lower for word in ["created", "updated", "depends"]):
+        return "0"  # Solid line for strong relationships
+    elif any(word in relationship_lower for word in ["related", "references", "tagged"]):
+        return "5,5"  # Dotted for looser relationships
+    
+    return "0"  # Default solid line
+
+
+def _get_node_color(node_type: NodeType) -> str:
+    """Get color for node based on type."""
+    color_map = {
+        NodeType.AGENT: "#4CAF50",      # Green
+        NodeType.USER: "#2196F3",       # Blue
+        NodeType.CHANNEL: "#9C27B0",    # Purple
+        NodeType.CONCEPT: "#FF9800",    # Orange
+        NodeType.CONFIG: "#795548",     # Brown
+        NodeType.TSDB_DATA: "#00BCD4",  # Cyan
+        NodeType.OBSERVATION: "#E91E63", # Pink
+        NodeType.IDENTITY: "#3F51B5",   # Indigo
+        NodeType.AUDIT_ENTRY: "#607D8B", # Blue Grey
+    }
+    return color_map.get(node_type, "#9E9E9E")  # Default grey
+
+
+def _get_node_size(node: GraphNode) -> int:
+    """Calculate node size based on importance/attributes."""
+    base_size = 30
+    
+    # Increase size for nodes with more attributes
+    if node.attributes:
+        if isinstance(node.attributes, dict):
+            attr_count = len([k for k, v in node.attributes.items() if v is not None])
+        else:
+            # Count non-None fields in GraphNodeAttributes
+            attr_count = len([f for f in node.attributes.model_fields if getattr(node.attributes, f, None) is not None])
+        base_size += min(attr_count * 2, 20)
+    
+    # Increase size for identity-related nodes
+    if node.scope == GraphScope.IDENTITY:
+        base_size += 10
+    
+    return base_size
+
+
+def _hierarchy_pos(G: "nx.DiGraph", root: str, width: float = 1., vert_gap: float = 0.2, vert_loc: float = 0, xcenter: float = 0.5) -> Dict[str, Tuple[float, float]]:
+    """
+    Create a hierarchical tree layout.
+    
+    If the graph is not a tree, this will still produce a hierarchical layout
+    by doing a breadth-first traversal.
+    """
+    def _hierarchy_pos_recursive(G: "nx.DiGraph", root: str, width: float = 1., vert_gap: float = 0.2, 
+                                vert_loc: float = 0, xcenter: float = 0.5, 
+                                pos: Optional[Dict[str, Tuple[float, float]]] = None, 
+                                parent: Optional[str] = None, 
+                                parsed: Optional[set[str]] = None) -> Dict[str, Tuple[float, float]]:
+        if pos is None:
+            pos = {root: (xcenter, vert_loc)}
+        else:
+            pos[root] = (xcenter, vert_loc)
+            
+        if parsed is None:
+            parsed = set([root])
+        else:
+            parsed.add(root)
+            
+        children = []
+        for neighbor in G.neighbors(root):
+            if neighbor not in parsed:
+                children.append(neighbor)
+                
+        if len(children) != 0:
+            dx = width / len(children)
+            nextx = xcenter - width/2 - dx/2
+            for child in children:
+                nextx += dx
+                pos = _hierarchy_pos_recursive(G, child, width=dx, vert_gap=vert_gap, 
+                                             vert_loc=vert_loc-vert_gap, xcenter=nextx, pos=pos, 
+                                             parent=root, parsed=parsed)
+        return pos
+
+    return _hierarchy_pos_recursive(G, root, width, vert_gap, vert_loc, xcenter)
+
+
+def _calculate_timeline_layout(G: "nx.DiGraph", nodes: List[GraphNode], width: int, height: int, hours: Optional[int] = None) -> Dict[str, Tuple[float, float]]:
+    """Calculate timeline layout with nodes arranged chronologically."""
+    pos = {}
+    
+    # Determine the time window
+    now = datetime.now(timezone.utc)
+    if hours:
+        window_start = now - timedelta(hours=hours)
+        window_end = now
+    else:
+        # Default to 24 hours if not specified
+        window_start = now - timedelta(hours=24)
+        window_end = now
+    
+    # Collect nodes with timestamps
+    nodes_with_time: List[Tuple[datetime, str]] = []
+    nodes_without_time = []
+    
+    for node in nodes:
+        node_time = None
+        try:
+            # Try to get timestamp from various sources
+            if isinstance(node.attributes, dict):
+                node_time = node.attributes.get('created_at') or node.attributes.get('timestamp')
+            else:
+                node_time = node.attributes.created_at
+            
+            # Fallback to top-level updated_at if no timestamp in attributes
+            if not node_time and hasattr(node, 'updated_at'):
+                node_time = node.updated_at
+            
+            if node_time:
+                # Debug log the raw timestamp value
+                logger.debug(f"Node {node.id} raw timestamp: {node_time} (type: {type(node_time)})")
+                
+                # Convert string to datetime if needed
+                if isinstance(node_time, str):
+                    # Handle ISO format with Z suffix
+                    node_time = datetime.fromisoformat(node_time.replace('Z', UTC_TIMEZONE_SUFFIX))
+                
+                # Ensure we have a datetime object
+                if isinstance(node_time, datetime):
+                    # Ensure timezone info
+                    if node_time.tzinfo is None:
+                        node_time = node_time.replace(tzinfo=timezone.utc)
+                    
+                    nodes_with_time.append((node_time, node.id))
+                    logger.debug(f"Node {node.id} timestamp: {node_time.isoformat()}")
+                else:
+                    logger.warning(f"Node {node.id} has non-datetime timestamp after parsing: {node_time}")
+                    nodes_without_time.append(node.id)
+            else:
+                nodes_without_time.append(node.id)
+        except Exception as e:
+            logger.warning(f"Failed to parse timestamp for node {node.id}: {e}")
+            nodes_without_time.append(node.id)
+    
+    # Sort nodes by time
+    nodes_with_time.sort()
+    
+    logger.debug(f"Timeline layout: {len(nodes_with_time)} nodes with timestamps, {len(nodes_without_time)} without")
+    
+    if not nodes_with_time:
+        # Fallback to force layout if no timestamps
+        import networkx as nx
+
+        layout_result = nx.spring_layout(G)
+        # Convert to proper type
+        return {node: (float(x), float(y)) for node, (x, y) in layout_result.items()}
+    
+    # Get time range - use the window range, not the data range
+    window_range = (window_end - window_start).total_seconds()
+    
+    # Get actual data range for logging
+    data_min_time = nodes_with_time[0][0]
+    data_max_time = nodes_with_time[-1][0]
+    data_range = (data_max_time - data_min_time).total_seconds()
+    
+    logger.debug(f"Window range: {window_start.isoformat()} to {window_end.isoformat()} ({window_range/3600:.1f} hours)")
+    logger.debug(f"Data range: {data_min_time.isoformat()} to {data_max_time.isoformat()} ({data_range/3600:.1f} hours)")
+    
+    # If all nodes are at the same time or very close, use vertical distribution
+    if data_range < 3600:  # Less than 1 hour range
+        logger.debug("All nodes within 1 hour - using vertical distribution at appropriate x position")
+        # Place the group at the correct position within the window
+        time_offset = (data_min_time - window_start).total_seconds()
+        x = 100 + (time_offset / window_range) * (width - 200)
+        y_spacing = (height - 100) / max(len(nodes_with_time), 1)
+        for i, (_, node_id) in enumerate(nodes_with_time):
+            y = 50 + i * y_spacing + (y_spacing / 2)
+            pos[node_id] = (x, y)
+    else:
+        # Distribute nodes across the timeline proportionally
+        x_margin = 100
+        available_width = width - 2 * x_margin
+        
+        # Group nodes that are very close in time (within 5 minutes)
+        node_groups: List[List[Tuple[datetime, str]]] = []
+        current_group: List[Tuple[datetime, str]] = [nodes_with_time[0]]
+        
+        for i in range(1, len(nodes_with_time)):
+            time_diff = (nodes_with_time[i][0] - current_group[-1][0]).total_seconds()
+            if time_diff < 300:  # Within 5 minutes
+                current_group.append(nodes_with_time[i])
+            else:
+                node_groups.append(current_group)
+                current_group = [nodes_with_time[i]]
+        node_groups.append(current_group)
+        
+        logger.debug(f"Grouped nodes into {len(node_groups)} time groups")
+        
+        # Position each group
+        for group in node_groups:
+            # Calculate x position based on the group's average time within the window
+            avg_time = sum((t.timestamp() for t, _ in group), 0.0) / len(group)
+            avg_datetime = datetime.fromtimestamp(avg_time, tz=timezone.utc)
+            time_offset = (avg_datetime - window_start).total_seconds()
+            
+            # Ensure nodes stay within bounds
+            if time_offset < 0:
+                # Node is before window start - place at left edge
+                x = x_margin
+            elif time_offset > window_range:
+                # Node is after window end - place at right edge
+                x = width - x_margin
+            else:
+                # Normal case - position proportionally
+                x = x_margin + (time_offset / window_range) * available_width
+            
+            # Distribute nodes in the group vertically with slight x variation
+            if len(group) == 1:
+                pos[group[0][1]] = (x, height / 2)
+            else:
+                y_spacing = (height - 100) / len(group)
+                for j, (_, node_id) in enumerate(group):
+                    # Add small x offset to avoid perfect vertical lines
+                    x_offset = (hash(node_id) % 30) - 15
+                    y = 50 + j * y_spacing + (y_spacing / 2)
+                    pos[node_id] = (x + x_offset, y)
+    
+    # Place nodes without timestamps at the beginning
+    if nodes_without_time:
+        # Place them in a vertical column at x=25 (before the timeline)
+        y_spacing = (height - 100) / max(len(nodes_without_time), 1)
+        for j, node_id in enumerate(nodes_without_time):
+            y = 50 + j * y_spacing + (y_spacing / 2)
+            pos[node_id] = (25, y)
+        logger.debug(f"Placed {len(nodes_without_time)} nodes without timestamps at x=25")
+    
+    # Log final position summary
+    if pos and logger.isEnabledFor(logging.DEBUG):
+        x_positions = sorted(set(x for x, y in pos.values()))
+        logger.debug(f"Timeline positions assigned: {len(pos)} nodes across {len(x_positions)} unique x-positions")
+        logger.debug(f"X-position range: {min(x_positions):.1f} to {max(x_positions):.1f}")
+    
+    return pos
+
+
+def _generate_svg(G: "nx.DiGraph", pos: Dict[str, Tuple[float, float]], width: int, height: int, 
+                  layout: str, hours: Optional[int], edges: Optional[List[GraphEdge]] = None) -> str:
+    """Generate SVG visualization of the graph."""
+    svg_parts = [
+        f'<svg width="{width}" height="{height}" xmlns="http://www.w3.org/2000/svg">',
+        f'<rect width="{width}" height="{height}" fill="#f8f9fa"/>',
+        '<defs>',
+        # Define multiple arrow markers for different relationship types
+        '<marker id="arrowhead-default" markerWidth="10" markerHeight="7" refX="9" refY="3.5" orient="auto">',
+        '<polygon points="0 0, 10 3.5, 0 7" fill="#999" />',
+        MARKER_END,
+        '<marker id="arrowhead-strong" markerWidth="12" markerHeight="8" refX="11" refY="4" orient="auto">',
+        '<polygon points="0 0, 12 4, 0 8" fill="#666" />',
+        MARKER_END,
+        '<marker id="arrowhead-weak" markerWidth="8" markerHeight="6" refX="7" refY="3" orient="auto">',
+        '<polygon points="0 0, 8 3, 0 6" fill="#ccc" />',
+        MARKER_END,
+        # Add hover style
+        '<style>',
+        '.edge-line { cursor: pointer; }',
+        '.edge-line:hover { stroke-width: 4; opacity: 1.0; }',
+        '.edge-label { pointer-events: none; font-family: Arial; font-size: 10px; fill: #666; }',
+        '</style>',
+        '</defs>'
+    ]
+    
+    # Add title
+    title = f"Memory Graph Visualization"
+    if layout == "timeline" and hours:
+        title = f"Memory Timeline - Last {hours} hours"
+    svg_parts.append(
+        f'<text x="{width//2}" y="30" text-anchor="middle" font-family="Arial" '
+        f'font-size="20" font-weight="bold" fill="#333">{title}</text>'
+    )
+    
+    # Draw edges with different styles for different relationship types
+    if edges:
+        for edge in edges:
+            if edge.source in pos and edge.target in pos:
+                x1, y1 = pos[edge.source]
+                x2, y2 = pos[edge.target]
+                
+                # Calculate edge style based on relationship type and weight
+                edge_color = get_edge_color(edge.relationship)
+                edge_style = _get_edge_style(edge.relationship)
+                edge_width = 1 + (edge.weight * 2)  # Width based on weight
+                opacity = 0.4 + (edge.weight * 0.4)  # Opacity based on weight
+                
+                # Choose arrow marker based on weight
+                if edge.weight > 0.7:
+                    marker = "arrowhead-strong"
+                elif edge.weight < 0.3:
+                    marker = "arrowhead-weak"
+                else:
+                    marker = "arrowhead-default"
+                
+                # Draw edge line with data attributes for interactivity
+                svg_parts.append(
+                    f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+                    f'stroke="{edge_color}" stroke-width="{edge_width}" '
+                    f'stroke-dasharray="{edge_style}" '
+                    f'marker-end="url(#{marker})" opacity="{opacity}" '
+                    f'class="edge-line" '
+                    f'data-source="{edge.source}" data-target="{edge.target}" '
+                    f'data-relationship="{edge.relationship}" data-weight="{edge.weight}"/>'
+                )
+                
+                # Add edge label at midpoint
+                mid_x = (x1 + x2) / 2
+                mid_y = (y1 + y2) / 2
+                svg_parts.append(
+                    f'<text x="{mid_x}" y="{mid_y}" class="edge-label" '
+                    f'text-anchor="middle">{edge.relationship}</text>'
+                )
+    
+    # Draw nodes
+    for node_id, attrs in G.nodes(data=True):
+        x, y = pos[node_id]
+        color = attrs.get('color', '#9E9E9E')
+        size = attrs.get('size', 30)
+        label = attrs.get('label', node_id)
+        node_type = attrs.get('type', 'unknown')
+        
+        # Node circle with data-node-id attribute for click handling
+        svg_parts.append(
+            f'<circle cx="{x}" cy="{y}" r="{size}" fill="{color}" '
+            f'stroke="#333" stroke-width="2" opacity="0.8" '
+            f'data-node-id="{node_id}"/>'
+        )
+        
+        # Node label
+        svg_parts.append(
+            f'<text x="{x}" y="{y + size + 15}" text-anchor="middle" '
+            f'font-family="Arial" font-size="12" fill="#333">{label}</text>'
+        )
+        
+        # Node type label
+        svg_parts.append(
+            f'<text x="{x}" y="{y + 5}" text-anchor="middle" '
+            f'font-family="Arial" font-size="10" fill="white" font-weight="bold">{node_type}</text>'
+        )
+    
+    # Add timeline axis if in timeline mode
+    if layout == "timeline" and hours:
+        # Draw time axis
+        svg_parts.append(
+            f'<line x1="50" y1="{height - 40}" x2="{width - 50}" y2="{height - 40}" '
+            f'stroke="#666" stroke-width="2"/>'
+        )
+        
+        # Add time labels with fixed intervals
+        now = datetime.now(timezone.utc)
+        # Use predefined safe intervals based on hours range
+        if hours <= 6:
+            intervals = [0, 1, 2, 3, 4, 5, hours][:hours+1]
+        elif hours <= 24:
+            intervals = [0, 4, 8, 12, 16, 20, hours]
+        elif hours <= 48:
+            intervals = [0, 8, 16, 24, 32, 40, hours]
+        elif hours <= 96:
+            intervals = [0, 16, 32, 48, 64, 80, hours]
+        else:  # hours <= 168
+            intervals = [0, 24, 48, 72, 96, 120, 144, hours]
+        
+        # Filter out any duplicates and sort
+        intervals = sorted(set(i for i in intervals if i <= hours))
+        
+        for hour in intervals:
+            x = 50 + (hour / hours) * (width - 100)
+            time_label = (now - timedelta(hours=hours-hour)).strftime("%m/%d %H:%M")
+            svg_parts.append(
+                f'<text x="{x}" y="{height - 20}" text-anchor="middle" '
+                f'font-family="Arial" font-size="10" fill="#666">{time_label}</text>'
+            )
+    
+    # Add legend
+    legend_y = height - 200
+    
+    # Node types legend
+    svg_parts.append(
+        f'<text x="20" y="{legend_y}" font-family="Arial" font-size="14" '
+        f'font-weight="bold" fill="#333">Node Types:</text>'
+    )
+    
+    type_colors = [
+        (NodeType.CONCEPT, "Concept"),
+        (NodeType.OBSERVATION, "Observation"),
+        (NodeType.IDENTITY, "Identity"),
+        (NodeType.CONFIG, "Config"),
+    ]
+    
+    for i, (node_type, label) in enumerate(type_colors):
+        y_offset = legend_y + 20 + i * 20
+        color = _get_node_color(node_type)
+        svg_parts.append(
+            f'<circle cx="30" cy="{y_offset}" r="8" fill="{color}" stroke="#333" stroke-width="1"/>'
+        )
+        svg_parts.append(
+            f'<text x="45" y="{y_offset + 5}" font-family="Arial" font-size="12" fill="#333">{label}</text>'
+        )
+    
+    # Edge relationships legend (if we have edges)
+    if edges and len(edges) > 0:
+        edge_legend_y = legend_y + 100
+        svg_parts.append(
+            f'<text x="20" y="{edge_legend_y}" font-family="Arial" font-size="14" '
+            f'font-weight="bold" fill="#333">Edge Types:</text>'
+        )
+        
+        # Get unique relationship types from displayed edges
+        unique_relationships = list(set(edge.relationship for edge in edges))[:4]  # Show max 4
+        
+        for i, relationship in enumerate(unique_relationships):
+            y_offset = edge_legend_y + 20 + i * 20
+            color = get_edge_color(relationship)
+            style = _get_edge_style(relationship)
+            
+            # Draw sample edge line
+            svg_parts.append(
+                f'<line x1="20" y1="{y_offset}" x2="40" y2="{y_offset}" '
+                f'stroke="{color}" stroke-width="2" stroke-dasharray="{style}"/>'
+            )
+            svg_parts.append(
+                f'<text x="45" y="{y_offset + 5}" font-family="Arial" font-size="12" fill="#333">{relationship}</text>'
+            )
+    
+    svg_parts.append('</svg>')
+    
+    return '\n'.join(svg_parts)
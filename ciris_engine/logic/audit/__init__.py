@@ -6,9 +6,13 @@ Provides cryptographic hash chain and digital signature capabilities for audit t
 from .hash_chain import AuditHashChain
 from .signature_manager import AuditSignatureManager
 from .verifier import AuditVerifier
+from .writer import AuditChainWriter
+from .exporter import AuditExporter
 
 __all__ = [
     "AuditHashChain",
     "AuditSignatureManager",
-    "AuditVerifier"
+    "AuditVerifier",
+    "AuditChainWriter",
+    "AuditExporter"
 ]
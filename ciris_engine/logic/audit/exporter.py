@@ -0,0 +1,296 @@
+"""
+Streaming, resumable exporter for the signed audit log.
+
+Rows are read from audit_log in sequence order with a keyset cursor (see
+AuditHashChain.iter_entries), so memory use does not grow with the size of
+the log. They are written as JSONL or CSV into compressed chunk files that
+rotate once they reach ``max_chunk_bytes`` on disk. Each closed chunk is
+recorded in ``manifest.json`` together with its hash-chain boundaries (the
+previous_hash of its first entry and the entry_hash of its last), so a
+consumer can check that consecutive chunks link up, and a later incremental
+export resumes right after the last exported sequence number.
+"""
+
+import csv
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+
+from ciris_engine.logic.audit.hash_chain import AuditHashChain, DEFAULT_CHUNK_SIZE
+from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
+from ciris_engine.schemas.audit.export import AuditExportChunk, AuditExportManifest
+
+# Optional zstd support
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("jsonl", "csv")
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+COMPRESSION_NONE = "none"
+COMPRESSIONS = (COMPRESSION_GZIP, COMPRESSION_ZSTD, COMPRESSION_NONE)
+_EXTENSIONS = {COMPRESSION_GZIP: ".gz", COMPRESSION_ZSTD: ".zst", COMPRESSION_NONE: ""}
+
+DEFAULT_MAX_CHUNK_BYTES = 64 * 1024 * 1024
+MANIFEST_NAME = "manifest.json"
+
+# Everything needed to re-verify the chain and its signatures offline
+EXPORT_COLUMNS = (
+    "sequence_number", "event_id", "event_timestamp", "event_type", "originator_id",
+    "actor", "event_summary", "event_payload", "previous_hash", "entry_hash",
+    "signature", "signing_key_id",
+)
+
+
+class _ChunkWriter:
+    """One compressed chunk file being written."""
+
+    def __init__(self, path: Path, fmt: str, compression: str) -> None:
+        self.path = path
+        self.format = fmt
+        self.raw: BinaryIO = open(path, "wb")
+        self.stream: Any
+        if compression == COMPRESSION_GZIP:
+            # mtime=0 keeps identical chunks byte-identical
+            self.stream = gzip.GzipFile(fileobj=self.raw, mode="wb", mtime=0)
+        elif compression == COMPRESSION_ZSTD:
+            self.stream = zstandard.ZstdCompressor().stream_writer(self.raw, closefd=False)
+        else:
+            self.stream = self.raw
+        self.first: Optional[Dict[str, Any]] = None
+        self.last: Optional[Dict[str, Any]] = None
+        self.count = 0
+        if fmt == "csv":
+            self._write_text(self._csv_line(EXPORT_COLUMNS))
+
+    @staticmethod
+    def _csv_line(values: Tuple[Any, ...]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(values)
+        return buffer.getvalue()
+
+    def _write_text(self, text: str) -> None:
+        self.stream.write(text.encode("utf-8"))
+
+    def write(self, row: Dict[str, Any]) -> None:
+        if self.format == "csv":
+            self._write_text(self._csv_line(tuple(row.get(column) for column in EXPORT_COLUMNS)))
+        else:
+            record = {column: row.get(column) for column in EXPORT_COLUMNS}
+            self._write_text(json.dumps(record, separators=(",", ":")) + "\n")
+        if self.first is None:
+            self.first = row
+        self.last = row
+        self.count += 1
+
+    @property
+    def size(self) -> int:
+        """Bytes on disk so far (compressors buffer, so this trails slightly)."""
+        return self.raw.tell()
+
+    def close(self) -> None:
+        if self.stream is not self.raw:
+            self.stream.close()
+        self.raw.flush()
+        os.fsync(self.raw.fileno())
+        self.raw.close()
+
+    def discard(self) -> None:
+        try:
+            self.close()
+        finally:
+            self.path.unlink(missing_ok=True)
+
+
+class AuditExporter:
+    """Exports audit_log to rotated, compressed chunks with a manifest"""
+
+    def __init__(
+        self,
+        db_path: str,
+        export_dir: Union[str, Path],
+        time_service: TimeServiceProtocol,
+        format: str = "jsonl",
+        compression: str = COMPRESSION_GZIP,
+        max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported streaming export format: {format}")
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unsupported export compression: {compression}")
+        if compression == COMPRESSION_ZSTD and not ZSTD_AVAILABLE:
+            raise ValueError("zstd export compression requires the zstandard package")
+        if max_chunk_bytes < 1:
+            raise ValueError("max_chunk_bytes must be positive")
+
+        self.db_path = db_path
+        self.export_dir = Path(export_dir)
+        self.format = format
+        self.compression = compression
+        self.max_chunk_bytes = max_chunk_bytes
+        self.chunk_size = chunk_size
+        self._time_service = time_service
+        self.hash_chain = AuditHashChain(db_path)
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.export_dir / MANIFEST_NAME
+
+    def load_manifest(self) -> Optional[AuditExportManifest]:
+        """The manifest of the export directory, if one has been written."""
+        if not self.manifest_path.exists():
+            return None
+        return AuditExportManifest.model_validate_json(self.manifest_path.read_text(encoding="utf-8"))
+
+    def export(
+        self,
+        start_seq: Optional[int] = None,
+        end_seq: Optional[int] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        resume: bool = True,
+    ) -> AuditExportManifest:
+        """Export a sequence range, by default everything after the last export.
+
+        A time window is widened to the contiguous sequence range spanning
+        it, so every chunk remains a verifiable slice of the chain. With
+        ``resume`` the export continues from the manifest and refuses to
+        proceed if the chain no longer links onto what was exported.
+        """
+        self.export_dir.mkdir(parents=True, exist_ok=True)
+        manifest = self.load_manifest() if resume else None
+        if manifest is None:
+            manifest = AuditExportManifest(format=self.format, compression=self.compression)
+        elif (manifest.format, manifest.compression) != (self.format, self.compression):
+            raise ValueError(
+                f"Export directory holds {manifest.format}/{manifest.compression} chunks, "
+                f"not {self.format}/{self.compression}"
+            )
+
+        if start_time or end_time:
+            window = self._sequence_window(start_time, end_time)
+            if window is None:
+                return manifest
+            start_seq = max(start_seq or 1, window[0])
+            end_seq = min(end_seq, window[1]) if end_seq else window[1]
+
+        expected_previous: Optional[str] = None
+        if manifest.last_sequence is not None:
+            start_seq = max(start_seq or 1, manifest.last_sequence + 1)
+            expected_previous = manifest.last_entry_hash
+
+        self._remove_partial_chunks()
+        writer: Optional[_ChunkWriter] = None
+        try:
+            for rows in self.hash_chain.iter_entries(start_seq or 1, end_seq, self.chunk_size):
+                for row in rows:
+                    if expected_previous is not None:
+                        if row["previous_hash"] != expected_previous:
+                            raise ValueError(
+                                f"Audit chain does not link onto the last export at sequence "
+                                f"{row['sequence_number']}"
+                            )
+                        expected_previous = None
+                    if writer is None:
+                        writer = _ChunkWriter(self._partial_path(row["sequence_number"]), self.format, self.compression)
+                    writer.write(row)
+                    if writer.size >= self.max_chunk_bytes:
+                        self._seal(writer, manifest)
+                        writer = None
+            if writer is not None:
+                self._seal(writer, manifest)
+                writer = None
+        finally:
+            if writer is not None:
+                writer.discard()
+
+        return manifest
+
+    def _sequence_window(self, start_time: Optional[datetime], end_time: Optional[datetime]) -> Optional[Tuple[int, int]]:
+        clauses: List[str] = []
+        params: List[str] = []
+        for value, op in ((start_time, ">="), (end_time, "<=")):
+            if value is None:
+                continue
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            clauses.append(f"event_timestamp {op} ?")
+            params.append(value.astimezone(timezone.utc).isoformat())
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                f"SELECT MIN(sequence_number), MAX(sequence_number) FROM audit_log WHERE {' AND '.join(clauses)}",  # nosec B608
+                params,
+            ).fetchone()
+        finally:
+            conn.close()
+        if not row or row[0] is None:
+            return None
+        return int(row[0]), int(row[1])
+
+    def _partial_path(self, first_sequence: int) -> Path:
+        return self.export_dir / f"audit_{first_sequence:012d}.{self.format}{_EXTENSIONS[self.compression]}.partial"
+
+    def _remove_partial_chunks(self) -> None:
+        """Drop chunks left by an interrupted export; the manifest never lists them."""
+        for path in self.export_dir.glob("*.partial"):
+            path.unlink(missing_ok=True)
+
+    def _seal(self, writer: _ChunkWriter, manifest: AuditExportManifest) -> None:
+        """Close a chunk, give it its final name and record it in the manifest."""
+        assert writer.first is not None and writer.last is not None
+        writer.close()
+        first_seq = writer.first["sequence_number"]
+        last_seq = writer.last["sequence_number"]
+        final_path = self.export_dir / (
+            f"audit_{first_seq:012d}-{last_seq:012d}.{self.format}{_EXTENSIONS[self.compression]}"
+        )
+        os.replace(writer.path, final_path)
+
+        digest = hashlib.sha256()
+        with open(final_path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+
+        now = self._time_service.now().isoformat()
+        manifest.chunks.append(AuditExportChunk(
+            file_name=final_path.name,
+            first_sequence=first_seq,
+            last_sequence=last_seq,
+            entry_count=writer.count,
+            first_previous_hash=writer.first["previous_hash"],
+            last_entry_hash=writer.last["entry_hash"],
+            size_bytes=final_path.stat().st_size,
+            sha256=digest.hexdigest(),
+            created_at=now,
+        ))
+        if manifest.first_sequence is None:
+            manifest.first_sequence = first_seq
+        manifest.last_sequence = last_seq
+        manifest.last_entry_hash = writer.last["entry_hash"]
+        manifest.total_entries += writer.count
+        manifest.updated_at = now
+        self._write_manifest(manifest)
+        logger.debug(f"Exported audit sequences {first_seq}-{last_seq} to {final_path.name}")
+
+    def _write_manifest(self, manifest: AuditExportManifest) -> None:
+        """Replace the manifest atomically so readers never see a torn file."""
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(manifest.model_dump_json(indent=2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
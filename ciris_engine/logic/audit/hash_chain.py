@@ -10,13 +10,16 @@ import json
 import sqlite3
 import logging
 import threading
-from typing import Optional, List
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from ciris_engine.schemas.audit.hash_chain import (
     HashChainVerificationResult, ChainSummary
 )
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round trip when streaming the chain
+DEFAULT_CHUNK_SIZE = 1000
+
 class AuditHashChain:
     """Manages the cryptographic hash chain for audit entries"""
 
@@ -84,6 +87,37 @@ class AuditHashChain:
 
         return entry
 
+    def link_entry(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Chain an entry onto the in-memory tip without re-reading the database.
+
+        Only safe when a single writer owns the chain (see AuditChainWriter).
+        Callers that roll back a failed write must restore the tip with
+        ``reset_tip``.
+        """
+        if not self._initialized:
+            self.initialize()
+
+        with self._lock:
+            self._sequence_number += 1
+            entry["sequence_number"] = self._sequence_number
+            entry["previous_hash"] = self._last_hash or "genesis"
+            entry["entry_hash"] = self.compute_entry_hash(entry)
+            self._last_hash = entry["entry_hash"]
+
+        return entry
+
+    @property
+    def tip(self) -> Tuple[int, Optional[str]]:
+        """Current (sequence_number, last_hash) held in memory."""
+        with self._lock:
+            return self._sequence_number, self._last_hash
+
+    def reset_tip(self, sequence_number: int, last_hash: Optional[str]) -> None:
+        """Restore the in-memory tip, e.g. after a failed batch commit."""
+        with self._lock:
+            self._sequence_number = sequence_number
+            self._last_hash = last_hash
+
     def get_last_entry(self) -> Optional[dict]:
         """Retrieve the last entry from the chain"""
         try:
@@ -108,94 +142,107 @@ class AuditHashChain:
             logger.error(f"Failed to get last entry: {e}")
             return None
 
-    def verify_chain_integrity(self, start_seq: int = 1, end_seq: Optional[int] = None) -> HashChainVerificationResult:
-        """Verify the integrity of the hash chain"""
-        conn = None
-        result = None
+    def iter_entries(
+        self,
+        start_seq: int = 1,
+        end_seq: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Stream audit_log rows in sequence order, ``chunk_size`` rows at a time
+
+        Each chunk is its own keyset query, so no read lock is held between
+        chunks and the audit writer can keep committing during long scans.
+        """
+        conn = sqlite3.connect(self.db_path)
         try:
-            conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+            next_seq = start_seq
+            while True:
+                if end_seq:
+                    rows = conn.execute("""
+                        SELECT * FROM audit_log
+                        WHERE sequence_number >= ? AND sequence_number <= ?
+                        ORDER BY sequence_number
+                        LIMIT ?
+                    """, (next_seq, end_seq, chunk_size)).fetchall()
+                else:
+                    rows = conn.execute("""
+                        SELECT * FROM audit_log
+                        WHERE sequence_number >= ?
+                        ORDER BY sequence_number
+                        LIMIT ?
+                    """, (next_seq, chunk_size)).fetchall()
+                if not rows:
+                    break
+                yield [dict(row) for row in rows]
+                next_seq = rows[-1]["sequence_number"] + 1
+        finally:
+            conn.close()
 
-            # Build query
-            if end_seq:
-                cursor.execute("""
-                    SELECT * FROM audit_log
-                    WHERE sequence_number >= ? AND sequence_number <= ?
-                    ORDER BY sequence_number
-                """, (start_seq, end_seq))
-            else:
-                cursor.execute("""
-                    SELECT * FROM audit_log
-                    WHERE sequence_number >= ?
-                    ORDER BY sequence_number
-                """, (start_seq,))
-
-            entries = [dict(row) for row in cursor.fetchall()]
-
-            if not entries:
-                result = HashChainVerificationResult(
-                    valid=True,
-                    entries_checked=0,
-                    errors=[],
-                    last_sequence=0,
-                    tampering_location=None
-                )
-            else:
-                errors: List[str] = []
-                previous_hash: Optional[str] = None
-
-                # If not starting from sequence 1, get the previous entry's hash
-                if start_seq > 1:
-                    cursor.execute("""
-                        SELECT entry_hash FROM audit_log
-                        WHERE sequence_number = ?
-                    """, (start_seq - 1,))
-                    prev_row = cursor.fetchone()
-                    if prev_row:
-                        previous_hash = prev_row[0]
-
-                for i, entry in enumerate(entries):
-                    expected_seq = start_seq + i
-                    if entry["sequence_number"] != expected_seq:
-                        errors.append(f"Sequence gap at {entry['sequence_number']}, expected {expected_seq}")
-
-                    if i == 0 and start_seq == 1:
-                        expected_prev = "genesis"
-                    else:
-                        expected_prev = previous_hash or ""
-
-                    if entry["previous_hash"] != expected_prev:
-                        errors.append(f"Hash chain break at sequence {entry['sequence_number']}")
-
-                    computed_hash = self.compute_entry_hash(entry)
-                    if computed_hash != entry["entry_hash"]:
-                        errors.append(f"Entry hash mismatch at sequence {entry['sequence_number']}")
+    def get_entry_hash(self, sequence_number: int) -> Optional[str]:
+        """Look up the stored hash of one entry"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT entry_hash FROM audit_log WHERE sequence_number = ?",
+                (sequence_number,)
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[0] if row else None
+
+    def check_link(self, entry: Dict[str, Any], expected_seq: int, expected_prev: str) -> List[str]:
+        """Check one entry's sequence number, previous-hash link and own hash"""
+        errors: List[str] = []
+        if entry["sequence_number"] != expected_seq:
+            errors.append(f"Sequence gap at {entry['sequence_number']}, expected {expected_seq}")
+        if entry["previous_hash"] != expected_prev:
+            errors.append(f"Hash chain break at sequence {entry['sequence_number']}")
+        if self.compute_entry_hash(entry) != entry["entry_hash"]:
+            errors.append(f"Entry hash mismatch at sequence {entry['sequence_number']}")
+        return errors
+
+    def verify_chain_integrity(
+        self,
+        start_seq: int = 1,
+        end_seq: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> HashChainVerificationResult:
+        """Verify the integrity of the hash chain, streaming rows in chunks"""
+        errors: List[str] = []
+        entries_checked = 0
+        last_sequence = 0
 
+        try:
+            # If not starting from sequence 1, link onto the previous entry's hash
+            previous_hash: Optional[str] = "genesis"
+            if start_seq > 1:
+                previous_hash = self.get_entry_hash(start_seq - 1)
+
+            for chunk in self.iter_entries(start_seq, end_seq, chunk_size):
+                for entry in chunk:
+                    errors.extend(self.check_link(entry, start_seq + entries_checked, previous_hash or ""))
                     previous_hash = entry["entry_hash"]
-
-                result = HashChainVerificationResult(
-                    valid=len(errors) == 0,
-                    entries_checked=len(entries),
-                    errors=errors,
-                    last_sequence=entries[-1]["sequence_number"] if entries else 0,
-                    tampering_location=None
-                )
+                    last_sequence = entry["sequence_number"]
+                    entries_checked += 1
 
         except sqlite3.Error as e:
             logger.error(f"Chain verification failed: {e}")
-            result = HashChainVerificationResult(
+            return HashChainVerificationResult(
                 valid=False,
                 entries_checked=0,
                 errors=[f"Database error: {e}"],
                 last_sequence=0,
                 tampering_location=None
             )
-        finally:
-            if conn:
-                conn.close()
 
-        return result
+        return HashChainVerificationResult(
+            valid=len(errors) == 0,
+            entries_checked=entries_checked,
+            errors=errors,
+            last_sequence=last_sequence,
+            tampering_location=None
+        )
 
     def find_tampering(self) -> Optional[int]:
         """Find the first tampered entry in the chain using linear search"""
@@ -0,0 +1,74 @@
+"""
+Merkle tree helpers for batch-signed audit entries.
+
+Leaves are audit entry hashes (hex SHA-256). Leaf and interior nodes are
+domain-separated (0x00 / 0x01 prefixes, as in RFC 6962) and an odd node at
+the end of a level is promoted unchanged rather than duplicated, so a tree
+over N leaves cannot be made to collide with a tree over N+1.
+"""
+
+import hashlib
+from typing import List, Sequence, Tuple
+
+# Prefix stored in audit_log.signature for entries covered by a signed root
+MERKLE_SIGNATURE_PREFIX = "merkle:"
+
+# (sibling hash hex, sibling is on the left)
+ProofStep = Tuple[str, bool]
+
+
+def _leaf_hash(entry_hash: str) -> bytes:
+    return hashlib.sha256(b"\x00" + bytes.fromhex(entry_hash)).digest()
+
+
+def _node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def build_tree(entry_hashes: Sequence[str]) -> List[List[bytes]]:
+    """Build every level of the tree, leaves first and the root level last."""
+    if not entry_hashes:
+        raise ValueError("Cannot build a Merkle tree without leaves")
+
+    level = [_leaf_hash(h) for h in entry_hashes]
+    levels = [level]
+    while len(level) > 1:
+        parents = [_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        level = parents
+        levels.append(level)
+    return levels
+
+
+def merkle_root(entry_hashes: Sequence[str]) -> str:
+    """Hex root over the given entry hashes."""
+    return build_tree(entry_hashes)[-1][0].hex()
+
+
+def inclusion_proof(levels: List[List[bytes]], index: int) -> List[ProofStep]:
+    """Sibling path from leaf ``index`` up to the root."""
+    proof: List[ProofStep] = []
+    for level in levels[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append((level[sibling].hex(), sibling < index))
+        index //= 2
+    return proof
+
+
+def verify_inclusion(entry_hash: str, proof: Sequence[ProofStep], root_hash: str) -> bool:
+    """Check that ``entry_hash`` is a leaf of the tree with ``root_hash``."""
+    try:
+        node = _leaf_hash(entry_hash)
+        for sibling_hex, sibling_is_left in proof:
+            sibling = bytes.fromhex(sibling_hex)
+            node = _node_hash(sibling, node) if sibling_is_left else _node_hash(node, sibling)
+    except ValueError:
+        return False
+    return node.hex() == root_hash
+
+
+def root_signing_message(sequence_start: int, sequence_end: int, root_hash: str) -> str:
+    """The string signed for a batch root; binds the root to its sequence range."""
+    return f"{sequence_start}:{sequence_end}:{root_hash}"
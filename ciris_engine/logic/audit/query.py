@@ -0,0 +1,129 @@
+"""
+SQL queries over the signed audit_log table.
+
+Audit queries are answered from the indexed audit_log rows instead of
+scanning graph nodes: filters become WHERE clauses on event_type, actor,
+originator_id and event_timestamp, pages are cut with a keyset cursor on
+(event_timestamp, entry_id) so deep pages cost the same as the first, only
+the columns a caller needs are read, and counts never materialise rows.
+"""
+
+import base64
+import binascii
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from ciris_engine.schemas.services.graph.audit import AuditQuery
+
+# Columns every page needs to build an audit entry
+SUMMARY_COLUMNS = (
+    "entry_id", "event_id", "event_timestamp", "event_type", "originator_id",
+    "actor", "event_summary", "previous_hash", "signature",
+)
+# Read only when the caller wants the decoded payload
+DETAIL_COLUMNS = SUMMARY_COLUMNS + ("event_payload",)
+
+
+def _db_timestamp(value: datetime) -> str:
+    """Render a datetime the way the writer stores event_timestamp (UTC isoformat)."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def encode_cursor(event_timestamp: str, entry_id: int) -> str:
+    """Opaque cursor pointing just past the given row."""
+    raw = f"{event_timestamp}|{entry_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Inverse of ``encode_cursor``; raises ValueError for malformed cursors."""
+    try:
+        event_timestamp, _, entry_id = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").rpartition("|")
+        return event_timestamp, int(entry_id)
+    except (binascii.Error, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid audit cursor: {cursor}") from e
+
+
+def build_filters(query: AuditQuery) -> Tuple[str, List[Any]]:
+    """WHERE clause (without keyset or paging) and its parameters."""
+    clauses: List[str] = []
+    params: List[Any] = []
+
+    if query.start_time:
+        clauses.append("event_timestamp >= ?")
+        params.append(_db_timestamp(query.start_time))
+    if query.end_time:
+        clauses.append("event_timestamp <= ?")
+        params.append(_db_timestamp(query.end_time))
+    if query.event_type:
+        clauses.append("event_type = ?")
+        params.append(query.event_type)
+    if query.actor:
+        clauses.append("actor = ?")
+        params.append(query.actor)
+    if query.entity_id:
+        clauses.append("originator_id = ?")
+        params.append(query.entity_id)
+    if query.search_text:
+        # event_summary is "<event_type> by <actor>"; LIKE is case-insensitive for ASCII
+        escaped = query.search_text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        clauses.append("event_summary LIKE ? ESCAPE '\\'")
+        params.append(f"%{escaped}%")
+
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def fetch_page(db_path: str, query: AuditQuery) -> Tuple[List[Dict[str, Any]], Optional[str], bool]:
+    """Fetch one page of rows, newest first unless ``order_desc`` is False.
+
+    Returns the rows, the cursor for the next page and whether more rows match.
+    """
+    where, params = build_filters(query)
+    direction = "DESC" if query.order_desc else "ASC"
+
+    if query.cursor:
+        cursor_timestamp, cursor_id = decode_cursor(query.cursor)
+        keyset = f"(event_timestamp, entry_id) {'<' if query.order_desc else '>'} (?, ?)"
+        where = f"{where} AND {keyset}" if where else f" WHERE {keyset}"
+        params.extend([cursor_timestamp, cursor_id])
+
+    columns = DETAIL_COLUMNS if query.include_details else SUMMARY_COLUMNS
+    sql = (
+        f"SELECT {', '.join(columns)} FROM audit_log{where} "  # nosec B608 - fixed columns, bound values
+        f"ORDER BY event_timestamp {direction}, entry_id {direction}"
+    )
+    if query.limit is not None:
+        # One extra row tells us whether another page exists
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([query.limit + 1, query.offset])
+    elif query.offset:
+        sql += " LIMIT -1 OFFSET ?"
+        params.append(query.offset)
+
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
+
+    has_more = query.limit is not None and len(rows) > query.limit
+    if has_more:
+        rows = rows[:query.limit]
+    next_cursor = encode_cursor(rows[-1]["event_timestamp"], rows[-1]["entry_id"]) if has_more else None
+    return rows, next_cursor, has_more
+
+
+def count_entries(db_path: str, query: AuditQuery) -> int:
+    """Number of rows matching the query's filters, ignoring paging."""
+    where, params = build_filters(query)
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(f"SELECT COUNT(*) FROM audit_log{where}", params).fetchone()  # nosec B608
+    finally:
+        conn.close()
+    return int(row[0]) if row else 0
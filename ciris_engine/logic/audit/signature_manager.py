@@ -11,17 +11,62 @@ import sqlite3
 import logging
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.primitives.asymmetric.types import PrivateKeyTypes, PublicKeyTypes
 from cryptography.exceptions import InvalidSignature
 
+from ciris_engine.logic.utils.crypto_executor import run_crypto
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 
 logger = logging.getLogger(__name__)
 
+# Public keys loaded inside signature-verification worker processes, by key ID
+_worker_public_keys: Dict[str, PublicKeyTypes] = {}
+
+
+def _verify_rsa_pss(public_key: rsa.RSAPublicKey, data: str, signature: str) -> None:
+    """Verify a base64 RSA-PSS/SHA-256 signature; raises InvalidSignature on mismatch."""
+    public_key.verify(
+        base64.b64decode(signature.encode('ascii')),
+        data.encode('utf-8'),
+        padding.PSS(
+            mgf=padding.MGF1(hashes.SHA256()),
+            salt_length=padding.PSS.MAX_LENGTH
+        ),
+        hashes.SHA256()
+    )
+
+
+def verify_signature_batch(
+    public_keys: Dict[str, str],
+    items: List[Tuple[int, str, str, str]]
+) -> List[int]:
+    """Verify (entry_id, entry_hash, signature, key_id) items against PEM public keys.
+
+    Module-level and dependent only on its arguments so it can run in a
+    process pool. Returns the entry IDs whose signature did not verify.
+    """
+    failed: List[int] = []
+    for entry_id, entry_hash, signature, key_id in items:
+        pem = public_keys.get(key_id)
+        if pem is None:
+            failed.append(entry_id)
+            continue
+        public_key = _worker_public_keys.get(key_id)
+        if public_key is None:
+            public_key = serialization.load_pem_public_key(pem.encode('ascii'))
+            _worker_public_keys[key_id] = public_key
+        try:
+            if not isinstance(public_key, rsa.RSAPublicKey):
+                raise InvalidSignature()
+            _verify_rsa_pss(public_key, entry_hash, signature)
+        except (InvalidSignature, ValueError):
+            failed.append(entry_id)
+    return failed
+
 class AuditSignatureManager:
     """Manages signing keys and signatures for audit entries"""
 
@@ -208,6 +253,10 @@ class AuditSignatureManager:
             logger.error(f"Failed to sign entry: {e}")
             raise
 
+    async def async_sign_entry(self, entry_hash: str) -> str:
+        """Sign an entry hash on the shared crypto executor."""
+        return await run_crypto("rsa_sign", self.sign_entry, entry_hash)
+
     def verify_signature(self, entry_hash: str, signature: str, key_id: Optional[str] = None) -> bool:
         """Verify a signature against an entry hash"""
         try:
@@ -227,18 +276,7 @@ class AuditSignatureManager:
                 logger.error("Only RSA keys are supported for verification")
                 return False
 
-            signature_bytes = base64.b64decode(signature.encode('ascii'))
-
-            public_key.verify(
-                signature_bytes,
-                entry_hash.encode('utf-8'),
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
-
+            _verify_rsa_pss(public_key, entry_hash, signature)
             return True
 
         except InvalidSignature:
@@ -340,6 +378,26 @@ class AuditSignatureManager:
         except sqlite3.Error as e:
             return {"error": f"Database error: {e}"}
 
+    def export_public_keys(self) -> Dict[str, str]:
+        """All registered public keys as PEM, by key ID, including the active key."""
+        keys: Dict[str, str] = {}
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                for key_id, public_key in conn.execute("SELECT key_id, public_key FROM audit_signing_keys"):
+                    keys[key_id] = public_key
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to load public keys: {e}")
+
+        if self._public_key and self._key_id:
+            keys[self._key_id] = self._public_key.public_bytes(
+                encoding=serialization.Encoding.PEM,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo
+            ).decode('ascii')
+        return keys
+
     @property
     def key_id(self) -> Optional[str]:
         """Get the current key ID"""
@@ -5,29 +5,68 @@ Provides comprehensive verification of audit log integrity including
 hash chains, digital signatures, and root anchoring.
 """
 
+import json
+import multiprocessing
+import os
 import sqlite3
 import logging
-from typing import List, Optional
-from .hash_chain import AuditHashChain
-from .signature_manager import AuditSignatureManager
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Union
+from .hash_chain import AuditHashChain, DEFAULT_CHUNK_SIZE
+from .merkle import MERKLE_SIGNATURE_PREFIX, merkle_root, root_signing_message, verify_inclusion
+from .signature_manager import AuditSignatureManager, verify_signature_batch
 from ciris_engine.protocols.services.lifecycle import TimeServiceProtocol
 from ciris_engine.schemas.audit.verification import (
     SignatureVerificationResult, CompleteVerificationResult,
     EntryVerificationResult, RangeVerificationResult,
-    VerificationReport, RootAnchorVerificationResult
+    VerificationReport, RootAnchorVerificationResult, VerificationProgress
 )
 
 logger = logging.getLogger(__name__)
 
+# Signature checks are farmed out to a process pool only when there is
+# enough work to amortize starting the workers
+DEFAULT_SIGNATURE_WORKERS = min(4, os.cpu_count() or 1)
+PROCESS_POOL_MIN_ENTRIES = 5000
+
+# Bound on bound parameters per IN (...) list when loading inclusion proofs
+_PROOF_BATCH_SIZE = 500
+
+_CHECKPOINT_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS audit_verification_checkpoint (
+        checkpoint_id INTEGER PRIMARY KEY CHECK (checkpoint_id = 1),
+        verified_sequence INTEGER NOT NULL,
+        verified_hash TEXT NOT NULL,
+        updated_at TEXT NOT NULL
+    )
+"""
+
+# (last sequence, last entry hash, chunk clean so far, entries, signature failures or pending job)
+_PendingChunk = Tuple[int, str, bool, int, Union[List[int], "Future[List[int]]"]]
+
 class AuditVerifier:
     """Verifies audit log integrity and detects tampering"""
 
-    def __init__(self, db_path: str, key_path: str, time_service: TimeServiceProtocol) -> None:
+    def __init__(
+        self,
+        db_path: str,
+        key_path: str,
+        time_service: TimeServiceProtocol,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        signature_workers: Optional[int] = None
+    ) -> None:
         self.db_path = db_path
         self.hash_chain = AuditHashChain(db_path)
         self.signature_manager = AuditSignatureManager(key_path, db_path, time_service)
         self._time_service = time_service
         self._initialized = False
+        self.chunk_size = chunk_size
+        self.signature_workers = DEFAULT_SIGNATURE_WORKERS if signature_workers is None else signature_workers
+        self._progress = VerificationProgress()
+        self._progress_lock = threading.Lock()
+        self._cancel_requested = threading.Event()
 
     def initialize(self) -> None:
         """Initialize the verifier components"""
@@ -39,17 +78,28 @@ class AuditVerifier:
         self._initialized = True
         logger.info("Audit verifier initialized")
 
-    def verify_complete_chain(self) -> CompleteVerificationResult:
-        """Perform complete verification of the entire audit chain"""
+    def verify_complete_chain(self, resume: bool = False) -> CompleteVerificationResult:
+        """Perform complete verification of the entire audit chain
+
+        Rows are streamed in chunks: hash links are checked in order while
+        per-entry signature checks run in a process pool, and each Merkle
+        root is checked once. The highest sequence verified clean is
+        checkpointed as the run goes. With ``resume=True`` verification
+        starts after that checkpoint, provided the checkpointed entry still
+        has the hash it had when it was verified; a run without ``resume``
+        re-verifies the whole chain.
+        """
         if not self._initialized:
             self.initialize()
 
         logger.info("Starting complete audit chain verification")
         start_time = self._time_service.now()
+        self._cancel_requested.clear()
 
         # Get chain summary
         summary = self.hash_chain.get_chain_summary()
         if summary.error:
+            self._update_progress(state="failed", completed_at=self._time_service.now())
             return CompleteVerificationResult(
                 valid=False,
                 entries_verified=0,
@@ -61,7 +111,7 @@ class AuditVerifier:
 
         total_entries = summary.total_entries
         if total_entries == 0:
-            return CompleteVerificationResult(
+            result = CompleteVerificationResult(
                 valid=True,
                 entries_verified=0,
                 hash_chain_valid=True,
@@ -69,38 +119,273 @@ class AuditVerifier:
                 verification_time_ms=0,
                 summary="Empty audit log"
             )
+            self._set_progress(VerificationProgress(
+                state="completed", started_at=start_time, completed_at=start_time,
+                percent_complete=100.0, result=result
+            ))
+            return result
+
+        start_seq, previous_hash, resumed_from = 1, "genesis", None
+        if resume:
+            checkpoint = self.get_checkpoint()
+            if checkpoint and self.hash_chain.get_entry_hash(checkpoint[0]) == checkpoint[1]:
+                resumed_from = checkpoint[0]
+                start_seq, previous_hash = resumed_from + 1, checkpoint[1]
+            elif checkpoint:
+                logger.warning(f"Verification checkpoint at sequence {checkpoint[0]} no longer matches the chain; verifying from genesis")
+
+        target_seq = summary.sequence_range[1] if summary.sequence_range else 0
+        self._set_progress(VerificationProgress(
+            state="running",
+            started_at=start_time,
+            start_sequence=start_seq,
+            current_sequence=start_seq - 1,
+            target_sequence=target_seq,
+            checkpoint_sequence=resumed_from or 0,
+            resumed=resumed_from is not None
+        ))
 
-        # Verify hash chain integrity
-        chain_result = self.hash_chain.verify_chain_integrity()
-
-        # Verify signatures
-        signature_result = self._verify_all_signatures()
+        try:
+            chain_errors, signature_errors, checkpoint_seq, entries_checked = self._stream_verify(
+                start_seq, previous_hash, target_seq, resumed_from or 0
+            )
+        except Exception as e:
+            logger.error(f"Streaming audit verification failed: {e}", exc_info=True)
+            self._update_progress(state="failed", completed_at=self._time_service.now())
+            return CompleteVerificationResult(
+                valid=False,
+                entries_verified=0,
+                hash_chain_valid=False,
+                signatures_valid=False,
+                verification_time_ms=int((self._time_service.now() - start_time).total_seconds() * 1000),
+                error=str(e),
+                resumed_from_sequence=resumed_from
+            )
 
         # Calculate verification time
         end_time = self._time_service.now()
         verification_time = int((end_time - start_time).total_seconds() * 1000)
 
+        if self._cancel_requested.is_set():
+            result = CompleteVerificationResult(
+                valid=False,
+                entries_verified=0,
+                hash_chain_valid=not chain_errors,
+                signatures_valid=not signature_errors,
+                verification_time_ms=verification_time,
+                hash_chain_errors=chain_errors,
+                signature_errors=signature_errors,
+                error="Verification cancelled",
+                resumed_from_sequence=resumed_from,
+                checkpoint_sequence=checkpoint_seq
+            )
+            self._update_progress(state="cancelled", completed_at=end_time, result=result)
+            logger.info(f"Audit verification cancelled; checkpoint at sequence {checkpoint_seq}")
+            return result
+
         # Combine results
-        overall_valid = chain_result.valid and signature_result.valid
+        overall_valid = not chain_errors and not signature_errors
 
         result = CompleteVerificationResult(
             valid=overall_valid,
-            entries_verified=total_entries,
-            hash_chain_valid=chain_result.valid,
-            signatures_valid=signature_result.valid,
+            entries_verified=entries_checked,
+            hash_chain_valid=not chain_errors,
+            signatures_valid=not signature_errors,
             verification_time_ms=verification_time,
-            hash_chain_errors=chain_result.errors,
-            signature_errors=signature_result.errors,
-            chain_summary=summary.model_dump() if summary else None
+            hash_chain_errors=chain_errors,
+            signature_errors=signature_errors,
+            chain_summary=summary.model_dump() if summary else None,
+            resumed_from_sequence=resumed_from,
+            checkpoint_sequence=checkpoint_seq
         )
+        self._update_progress(state="completed", completed_at=end_time, percent_complete=100.0, result=result)
 
         if overall_valid:
-            logger.info(f"Audit verification passed: {total_entries} entries in {verification_time}ms")
+            logger.info(f"Audit verification passed: {entries_checked} entries in {verification_time}ms")
         else:
-            logger.error(f"Audit verification FAILED: {len(chain_result.errors)} hash + {len(signature_result.errors)} signature errors")
+            logger.error(f"Audit verification FAILED: {len(chain_errors)} hash + {len(signature_errors)} signature errors")
 
         return result
 
+    def mark_started(self) -> None:
+        """Report a run as running before its worker thread has picked it up"""
+        self._set_progress(VerificationProgress(state="running", started_at=self._time_service.now()))
+
+    def cancel(self) -> None:
+        """Ask a running verification to stop after its current chunk; its checkpoint is kept"""
+        self._cancel_requested.set()
+
+    def get_progress(self) -> VerificationProgress:
+        """Snapshot of the current (or last) verification run"""
+        with self._progress_lock:
+            return self._progress.model_copy()
+
+    def _set_progress(self, progress: VerificationProgress) -> None:
+        with self._progress_lock:
+            self._progress = progress
+
+    def _update_progress(self, **fields: Any) -> None:
+        with self._progress_lock:
+            progress = self._progress.model_copy(update=fields)
+            span = progress.target_sequence - progress.start_sequence + 1
+            if progress.state == "running" and span > 0:
+                done = progress.current_sequence - progress.start_sequence + 1
+                progress.percent_complete = round(100.0 * max(0, min(done, span)) / span, 2)
+            self._progress = progress
+
+    def get_checkpoint(self) -> Optional[Tuple[int, str]]:
+        """The (sequence, entry hash) of the highest entry verified clean, if any"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                conn.execute(_CHECKPOINT_TABLE_SQL)
+                row = conn.execute(
+                    "SELECT verified_sequence, verified_hash FROM audit_verification_checkpoint WHERE checkpoint_id = 1"
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read verification checkpoint: {e}")
+            return None
+        return (row[0], row[1]) if row else None
+
+    def reset_checkpoint(self) -> None:
+        """Forget the verification checkpoint so the next resume starts at genesis"""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(_CHECKPOINT_TABLE_SQL)
+            conn.execute("DELETE FROM audit_verification_checkpoint")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _save_checkpoint(self, conn: sqlite3.Connection, sequence: int, entry_hash: str) -> None:
+        conn.execute("""
+            INSERT INTO audit_verification_checkpoint (checkpoint_id, verified_sequence, verified_hash, updated_at)
+            VALUES (1, ?, ?, ?)
+            ON CONFLICT(checkpoint_id) DO UPDATE SET
+                verified_sequence = excluded.verified_sequence,
+                verified_hash = excluded.verified_hash,
+                updated_at = excluded.updated_at
+        """, (sequence, entry_hash, self._time_service.now_iso()))
+        conn.commit()
+
+    def _stream_verify(
+        self,
+        start_seq: int,
+        previous_hash: str,
+        target_seq: int,
+        checkpoint_seq: int
+    ) -> Tuple[List[str], List[str], int, int]:
+        """Stream the chain from ``start_seq``.
+
+        Returns (hash errors, signature errors, checkpoint, entries checked in this pass).
+        """
+        chain_errors: List[str] = []
+        signature_errors: List[str] = []
+        # Root errors name their root, so this counts unverified entries per failed root
+        failed_roots: Dict[str, int] = {}
+        # Entries stream in sequence order, so only the root of the current batch is held
+        current_root_id: Optional[str] = None
+        root: Optional[sqlite3.Row] = None
+        root_error: Optional[str] = None
+        public_keys = self.signature_manager.export_public_keys()
+
+        workers = self.signature_workers
+        if workers <= 1 or target_seq - start_seq + 1 < PROCESS_POOL_MIN_ENTRIES:
+            workers = 0
+        # Spawned, not forked: this runs on a worker thread, and forking a
+        # threaded process can copy locks held by other threads
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) if workers else None
+        max_in_flight = max(2, 2 * workers)
+        pending: Deque[_PendingChunk] = deque()
+        clean = True
+        entries_checked = 0
+        signatures_checked = 0
+
+        state_conn = sqlite3.connect(self.db_path)
+        state_conn.execute(_CHECKPOINT_TABLE_SQL)
+        root_conn = sqlite3.connect(self.db_path)
+        root_conn.row_factory = sqlite3.Row
+        root_cursor = root_conn.cursor()
+
+        def resolve_oldest() -> None:
+            nonlocal clean, checkpoint_seq, signatures_checked
+            last_seq, last_hash, chunk_ok, count, job = pending.popleft()
+            failed = job.result() if isinstance(job, Future) else job
+            signature_errors.extend(f"Invalid signature for entry {entry_id}" for entry_id in failed)
+            signatures_checked += count
+            if clean and chunk_ok and not failed:
+                checkpoint_seq = last_seq
+                self._save_checkpoint(state_conn, last_seq, last_hash)
+            else:
+                clean = False
+            self._update_progress(
+                signatures_checked=signatures_checked,
+                checkpoint_sequence=checkpoint_seq,
+                errors_found=len(chain_errors) + len(signature_errors) + len(failed_roots)
+            )
+
+        try:
+            expected_seq = start_seq
+            for chunk in self.hash_chain.iter_entries(start_seq, chunk_size=self.chunk_size):
+                if self._cancel_requested.is_set():
+                    break
+                chunk_ok = True
+                items: List[Tuple[int, str, str, str]] = []
+                proofs = self._load_merkle_proofs(root_cursor, [
+                    entry["sequence_number"] for entry in chunk if entry["signature"].startswith(MERKLE_SIGNATURE_PREFIX)
+                ])
+                for entry in chunk:
+                    link_errors = self.hash_chain.check_link(entry, expected_seq, previous_hash)
+                    if link_errors:
+                        chain_errors.extend(link_errors)
+                        chunk_ok = False
+                    previous_hash = entry["entry_hash"]
+                    expected_seq += 1
+
+                    signature = entry["signature"]
+                    if signature.startswith(MERKLE_SIGNATURE_PREFIX):
+                        root_id = signature[len(MERKLE_SIGNATURE_PREFIX):]
+                        if root_id != current_root_id:
+                            current_root_id = root_id
+                            root = self._load_merkle_root(root_cursor, root_id)
+                            root_error = self._verify_merkle_root(root_cursor, root_id)
+                        if root_error is not None:
+                            failed_roots[root_error] = failed_roots.get(root_error, 0) + 1
+                            chunk_ok = False
+                        elif not self._merkle_entry_included(entry, root, proofs.get(entry["sequence_number"])):
+                            signature_errors.append(f"Invalid Merkle inclusion for entry {entry['entry_id']}")
+                            chunk_ok = False
+                    else:
+                        items.append((entry["entry_id"], entry["entry_hash"], signature, entry["signing_key_id"]))
+
+                job: Union[List[int], "Future[List[int]]"]
+                if pool and items:
+                    job = pool.submit(verify_signature_batch, public_keys, items)
+                else:
+                    job = verify_signature_batch(public_keys, items)
+                pending.append((chunk[-1]["sequence_number"], chunk[-1]["entry_hash"], chunk_ok, len(chunk), job))
+
+                entries_checked += len(chunk)
+                self._update_progress(current_sequence=chunk[-1]["sequence_number"], entries_checked=entries_checked)
+
+                while pending and (len(pending) > max_in_flight or not isinstance(pending[0][4], Future) or pending[0][4].done()):
+                    resolve_oldest()
+
+            while pending:
+                resolve_oldest()
+        finally:
+            if pool:
+                pool.shutdown(cancel_futures=True)
+            state_conn.close()
+            root_conn.close()
+
+        for error, count in failed_roots.items():
+            signature_errors.append(f"{error}: {count} entries unverified")
+
+        return chain_errors, signature_errors, checkpoint_seq, entries_checked
+
     def verify_entry(self, entry_id: int) -> EntryVerificationResult:
         """Verify a specific audit entry by ID"""
         if not self._initialized:
@@ -188,12 +473,15 @@ class AuditVerifier:
         if not hash_valid:
             errors.append(f"Entry hash mismatch: computed {computed_hash}, stored {entry['entry_hash']}")
 
-        # Verify signature
-        signature_valid = self.signature_manager.verify_signature(
-            entry["entry_hash"],
-            entry["signature"],
-            entry["signing_key_id"]
-        )
+        # Verify signature (directly, or via the signed Merkle root of its batch)
+        if entry["signature"].startswith(MERKLE_SIGNATURE_PREFIX):
+            signature_valid = self._verify_merkle_entry(entry)
+        else:
+            signature_valid = self.signature_manager.verify_signature(
+                entry["entry_hash"],
+                entry["signature"],
+                entry["signing_key_id"]
+            )
         if not signature_valid:
             errors.append(f"Invalid signature for entry {entry['entry_id']}")
 
@@ -214,43 +502,87 @@ class AuditVerifier:
 
     def _verify_all_signatures(self) -> SignatureVerificationResult:
         """Verify signatures for all entries in the audit log"""
+        return self._verify_signatures()
+
+    def _verify_signatures_in_range(self, start_seq: int, end_seq: int) -> SignatureVerificationResult:
+        """Verify signatures for entries in a specific sequence range"""
+        return self._verify_signatures(start_seq, end_seq)
+
+    def _verify_signatures(self, start_seq: Optional[int] = None, end_seq: Optional[int] = None) -> SignatureVerificationResult:
+        """Verify per-entry signatures, and each Merkle root once for batch-signed entries"""
+        range_label = f" (seq {start_seq}-{end_seq})" if start_seq is not None else ""
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
 
-            cursor.execute("""
-                SELECT entry_id, entry_hash, signature, signing_key_id
-                FROM audit_log
-                ORDER BY sequence_number
-            """)
-
-            entries = cursor.fetchall()
-            conn.close()
+            if start_seq is None:
+                cursor.execute("""
+                    SELECT entry_id, sequence_number, entry_hash, signature, signing_key_id
+                    FROM audit_log
+                    ORDER BY sequence_number
+                """)
+            else:
+                cursor.execute("""
+                    SELECT entry_id, sequence_number, entry_hash, signature, signing_key_id
+                    FROM audit_log
+                    WHERE sequence_number >= ? AND sequence_number <= ?
+                    ORDER BY sequence_number
+                """, (start_seq, end_seq))
 
             errors: List[str] = []
             verified_count = 0
+            entries_signed = 0
+            root_cursor = conn.cursor()
+            failed_roots: Dict[str, int] = {}
+            current_root_id: Optional[str] = None
+            root: Optional[sqlite3.Row] = None
+            root_error: Optional[str] = None
+
+            while True:
+                entries = cursor.fetchmany(self.chunk_size)
+                if not entries:
+                    break
+                entries_signed += len(entries)
+                merkle_entries = [entry for entry in entries if entry["signature"].startswith(MERKLE_SIGNATURE_PREFIX)]
+                proofs = self._load_merkle_proofs(root_cursor, [entry["sequence_number"] for entry in merkle_entries])
+                for entry in entries:
+                    if entry["signature"].startswith(MERKLE_SIGNATURE_PREFIX):
+                        root_id = entry["signature"][len(MERKLE_SIGNATURE_PREFIX):]
+                        if root_id != current_root_id:
+                            current_root_id = root_id
+                            root = self._load_merkle_root(root_cursor, root_id)
+                            root_error = self._verify_merkle_root(root_cursor, root_id)
+                        if root_error is not None:
+                            failed_roots[root_error] = failed_roots.get(root_error, 0) + 1
+                        elif self._merkle_entry_included(entry, root, proofs.get(entry["sequence_number"])):
+                            verified_count += 1
+                        else:
+                            errors.append(f"Invalid Merkle inclusion for entry {entry['entry_id']}{range_label}")
+                    elif self.signature_manager.verify_signature(
+                        entry["entry_hash"],
+                        entry["signature"],
+                        entry["signing_key_id"]
+                    ):
+                        verified_count += 1
+                    else:
+                        errors.append(f"Invalid signature for entry {entry['entry_id']}{range_label}")
+
+            for error, count in failed_roots.items():
+                errors.append(f"{error}: {count} entries unverified{range_label}")
 
-            for entry in entries:
-                if self.signature_manager.verify_signature(
-                    entry["entry_hash"],
-                    entry["signature"],
-                    entry["signing_key_id"]
-                ):
-                    verified_count += 1
-                else:
-                    errors.append(f"Invalid signature for entry {entry['entry_id']}")
+            conn.close()
 
             return SignatureVerificationResult(
                 valid=len(errors) == 0,
-                entries_signed=len(entries),
+                entries_signed=entries_signed,
                 entries_verified=verified_count,
                 errors=errors,
                 untrusted_keys=[]
             )
 
         except sqlite3.Error as e:
-            logger.error(f"Database error verifying signatures: {e}")
+            logger.error(f"Database error verifying signatures{range_label}: {e}")
             return SignatureVerificationResult(
                 valid=False,
                 entries_signed=0,
@@ -259,53 +591,102 @@ class AuditVerifier:
                 untrusted_keys=[]
             )
 
-    def _verify_signatures_in_range(self, start_seq: int, end_seq: int) -> SignatureVerificationResult:
-        """Verify signatures for entries in a specific sequence range"""
+    def _load_merkle_root(self, cursor: sqlite3.Cursor, root_id: Any) -> Optional[sqlite3.Row]:
+        cursor.execute("""
+            SELECT root_id, sequence_start, sequence_end, root_hash, signature, signing_key_id
+            FROM audit_roots
+            WHERE root_id = ?
+        """, (root_id,))
+        row: Optional[sqlite3.Row] = cursor.fetchone()
+        return row
+
+    def _verify_root_signature(self, root: sqlite3.Row) -> bool:
+        if not root["signature"]:
+            return False
+        return self.signature_manager.verify_signature(
+            root_signing_message(root["sequence_start"], root["sequence_end"], root["root_hash"]),
+            root["signature"],
+            root["signing_key_id"]
+        )
+
+    def _verify_merkle_root(self, cursor: sqlite3.Cursor, root_id: str) -> Optional[str]:
+        """Check one batch root: its signature, and that it matches the stored entry hashes.
+
+        Returns an error message, or None when the root is valid.
+        """
+        root = self._load_merkle_root(cursor, root_id)
+        if root is None:
+            return f"Merkle root {root_id} not found"
+        if not self._verify_root_signature(root):
+            return f"Invalid signature for Merkle root {root_id}"
+
+        cursor.execute("""
+            SELECT entry_hash FROM audit_log
+            WHERE sequence_number >= ? AND sequence_number <= ?
+            ORDER BY sequence_number
+        """, (root["sequence_start"], root["sequence_end"]))
+        leaves: Sequence[str] = [row[0] for row in cursor.fetchall()]
+
+        if len(leaves) != root["sequence_end"] - root["sequence_start"] + 1:
+            return f"Merkle root {root_id} covers missing entries"
+        try:
+            computed = merkle_root(leaves)
+        except ValueError:
+            return f"Merkle root {root_id} covers malformed entry hashes"
+        if computed != root["root_hash"]:
+            return f"Merkle root mismatch for root {root_id}"
+        return None
+
+    def _load_merkle_proofs(self, cursor: sqlite3.Cursor, sequences: Sequence[int]) -> Dict[int, Tuple[str, str]]:
+        """Stored (root id, proof JSON) for each of ``sequences`` that has a proof row"""
+        proofs: Dict[int, Tuple[str, str]] = {}
+        for start in range(0, len(sequences), _PROOF_BATCH_SIZE):
+            batch = list(sequences[start:start + _PROOF_BATCH_SIZE])
+            cursor.execute(
+                f"SELECT sequence_number, root_id, proof FROM audit_merkle_proofs "
+                f"WHERE sequence_number IN ({','.join('?' * len(batch))})",
+                batch
+            )
+            for sequence_number, root_id, proof in cursor.fetchall():
+                proofs[sequence_number] = (str(root_id), proof)
+        return proofs
+
+    def _merkle_entry_included(self, entry: Any, root: Optional[sqlite3.Row], proof_row: Optional[Tuple[str, str]]) -> bool:
+        """Whether a batch-signed entry lies in ``root``'s range and its stored proof leads to the root.
+
+        The root's own signature is checked separately; an entry pointing at
+        a validly signed root it is not part of must still fail here.
+        """
+        if root is None or proof_row is None:
+            return False
+        proof_root_id, proof_json = proof_row
+        if entry["signature"] != f"{MERKLE_SIGNATURE_PREFIX}{proof_root_id}" or str(root["root_id"]) != proof_root_id:
+            return False
+        if not root["sequence_start"] <= entry["sequence_number"] <= root["sequence_end"]:
+            return False
+        try:
+            proof = [(sibling, bool(is_left)) for sibling, is_left in json.loads(proof_json)]
+        except (TypeError, ValueError):
+            return False
+        return verify_inclusion(entry["entry_hash"], proof, root["root_hash"])
+
+    def _verify_merkle_entry(self, entry: Dict[str, Any]) -> bool:
+        """Verify one batch-signed entry with its stored inclusion proof"""
+        root_id = entry["signature"][len(MERKLE_SIGNATURE_PREFIX):]
         try:
             conn = sqlite3.connect(self.db_path)
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-
-            cursor.execute("""
-                SELECT entry_id, entry_hash, signature, signing_key_id
-                FROM audit_log
-                WHERE sequence_number >= ? AND sequence_number <= ?
-                ORDER BY sequence_number
-            """, (start_seq, end_seq))
-
-            entries = cursor.fetchall()
-            conn.close()
-
-            errors: List[str] = []
-            verified_count = 0
-
-            for entry in entries:
-                if self.signature_manager.verify_signature(
-                    entry["entry_hash"],
-                    entry["signature"],
-                    entry["signing_key_id"]
-                ):
-                    verified_count += 1
-                else:
-                    errors.append(f"Invalid signature for entry {entry['entry_id']} (seq {start_seq}-{end_seq})")
-
-            return SignatureVerificationResult(
-                valid=len(errors) == 0,
-                entries_signed=len(entries),
-                entries_verified=verified_count,
-                errors=errors,
-                untrusted_keys=[]
-            )
-
+            try:
+                proof_row = self._load_merkle_proofs(cursor, [entry["sequence_number"]]).get(entry["sequence_number"])
+                root = self._load_merkle_root(cursor, root_id)
+            finally:
+                conn.close()
         except sqlite3.Error as e:
-            logger.error(f"Database error verifying range signatures: {e}")
-            return SignatureVerificationResult(
-                valid=False,
-                entries_signed=0,
-                entries_verified=0,
-                errors=[f"Database error: {e}"],
-                untrusted_keys=[]
-            )
+            logger.error(f"Database error loading Merkle proof for entry {entry.get('entry_id')}: {e}")
+            return False
+
+        return self._merkle_entry_included(entry, root, proof_row) and root is not None and self._verify_root_signature(root)
 
     def get_verification_report(self) -> VerificationReport:
         """Generate a comprehensive verification report"""
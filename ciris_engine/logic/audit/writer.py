@@ -0,0 +1,344 @@
+"""
+Group-commit writer for the signed audit hash chain.
+
+A single writer owns the chain tip in memory, takes entries from a queue,
+hashes them strictly in arrival order, signs them on the shared crypto
+executor and commits them to audit_log in batches, one transaction per
+batch. Durability is bounded by
+two knobs: a batch is flushed as soon as ``flush_batch_size`` entries are
+queued, or ``flush_interval_ms`` after the first entry of the batch arrived,
+whichever comes first.
+
+In ``merkle`` signing mode each batch is additionally summarised by a
+Merkle tree over its entry hashes: only the root is signed (into
+audit_roots) and every entry stores its inclusion proof, so a batch costs
+one signature instead of one per entry.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ciris_engine.logic.audit.hash_chain import AuditHashChain
+from ciris_engine.logic.audit.merkle import (
+    MERKLE_SIGNATURE_PREFIX, build_tree, inclusion_proof, root_signing_message
+)
+from ciris_engine.logic.audit.signature_manager import AuditSignatureManager
+from ciris_engine.schemas.audit.hash_chain import AuditWriterStats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_BATCH_SIZE = 64
+DEFAULT_FLUSH_INTERVAL_MS = 50.0
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+SIGNING_MODE_ENTRY = "entry"
+SIGNING_MODE_MERKLE = "merkle"
+SIGNING_MODES = (SIGNING_MODE_ENTRY, SIGNING_MODE_MERKLE)
+
+_INSERT_SQL = """
+    INSERT INTO audit_log
+    (event_id, event_timestamp, event_type, originator_id, actor,
+     event_summary, event_payload, sequence_number, previous_hash,
+     entry_hash, signature, signing_key_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_ROOT_SQL = """
+    INSERT INTO audit_roots
+    (sequence_start, sequence_end, root_hash, timestamp, signature, signing_key_id)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_INSERT_PROOF_SQL = """
+    INSERT INTO audit_merkle_proofs (sequence_number, root_id, leaf_index, proof)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+@dataclass
+class _QueueItem:
+    """An entry to append, or a control marker when ``entry`` is None."""
+    entry: Optional[Dict[str, Any]]
+    future: Optional["asyncio.Future[Any]"] = None
+    stop: bool = False
+
+
+class AuditChainWriter:
+    """Single-owner, batching writer for the audit hash chain"""
+
+    def __init__(
+        self,
+        db_path: str,
+        hash_chain: AuditHashChain,
+        signature_manager: AuditSignatureManager,
+        flush_batch_size: int = DEFAULT_FLUSH_BATCH_SIZE,
+        flush_interval_ms: float = DEFAULT_FLUSH_INTERVAL_MS,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        signing_mode: str = SIGNING_MODE_ENTRY,
+    ) -> None:
+        if signing_mode not in SIGNING_MODES:
+            raise ValueError(f"Unknown audit signing mode: {signing_mode}")
+        if flush_batch_size < 1:
+            raise ValueError("flush_batch_size must be at least 1")
+        if flush_interval_ms < 0:
+            raise ValueError("flush_interval_ms must not be negative")
+
+        self.db_path = db_path
+        self.hash_chain = hash_chain
+        self.signature_manager = signature_manager
+        self.flush_batch_size = flush_batch_size
+        self.flush_interval_ms = flush_interval_ms
+        self.signing_mode = signing_mode
+        self._max_queue_size = max_queue_size
+
+        self._queue: Optional["asyncio.Queue[_QueueItem]"] = None
+        self._task: Optional[asyncio.Task[None]] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+        self._entries_written = 0
+        self._batches_committed = 0
+        self._failed_entries = 0
+        self._largest_batch = 0
+        self._last_commit_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """Whether the writer task is accepting entries."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Load the chain tip once and start the background writer task."""
+        if self.running:
+            return
+
+        def _open() -> sqlite3.Connection:
+            self.hash_chain.initialize(force=True)
+            return sqlite3.connect(self.db_path, check_same_thread=False)
+
+        self._conn = await asyncio.to_thread(_open)
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._task = asyncio.create_task(self._run(), name="audit_chain_writer")
+        sequence, _ = self.hash_chain.tip
+        logger.info(
+            f"Audit chain writer started at sequence {sequence} in {self.signing_mode} signing mode "
+            f"(flush every {self.flush_batch_size} entries or {self.flush_interval_ms}ms)"
+        )
+
+    async def stop(self) -> None:
+        """Commit everything still queued, then stop the writer."""
+        if self.running and self._queue is not None:
+            await self._queue.put(_QueueItem(entry=None, stop=True))
+            if self._task:
+                await self._task
+        self._task = None
+
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+
+    async def submit(self, entry: Dict[str, Any], wait: bool = False) -> Optional[Dict[str, Any]]:
+        """Queue an entry for the chain.
+
+        The entry needs event_id, event_timestamp, event_type, originator_id,
+        event_summary and event_payload, and may carry the actor. With ``wait=True`` this returns once
+        the entry's batch is committed, with the chain fields filled in;
+        otherwise it returns as soon as the entry is queued.
+        """
+        if not self.running or self._queue is None:
+            raise RuntimeError("Audit chain writer is not running")
+
+        future: Optional["asyncio.Future[Any]"] = None
+        if wait:
+            future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_QueueItem(entry=entry, future=future))
+        if future is None:
+            return None
+        result: Dict[str, Any] = await future
+        return result
+
+    async def flush(self) -> None:
+        """Wait until every entry queued before this call is committed."""
+        if not self.running or self._queue is None:
+            return
+        future: "asyncio.Future[Any]" = asyncio.get_running_loop().create_future()
+        await self._queue.put(_QueueItem(entry=None, future=future))
+        await future
+
+    def get_stats(self) -> AuditWriterStats:
+        """Snapshot of writer throughput counters."""
+        return AuditWriterStats(
+            running=self.running,
+            queue_depth=self._queue.qsize() if self._queue else 0,
+            entries_written=self._entries_written,
+            batches_committed=self._batches_committed,
+            failed_entries=self._failed_entries,
+            largest_batch=self._largest_batch,
+            average_batch_size=(
+                self._entries_written / self._batches_committed if self._batches_committed else 0.0
+            ),
+            last_commit_ms=self._last_commit_ms,
+            flush_batch_size=self.flush_batch_size,
+            flush_interval_ms=self.flush_interval_ms,
+            signing_mode=self.signing_mode,
+        )
+
+    async def _run(self) -> None:
+        """Collect batches from the queue and commit them in order."""
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        interval = self.flush_interval_ms / 1000.0
+
+        while True:
+            item = await self._queue.get()
+            batch: List[_QueueItem] = []
+            markers: List[_QueueItem] = []
+            stopping = False
+
+            deadline = loop.time() + interval
+            waiting = False
+            while True:
+                if item.entry is None:
+                    # Control markers close the batch so callers see a durable prefix
+                    markers.append(item)
+                    stopping = item.stop
+                    break
+                batch.append(item)
+                waiting = waiting or item.future is not None
+                if len(batch) >= self.flush_batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                if waiting:
+                    # A caller is blocked on this batch: commit what has queued
+                    # rather than holding it for the interval
+                    break
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+            if batch:
+                await self._commit(batch)
+            for marker in markers:
+                if marker.future and not marker.future.done():
+                    marker.future.set_result(None)
+            if stopping:
+                return
+
+    async def _commit(self, batch: List[_QueueItem]) -> None:
+        """Chain, sign and insert one batch.
+
+        Entries are chained in order on the event loop (hashing is cheap),
+        signed on the shared crypto executor and inserted in one transaction
+        in a worker thread. On any failure the in-memory tip is restored, so
+        the next batch links onto the last committed entry.
+        """
+        entries = [item.entry for item in batch if item.entry is not None]
+        started = time.perf_counter()
+        tip_sequence, tip_hash = self.hash_chain.tip
+        try:
+            key_id = self.signature_manager.key_id or "unknown"
+            for entry in entries:
+                self.hash_chain.link_entry(entry)
+                entry["signing_key_id"] = key_id
+
+            if self.signing_mode == SIGNING_MODE_MERKLE:
+                levels = build_tree([entry["entry_hash"] for entry in entries])
+                root_hash = levels[-1][0].hex()
+                root_signature = await self.signature_manager.async_sign_entry(root_signing_message(
+                    entries[0]["sequence_number"], entries[-1]["sequence_number"], root_hash
+                ))
+                await asyncio.to_thread(
+                    self._insert_merkle_batch, entries, key_id, levels, root_hash, root_signature
+                )
+            else:
+                signatures = await asyncio.gather(*(
+                    self.signature_manager.async_sign_entry(entry["entry_hash"]) for entry in entries
+                ))
+                for entry, signature in zip(entries, signatures):
+                    entry["signature"] = signature
+                await asyncio.to_thread(self._insert_batch, entries)
+        except Exception as e:
+            self.hash_chain.reset_tip(tip_sequence, tip_hash)
+            self._failed_entries += len(entries)
+            logger.error(f"Failed to commit {len(entries)} audit entries to hash chain: {e}", exc_info=True)
+            for item in batch:
+                if item.future and not item.future.done():
+                    item.future.set_exception(e)
+            return
+
+        self._last_commit_ms = (time.perf_counter() - started) * 1000
+        self._entries_written += len(entries)
+        self._batches_committed += 1
+        self._largest_batch = max(self._largest_batch, len(entries))
+        for item in batch:
+            if item.future and not item.future.done():
+                item.future.set_result(item.entry)
+
+    def _insert_batch(self, entries: List[Dict[str, Any]]) -> None:
+        """Insert chained, signed entries in one transaction."""
+        if not self._conn:
+            raise RuntimeError("Database connection not available")
+        with self._conn:
+            self._conn.executemany(_INSERT_SQL, [self._row(entry) for entry in entries])
+
+    def _insert_merkle_batch(
+        self,
+        entries: List[Dict[str, Any]],
+        key_id: str,
+        levels: List[List[bytes]],
+        root_hash: str,
+        root_signature: str,
+    ) -> None:
+        """Store the signed batch root, the entries and their inclusion proofs in one transaction."""
+        if not self._conn:
+            raise RuntimeError("Database connection not available")
+        with self._conn:
+            cursor = self._conn.execute(_INSERT_ROOT_SQL, (
+                entries[0]["sequence_number"],
+                entries[-1]["sequence_number"],
+                root_hash,
+                entries[-1]["event_timestamp"],
+                root_signature,
+                key_id,
+            ))
+            root_id = cursor.lastrowid
+
+            proofs: List[Tuple[Any, ...]] = []
+            for index, entry in enumerate(entries):
+                proof = inclusion_proof(levels, index)
+                entry["signature"] = f"{MERKLE_SIGNATURE_PREFIX}{root_id}"
+                entry["merkle_root_id"] = root_id
+                entry["merkle_proof"] = proof
+                proofs.append((entry["sequence_number"], root_id, index, json.dumps(proof)))
+
+            self._conn.executemany(_INSERT_SQL, [self._row(entry) for entry in entries])
+            self._conn.executemany(_INSERT_PROOF_SQL, proofs)
+
+    @staticmethod
+    def _row(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (
+            entry["event_id"],
+            entry["event_timestamp"],
+            entry["event_type"],
+            entry["originator_id"],
+            entry.get("actor"),
+            entry.get("event_summary"),
+            entry.get("event_payload", ""),
+            entry["sequence_number"],
+            entry["previous_hash"],
+            entry["entry_hash"],
+            entry["signature"],
+            entry["signing_key_id"],
+        )
@@ -4,7 +4,7 @@ Base message bus implementation
 
 import asyncio
 import logging
-from typing import Generic, List, Optional, TypeVar
+from typing import Awaitable, Generic, List, Optional, TypeVar
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
@@ -12,6 +12,7 @@ from datetime import datetime
 from ciris_engine.schemas.runtime.enums import ServiceType
 from ciris_engine.logic.registries.base import ServiceRegistry
 from ciris_engine.protocols.services import Service
+from ciris_engine.logic.telemetry.latency import record_call
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,7 @@ class BusMessage:
 
 # Define the service type variable
 ServiceT = TypeVar('ServiceT', bound=Service)
+T = TypeVar('T')
 
 class BaseBus(ABC, Generic[ServiceT]):
     """
@@ -144,6 +146,10 @@ class BaseBus(ABC, Generic[ServiceT]):
         # Trust the registry returns the right type
         return service
 
+    async def _dispatch(self, service: object, call: Awaitable[T]) -> T:
+        """Await a provider call, recording its latency under ("service", <provider class>)"""
+        return await record_call("service", type(service).__name__, call)
+
     def get_queue_size(self) -> int:
         """Get current queue size"""
         return self._queue.qsize()
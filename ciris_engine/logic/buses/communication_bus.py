@@ -16,6 +16,7 @@ from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.schemas.runtime.enums import ServiceType
 from ciris_engine.logic.registries.base import Priority, ServiceProvider
 from .base_bus import BaseBus, BusMessage
+from ciris_engine.logic.telemetry.latency import timed
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +93,7 @@ class CommunicationBus(BaseBus[CommunicationService]):
         logger.warning("No communication adapter has a home channel configured")
         return None
 
+    @timed("communication_bus", "send_message")
     async def send_message(
         self,
         channel_id: Optional[str],
@@ -118,6 +120,7 @@ class CommunicationBus(BaseBus[CommunicationService]):
             logger.debug(f"Queued send_message for channel {channel_id}")
         return success
 
+    @timed("communication_bus", "send_message_sync")
     async def send_message_sync(
         self,
         channel_id: Optional[str],
@@ -180,12 +183,13 @@ class CommunicationBus(BaseBus[CommunicationService]):
             return False
 
         try:
-            result = await service.send_message(resolved_channel_id, content)
+            result = await self._dispatch(service, service.send_message(resolved_channel_id, content))
             return bool(result)
         except Exception as e:
             logger.error(f"Failed to send message: {e}", exc_info=True)
             return False
 
+    @timed("communication_bus", "fetch_messages")
     async def fetch_messages(
         self,
         channel_id: str,
@@ -207,7 +211,7 @@ class CommunicationBus(BaseBus[CommunicationService]):
             return []
 
         try:
-            messages = await service.fetch_messages(channel_id, limit=limit)
+            messages = await self._dispatch(service, service.fetch_messages(channel_id, limit=limit))
             if not messages:
                 return []
             
@@ -287,10 +291,10 @@ class CommunicationBus(BaseBus[CommunicationService]):
             )
 
         # Send the message
-        success = await service.send_message(
+        success = await self._dispatch(service, service.send_message(
             resolved_channel_id,
             request.content
-        )
+        ))
 
         if success:
             logger.debug(
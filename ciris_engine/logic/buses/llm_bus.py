@@ -10,7 +10,7 @@ from typing import Optional, List, Type, Tuple, Any, TYPE_CHECKING, cast
 if TYPE_CHECKING:
     from ciris_engine.logic.registries.base import ServiceRegistry
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from collections import defaultdict
 
@@ -24,6 +24,7 @@ from ciris_engine.protocols.services.runtime.llm import MessageDict
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.protocols.services.graph.telemetry import TelemetryServiceProtocol
 from .base_bus import BaseBus, BusMessage
+from ciris_engine.logic.telemetry.latency import LatencyHistogram, latency_registry
 from ciris_engine.logic.registries.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
 
 logger = logging.getLogger(__name__)
@@ -44,6 +45,7 @@ class ServiceMetrics:
     last_request_time: Optional[datetime] = None
     last_failure_time: Optional[datetime] = None
     consecutive_failures: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
 
     @property
     def average_latency_ms(self) -> float:
@@ -364,8 +366,11 @@ class LLMBus(BaseBus[LLMService]):
     def _record_success(self, service_name: str, latency_ms: float) -> None:
         """Record successful call metrics"""
         metrics = self.service_metrics[service_name]
+        if not metrics.latency.count:
+            latency_registry.attach("llm", service_name, metrics.latency)
         metrics.total_requests += 1
         metrics.total_latency_ms += latency_ms
+        metrics.latency.record(latency_ms)
         metrics.last_request_time = self._time_service.now()
         metrics.consecutive_failures = 0
 
@@ -467,12 +472,16 @@ class LLMBus(BaseBus[LLMService]):
 
         for service_name, metrics in self.service_metrics.items():
             circuit_breaker = self.circuit_breakers.get(service_name)
+            latency = metrics.latency.summary()
 
             stats[service_name] = {
                 "total_requests": metrics.total_requests,
                 "failed_requests": metrics.failed_requests,
                 "failure_rate": f"{metrics.failure_rate * 100:.2f}%",
                 "average_latency_ms": f"{metrics.average_latency_ms:.2f}",
+                "p50_latency_ms": f"{latency.p50_ms:.2f}",
+                "p95_latency_ms": f"{latency.p95_ms:.2f}",
+                "p99_latency_ms": f"{latency.p99_ms:.2f}",
                 "consecutive_failures": metrics.consecutive_failures,
                 "circuit_breaker_state": circuit_breaker.state if circuit_breaker else "none",
                 "last_request": metrics.last_request_time.isoformat() if metrics.last_request_time else None,
@@ -18,6 +18,7 @@ from ciris_engine.schemas.services.graph.memory import MemorySearchFilter
 from ciris_engine.protocols.services import MemoryService
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from .base_bus import BaseBus, BusMessage
+from ciris_engine.logic.telemetry.latency import timed
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +55,7 @@ class MemoryBus(BaseBus[MemoryService]):
         self._time_service = time_service
         self._audit_service = audit_service
 
+    @timed("memory_bus", "memorize")
     async def memorize(
         self,
         node: GraphNode,
@@ -86,7 +88,7 @@ class MemoryBus(BaseBus[MemoryService]):
             )
 
         try:
-            result = await service.memorize(node)
+            result = await self._dispatch(service, service.memorize(node))
             # Protocol guarantees MemoryOpResult return
             return result
         except Exception as e:
@@ -97,6 +99,7 @@ class MemoryBus(BaseBus[MemoryService]):
                 error=str(e)
             )
 
+    @timed("memory_bus", "recall")
     async def recall(
         self,
         recall_query: MemoryQuery,
@@ -123,12 +126,13 @@ class MemoryBus(BaseBus[MemoryService]):
             return []
 
         try:
-            nodes = await service.recall(recall_query)
+            nodes = await self._dispatch(service, service.recall(recall_query))
             return nodes if nodes else []
         except Exception as e:
             logger.error(f"Failed to recall nodes: {e}", exc_info=True)
             return []
 
+    @timed("memory_bus", "forget")
     async def forget(
         self,
         node: GraphNode,
@@ -159,7 +163,7 @@ class MemoryBus(BaseBus[MemoryService]):
             )
 
         try:
-            result = await service.forget(node)
+            result = await self._dispatch(service, service.forget(node))
             # Protocol guarantees MemoryOpResult return
             return result
         except Exception as e:
@@ -170,6 +174,7 @@ class MemoryBus(BaseBus[MemoryService]):
                 error=str(e)
             )
 
+    @timed("memory_bus", "search_memories")
     async def search_memories(
         self,
         query: str,
@@ -204,7 +209,7 @@ class MemoryBus(BaseBus[MemoryService]):
                 limit=limit
             )
             
-            nodes = await service.search(query, search_filter)
+            nodes = await self._dispatch(service, service.search(query, search_filter))
             
             # Convert GraphNodes to MemorySearchResults
             results = []
@@ -240,6 +245,7 @@ class MemoryBus(BaseBus[MemoryService]):
             logger.error(f"Failed to search memories: {e}", exc_info=True)
             return []
     
+    @timed("memory_bus", "search")
     async def search(
         self,
         query: str,
@@ -257,11 +263,12 @@ class MemoryBus(BaseBus[MemoryService]):
             return []
 
         try:
-            return await service.search(query, filters)
+            return await self._dispatch(service, service.search(query, filters))
         except Exception as e:
             logger.error(f"Failed to search graph nodes: {e}", exc_info=True)
             return []
 
+    @timed("memory_bus", "recall_timeseries")
     async def recall_timeseries(
         self,
         scope: str = "default",
@@ -282,7 +289,7 @@ class MemoryBus(BaseBus[MemoryService]):
             return []
 
         try:
-            return await service.recall_timeseries(scope, hours, correlation_types)
+            return await self._dispatch(service, service.recall_timeseries(scope, hours, correlation_types))
         except Exception as e:
             logger.error(f"Failed to recall timeseries: {e}", exc_info=True)
             return []
@@ -309,7 +316,7 @@ class MemoryBus(BaseBus[MemoryService]):
             )
 
         try:
-            return await service.memorize_metric(metric_name, value, tags, scope)
+            return await self._dispatch(service, service.memorize_metric(metric_name, value, tags, scope))
         except Exception as e:
             logger.error(f"Failed to memorize metric: {e}", exc_info=True)
             return MemoryOpResult(
@@ -340,7 +347,7 @@ class MemoryBus(BaseBus[MemoryService]):
             )
 
         try:
-            return await service.memorize_log(log_message, log_level, tags, scope)
+            return await self._dispatch(service, service.memorize_log(log_message, log_level, tags, scope))
         except Exception as e:
             logger.error(f"Failed to memorize log: {e}", exc_info=True)
             return MemoryOpResult(
@@ -364,7 +371,7 @@ class MemoryBus(BaseBus[MemoryService]):
             return ""
 
         try:
-            return await service.export_identity_context()
+            return await self._dispatch(service, service.export_identity_context())
         except Exception as e:
             logger.error(f"Failed to export identity context: {e}", exc_info=True)
             return ""
@@ -2,15 +2,20 @@
 Tool message bus - handles all tool service operations
 """
 
+import asyncio
+import inspect
 import logging
 import uuid
-from typing import TYPE_CHECKING, List, Optional, cast, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, cast, Any
 
 from ciris_engine.schemas.runtime.enums import ServiceType
-from ciris_engine.schemas.adapters.tools import ToolExecutionStatus, ToolInfo, ToolExecutionResult
+from ciris_engine.schemas.adapters.tools import (
+    ToolCatalog, ToolCatalogEntry, ToolExecutionStatus, ToolInfo, ToolExecutionResult
+)
 from ciris_engine.protocols.services import ToolService
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from .base_bus import BaseBus, BusMessage
+from ciris_engine.logic.telemetry.latency import timed
 
 if TYPE_CHECKING:
     from ciris_engine.logic.registries.base import ServiceRegistry
@@ -28,6 +33,10 @@ class ToolBus(BaseBus[ToolService]):
     - get_tool_info
     - get_all_tool_info
     - validate_parameters
+
+    It also keeps a catalog of every registered tool. Tool catalogs only
+    change when adapters load or unload, so the catalog is built once and
+    reused until invalidate_catalog() is called.
     """
 
     def __init__(self, service_registry: "ServiceRegistry", time_service: TimeServiceProtocol):
@@ -36,7 +45,123 @@ class ToolBus(BaseBus[ToolService]):
             service_registry=service_registry
         )
         self._time_service = time_service
+        self._catalog: Optional[ToolCatalog] = None
+        self._catalog_version = 0
+        self._catalog_refresh: Optional[Tuple[int, "asyncio.Future[ToolCatalog]"]] = None
+
+    @property
+    def catalog_version(self) -> int:
+        """Bumped every time the catalog is invalidated."""
+        return self._catalog_version
+
+    def invalidate_catalog(self, reason: str = "") -> None:
+        """Drop the cached catalog; the next reader rebuilds it."""
+        self._catalog_version += 1
+        self._catalog = None
+        logger.debug(f"Tool catalog invalidated (version {self._catalog_version}): {reason}")
+
+    async def get_catalog(self) -> ToolCatalog:
+        """Return the cached tool catalog, building it if needed."""
+        if self._catalog is not None:
+            return self._catalog
+        return await self.refresh_catalog()
+
+    async def refresh_catalog(self) -> ToolCatalog:
+        """Rebuild the catalog from every registered tool service.
+
+        Concurrent callers share one rebuild. A rebuild that races with an
+        invalidation is returned to its callers but not cached.
+        """
+        version = self._catalog_version
+        if self._catalog_refresh is None or self._catalog_refresh[0] != version:
+            future = asyncio.ensure_future(self._build_catalog(version))
+            self._catalog_refresh = (version, future)
 
+            def _done(done: "asyncio.Future[ToolCatalog]") -> None:
+                if self._catalog_refresh is not None and self._catalog_refresh[1] is done:
+                    self._catalog_refresh = None
+                if not done.cancelled() and done.exception() is None and done.result().version == self._catalog_version:
+                    self._catalog = done.result()
+
+            future.add_done_callback(_done)
+        return await asyncio.shield(self._catalog_refresh[1])
+
+    def get_tools_prompt_fragment(self) -> str:
+        """Pre-rendered tool list for prompts; empty until the catalog is built."""
+        return self._catalog.prompt_fragment if self._catalog is not None else ""
+
+    async def _build_catalog(self, version: int) -> ToolCatalog:
+        tool_services = [
+            service for service in self.service_registry.get_services_by_type(ServiceType.TOOL)
+            if hasattr(service, 'get_available_tools')
+        ]
+        results = await asyncio.gather(
+            *(self._catalog_entries(service) for service in tool_services), return_exceptions=True
+        )
+        entries: List[ToolCatalogEntry] = []
+        for service, service_entries in zip(tool_services, results):
+            if isinstance(service_entries, BaseException):
+                logger.warning(f"Failed to get tools from {type(service).__name__}: {service_entries}")
+                continue
+            entries.extend(service_entries)
+        entries.sort(key=lambda entry: (entry.adapter_id, entry.name))
+
+        logger.info(f"Built tool catalog version {version} with {len(entries)} tools from {len(tool_services)} services")
+        return ToolCatalog(
+            version=version,
+            entries=entries,
+            prompt_fragment=self._render_prompt_fragment(entries),
+            built_at=self._time_service.now(),
+        )
+
+    @staticmethod
+    async def _catalog_entries(service: Any) -> List[ToolCatalogEntry]:
+        async def _call(method: Any, *args: Any) -> Any:
+            result = method(*args)
+            return await result if inspect.isawaitable(result) else result
+
+        adapter_id = getattr(service, 'adapter_id', 'unknown')
+        tool_names: List[str] = await _call(service.get_available_tools)
+
+        # One get_all_tool_info call where available, per-tool lookups otherwise
+        infos: Dict[str, ToolInfo] = {}
+        if hasattr(service, 'get_all_tool_info'):
+            try:
+                infos = {info.name: info for info in await _call(service.get_all_tool_info)}
+            except Exception as e:
+                logger.debug(f"get_all_tool_info failed for {type(service).__name__}: {e}")
+        missing = [name for name in tool_names if name not in infos]
+        if missing and hasattr(service, 'get_tool_info'):
+            lookups = await asyncio.gather(
+                *(_call(service.get_tool_info, name) for name in missing), return_exceptions=True
+            )
+            for name, info in zip(missing, lookups):
+                if isinstance(info, ToolInfo):
+                    infos[name] = info
+
+        return [
+            ToolCatalogEntry(
+                name=name,
+                adapter_id=adapter_id,
+                description=infos[name].description if name in infos else "",
+                info=infos.get(name),
+            )
+            for name in tool_names
+        ]
+
+    @staticmethod
+    def _render_prompt_fragment(entries: List[ToolCatalogEntry]) -> str:
+        if not entries:
+            return ""
+        lines = ["", "Available Tools (use with the TOOL action):"]
+        for entry in entries:
+            line = f"  - {entry.name} [{entry.adapter_id}]"
+            if entry.description:
+                line += f": {entry.description}"
+            lines.append(line)
+        return "\n".join(lines)
+
+    @timed("tool_bus", "execute_tool")
     async def execute_tool(
         self,
         tool_name: str,
@@ -120,7 +245,9 @@ class ToolBus(BaseBus[ToolService]):
         # Step 5: Execute the tool
         try:
             logger.debug(f"Executing tool '{tool_name}' with {type(selected_service).__name__}")
-            result: ToolExecutionResult = await selected_service.execute_tool(tool_name, parameters)
+            result: ToolExecutionResult = await self._dispatch(
+                selected_service, selected_service.execute_tool(tool_name, parameters)
+            )
             return result
         except Exception as e:
             logger.error(f"Failed to execute tool {tool_name}: {e}", exc_info=True)
@@ -10,6 +10,7 @@ from ciris_engine.schemas.services.context import GuidanceContext, DeferralConte
 from ciris_engine.protocols.services import WiseAuthorityService
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from .base_bus import BaseBus, BusMessage
+from ciris_engine.logic.telemetry.latency import timed
 
 if TYPE_CHECKING:
     from ciris_engine.logic.registries.base import ServiceRegistry
@@ -32,6 +33,7 @@ class WiseBus(BaseBus[WiseAuthorityService]):
         )
         self._time_service = time_service
 
+    @timed("wise_bus", "send_deferral")
     async def send_deferral(
         self,
         context: DeferralContext,
@@ -104,7 +106,7 @@ class WiseBus(BaseBus[WiseAuthorityService]):
             logger.info(f"Broadcasting deferral to {len(services)} wise authority service(s)")
             for service in services:
                 try:
-                    result = await service.send_deferral(deferral_request)
+                    result = await self._dispatch(service, service.send_deferral(deferral_request))
                     if result:
                         any_success = True
                         logger.debug(f"Successfully sent deferral to WA service: {service.__class__.__name__}")
@@ -117,6 +119,7 @@ class WiseBus(BaseBus[WiseAuthorityService]):
             logger.error(f"Failed to prepare deferral request: {e}", exc_info=True)
             return False
 
+    @timed("wise_bus", "fetch_guidance")
     async def fetch_guidance(
         self,
         context: GuidanceContext,
@@ -133,7 +136,7 @@ class WiseBus(BaseBus[WiseAuthorityService]):
             return None
 
         try:
-            result = await service.fetch_guidance(context)
+            result = await self._dispatch(service, service.fetch_guidance(context))
             return str(result) if result is not None else None
         except Exception as e:
             logger.error(f"Failed to fetch guidance: {e}", exc_info=True)
@@ -1,22 +1,34 @@
 """
 Batch context builder for optimizing system snapshot generation.
 Separates per-batch vs per-thought operations for performance.
+
+Every component that does not depend on the thought is collected here,
+concurrently, through a SnapshotEngine: round-layer components are
+memoized with a TTL across batches, batch-layer components are computed
+once for the whole batch. build_system_snapshot adds the per-thought layer.
 """
+import asyncio
+import inspect
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
 
 from ciris_engine.schemas.runtime.models import Task
 from ciris_engine.schemas.runtime.system_context import SystemSnapshot, TaskSummary
 from ciris_engine.schemas.services.graph_core import GraphScope, NodeType
 from ciris_engine.schemas.services.operations import MemoryQuery
 from ciris_engine.logic import persistence
+from ciris_engine.logic.buses.tool_bus import ToolBus
+from .snapshot_engine import SnapshotEngine, SnapshotLayer
+from .user_profiles import UserProfileMemo
 
 logger = logging.getLogger(__name__)
 
 
 class BatchContextData:
     """Pre-fetched data that's the same for all thoughts in a batch."""
-    
+
     def __init__(self) -> None:
         self.agent_identity: Dict[str, Any] = {}
         self.identity_purpose: Optional[str] = None
@@ -30,7 +42,232 @@ class BatchContextData:
         self.telemetry_summary: Optional[Any] = None
         self.secrets_snapshot: Dict[str, Any] = {}
         self.shutdown_context: Optional[Any] = None
-        
+        self.system_counts: Dict[str, int] = {}
+        self.adapter_channels: Dict[str, List[Dict[str, Any]]] = {}
+        self.available_tools: Dict[str, List[Dict[str, Any]]] = {}
+        # Filled lazily as thoughts of the batch mention users
+        self.user_profiles = UserProfileMemo()
+
+
+def _task_summary(task: BaseModel) -> TaskSummary:
+    return TaskSummary(
+        task_id=task.task_id,  # type: ignore[attr-defined]
+        channel_id=getattr(task, 'channel_id', 'system'),
+        created_at=task.created_at,  # type: ignore[attr-defined]
+        status=task.status.value if hasattr(task.status, 'value') else str(task.status),  # type: ignore[attr-defined]
+        priority=getattr(task, 'priority', 0),
+        retry_count=getattr(task, 'retry_count', 0),
+        parent_task_id=getattr(task, 'parent_task_id', None)
+    )
+
+
+async def _call(method: Any, *args: Any) -> Any:
+    """Call a service method that may be sync or async."""
+    if inspect.iscoroutinefunction(method):
+        return await method(*args)
+    return method(*args)
+
+
+# ---------------------------------------------------------------------------
+# Round layer: slow-changing, memoized with a TTL
+# ---------------------------------------------------------------------------
+
+async def _collect_agent_identity(memory_service: Any) -> Dict[str, Any]:
+    """Identity fields from the agent/identity node (single query)."""
+    try:
+        identity_query = MemoryQuery(
+            node_id="agent/identity",
+            scope=GraphScope.IDENTITY,
+            type=NodeType.AGENT,
+            include_edges=False,
+            depth=1
+        )
+        identity_nodes = await memory_service.recall(identity_query)
+        identity_result = identity_nodes[0] if identity_nodes else None
+        if not identity_result or not identity_result.attributes:
+            return {}
+        attrs = identity_result.attributes
+        attrs_dict: Dict[str, Any] = attrs.model_dump() if hasattr(attrs, 'model_dump') else dict(attrs)
+        return {
+            "agent_identity": {
+                "agent_id": attrs_dict.get("agent_id", ""),
+                "description": attrs_dict.get("description", ""),
+                "role": attrs_dict.get("role_description", ""),
+                "trust_level": attrs_dict.get("trust_level", 0.5)
+            },
+            "identity_purpose": attrs_dict.get("role_description", ""),
+            "identity_capabilities": attrs_dict.get("permitted_actions", []),
+            "identity_restrictions": attrs_dict.get("restricted_capabilities", []),
+        }
+    except Exception as e:
+        logger.warning(f"Failed to retrieve agent identity: {e}")
+        return {}
+
+
+async def _collect_service_health(service_registry: Any) -> Dict[str, Dict[str, Any]]:
+    """Health and circuit breaker status of handler and global services."""
+    service_health: Dict[str, Any] = {}
+    circuit_breaker_status: Dict[str, Any] = {}
+    try:
+        registry_info = service_registry.get_provider_info()
+        named_services = [
+            (f"{handler}.{service_type}", service)
+            for handler, service_types in registry_info.get('handlers', {}).items()
+            for service_type, services in service_types.items()
+            for service in services
+        ] + [
+            (f"global.{service_type}", service)
+            for service_type, services in registry_info.get('global_services', {}).items()
+            for service in services
+        ]
+
+        health_checks = [(name, service) for name, service in named_services if hasattr(service, 'get_health_status')]
+        results = await asyncio.gather(
+            *(service.get_health_status() for _, service in health_checks), return_exceptions=True
+        )
+        for (name, _), result in zip(health_checks, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to get health status of {name}: {result}")
+            else:
+                service_health[name] = result
+        for name, service in named_services:
+            if hasattr(service, 'get_circuit_breaker_status'):
+                circuit_breaker_status[name] = service.get_circuit_breaker_status()
+    except Exception as e:
+        logger.warning(f"Failed to collect service health status: {e}")
+    return {"service_health": service_health, "circuit_breaker_status": circuit_breaker_status}
+
+
+async def _collect_telemetry_summary(telemetry_service: Any) -> Optional[Any]:
+    try:
+        return await telemetry_service.get_telemetry_summary()
+    except Exception as e:
+        logger.warning(f"Failed to get telemetry summary: {e}")
+        return None
+
+
+async def _collect_adapter_channels(runtime: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """Channels of every active adapter, keyed by adapter type."""
+    adapter_channels: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        for adapter_name, adapter in runtime.adapter_manager._adapters.items():
+            if hasattr(adapter, 'get_channel_list'):
+                channels = adapter.get_channel_list()
+                if channels:
+                    # Extract adapter type from channel_type in first channel
+                    adapter_type = channels[0].get('channel_type', adapter_name.lower())
+                    adapter_channels[adapter_type] = channels
+                    logger.debug(f"Found {len(channels)} channels for {adapter_type} adapter")
+    except Exception as e:
+        logger.warning(f"Failed to get adapter channels: {e}")
+    return adapter_channels
+
+
+def _tool_bus(runtime: Any) -> Optional[ToolBus]:
+    tool_bus = getattr(getattr(runtime, 'bus_manager', None), 'tool', None)
+    return tool_bus if isinstance(tool_bus, ToolBus) else None
+
+
+async def _collect_service_tools(tool_service: Any) -> List[Dict[str, Any]]:
+    adapter_id = getattr(tool_service, 'adapter_id', 'unknown')
+    tools = await _call(tool_service.get_available_tools)
+
+    async def _tool_info(tool_name: str) -> Dict[str, Any]:
+        tool_info: Dict[str, Any] = {'name': tool_name, 'adapter_id': adapter_id}
+        if hasattr(tool_service, 'get_tool_info'):
+            try:
+                detailed_info = await _call(tool_service.get_tool_info, tool_name)
+                if detailed_info:
+                    tool_info['description'] = getattr(detailed_info, 'description', '')
+            except Exception:
+                pass
+        return tool_info
+
+    return list(await asyncio.gather(*(_tool_info(tool_name) for tool_name in tools)))
+
+
+async def _collect_available_tools(runtime: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """Tools of every registered tool service, keyed by adapter type.
+
+    Read from the ToolBus catalog when the runtime has one; tool services
+    are only queried directly when it does not.
+    """
+    tool_bus = _tool_bus(runtime)
+    if tool_bus is not None:
+        catalog = await tool_bus.get_catalog()
+        return catalog.by_adapter_type()
+
+    available_tools: Dict[str, List[Dict[str, Any]]] = {}
+    try:
+        tool_services = [
+            service for service in runtime.service_registry.get_services_by_type('tool')
+            if hasattr(service, 'get_available_tools')
+        ]
+        results = await asyncio.gather(
+            *(_collect_service_tools(service) for service in tool_services), return_exceptions=True
+        )
+        for tool_service, tool_infos in zip(tool_services, results):
+            if isinstance(tool_infos, BaseException):
+                logger.warning(f"Failed to get tools from {type(tool_service).__name__}: {tool_infos}")
+                continue
+            if tool_infos:
+                # Group by adapter type (extract from adapter_id)
+                adapter_id = getattr(tool_service, 'adapter_id', 'unknown')
+                adapter_type = adapter_id.split('_')[0] if '_' in adapter_id else adapter_id
+                available_tools.setdefault(adapter_type, []).extend(tool_infos)
+                logger.debug(f"Found {len(tool_infos)} tools for {adapter_type} adapter")
+    except Exception as e:
+        logger.warning(f"Failed to get available tools: {e}")
+    return available_tools
+
+
+# ---------------------------------------------------------------------------
+# Batch layer: computed once per batch
+# ---------------------------------------------------------------------------
+
+async def _collect_recent_tasks() -> List[TaskSummary]:
+    tasks = await asyncio.to_thread(persistence.get_recent_completed_tasks, 10)
+    return [_task_summary(t) for t in tasks if isinstance(t, BaseModel)]
+
+
+async def _collect_top_tasks() -> List[TaskSummary]:
+    tasks = await asyncio.to_thread(persistence.get_top_tasks, 10)
+    return [_task_summary(t) for t in tasks if isinstance(t, BaseModel)]
+
+
+async def _collect_system_counts() -> Dict[str, int]:
+    queue_status = await asyncio.to_thread(persistence.get_queue_status)
+    return {
+        "total_tasks": queue_status.total_tasks,
+        "total_thoughts": queue_status.total_thoughts,
+        "pending_tasks": queue_status.pending_tasks,
+        "pending_thoughts": queue_status.pending_thoughts + queue_status.processing_thoughts,
+    }
+
+
+async def _collect_secrets_snapshot(secrets_service: Any) -> Dict[str, Any]:
+    from .secrets_snapshot import build_secrets_snapshot
+    return await build_secrets_snapshot(secrets_service)
+
+
+def _collect_resource_alerts(resource_monitor: Any) -> List[str]:
+    """Mission-critical resource alerts from the resource monitor."""
+    resource_alerts: List[str] = []
+    if resource_monitor is None:
+        logger.warning("Resource monitor not available - cannot check resource constraints")
+        return resource_alerts
+    try:
+        snapshot = resource_monitor.snapshot
+        if snapshot.critical:
+            for alert in snapshot.critical:
+                resource_alerts.append(f"🚨 CRITICAL! RESOURCE LIMIT BREACHED! {alert} - REJECT OR DEFER ALL TASKS!")
+        if not snapshot.healthy:
+            resource_alerts.append("🚨 CRITICAL! SYSTEM UNHEALTHY! RESOURCE LIMITS EXCEEDED - IMMEDIATE ACTION REQUIRED!")
+    except Exception as e:
+        logger.error(f"Failed to get resource alerts: {e}")
+        resource_alerts.append(f"🚨 CRITICAL! FAILED TO CHECK RESOURCES: {str(e)}")
+    return resource_alerts
+
 
 async def prefetch_batch_context(
     memory_service: Optional[Any] = None,
@@ -39,126 +276,71 @@ async def prefetch_batch_context(
     resource_monitor: Optional[Any] = None,
     telemetry_service: Optional[Any] = None,
     runtime: Optional[Any] = None,
+    engine: Optional[SnapshotEngine] = None,
 ) -> BatchContextData:
-    """Pre-fetch all data that's common across a batch of thoughts."""
-    
-    logger.info("[DEBUG DB TIMING] Starting batch context prefetch")
+    """Pre-fetch all data that's common across a batch of thoughts.
+
+    Independent components are gathered concurrently. With an ``engine``,
+    round-layer components are reused across batches until their TTL
+    expires; without one everything is computed fresh.
+    """
+    engine = engine or SnapshotEngine(ttls={})
     batch_data = BatchContextData()
-    
-    # 1. Agent Identity (single query)
-    if memory_service:
-        try:
-            logger.info("[DEBUG DB TIMING] Batch: fetching agent identity")
-            identity_query = MemoryQuery(
-                node_id="agent/identity",
-                scope=GraphScope.IDENTITY,
-                type=NodeType.AGENT,
-                include_edges=False,
-                depth=1
-            )
-            identity_nodes = await memory_service.recall(identity_query)
-            identity_result = identity_nodes[0] if identity_nodes else None
-            
-            if identity_result and identity_result.attributes:
-                attrs = identity_result.attributes
-                if isinstance(attrs, dict):
-                    batch_data.agent_identity = {
-                        "agent_id": attrs.get("agent_id", ""),
-                        "description": attrs.get("description", ""),
-                        "role": attrs.get("role_description", ""),
-                        "trust_level": attrs.get("trust_level", 0.5)
-                    }
-                    batch_data.identity_purpose = attrs.get("role_description", "")
-                    batch_data.identity_capabilities = attrs.get("permitted_actions", [])
-                    batch_data.identity_restrictions = attrs.get("restricted_capabilities", [])
-        except Exception as e:
-            logger.warning(f"Failed to retrieve agent identity: {e}")
-    
-    # 2. Recent and Top Tasks (single query each)
-    logger.info("[DEBUG DB TIMING] Batch: fetching recent completed tasks")
-    db_recent_tasks = persistence.get_recent_completed_tasks(10)
-    
-    logger.info("[DEBUG DB TIMING] Batch: fetching top tasks")
-    db_top_tasks = persistence.get_top_tasks(10)
-    
-    # Convert to TaskSummary
-    from pydantic import BaseModel
-    for t_obj in db_recent_tasks:
-        if isinstance(t_obj, BaseModel):
-            batch_data.recent_tasks.append(TaskSummary(
-                task_id=t_obj.task_id,
-                channel_id=getattr(t_obj, 'channel_id', 'system'),
-                created_at=t_obj.created_at,
-                status=t_obj.status.value if hasattr(t_obj.status, 'value') else str(t_obj.status),
-                priority=getattr(t_obj, 'priority', 0),
-                retry_count=getattr(t_obj, 'retry_count', 0),
-                parent_task_id=getattr(t_obj, 'parent_task_id', None)
-            ))
-    
-    for t_obj in db_top_tasks:
-        if isinstance(t_obj, BaseModel):
-            batch_data.top_tasks.append(TaskSummary(
-                task_id=t_obj.task_id,
-                channel_id=getattr(t_obj, 'channel_id', 'system'),
-                created_at=t_obj.created_at,
-                status=t_obj.status.value if hasattr(t_obj.status, 'value') else str(t_obj.status),
-                priority=getattr(t_obj, 'priority', 0),
-                retry_count=getattr(t_obj, 'retry_count', 0),
-                parent_task_id=getattr(t_obj, 'parent_task_id', None)
-            ))
-    
-    # 3. Service Health (if needed)
-    if service_registry:
-        logger.info("[DEBUG DB TIMING] Batch: collecting service health")
-        try:
-            registry_info = service_registry.get_provider_info()
-            
-            # Check handler-specific services
-            for handler, service_types in registry_info.get('handlers', {}).items():
-                for service_type, services in service_types.items():
-                    for service in services:
-                        if hasattr(service, 'get_health_status'):
-                            service_name = f"{handler}.{service_type}"
-                            batch_data.service_health[service_name] = await service.get_health_status()
-                        if hasattr(service, 'get_circuit_breaker_status'):
-                            service_name = f"{handler}.{service_type}"
-                            batch_data.circuit_breaker_status[service_name] = service.get_circuit_breaker_status()
-        except Exception as e:
-            logger.warning(f"Failed to collect service health: {e}")
-    
-    # 4. Resource Alerts
-    if resource_monitor:
-        logger.info("[DEBUG DB TIMING] Batch: checking resource monitor")
-        try:
-            snapshot = resource_monitor.snapshot
-            if snapshot.critical:
-                for alert in snapshot.critical:
-                    batch_data.resource_alerts.append(f"🚨 CRITICAL! RESOURCE LIMIT BREACHED! {alert} - REJECT OR DEFER ALL TASKS!")
-            if not snapshot.healthy:
-                batch_data.resource_alerts.append("🚨 CRITICAL! SYSTEM UNHEALTHY! RESOURCE LIMITS EXCEEDED - IMMEDIATE ACTION REQUIRED!")
-        except Exception as e:
-            logger.error(f"Failed to get resource alerts: {e}")
-            batch_data.resource_alerts.append(f"🚨 CRITICAL! FAILED TO CHECK RESOURCES: {str(e)}")
-    
-    # 5. Telemetry Summary
-    if telemetry_service:
-        logger.info("[DEBUG DB TIMING] Batch: getting telemetry summary")
-        try:
-            batch_data.telemetry_summary = await telemetry_service.get_telemetry_summary()
-        except Exception as e:
-            logger.warning(f"Failed to get telemetry summary: {e}")
-    
-    # 6. Secrets Snapshot
-    if secrets_service:
-        logger.info("[DEBUG DB TIMING] Batch: building secrets snapshot")
-        from .secrets_snapshot import build_secrets_snapshot
-        batch_data.secrets_snapshot = await build_secrets_snapshot(secrets_service)
-    
-    # 7. Shutdown Context
+
+    async def _none() -> None:
+        return None
+
+    def round_component(name: str, available: Any, factory: Any, version: Any = None) -> Any:
+        if not available:
+            return _none()
+        return engine.memoized(name, factory, version=version)
+
+    def batch_component(name: str, available: Any, factory: Any) -> Any:
+        if not available:
+            return _none()
+        return engine.timed(name, SnapshotLayer.BATCH, factory)
+
+    # The catalog version changes when adapters load or unload
+    tool_bus = _tool_bus(runtime)
+    has_runtime_tools = runtime is not None and hasattr(runtime, 'bus_manager') and hasattr(runtime, 'service_registry')
+    (
+        identity, health, telemetry_summary, adapter_channels, available_tools,
+        recent_tasks, top_tasks, system_counts, secrets_snapshot,
+    ) = await asyncio.gather(
+        round_component("agent_identity", memory_service, lambda: _collect_agent_identity(memory_service)),
+        round_component("service_health", service_registry, lambda: _collect_service_health(service_registry)),
+        round_component("telemetry_summary", telemetry_service, lambda: _collect_telemetry_summary(telemetry_service)),
+        round_component("adapter_channels", runtime is not None and hasattr(runtime, 'adapter_manager'),
+                        lambda: _collect_adapter_channels(runtime)),
+        round_component("available_tools", has_runtime_tools, lambda: _collect_available_tools(runtime),
+                        version=tool_bus.catalog_version if tool_bus is not None else None),
+        batch_component("recent_tasks", True, _collect_recent_tasks),
+        batch_component("top_tasks", True, _collect_top_tasks),
+        batch_component("system_counts", True, _collect_system_counts),
+        batch_component("secrets_snapshot", secrets_service, lambda: _collect_secrets_snapshot(secrets_service)),
+    )
+
+    if identity:
+        batch_data.agent_identity = identity["agent_identity"]
+        batch_data.identity_purpose = identity["identity_purpose"]
+        batch_data.identity_capabilities = identity["identity_capabilities"]
+        batch_data.identity_restrictions = identity["identity_restrictions"]
+    if health:
+        batch_data.service_health = health["service_health"]
+        batch_data.circuit_breaker_status = health["circuit_breaker_status"]
+    batch_data.telemetry_summary = telemetry_summary
+    batch_data.adapter_channels = adapter_channels or {}
+    batch_data.available_tools = available_tools or {}
+    batch_data.recent_tasks = recent_tasks
+    batch_data.top_tasks = top_tasks
+    batch_data.system_counts = system_counts
+    batch_data.secrets_snapshot = secrets_snapshot or {}
+
+    # Cheap, in-memory reads
+    batch_data.resource_alerts = _collect_resource_alerts(resource_monitor)
     if runtime and hasattr(runtime, 'current_shutdown_context'):
         batch_data.shutdown_context = runtime.current_shutdown_context
-    
-    logger.info("[DEBUG DB TIMING] Batch context prefetch complete")
+
     return batch_data
 
 
@@ -168,103 +350,20 @@ async def build_system_snapshot_with_batch(
     batch_data: BatchContextData,
     memory_service: Optional[Any] = None,
     graphql_provider: Optional[Any] = None,
+    engine: Optional[SnapshotEngine] = None,
 ) -> SystemSnapshot:
-    """Build system snapshot using pre-fetched batch data."""
-    
-    from ciris_engine.schemas.runtime.system_context import ThoughtSummary
-    
-    logger.info(f"[DEBUG DB TIMING] Building snapshot for thought {getattr(thought, 'thought_id', 'unknown')} with batch data")
-    
-    # Per-thought data
-    thought_summary = None
-    if thought:
-        status_val = getattr(thought, 'status', None)
-        if status_val is not None and hasattr(status_val, 'value'):
-            status_val = status_val.value
-        elif status_val is not None:
-            status_val = str(status_val)
-        
-        thought_summary = ThoughtSummary(
-            thought_id=getattr(thought, 'thought_id', 'unknown'),
-            content=getattr(thought, 'content', None),
-            status=status_val,
-            source_task_id=getattr(thought, 'source_task_id', None),
-            thought_type=getattr(thought, 'thought_type', None),
-            thought_depth=getattr(thought, 'thought_depth', None),
-        )
-    
-    # Channel context (per-thought if different channels)
-    channel_id = None
-    channel_context = None
-    
-    # Extract channel_id logic (simplified)
-    if task and hasattr(task, 'context') and task.context:
-        if hasattr(task.context, 'system_snapshot') and task.context.system_snapshot and hasattr(task.context.system_snapshot, 'channel_id'):
-            channel_id = str(task.context.system_snapshot.channel_id)
-    
-    # Only query channel context if we have a channel_id
-    if channel_id and memory_service:
-        logger.info(f"[DEBUG DB TIMING] Per-thought: querying channel context for {channel_id}")
-        try:
-            query = MemoryQuery(
-                node_id=f"channel/{channel_id}",
-                scope=GraphScope.LOCAL,
-                type=NodeType.CHANNEL,
-                include_edges=False,
-                depth=1
-            )
-            await memory_service.recall(query)
-        except Exception as e:
-            logger.debug(f"Failed to retrieve channel context: {e}")
-    
-    # Current task summary
-    current_task_summary = None
-    if task:
-        from pydantic import BaseModel
-        if isinstance(task, BaseModel):
-            current_task_summary = TaskSummary(
-                task_id=task.task_id,
-                channel_id=getattr(task, 'channel_id', 'system'),
-                created_at=task.created_at,
-                status=task.status.value if hasattr(task.status, 'value') else str(task.status),
-                priority=getattr(task, 'priority', 0),
-                retry_count=getattr(task, 'retry_count', 0),
-                parent_task_id=getattr(task, 'parent_task_id', None)
-            )
-    
-    # Build snapshot with batch data
-    return SystemSnapshot(
-        # Channel context fields
-        channel_context=channel_context,
-        channel_id=channel_id,
-        
-        # Current processing state
-        current_task_details=current_task_summary,
-        current_thought_summary=thought_summary,
-        
-        # System overview
-        system_counts={},  # Could be populated from batch data if needed
-        top_pending_tasks_summary=batch_data.top_tasks,
-        recently_completed_tasks_summary=batch_data.recent_tasks,
-        
-        # Agent identity fields
-        agent_identity=batch_data.agent_identity or {},
-        identity_purpose=batch_data.identity_purpose or "",
-        identity_capabilities=batch_data.identity_capabilities,
-        identity_restrictions=batch_data.identity_restrictions,
-        
-        # Security fields
-        detected_secrets=batch_data.secrets_snapshot.get('detected_secrets', []) if batch_data.secrets_snapshot else [],
-        secrets_filter_version=batch_data.secrets_snapshot.get('secrets_filter_version', 0) if batch_data.secrets_snapshot else 0,
-        total_secrets_stored=batch_data.secrets_snapshot.get('total_secrets_stored', 0) if batch_data.secrets_snapshot else 0,
-        
-        # Service health fields
-        service_health=batch_data.service_health,
-        circuit_breaker_status=batch_data.circuit_breaker_status,
-        resource_alerts=batch_data.resource_alerts,
-        
-        # Other fields
-        shutdown_context=batch_data.shutdown_context,
-        telemetry_summary=batch_data.telemetry_summary,
-        user_profiles=[]  # Not using dict, it expects a list
-    )
\ No newline at end of file
+    """Build system snapshot using pre-fetched batch data.
+
+    Only the per-thought layer is computed here.
+    """
+    from .system_snapshot import build_system_snapshot
+
+    return await build_system_snapshot(
+        task,
+        thought,
+        None,  # Resource alerts were collected with the batch
+        memory_service=memory_service,
+        graphql_provider=graphql_provider,
+        batch_data=batch_data,
+        engine=engine,
+    )
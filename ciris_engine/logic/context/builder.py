@@ -9,6 +9,7 @@ from ciris_engine.logic.config.env_utils import get_env_var
 from ciris_engine.logic.secrets.service import SecretsService
 import logging
 from .system_snapshot import build_system_snapshot as _build_snapshot
+from .snapshot_engine import SnapshotEngine
 from .secrets_snapshot import build_secrets_snapshot as _secrets_snapshot
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,8 @@ class ContextBuilder:
         self.runtime = runtime
         self.service_registry = service_registry
         self.resource_monitor = resource_monitor
+        # Memoizes slow-changing snapshot components across thoughts and batches
+        self.snapshot_engine = SnapshotEngine()
 
     async def build_thought_context(
         self,
@@ -220,6 +223,7 @@ class ContextBuilder:
             secrets_service=self.secrets_service,
             runtime=self.runtime,
             service_registry=self.service_registry,
+            engine=self.snapshot_engine,
         )
 
     async def _build_secrets_snapshot(self) -> dict:
@@ -0,0 +1,131 @@
+"""
+Layered, memoized computation of SystemSnapshot components.
+
+A snapshot is assembled from components that change at very different
+rates, so each belongs to a layer:
+
+- ROUND components (agent identity, service health, telemetry summary,
+  adapter channels, available tools) change slowly. They are memoized with
+  a per-component TTL and shared by every batch until they expire or are
+  invalidated.
+- BATCH components (recent/top tasks, queue status, secrets, resource
+  alerts) are computed once per batch of thoughts.
+- THOUGHT components (channel context, user profiles) are computed for
+  every thought.
+
+Independent components are gathered concurrently by the callers, and the
+engine records how long each one takes so slow components are visible.
+"""
+import asyncio
+import logging
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from ciris_engine.schemas.runtime.system_context import SnapshotComponentTiming
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SnapshotLayer(str, Enum):
+    """How often a snapshot component is recomputed."""
+    ROUND = "round"
+    BATCH = "batch"
+    THOUGHT = "thought"
+
+
+# Seconds a round-layer component stays valid
+DEFAULT_COMPONENT_TTLS: Dict[str, float] = {
+    "agent_identity": 60.0,
+    "service_health": 5.0,
+    "telemetry_summary": 10.0,
+    "adapter_channels": 30.0,
+    "available_tools": 30.0,
+}
+
+
+class SnapshotEngine:
+    """Memoizes round-layer components and times every component.
+
+    One engine lives as long as the processor that owns it. Passing
+    ``ttls={}`` disables memoization while keeping the timings.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttls = dict(DEFAULT_COMPONENT_TTLS if ttls is None else ttls)
+        self._clock = clock
+        self._memo: Dict[str, Tuple[Any, float, Any]] = {}
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self._timings: Dict[str, SnapshotComponentTiming] = {}
+
+    def _timing(self, name: str, layer: SnapshotLayer) -> SnapshotComponentTiming:
+        timing = self._timings.get(name)
+        if timing is None:
+            timing = SnapshotComponentTiming(component=name, layer=layer.value)
+            self._timings[name] = timing
+        return timing
+
+    async def timed(self, name: str, layer: SnapshotLayer, factory: Callable[[], Awaitable[T]]) -> T:
+        """Compute a component and record how long it took."""
+        started = time.perf_counter()
+        try:
+            return await factory()
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            timing = self._timing(name, layer)
+            timing.calls += 1
+            timing.total_ms += elapsed_ms
+            timing.last_ms = elapsed_ms
+            timing.max_ms = max(timing.max_ms, elapsed_ms)
+            logger.debug(f"Snapshot component {name} ({layer.value}) took {elapsed_ms:.1f}ms")
+
+    async def memoized(self, name: str, factory: Callable[[], Awaitable[T]], version: Any = None) -> T:
+        """Round-layer component: reuse the value until its TTL expires.
+
+        Concurrent callers share one computation. A component without a TTL
+        is recomputed every time. When the source of a component tracks
+        changes itself, pass its ``version``: a cached value computed for
+        another version is recomputed even if its TTL has not expired.
+        """
+        ttl = self.ttls.get(name, 0.0)
+        cached = self._memo.get(name)
+        if cached is not None and cached[1] > self._clock() and cached[2] == version:
+            self._timing(name, SnapshotLayer.ROUND).cache_hits += 1
+            return cached[0]  # type: ignore[no-any-return]
+
+        inflight = self._inflight.get(name)
+        if inflight is None:
+            async def _refresh() -> Any:
+                value = await self.timed(name, SnapshotLayer.ROUND, factory)
+                if ttl > 0:
+                    self._memo[name] = (value, self._clock() + ttl, version)
+                return value
+
+            inflight = asyncio.ensure_future(_refresh())
+            self._inflight[name] = inflight
+            inflight.add_done_callback(lambda _: self._inflight.pop(name, None))
+        else:
+            self._timing(name, SnapshotLayer.ROUND).cache_hits += 1
+        # Shield so one cancelled caller does not cancel the shared computation
+        return await asyncio.shield(inflight)
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Forget one memoized component, or all of them."""
+        if name is None:
+            self._memo.clear()
+        else:
+            self._memo.pop(name, None)
+
+    def get_component_timings(self) -> List[SnapshotComponentTiming]:
+        """Accumulated timings, slowest total first."""
+        return sorted(
+            (timing.model_copy() for timing in self._timings.values()),
+            key=lambda timing: timing.total_ms,
+            reverse=True,
+        )
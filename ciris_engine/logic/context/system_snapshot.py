@@ -1,7 +1,7 @@
+import asyncio
 import logging
-import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Optional, Tuple
 
 from pydantic import BaseModel
 from ciris_engine.logic.services.memory_service import LocalGraphMemoryService
@@ -11,8 +11,9 @@ from ciris_engine.schemas.runtime.models import Task
 from ciris_engine.schemas.runtime.system_context import SystemSnapshot, UserProfile
 from ciris_engine.schemas.services.graph_core import GraphScope, NodeType
 from ciris_engine.schemas.services.operations import MemoryQuery
-from ciris_engine.logic import persistence
-from .secrets_snapshot import build_secrets_snapshot
+from .batch_context import BatchContextData, prefetch_batch_context
+from .snapshot_engine import SnapshotEngine, SnapshotLayer
+from .user_profiles import collect_user_ids
 
 logger = logging.getLogger(__name__)
 
@@ -26,8 +27,16 @@ async def build_system_snapshot(
     secrets_service: Optional[SecretsService] = None,
     runtime: Optional[Any] = None,
     service_registry: Optional[Any] = None,
+    batch_data: Optional[BatchContextData] = None,
+    engine: Optional[SnapshotEngine] = None,
 ) -> SystemSnapshot:
-    """Build system snapshot for the thought."""
+    """Build system snapshot for the thought.
+
+    Components that do not depend on the thought come from ``batch_data``
+    (see prefetch_batch_context); without it they are prefetched here,
+    concurrently with the per-thought work. Pass the processor's ``engine``
+    to reuse memoized round-layer components and record timings.
+    """
     from ciris_engine.schemas.runtime.system_context import ThoughtSummary, TaskSummary
 
     thought_summary = None
@@ -93,7 +102,11 @@ async def build_system_snapshot(
     if not channel_id and thought and thought.context:
         channel_id, channel_context = safe_extract_channel_info(thought.context, "thought.context")
 
-    if channel_id and memory_service:
+    engine = engine or SnapshotEngine(ttls={})
+
+    async def _lookup_channel() -> None:
+        if not (channel_id and memory_service):
+            return
         try:
             # First try direct lookup for performance
             query = MemoryQuery(
@@ -132,85 +145,23 @@ async def build_system_snapshot(
         except Exception as e:
             logger.debug(f"Failed to retrieve channel context for {channel_id}: {e}")
 
-    # Retrieve agent identity from graph - SINGLE CALL at snapshot generation
-    identity_data: dict = {}
-    identity_purpose: Optional[str] = None
-    identity_capabilities: List[str] = []
-    identity_restrictions: List[str] = []
-
-    if memory_service:
-        try:
-            # Query for the agent's identity node from the graph
-            identity_query = MemoryQuery(
-                node_id="agent/identity",
-                scope=GraphScope.IDENTITY,
-                type=NodeType.AGENT,
-                include_edges=False,
-                depth=1
-            )
-            logger.info(f"[DEBUG DB TIMING] About to query memory service for agent/identity")
-            identity_nodes = await memory_service.recall(identity_query)
-            logger.info(f"[DEBUG DB TIMING] Completed memory service query for agent/identity")
-            identity_result = identity_nodes[0] if identity_nodes else None
-
-            if identity_result and identity_result.attributes:
-                # The identity is stored as a TypedGraphNode (IdentityNode)
-                # Extract the identity fields from attributes
-                node_attrs: Union[Any, Dict[str, Any]] = identity_result.attributes
-                # GraphNodeAttributes is always a Pydantic model with model_dump()
-                # Convert to dict for consistent access
-                attrs_dict: Dict[str, Any]
-                if hasattr(node_attrs, 'model_dump'):
-                    attrs_dict = node_attrs.model_dump()
-                else:
-                    # Fallback for dict-like objects
-                    attrs_dict = dict(node_attrs) if node_attrs else {}
-                
-                identity_data = {
-                    "agent_id": attrs_dict.get("agent_id", ""),
-                    "description": attrs_dict.get("description", ""),
-                    "role": attrs_dict.get("role_description", ""),
-                    "trust_level": attrs_dict.get("trust_level", 0.5)
-                }
-                identity_purpose = attrs_dict.get("role_description", "")
-                identity_capabilities = attrs_dict.get("permitted_actions", [])
-                identity_restrictions = attrs_dict.get("restricted_capabilities", [])
-        except Exception as e:
-            logger.warning(f"Failed to retrieve agent identity from graph: {e}")
-
-    recent_tasks_list: List[Any] = []
-    logger.info(f"[DEBUG DB TIMING] About to get recent completed tasks")
-    db_recent_tasks = persistence.get_recent_completed_tasks(10)
-    logger.info(f"[DEBUG DB TIMING] Completed get recent completed tasks: {len(db_recent_tasks)} tasks")
-    for t_obj in db_recent_tasks:
-        # db_recent_tasks returns List[Task], convert to TaskSummary
-        if isinstance(t_obj, BaseModel):
-            recent_tasks_list.append(TaskSummary(
-                task_id=t_obj.task_id,
-                channel_id=getattr(t_obj, 'channel_id', 'system'),
-                created_at=t_obj.created_at,
-                status=t_obj.status.value if hasattr(t_obj.status, 'value') else str(t_obj.status),
-                priority=getattr(t_obj, 'priority', 0),
-                retry_count=getattr(t_obj, 'retry_count', 0),
-                parent_task_id=getattr(t_obj, 'parent_task_id', None)
-            ))
-
-    top_tasks_list: List[Any] = []
-    logger.info(f"[DEBUG DB TIMING] About to get top tasks")
-    db_top_tasks = persistence.get_top_tasks(10)
-    logger.info(f"[DEBUG DB TIMING] Completed get top tasks: {len(db_top_tasks)} tasks")
-    for t_obj in db_top_tasks:
-        # db_top_tasks returns List[Task], convert to TaskSummary
-        if isinstance(t_obj, BaseModel):
-            top_tasks_list.append(TaskSummary(
-                task_id=t_obj.task_id,
-                channel_id=getattr(t_obj, 'channel_id', 'system'),
-                created_at=t_obj.created_at,
-                status=t_obj.status.value if hasattr(t_obj.status, 'value') else str(t_obj.status),
-                priority=getattr(t_obj, 'priority', 0),
-                retry_count=getattr(t_obj, 'retry_count', 0),
-                parent_task_id=getattr(t_obj, 'parent_task_id', None)
-            ))
+    batch: BatchContextData
+    if batch_data is None:
+        batch, _ = await asyncio.gather(
+            prefetch_batch_context(
+                memory_service=memory_service,
+                secrets_service=secrets_service,
+                service_registry=service_registry,
+                resource_monitor=resource_monitor,
+                telemetry_service=telemetry_service,
+                runtime=runtime,
+                engine=engine,
+            ),
+            engine.timed("channel_context", SnapshotLayer.THOUGHT, _lookup_channel),
+        )
+    else:
+        batch = batch_data
+        await engine.timed("channel_context", SnapshotLayer.THOUGHT, _lookup_channel)
 
     current_task_summary = None
     if task:
@@ -226,181 +177,33 @@ async def build_system_snapshot(
                 parent_task_id=getattr(task, 'parent_task_id', None)
             )
 
-    secrets_data: dict = {}
-    if secrets_service:
-        secrets_data = await build_secrets_snapshot(secrets_service)
-
-    # Get shutdown context from runtime
-    shutdown_context = None
-    if runtime and hasattr(runtime, 'current_shutdown_context'):
-        shutdown_context = runtime.current_shutdown_context
-
-    # Get resource alerts - CRITICAL for mission-critical systems
-    resource_alerts: List[str] = []
-    try:
-        if resource_monitor is not None:
-            snapshot = resource_monitor.snapshot
-            # Check for critical resource conditions
-            if snapshot.critical:
-                for alert in snapshot.critical:
-                    resource_alerts.append(f"🚨 CRITICAL! RESOURCE LIMIT BREACHED! {alert} - REJECT OR DEFER ALL TASKS!")
-            # Also check if healthy flag is False
-            if not snapshot.healthy:
-                resource_alerts.append("🚨 CRITICAL! SYSTEM UNHEALTHY! RESOURCE LIMITS EXCEEDED - IMMEDIATE ACTION REQUIRED!")
-        else:
-            logger.warning("Resource monitor not available - cannot check resource constraints")
-    except Exception as e:
-        logger.error(f"Failed to get resource alerts: {e}")
-        resource_alerts.append(f"🚨 CRITICAL! FAILED TO CHECK RESOURCES: {str(e)}")
-
-    # Get service health status
-    service_health: Dict[str, dict] = {}
-    circuit_breaker_status: Dict[str, dict] = {}
-
-    if service_registry:
-        try:
-            # Get health status from all registered services
-            registry_info = service_registry.get_provider_info()
-
-            # Check handler-specific services
-            for handler, service_types in registry_info.get('handlers', {}).items():
-                for service_type, services in service_types.items():
-                    for service in services:
-                        if hasattr(service, 'get_health_status'):
-                            service_name = f"{handler}.{service_type}"
-                            service_health[service_name] = await service.get_health_status()
-                        if hasattr(service, 'get_circuit_breaker_status'):
-                            service_name = f"{handler}.{service_type}"
-                            circuit_breaker_status[service_name] = service.get_circuit_breaker_status()
-
-            # Check global services
-            for service_type, services in registry_info.get('global_services', {}).items():
-                for service in services:
-                    if hasattr(service, 'get_health_status'):
-                        service_name = f"global.{service_type}"
-                        service_health[service_name] = await service.get_health_status()
-                    if hasattr(service, 'get_circuit_breaker_status'):
-                        service_name = f"global.{service_type}"
-                        circuit_breaker_status[service_name] = service.get_circuit_breaker_status()
-
-        except Exception as e:
-            logger.warning(f"Failed to collect service health status: {e}")
-
-    # Get telemetry summary for resource usage
-    telemetry_summary = None
-    if telemetry_service:
-        try:
-            telemetry_summary = await telemetry_service.get_telemetry_summary()
-            logger.debug("Successfully retrieved telemetry summary")
-        except Exception as e:
-            logger.warning(f"Failed to get telemetry summary: {e}")
-    
-    # Get adapter channels for agent visibility
-    adapter_channels: Dict[str, List[Dict[str, Any]]] = {}
-    if runtime and hasattr(runtime, 'adapter_manager'):
-        try:
-            adapter_manager = runtime.adapter_manager
-            # Get all active adapters
-            for adapter_name, adapter in adapter_manager._adapters.items():
-                if hasattr(adapter, 'get_channel_list'):
-                    channels = adapter.get_channel_list()
-                    if channels:
-                        # Extract adapter type from channel_type in first channel
-                        adapter_type = channels[0].get('channel_type', adapter_name.lower())
-                        adapter_channels[adapter_type] = channels
-                        logger.debug(f"Found {len(channels)} channels for {adapter_type} adapter")
-        except Exception as e:
-            logger.warning(f"Failed to get adapter channels: {e}")
-    
-    # Get available tools from all adapters via tool bus
-    available_tools: Dict[str, List[Dict[str, Any]]] = {}
-    if runtime and hasattr(runtime, 'bus_manager') and hasattr(runtime, 'service_registry'):
-        try:
-            runtime.bus_manager
-            service_registry = runtime.service_registry
-            
-            # Get all tool services from registry
-            tool_services = service_registry.get_services_by_type('tool')
-            
-            for tool_service in tool_services:
-                # Get adapter context from the tool service
-                adapter_id = getattr(tool_service, 'adapter_id', 'unknown')
-                
-                # Get available tools from this service
-                if hasattr(tool_service, 'get_available_tools'):
-                    # Check if it's a coroutine function
-                    import inspect
-                    if inspect.iscoroutinefunction(tool_service.get_available_tools):
-                        tools = await tool_service.get_available_tools()
-                    else:
-                        tools = tool_service.get_available_tools()
-                    
-                    # Get detailed info for each tool
-                    tool_infos = []
-                    for tool_name in tools:
-                        tool_info = {
-                            'name': tool_name,
-                            'adapter_id': adapter_id
-                        }
-                        
-                        # Try to get additional info
-                        if hasattr(tool_service, 'get_tool_info'):
-                            try:
-                                if inspect.iscoroutinefunction(tool_service.get_tool_info):
-                                    detailed_info = await tool_service.get_tool_info(tool_name)
-                                else:
-                                    detailed_info = tool_service.get_tool_info(tool_name)
-                                if detailed_info:
-                                    tool_info['description'] = getattr(detailed_info, 'description', '')
-                            except Exception:
-                                pass
-                        
-                        tool_infos.append(tool_info)
-                    
-                    if tool_infos:
-                        # Group by adapter type (extract from adapter_id)
-                        adapter_type = adapter_id.split('_')[0] if '_' in adapter_id else adapter_id
-                        if adapter_type not in available_tools:
-                            available_tools[adapter_type] = []
-                        available_tools[adapter_type].extend(tool_infos)
-                        logger.debug(f"Found {len(tool_infos)} tools for {adapter_type} adapter")
-                        
-        except Exception as e:
-            logger.warning(f"Failed to get available tools: {e}")
-
-    # Get queue status using centralized function
-    queue_status = persistence.get_queue_status()
-    
     context_data = {
         "current_task_details": current_task_summary,
         "current_thought_summary": thought_summary,
-        "system_counts": {
-            "total_tasks": queue_status.total_tasks,
-            "total_thoughts": queue_status.total_thoughts,
-            "pending_tasks": queue_status.pending_tasks,
-            "pending_thoughts": queue_status.pending_thoughts + queue_status.processing_thoughts,
-        },
-        "top_pending_tasks_summary": top_tasks_list,
-        "recently_completed_tasks_summary": recent_tasks_list,
+        "system_counts": batch.system_counts,
+        "top_pending_tasks_summary": batch.top_tasks,
+        "recently_completed_tasks_summary": batch.recent_tasks,
         "channel_id": channel_id,
         "channel_context": channel_context,  # Preserve the full ChannelContext object
-        # Identity graph data - loaded once per snapshot
-        "agent_identity": identity_data,
-        "identity_purpose": identity_purpose,
-        "identity_capabilities": identity_capabilities,
-        "identity_restrictions": identity_restrictions,
-        "shutdown_context": shutdown_context,
-        "service_health": service_health,
-        "circuit_breaker_status": circuit_breaker_status,
-        "resource_alerts": resource_alerts,  # CRITICAL mission-critical alerts
-        "telemetry_summary": telemetry_summary,  # Resource usage data
-        "adapter_channels": adapter_channels,  # Available channels by adapter
-        "available_tools": available_tools,  # Available tools by adapter
-        **secrets_data,
+        # Identity graph data - loaded once per batch
+        "agent_identity": batch.agent_identity,
+        "identity_purpose": batch.identity_purpose,
+        "identity_capabilities": batch.identity_capabilities,
+        "identity_restrictions": batch.identity_restrictions,
+        "shutdown_context": batch.shutdown_context,
+        "service_health": batch.service_health,
+        "circuit_breaker_status": batch.circuit_breaker_status,
+        "resource_alerts": batch.resource_alerts,  # CRITICAL mission-critical alerts
+        "telemetry_summary": batch.telemetry_summary,  # Resource usage data
+        "adapter_channels": batch.adapter_channels,  # Available channels by adapter
+        "available_tools": batch.available_tools,  # Available tools by adapter
+        **batch.secrets_snapshot,
     }
 
     if graphql_provider:
-        enriched_context = await graphql_provider.enrich_context(task, thought)
+        enriched_context = await engine.timed(
+            "graphql_enrichment", SnapshotLayer.THOUGHT, lambda: graphql_provider.enrich_context(task, thought)
+        )
         # Convert EnrichedContext to dict for merging
         if enriched_context:
             # Convert GraphQLUserProfile to UserProfile
@@ -431,160 +234,23 @@ async def build_system_snapshot(
 
     # Enrich user profiles from memory graph (supplement or replace GraphQL data)
     if memory_service and thought:
-        # Extract user IDs from the thought content and context
-        user_ids_to_enrich = set()
-        
-        # Look for user mentions in thought content (Discord format: <@USER_ID> or @username)
-        import re
-        thought_content = getattr(thought, 'content', '')
-        # Discord user ID pattern
-        discord_mentions = re.findall(r'<@(\d+)>', thought_content)
-        user_ids_to_enrich.update(discord_mentions)
-        # Also look for "ID: <number>" pattern
-        id_mentions = re.findall(r'ID:\s*(\d+)', thought_content)
-        user_ids_to_enrich.update(id_mentions)
-        
-        # Also check the current channel context for the message author
-        if hasattr(thought, 'context') and thought.context:
-            if hasattr(thought.context, 'user_id') and thought.context.user_id:
-                user_ids_to_enrich.add(str(thought.context.user_id))
-                
+        user_ids_to_enrich = collect_user_ids(thought)
         logger.info(f"Enriching user profiles for users: {user_ids_to_enrich}")
-        
+
         # Get existing user profiles or create new list
         existing_profiles = context_data.get("user_profiles", [])
         existing_user_ids = {p.user_id for p in existing_profiles}
-        
-        for user_id in user_ids_to_enrich:
-            if user_id in existing_user_ids:
-                continue  # Already have profile from GraphQL
-                
-            try:
-                # Query user node with ALL attributes
-                user_query = MemoryQuery(
-                    node_id=f"user/{user_id}",
-                    scope=GraphScope.LOCAL,
-                    type=NodeType.USER,
-                    include_edges=True,  # Get edges too
-                    depth=2  # Get connected nodes
-                )
-                logger.info(f"[DEBUG] Querying memory for user/{user_id}")
-                user_results = await memory_service.recall(user_query)
-                
-                if user_results:
-                    user_node = user_results[0]
-                    # Extract ALL attributes from the user node
-                    attrs = user_node.attributes if isinstance(user_node.attributes, dict) else {}
-                    
-                    # Get edges and connected nodes
-                    connected_nodes_info = []
-                    try:
-                        # Get edges for this user node
-                        from ciris_engine.logic.persistence.models.graph import get_edges_for_node
-                        edges = get_edges_for_node(f"user/{user_id}", GraphScope.LOCAL)
-                        
-                        for edge in edges:
-                            # Get the connected node
-                            connected_node_id = edge.target if edge.source == f"user/{user_id}" else edge.source
-                            connected_query = MemoryQuery(
-                                node_id=connected_node_id,
-                                scope=GraphScope.LOCAL,
-                                include_edges=False,
-                                depth=1
-                            )
-                            connected_results = await memory_service.recall(connected_query)
-                            if connected_results:
-                                connected_node = connected_results[0]
-                                connected_attrs = connected_node.attributes if isinstance(connected_node.attributes, dict) else {}
-                                connected_nodes_info.append({
-                                    'node_id': connected_node.id,
-                                    'node_type': connected_node.type,
-                                    'relationship': edge.relationship,
-                                    'attributes': connected_attrs
-                                })
-                    except Exception as e:
-                        logger.warning(f"Failed to get connected nodes for user {user_id}: {e}")
-                    
-                    # Create UserProfile with all available data
-                    notes_content = f"All attributes: {json.dumps(attrs)}"
-                    if connected_nodes_info:
-                        notes_content += f"\nConnected nodes: {json.dumps(connected_nodes_info)}"
-                    
-                    user_profile = UserProfile(
-                        user_id=user_id,
-                        display_name=attrs.get('username', attrs.get('display_name', f'User_{user_id}')),
-                        created_at=datetime.now(),  # Could parse from node if available
-                        preferred_language=attrs.get('language', 'en'),
-                        timezone=attrs.get('timezone', 'UTC'),
-                        communication_style=attrs.get('communication_style', 'formal'),
-                        trust_level=attrs.get('trust_level', 0.5),
-                        last_interaction=attrs.get('last_seen'),
-                        is_wa=attrs.get('is_wa', False),
-                        permissions=attrs.get('permissions', []),
-                        restrictions=attrs.get('restrictions', []),
-                        # Store ALL other attributes and connected nodes in notes for access
-                        notes=notes_content
-                    )
-                    existing_profiles.append(user_profile)
-                    logger.info(f"Added user profile for {user_id} with attributes: {list(attrs.keys())} and {len(connected_nodes_info)} connected nodes")
-                    
-                # Get messages from other channels
-                if channel_id:
-                    # Query service correlations for user's recent messages
-                    with persistence.get_db_connection() as conn:
-                        cursor = conn.cursor()
-                        # Look for handler actions from this user in other channels
-                        cursor.execute("""
-                            SELECT 
-                                c.correlation_id,
-                                c.handler_name,
-                                c.request_data,
-                                c.created_at,
-                                c.tags
-                            FROM service_correlations c
-                            WHERE 
-                                c.tags LIKE ? 
-                                AND c.tags NOT LIKE ?
-                                AND c.handler_name IN ('ObserveHandler', 'SpeakHandler')
-                            ORDER BY c.created_at DESC
-                            LIMIT 3
-                        """, (f'%"user_id":"{user_id}"%', f'%"channel_id":"{channel_id}"%'))
-                        
-                        recent_messages = []
-                        for row in cursor.fetchall():
-                            try:
-                                tags = json.loads(row['tags']) if row['tags'] else {}
-                                msg_channel = tags.get('channel_id', 'unknown')
-                                msg_content = 'Message in ' + msg_channel
-                                
-                                # Try to extract content from request_data
-                                if row['request_data']:
-                                    req_data = json.loads(row['request_data'])
-                                    if isinstance(req_data, dict):
-                                        msg_content = req_data.get('content', req_data.get('message', msg_content))
-                                
-                                recent_messages.append({
-                                    'channel': msg_channel,
-                                    'content': msg_content,
-                                    'timestamp': row['created_at'].isoformat() if hasattr(row['created_at'], 'isoformat') else str(row['created_at'])
-                                })
-                            except (json.JSONDecodeError, TypeError, AttributeError, KeyError):
-                                # JSONDecodeError: malformed JSON in tags or request_data
-                                # TypeError: row['tags'] or row['request_data'] is not a string
-                                # AttributeError: row object missing expected attributes
-                                # KeyError: row dictionary missing expected keys
-                                pass
-                        
-                        if recent_messages and existing_profiles:
-                            # Find the user profile we just added
-                            for profile in existing_profiles:
-                                if profile.user_id == user_id:
-                                    profile.notes += f"\nRecent messages from other channels: {json.dumps(recent_messages)}"
-                                    break
-                                
-            except Exception as e:
-                logger.warning(f"Failed to enrich user {user_id}: {e}")
-        
+        # Profiles from GraphQL take precedence
+        missing_user_ids = user_ids_to_enrich - existing_user_ids
+
+        if missing_user_ids:
+            # The batch memo shares profiles between thoughts of the batch
+            existing_profiles.extend(await engine.timed(
+                "user_profiles",
+                SnapshotLayer.THOUGHT,
+                lambda: batch.user_profiles.get_profiles(missing_user_ids, memory_service, channel_id),
+            ))
+
         # Update context data with enriched profiles
         if existing_profiles:
             context_data["user_profiles"] = existing_profiles
@@ -0,0 +1,235 @@
+"""
+Bulk user-profile loading for system snapshots.
+
+Profiles used to be built one user at a time: a recall per user node, an
+edge query per user, a recall per neighbour and a LIKE scan over
+service_correlations tags for cross-channel messages. Here all users of a
+thought are loaded together - one query for the user nodes, one for their
+edges, one for the neighbours and one indexed correlation query - and a
+per-batch memo lets thoughts of the same batch share the result.
+"""
+import asyncio
+import json
+import logging
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ciris_engine.logic import persistence
+from ciris_engine.schemas.runtime.system_context import UserProfile
+from ciris_engine.schemas.services.graph_core import GraphEdge, GraphNode, GraphScope
+
+logger = logging.getLogger(__name__)
+
+# Discord mentions (<@USER_ID>) and "ID: <number>" references in thought content
+_MENTION_PATTERNS = (re.compile(r'<@(\d+)>'), re.compile(r'ID:\s*(\d+)'))
+RECENT_MESSAGES_PER_USER = 3
+
+
+def collect_user_ids(thought: Any) -> Set[str]:
+    """User IDs mentioned in a thought's content or set on its context."""
+    user_ids: Set[str] = set()
+    content = getattr(thought, 'content', '') or ''
+    for pattern in _MENTION_PATTERNS:
+        user_ids.update(pattern.findall(content))
+    context = getattr(thought, 'context', None)
+    if context and getattr(context, 'user_id', None):
+        user_ids.add(str(context.user_id))
+    return user_ids
+
+
+def _edge_dict(edge: GraphEdge) -> Dict[str, Any]:
+    """Edge in the shape recall() attaches under ``_edges``, JSON-safe for the notes."""
+    return {
+        "source": edge.source,
+        "target": edge.target,
+        "relationship": edge.relationship,
+        "weight": edge.weight,
+        "attributes": edge.attributes.model_dump(mode="json") if hasattr(edge.attributes, 'model_dump') else edge.attributes,
+    }
+
+
+def _build_profile(user_id: str, node: GraphNode, edges: List[GraphEdge], nodes: Dict[str, GraphNode]) -> UserProfile:
+    attrs = dict(node.attributes) if isinstance(node.attributes, dict) else {}
+    if edges:
+        attrs["_edges"] = [_edge_dict(edge) for edge in edges]
+
+    connected_nodes_info = []
+    for edge in edges:
+        connected = nodes.get(edge.target if edge.source == node.id else edge.source)
+        if connected:
+            connected_nodes_info.append({
+                'node_id': connected.id,
+                'node_type': connected.type,
+                'relationship': edge.relationship,
+                'attributes': connected.attributes if isinstance(connected.attributes, dict) else {},
+            })
+
+    notes_content = f"All attributes: {json.dumps(attrs)}"
+    if connected_nodes_info:
+        notes_content += f"\nConnected nodes: {json.dumps(connected_nodes_info)}"
+
+    return UserProfile(
+        user_id=user_id,
+        display_name=attrs.get('username', attrs.get('display_name', f'User_{user_id}')),
+        created_at=datetime.now(),  # Could parse from node if available
+        preferred_language=attrs.get('language', 'en'),
+        timezone=attrs.get('timezone', 'UTC'),
+        communication_style=attrs.get('communication_style', 'formal'),
+        trust_level=attrs.get('trust_level', 0.5),
+        last_interaction=attrs.get('last_seen'),
+        is_wa=attrs.get('is_wa', False),
+        permissions=attrs.get('permissions', []),
+        restrictions=attrs.get('restrictions', []),
+        # Store ALL other attributes and connected nodes in notes for access
+        notes=notes_content
+    )
+
+
+def _recent_messages(records: Iterable[Any]) -> List[Dict[str, str]]:
+    messages = []
+    for record in records:
+        try:
+            tags = record.tags if isinstance(record.tags, dict) else {}
+            msg_channel = tags.get('channel_id', 'unknown')
+            msg_content = 'Message in ' + msg_channel
+            request_data = record.request_data
+            if isinstance(request_data, dict):
+                parameters = request_data.get('parameters') or {}
+                msg_content = request_data.get('content', request_data.get('message', parameters.get('content', msg_content)))
+            created_at = record.created_at
+            messages.append({
+                'channel': msg_channel,
+                'content': msg_content,
+                'timestamp': created_at.isoformat() if hasattr(created_at, 'isoformat') else str(created_at),
+            })
+        except (TypeError, AttributeError):
+            # Malformed tags or request_data - skip the message
+            pass
+    return messages
+
+
+async def load_user_profiles(
+    user_ids: Iterable[str],
+    memory_service: Any,
+    channel_id: Optional[str] = None,
+    db_path: Optional[str] = None,
+) -> Dict[str, UserProfile]:
+    """Build profiles for many users with a fixed number of queries.
+
+    Users without a node in the LOCAL scope get no profile. When
+    ``channel_id`` is given, each profile's notes also list the user's
+    recent messages from other channels.
+
+    Returns:
+        Dict mapping user_id to UserProfile
+    """
+    wanted = sorted(set(user_ids))
+    if not wanted or not memory_service:
+        return {}
+
+    node_ids = {user_id: f"user/{user_id}" for user_id in wanted}
+    try:
+        user_nodes = await memory_service.recall_nodes(list(node_ids.values()), GraphScope.LOCAL)
+    except Exception as e:
+        logger.warning(f"Failed to load user nodes for {wanted}: {e}")
+        return {}
+    if not user_nodes:
+        return {}
+
+    edges_by_node: Dict[str, List[GraphEdge]] = {node_id: [] for node_id in user_nodes}
+    neighbour_ids: Set[str] = set()
+    try:
+        for edge in memory_service.get_nodes_edges(list(user_nodes), GraphScope.LOCAL):
+            for endpoint, other in ((edge.source, edge.target), (edge.target, edge.source)):
+                if endpoint in edges_by_node:
+                    edges_by_node[endpoint].append(edge)
+                    neighbour_ids.add(other)
+        neighbours = await memory_service.recall_nodes(sorted(neighbour_ids - set(user_nodes)), GraphScope.LOCAL)
+    except Exception as e:
+        logger.warning(f"Failed to get connected nodes for users {wanted}: {e}")
+        edges_by_node = {node_id: [] for node_id in user_nodes}
+        neighbours = {}
+    all_nodes = {**neighbours, **user_nodes}
+
+    profiles: Dict[str, UserProfile] = {}
+    for user_id, node_id in node_ids.items():
+        node = user_nodes.get(node_id)
+        if node is None:
+            continue
+        try:
+            profiles[user_id] = _build_profile(user_id, node, edges_by_node[node_id], all_nodes)
+        except Exception as e:
+            logger.warning(f"Failed to enrich user {user_id}: {e}")
+
+    if channel_id and profiles:
+        records = await asyncio.to_thread(
+            persistence.get_recent_user_messages,
+            list(profiles),
+            channel_id,
+            RECENT_MESSAGES_PER_USER,
+            db_path=db_path,
+        )
+        for user_id, user_records in records.items():
+            messages = _recent_messages(user_records)
+            if messages and user_id in profiles:
+                profiles[user_id].notes = (profiles[user_id].notes or "") + (
+                    f"\nRecent messages from other channels: {json.dumps(messages)}"
+                )
+
+    logger.debug(f"Loaded {len(profiles)} user profiles for {len(wanted)} users")
+    return profiles
+
+
+class UserProfileMemo:
+    """Profiles loaded for one batch of thoughts, keyed by (user_id, channel_id).
+
+    Thoughts of the same conversation usually mention the same users, so
+    each (user, channel) pair is loaded once per batch. Concurrent callers
+    wait on the same in-flight load instead of issuing their own.
+    """
+
+    def __init__(self, db_path: Optional[str] = None) -> None:
+        self.db_path = db_path
+        self._entries: Dict[Tuple[str, Optional[str]], "asyncio.Future[Optional[UserProfile]]"] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def get_profiles(
+        self,
+        user_ids: Iterable[str],
+        memory_service: Any,
+        channel_id: Optional[str] = None,
+    ) -> List[UserProfile]:
+        """Profiles for ``user_ids``, loading only the pairs not yet memoized.
+
+        Each caller receives its own copies, so per-thought edits never leak
+        into other snapshots of the batch.
+        """
+        wanted = sorted(set(user_ids))
+        missing = [user_id for user_id in wanted if (user_id, channel_id) not in self._entries]
+        self.hits += len(wanted) - len(missing)
+        self.misses += len(missing)
+
+        if missing:
+            loop = asyncio.get_running_loop()
+            futures = {user_id: loop.create_future() for user_id in missing}
+            for user_id, future in futures.items():
+                self._entries[(user_id, channel_id)] = future
+            loaded: Dict[str, UserProfile] = {}
+            try:
+                loaded = await load_user_profiles(missing, memory_service, channel_id, db_path=self.db_path)
+            except Exception as e:
+                logger.warning(f"Failed to load user profiles for {missing}: {e}")
+            finally:
+                # Always resolve, so waiters never hang on a failed or cancelled load
+                for user_id, future in futures.items():
+                    if not future.done():
+                        future.set_result(loaded.get(user_id))
+
+        profiles = []
+        for user_id in wanted:
+            profile = await self._entries[(user_id, channel_id)]
+            if profile is not None:
+                profiles.append(profile.model_copy(deep=True))
+        return profiles
@@ -1,97 +1,24 @@
 """Context building utilities for Action Selection PDMA."""
 
 import logging
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Tuple, Union
 from ciris_engine.schemas.runtime.models import Thought
 from ciris_engine.schemas.dma.results import EthicalDMAResult, CSDMAResult, DSDMAResult
 from ciris_engine.schemas.dma.prompts import PromptCollection
 from ciris_engine.schemas.dma.faculty import ConscienceFailureContext, EnhancedDMAInputs
 from ciris_engine.schemas.runtime.enums import HandlerActionType
 from ciris_engine.logic.formatters import format_user_profiles, format_system_snapshot
+from ciris_engine.logic.dma.prompt_cache import StaticSectionCache
 
 logger = logging.getLogger(__name__)
 
-class ActionSelectionContextBuilder:
-    """Builds context for action selection evaluation."""
-
-    def __init__(self, prompts: Union[Dict[str, str], PromptCollection], service_registry: Optional[Any] = None, bus_manager: Optional[Any] = None):
-        self.prompts = prompts
-        self.service_registry = service_registry
-        self.bus_manager = bus_manager
-        self._instruction_generator: Optional[Any] = None
-
-    def build_main_user_content(
-        self,
-        triaged_inputs: EnhancedDMAInputs,
-        agent_name: Optional[str] = None
-    ) -> str:
-        """Build the main user content for LLM evaluation."""
-
-        # Extract core components from typed input
-        original_thought = triaged_inputs.original_thought
-        ethical_pdma_result = triaged_inputs.ethical_pdma_result
-        csdma_result = triaged_inputs.csdma_result
-        dsdma_result = triaged_inputs.dsdma_result
-        current_thought_depth = triaged_inputs.current_thought_depth
-        max_rounds = triaged_inputs.max_rounds
-
-        # Build context sections
-        permitted_actions = self._get_permitted_actions(triaged_inputs)
-        _action_options_str = ", ".join([a.value for a in permitted_actions])
-
-        _available_tools_str = self._get_available_tools_str(permitted_actions)
-
-        # Build DMA summaries
-        _ethical_summary = self._build_ethical_summary(ethical_pdma_result)
-        _csdma_summary = self._build_csdma_summary(csdma_result)
-        _dsdma_summary_str = self._build_dsdma_summary(dsdma_result)
-
-        # Build ponder context
-        _ponder_notes_str = self._build_ponder_context(
-            original_thought, current_thought_depth
-        )
-
-        # Build final attempt advisory
-        _final_ponder_advisory = self._build_final_attempt_advisory(
-            current_thought_depth, max_rounds, agent_name
-        )
-
-        # Build guidance sections
-        _guidance_sections = self._build_guidance_sections(agent_name, permitted_actions)
-
-        # Build system context
-        processing_context = triaged_inputs.processing_context
-        user_profile_context_str, system_snapshot_context_str = self._build_system_context(
-            processing_context
-        )
-
-        # Build startup guidance
-        _startup_guidance = self._build_startup_guidance(original_thought)
-
-        # Build conscience feedback guidance if available
-        conscience_feedback = getattr(triaged_inputs, 'conscience_feedback', None)
-        _conscience_guidance = self._build_conscience_guidance(conscience_feedback)
-        
-        # Get reject thought guidance
-        _reject_thought_guidance = self._get_reject_thought_guidance()
-        
-        # Extract all guidance sections for template formatting
-        _action_parameter_schemas = _guidance_sections.get('action_parameter_schemas', '')
-        _action_parameters_speak_csdma_guidance = _guidance_sections.get('action_parameters_speak_csdma_guidance', '')
-        _action_parameters_ponder_guidance = _guidance_sections.get('action_parameters_ponder_guidance', '')
-        _action_parameters_observe_guidance = _guidance_sections.get('action_parameters_observe_guidance', '')
-        _rationale_csdma_guidance = _guidance_sections.get('rationale_csdma_guidance', '')
-
-        # Assemble final content
-        main_user_content = """
+# Identical for every thought with the same profile, permitted actions and tools
+STATIC_USER_TEMPLATE = """
 Your task is to determine the single most appropriate HANDLER ACTION based on an original thought and evaluations from three prior DMAs (Ethical PDMA, CSDMA, DSDMA).
 You MUST execute the Principled Decision-Making Algorithm (PDMA) to choose this HANDLER ACTION and structure your response as a JSON object matching the provided schema.
 All fields specified in the schema for your response are MANDATORY unless explicitly marked as optional.
 Permitted Handler Actions: {action_options_str}{available_tools_str}
-{startup_guidance}
-{conscience_guidance}
 {reject_thought_guidance}
-{final_ponder_advisory}
 {action_parameter_schemas}
 Action Selection Instructions:
 Based on the DMA results and original thought, select the most appropriate handler action.
@@ -106,7 +33,13 @@ Your response MUST be a JSON object with exactly these three keys:
     {rationale_csdma_guidance}
 
 IMPORTANT: Return ONLY a JSON object with these exact keys: selected_action, action_parameters, rationale.
+"""
 
+# Rendered for every thought
+DYNAMIC_USER_TEMPLATE = """
+{startup_guidance}
+{conscience_guidance}
+{final_ponder_advisory}
 Original Thought: "{original_thought_content}"
 {ponder_notes_str}
 {user_profile_context_str}
@@ -120,31 +53,99 @@ DSDMA: {dsdma_summary_str}
 Based on all the provided information and the PDMA framework for action selection, determine the appropriate handler action and structure your response as specified.
 Adhere strictly to the schema for your JSON output.
 """
-        # Format the template with all the variables
-        formatted_content = main_user_content.format(
-            action_options_str=_action_options_str,
-            available_tools_str=_available_tools_str,
-            startup_guidance=_startup_guidance,
-            conscience_guidance=_conscience_guidance,
-            reject_thought_guidance=_reject_thought_guidance,
-            action_parameter_schemas=_action_parameter_schemas,
-            action_parameters_speak_csdma_guidance=_action_parameters_speak_csdma_guidance,
-            action_parameters_ponder_guidance=_action_parameters_ponder_guidance,
-            action_parameters_observe_guidance=_action_parameters_observe_guidance,
-            rationale_csdma_guidance=_rationale_csdma_guidance,
-            self=self,
-            final_ponder_advisory=_final_ponder_advisory,
-            guidance_sections=_guidance_sections,
-            original_thought=original_thought,
+
+class ActionSelectionContextBuilder:
+    """Builds context for action selection evaluation."""
+
+    def __init__(self, prompts: Union[Dict[str, str], PromptCollection], service_registry: Optional[Any] = None, bus_manager: Optional[Any] = None):
+        self.prompts = prompts
+        self.service_registry = service_registry
+        self.bus_manager = bus_manager
+        self._instruction_generator: Optional[Any] = None
+        self._static_sections = StaticSectionCache()
+        # Sizes of the last content built, for prompt render reports
+        self.last_static_bytes = 0
+        self.last_dynamic_bytes = 0
+        self.last_static_cache_hit = False
+
+    def build_main_user_content(
+        self,
+        triaged_inputs: EnhancedDMAInputs,
+        agent_name: Optional[str] = None,
+        context_blocks: Optional[Tuple[str, str]] = None,
+    ) -> str:
+        """Build the main user content for LLM evaluation.
+
+        The content starts with the static instructions, which only depend on
+        the agent profile, the permitted actions and the tool catalog and are
+        rendered once per combination. The per-thought sections follow.
+        ``context_blocks`` is an already budgeted ``(user_profiles,
+        system_snapshot)`` pair; without it both are formatted in full.
+        """
+
+        # Extract core components from typed input
+        original_thought = triaged_inputs.original_thought
+        current_thought_depth = triaged_inputs.current_thought_depth
+        max_rounds = triaged_inputs.max_rounds
+
+        permitted_actions = self._get_permitted_actions(triaged_inputs)
+        # The tool fragment is pre-rendered by the ToolBus and changes with its catalog
+        available_tools_str = self._get_available_tools_str(permitted_actions)
+        static_key = (
+            agent_name.lower() if agent_name else None,
+            tuple(a.value for a in permitted_actions),
+            available_tools_str,
+        )
+        static_content, cache_hit = self._static_sections.get_or_render(
+            static_key,
+            lambda: self._build_static_user_content(agent_name, permitted_actions, available_tools_str),
+        )
+
+        # Build system context
+        if context_blocks is not None:
+            user_profile_context_str, system_snapshot_context_str = context_blocks
+        else:
+            user_profile_context_str, system_snapshot_context_str = self._build_system_context(
+                triaged_inputs.processing_context
+            )
+        conscience_feedback = getattr(triaged_inputs, 'conscience_feedback', None)
+
+        dynamic_content = DYNAMIC_USER_TEMPLATE.format(
+            startup_guidance=self._build_startup_guidance(original_thought),
+            conscience_guidance=self._build_conscience_guidance(conscience_feedback),
+            final_ponder_advisory=self._build_final_attempt_advisory(
+                current_thought_depth, max_rounds, agent_name
+            ),
             original_thought_content=original_thought.content,
-            ponder_notes_str=_ponder_notes_str,
+            ponder_notes_str=self._build_ponder_context(original_thought, current_thought_depth),
             user_profile_context_str=user_profile_context_str,
             system_snapshot_context_str=system_snapshot_context_str,
-            ethical_summary=_ethical_summary,
-            csdma_summary=_csdma_summary,
-            dsdma_summary_str=_dsdma_summary_str
-        )
-        return formatted_content.strip()
+            ethical_summary=self._build_ethical_summary(triaged_inputs.ethical_pdma_result),
+            csdma_summary=self._build_csdma_summary(triaged_inputs.csdma_result),
+            dsdma_summary_str=self._build_dsdma_summary(triaged_inputs.dsdma_result),
+        ).strip()
+
+        self.last_static_bytes = len(static_content.encode('utf-8'))
+        self.last_dynamic_bytes = len(dynamic_content.encode('utf-8'))
+        self.last_static_cache_hit = cache_hit
+        return f"{static_content}\n\n{dynamic_content}"
+
+    def _build_static_user_content(
+        self, agent_name: Optional[str], permitted_actions: List[HandlerActionType], available_tools_str: str
+    ) -> str:
+        """Render the instructions shared by every thought with the same profile and actions."""
+        guidance_sections = self._build_guidance_sections(agent_name, permitted_actions)
+        action_options_str = ", ".join([a.value for a in permitted_actions])
+        return STATIC_USER_TEMPLATE.format(
+            action_options_str=action_options_str,
+            available_tools_str=available_tools_str,
+            reject_thought_guidance=self._get_reject_thought_guidance(),
+            action_parameter_schemas=guidance_sections.get('action_parameter_schemas', ''),
+            action_parameters_speak_csdma_guidance=guidance_sections.get('action_parameters_speak_csdma_guidance', ''),
+            action_parameters_ponder_guidance=guidance_sections.get('action_parameters_ponder_guidance', ''),
+            action_parameters_observe_guidance=guidance_sections.get('action_parameters_observe_guidance', ''),
+            rationale_csdma_guidance=guidance_sections.get('rationale_csdma_guidance', ''),
+        ).strip()
 
     def _get_permitted_actions(self, triaged_inputs: EnhancedDMAInputs) -> List[HandlerActionType]:
         """Get permitted actions from triaged inputs."""
@@ -174,26 +175,22 @@ Adhere strictly to the schema for your JSON output.
         return list(permitted_actions)
 
     def _get_available_tools_str(self, permitted_actions: List[HandlerActionType]) -> str:
-        """Get available tools string if TOOL action is permitted."""
-        available_tools_str = ""
-        if HandlerActionType.TOOL in permitted_actions:
-            try:
-                # Get tools from service registry if available
-                if self.service_registry:
-                    from ciris_engine.schemas.runtime.enums import ServiceType
-                    tool_services = self.service_registry.get_services_by_type(ServiceType.TOOL)
-                    _all_tools: List[str] = []
-                    for service in tool_services:
-                        if hasattr(service, 'get_available_tools'):
-                            # This is an async method, so we need to handle it properly
-                            # For now, we'll skip the async call since we're in a sync context
-                            # The dynamic instruction generator will handle this better
-                            pass
-                    # Fall back to empty string if we can't get tools synchronously
-            except Exception:
-                pass
-
-        return available_tools_str
+        """Get available tools string if TOOL action is permitted.
+
+        The ToolBus renders its catalog once per adapter load/unload; this
+        reuses that fragment instead of querying tool services per thought.
+        """
+        if HandlerActionType.TOOL not in permitted_actions:
+            return ""
+        tool_bus = getattr(self.bus_manager, 'tool', None)
+        if tool_bus is None or not hasattr(tool_bus, 'get_tools_prompt_fragment'):
+            return ""
+        try:
+            fragment = tool_bus.get_tools_prompt_fragment()
+        except Exception as e:
+            logger.debug(f"Tool catalog not available: {e}")
+            return ""
+        return fragment if isinstance(fragment, str) else ""
 
     def _build_ethical_summary(self, ethical_pdma_result: EthicalDMAResult) -> str:
         """Build ethical DMA summary."""
@@ -1,7 +1,7 @@
 """Refactored Action Selection PDMA - Modular and Clean."""
 
 import logging
-from typing import Dict, Any, Optional, cast, Union
+from typing import Dict, Any, List, Optional, cast, Union
 from pathlib import Path
 
 from ciris_engine.schemas.runtime.models import Thought
@@ -11,14 +11,14 @@ from ciris_engine.schemas.dma.faculty import (
     EnhancedDMAInputs,
     FacultyEvaluationSet,
 )
-from ciris_engine.schemas.dma.prompts import PromptCollection
+from ciris_engine.schemas.dma.prompts import PromptCollection, PromptRenderReport
 from ciris_engine.schemas.actions.parameters import PonderParams
 from ciris_engine.schemas.runtime.enums import HandlerActionType
 from ciris_engine.logic.registries.base import ServiceRegistry
 from ciris_engine.protocols.dma.base import ActionSelectionDMAProtocol
 from ciris_engine.protocols.faculties import EpistemicFaculty
 from ciris_engine.logic.utils import COVENANT_TEXT
-from ciris_engine.logic.formatters import format_system_prompt_blocks, format_user_profiles, format_system_snapshot
+from ciris_engine.logic.formatters import format_system_prompt_blocks
 
 from .base_dma import BaseDMA
 from .action_selection import (
@@ -72,6 +72,8 @@ class ActionSelectionPDMAEvaluator(BaseDMA, ActionSelectionDMAProtocol):
         )
 
         self.context_builder = ActionSelectionContextBuilder(self.prompts, service_registry, self.sink)
+        self._system_guidance: Optional[str] = None
+        self.last_prompt_report: Optional[PromptRenderReport] = None
         self.faculty_integration = FacultyIntegration(faculties) if faculties else None
 
     async def evaluate(self, input_data: EnhancedDMAInputs, enable_recursive_evaluation: bool = False) -> ActionSelectionDMAResult:
@@ -169,8 +171,10 @@ class ActionSelectionPDMAEvaluator(BaseDMA, ActionSelectionDMAProtocol):
         agent_identity = getattr(input_data, "agent_identity", {})
         agent_name = agent_identity.get("agent_name", "CIRISAgent") if isinstance(agent_identity, dict) else getattr(agent_identity, "agent_name", "CIRISAgent")
 
+        system_snapshot_block, user_profiles_block = await self._format_context_blocks(input_data)
+
         main_user_content = self.context_builder.build_main_user_content(
-            input_data, agent_name
+            input_data, agent_name, context_blocks=(user_profiles_block, system_snapshot_block)
         )
 
         # Get faculty evaluations from typed input
@@ -182,21 +186,39 @@ class ActionSelectionPDMAEvaluator(BaseDMA, ActionSelectionDMAProtocol):
             )
             main_user_content += faculty_insights
 
-        system_message = self._build_system_message(input_data)
+        context_message = self._build_context_message(
+            input_data, system_snapshot_block, user_profiles_block
+        )
 
         # Get original thought from input_data for follow-up detection
         original_thought = input_data.original_thought
 
-        # Prepend thought type to covenant for rock-solid follow-up detection
-        covenant_with_metadata = COVENANT_TEXT
+        # Thought type leads the per-thought context for rock-solid follow-up detection
         if original_thought and hasattr(original_thought, 'thought_type'):
-            covenant_with_metadata = f"THOUGHT_TYPE={original_thought.thought_type.value}\n\n{COVENANT_TEXT}"
+            context_message = "\n\n".join(
+                filter(None, [f"THOUGHT_TYPE={original_thought.thought_type.value}", context_message])
+            )
 
+        # Static messages first so the prompt prefix is byte-identical across
+        # thoughts and provider-side prompt caching can reuse it
         messages = [
-            {"role": "system", "content": covenant_with_metadata},
-            {"role": "system", "content": system_message},
-            {"role": "user", "content": main_user_content},
+            {"role": "system", "content": COVENANT_TEXT},
+            {"role": "system", "content": self._get_system_guidance()},
         ]
+        stable_prefix_bytes = sum(len(m["content"].encode('utf-8')) for m in messages)
+        if context_message:
+            messages.append({"role": "system", "content": context_message})
+        messages.append({"role": "user", "content": main_user_content})
+
+        self.last_prompt_report = self._build_render_report(
+            original_thought.thought_id, messages, stable_prefix_bytes
+        )
+        logger.debug(
+            f"Action selection prompt for thought {original_thought.thought_id}: "
+            f"{self.last_prompt_report.rendered_bytes} bytes rendered, "
+            f"{self.last_prompt_report.cached_bytes} bytes reused, "
+            f"{stable_prefix_bytes} bytes stable prefix"
+        )
 
         result_tuple = await self.call_llm_structured(
             messages=messages,
@@ -216,49 +238,34 @@ class ActionSelectionPDMAEvaluator(BaseDMA, ActionSelectionDMAProtocol):
 
         return final_result
 
-    def _build_system_message(self, input_data: EnhancedDMAInputs) -> str:
-        """Build the system message for LLM evaluation."""
+    async def _format_context_blocks(self, input_data: EnhancedDMAInputs) -> tuple[str, str]:
+        """System snapshot and user profile blocks, fitted to the context budget."""
 
         processing_context = input_data.processing_context
+        if isinstance(processing_context, dict):
+            system_snapshot = processing_context.get("system_snapshot")
+        else:
+            system_snapshot = getattr(processing_context, "system_snapshot", None)
+        if not system_snapshot:
+            return "", ""
+        return await self.format_context_blocks(system_snapshot)
 
-        system_snapshot_block = ""
-        user_profiles_block = ""
-        identity_block = ""
+    def _build_context_message(
+        self,
+        input_data: EnhancedDMAInputs,
+        system_snapshot_block: str,
+        user_profiles_block: str,
+    ) -> str:
+        """Build the per-thought system context: identity, system snapshot and user profiles."""
+
+        processing_context = input_data.processing_context
 
+        identity_block = ""
         if processing_context:
             if isinstance(processing_context, dict):
-                system_snapshot = processing_context.get("system_snapshot")
-                if system_snapshot:
-                    user_profiles_block = format_user_profiles(
-                        system_snapshot.get("user_profiles")
-                    )
-                    system_snapshot_block = format_system_snapshot(system_snapshot)
                 identity_block = processing_context.get("identity_context", "")
-            else:
-                # Handle ThoughtContext objects
-                if hasattr(processing_context, "system_snapshot") and processing_context.system_snapshot:
-                    user_profiles_block = format_user_profiles(
-                        getattr(processing_context.system_snapshot, "user_profiles", None)
-                    )
-                    system_snapshot_block = format_system_snapshot(processing_context.system_snapshot)
-                if hasattr(processing_context, "identity_context"):
-                    identity_block = processing_context.identity_context or ""
-
-        # Get prompts based on type
-        if isinstance(self.prompts, PromptCollection):
-            system_header = self.prompts.system_header or ""
-            decision_format = self.prompts.decision_format or ""
-            closing_reminder = self.prompts.closing_reminder or ""
-        else:
-            system_header = self.prompts.get("system_header", "")
-            decision_format = self.prompts.get("decision_format", "")
-            closing_reminder = self.prompts.get("closing_reminder", "")
-        
-        system_guidance = DEFAULT_TEMPLATE.format(
-            system_header=system_header,
-            decision_format=decision_format,
-            closing_reminder=closing_reminder,
-        )
+            elif hasattr(processing_context, "identity_context"):
+                identity_block = processing_context.identity_context or ""
 
         return format_system_prompt_blocks(
             identity_block,
@@ -266,7 +273,48 @@ class ActionSelectionPDMAEvaluator(BaseDMA, ActionSelectionDMAProtocol):
             system_snapshot_block,
             user_profiles_block,
             None,
-            system_guidance,
+            None,
+        )
+
+    def _get_system_guidance(self) -> str:
+        """Static system guidance, rendered once from the loaded prompts."""
+        if self._system_guidance is None:
+            # Get prompts based on type
+            if isinstance(self.prompts, PromptCollection):
+                system_header = self.prompts.system_header or ""
+                decision_format = self.prompts.decision_format or ""
+                closing_reminder = self.prompts.closing_reminder or ""
+            else:
+                system_header = self.prompts.get("system_header", "")
+                decision_format = self.prompts.get("decision_format", "")
+                closing_reminder = self.prompts.get("closing_reminder", "")
+
+            self._system_guidance = DEFAULT_TEMPLATE.format(
+                system_header=system_header,
+                decision_format=decision_format,
+                closing_reminder=closing_reminder,
+            )
+        return self._system_guidance
+
+    def _build_render_report(
+        self,
+        thought_id: str,
+        messages: List[Dict[str, str]],
+        stable_prefix_bytes: int,
+    ) -> PromptRenderReport:
+        """Account for how much of the prompt was rendered for this thought."""
+        total_bytes = sum(len(m["content"].encode('utf-8')) for m in messages)
+        builder = self.context_builder
+        cached_bytes = stable_prefix_bytes
+        if builder.last_static_cache_hit:
+            cached_bytes += builder.last_static_bytes
+        return PromptRenderReport(
+            thought_id=thought_id,
+            total_bytes=total_bytes,
+            rendered_bytes=total_bytes - cached_bytes,
+            cached_bytes=cached_bytes,
+            stable_prefix_bytes=stable_prefix_bytes,
+            static_cache_hit=builder.last_static_cache_hit,
         )
 
     def _create_fallback_result(self, error_message: str) -> ActionSelectionDMAResult:
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
-import yaml
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional, Any, Dict, TypeVar, Generic, TYPE_CHECKING, Tuple, Union
 
 from pydantic import BaseModel
-from ciris_engine.schemas.dma.prompts import PromptCollection
+from ciris_engine.schemas.dma.prompts import ContextBudgetReport, PromptCollection
 
 from ciris_engine.logic.registries.base import ServiceRegistry
+from ciris_engine.logic.formatters import format_budgeted_context
 from ciris_engine.protocols.services import LLMService
 from ciris_engine.schemas.runtime.enums import ServiceType
+from .prompt_cache import load_prompt_file
 
 if TYPE_CHECKING:
     from ciris_engine.protocols.faculties import EpistemicFaculty
@@ -33,6 +34,7 @@ class BaseDMA(ABC, Generic[InputT, DMAResultT]):
         prompt_overrides: Optional[Union[Dict[str, str], PromptCollection]] = None,
         faculties: Optional[Dict[str, 'EpistemicFaculty']] = None,
         sink: Optional[Any] = None,
+        context_budget_tokens: Optional[int] = None,
         **kwargs: Any
     ) -> None:
         self.service_registry = service_registry
@@ -40,6 +42,8 @@ class BaseDMA(ABC, Generic[InputT, DMAResultT]):
         self.max_retries = max_retries
         self.faculties = faculties or {}
         self.sink = sink
+        self.context_budget_tokens = context_budget_tokens
+        self.last_context_report: Optional[ContextBudgetReport] = None
 
         self.kwargs = kwargs
 
@@ -67,8 +71,7 @@ class BaseDMA(ABC, Generic[InputT, DMAResultT]):
                     self.prompts = overrides
                     return
                     
-                with open(prompt_file, 'r') as f:
-                    file_prompts = yaml.safe_load(f) or {}
+                file_prompts = load_prompt_file(prompt_file) or {}
                     
                 # Support both dict and PromptCollection
                 if isinstance(overrides, dict):
@@ -138,6 +141,48 @@ class BaseDMA(ABC, Generic[InputT, DMAResultT]):
 
         return result
 
+    async def format_context_blocks(self, system_snapshot: Any, user_profiles: Any = None) -> Tuple[str, str]:
+        """System snapshot and user profile blocks fitted to this DMA's context budget.
+
+        ``user_profiles`` defaults to the snapshot's own profiles. Tokens
+        saved by the budget are recorded as the ``dma_context_tokens_saved``
+        metric.
+
+        Returns:
+            ``(system_snapshot_block, user_profiles_block)``
+        """
+        if user_profiles is None and system_snapshot is not None:
+            if isinstance(system_snapshot, dict):
+                user_profiles = system_snapshot.get("user_profiles")
+            else:
+                user_profiles = getattr(system_snapshot, "user_profiles", None)
+
+        snapshot_block, profiles_block, report = format_budgeted_context(
+            system_snapshot, user_profiles, self.context_budget_tokens
+        )
+        self.last_context_report = report
+
+        if report.saved_tokens > 0:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.debug(
+                f"{self.__class__.__name__} context budget {report.budget_tokens}: "
+                f"{report.original_tokens} -> {report.assembled_tokens} tokens "
+                f"(summarized={report.summarized}, truncated={report.truncated}, dropped={report.dropped})"
+            )
+            telemetry_service = getattr(self.sink, "telemetry_service", None)
+            if telemetry_service:
+                try:
+                    await telemetry_service.record_metric(
+                        "dma_context_tokens_saved",
+                        float(report.saved_tokens),
+                        tags={"dma": self.__class__.__name__},
+                    )
+                except Exception as e:
+                    logger.debug(f"Failed to record context budget savings: {e}")
+
+        return snapshot_block, profiles_block
+
     async def apply_faculties(self, content: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, BaseModel]:
         """Apply available epistemic faculties to content.
 
@@ -6,9 +6,8 @@ from ciris_engine.logic.registries.base import ServiceRegistry
 from .base_dma import BaseDMA
 from ciris_engine.protocols.dma.base import CSDMAProtocol
 from ciris_engine.schemas.dma.results import CSDMAResult
+from ciris_engine.schemas.dma.prompts import PromptCollection
 from ciris_engine.logic.formatters import (
-    format_system_snapshot,
-    format_user_profiles,
     format_parent_task_chain,
     format_thoughts_chain,
     format_system_prompt_blocks,
@@ -59,14 +58,22 @@ class CSDMAEvaluator(BaseDMA, CSDMAProtocol):
         except FileNotFoundError:
             logger.warning("CSDMA prompt template not found, using fallback")
             # Fallback to embedded prompt for backward compatibility
-            self.prompt_template_data = {
-                "system_guidance_header": DEFAULT_TEMPLATE,
-                "covenant_header": True
-            }
+            self.prompt_template_data = PromptCollection(
+                component_name="csdma_common_sense",
+                description="Embedded fallback CSDMA prompt",
+                system_guidance_header=DEFAULT_TEMPLATE,
+                uses_covenant_header=True,
+            )
 
-        # Apply prompt overrides if provided
+        # Apply prompt overrides if provided; keys that are not prompt
+        # sections are kept as custom prompts
         if self.prompt_overrides:
-            self.prompt_template_data.update(self.prompt_overrides)
+            sections = {k: v for k, v in self.prompt_overrides.items() if k in PromptCollection.model_fields}
+            custom = {k: v for k, v in self.prompt_overrides.items() if k not in PromptCollection.model_fields}
+            self.prompt_template_data = self.prompt_template_data.model_copy(update={
+                **sections,
+                "custom_prompts": {**self.prompt_template_data.custom_prompts, **custom},
+            })
 
         # Client will be retrieved from the service registry during evaluation
 
@@ -147,9 +154,7 @@ class CSDMAEvaluator(BaseDMA, CSDMAProtocol):
         if hasattr(thought_item, 'context') and thought_item.context:
             system_snapshot = thought_item.context.get("system_snapshot")
             if system_snapshot:
-                user_profiles_data = system_snapshot.get("user_profiles")
-                user_profiles_block = format_user_profiles(user_profiles_data)
-                system_snapshot_block = format_system_snapshot(system_snapshot)
+                system_snapshot_block, user_profiles_block = await self.format_context_blocks(system_snapshot)
 
         identity_block = ""
         if hasattr(thought_item, "context") and thought_item.context:
@@ -8,8 +8,6 @@ from ciris_engine.logic.registries.base import ServiceRegistry
 from .base_dma import BaseDMA
 from ciris_engine.protocols.dma.base import DSDMAProtocol
 from ciris_engine.logic.formatters import (
-    format_user_profiles,
-    format_system_snapshot,
     format_system_prompt_blocks,
     get_escalation_guidance
 )
@@ -139,8 +137,9 @@ class BaseDSDMA(BaseDMA, DSDMAProtocol):
                     'interests': getattr(profile, 'interests', []),
                     'primary_channel': getattr(profile, 'primary_channel', None)
                 }
-            user_profiles_block = format_user_profiles(user_profiles_dict)
-            system_snapshot_block = format_system_snapshot(system_snapshot)
+            system_snapshot_block, user_profiles_block = await self.format_context_blocks(
+                system_snapshot, user_profiles_dict
+            )
 
             # Get identity from system snapshot - CRITICAL requirement
             if not system_snapshot.agent_identity:
@@ -161,9 +160,7 @@ class BaseDSDMA(BaseDMA, DSDMAProtocol):
             if hasattr(thought_item, 'context') and thought_item.context:
                 system_snapshot = thought_item.context.get("system_snapshot")
                 if system_snapshot:
-                    user_profiles_data = system_snapshot.get("user_profiles")
-                    user_profiles_block = format_user_profiles(user_profiles_data)
-                    system_snapshot_block = format_system_snapshot(system_snapshot)
+                    system_snapshot_block, user_profiles_block = await self.format_context_blocks(system_snapshot)
 
                 identity_block = thought_item.context.get("identity_context", "")
 
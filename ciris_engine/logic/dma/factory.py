@@ -106,6 +106,7 @@ def create_dsdma_from_identity(
     *,
     model_name: Optional[str] = None,
     sink: Optional[Any] = None,
+    context_budget_tokens: Optional[int] = None,
 ) -> Optional[BaseDSDMA]:
     """Instantiate a DSDMA based on the agent's identity.
 
@@ -139,6 +140,7 @@ def create_dsdma_from_identity(
         domain_specific_knowledge=domain_knowledge,
         prompt_template=prompt_template,
         sink=sink,
+        context_budget_tokens=context_budget_tokens,
     )
 
     # Ensure we return the correct type
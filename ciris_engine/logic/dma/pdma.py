@@ -6,7 +6,6 @@ from ciris_engine.logic.registries.base import ServiceRegistry
 from .base_dma import BaseDMA
 from ciris_engine.protocols.dma.base import PDMAProtocol
 from ciris_engine.schemas.dma.results import EthicalDMAResult
-from ciris_engine.logic.formatters import format_user_profiles, format_system_snapshot
 from ciris_engine.logic.utils import COVENANT_TEXT
 from ciris_engine.schemas.runtime.system_context import ThoughtState
 from .prompt_loader import get_prompt_loader
@@ -76,11 +75,11 @@ class EthicalPDMAEvaluator(BaseDMA, PDMAProtocol):
         system_snapshot_context_str = ""
         user_profile_context_str = ""
         if context and hasattr(context, 'system_snapshot') and context.system_snapshot:
-            system_snapshot_context_str = format_system_snapshot(context.system_snapshot)
-            if hasattr(context.system_snapshot, 'user_profiles') and context.system_snapshot.user_profiles:
-                user_profile_context_str = format_user_profiles(context.system_snapshot.user_profiles)
+            system_snapshot_context_str, user_profile_context_str = await self.format_context_blocks(
+                context.system_snapshot
+            )
         elif context and hasattr(context, 'user_profiles') and context.user_profiles:
-            user_profile_context_str = format_user_profiles(context.user_profiles)
+            _, user_profile_context_str = await self.format_context_blocks(None, context.user_profiles)
 
         full_context_str = system_snapshot_context_str + user_profile_context_str
 
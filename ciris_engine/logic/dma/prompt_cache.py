@@ -0,0 +1,86 @@
+"""
+Prompt compilation caches for DMA systems.
+
+Prompt YAML files are parsed once per file version instead of on every
+DMA construction, and sections of a prompt that only depend on the agent
+profile and permitted actions are rendered once and reused for every
+thought.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Tuple, Union
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+_file_cache: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_file_cache_lock = threading.Lock()
+
+
+def load_prompt_file(path: Union[str, Path]) -> Any:
+    """Parse a prompt YAML file, reusing the result until the file changes.
+
+    Returns a shallow copy for mappings so callers can merge overrides
+    without touching the cached value.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        yaml.YAMLError: If the YAML file is malformed
+    """
+    resolved = str(Path(path).resolve())
+    stat = Path(resolved).stat()
+    version = (stat.st_mtime_ns, stat.st_size)
+
+    with _file_cache_lock:
+        cached = _file_cache.get(resolved)
+    if cached is None or cached[0] != version:
+        with open(resolved, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        with _file_cache_lock:
+            _file_cache[resolved] = (version, data)
+        logger.debug(f"Parsed prompt file {resolved}")
+    else:
+        data = cached[1]
+    return dict(data) if isinstance(data, dict) else data
+
+
+def clear_prompt_file_cache() -> None:
+    """Forget every parsed prompt file."""
+    with _file_cache_lock:
+        _file_cache.clear()
+
+
+class StaticSectionCache:
+    """Rendered prompt sections keyed by whatever they depend on.
+
+    Keys are typically (agent profile, permitted actions, tool catalog
+    version). The oldest entries are evicted beyond ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int = 64) -> None:
+        self.max_entries = max_entries
+        self._sections: "OrderedDict[Hashable, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> Tuple[str, bool]:
+        """Return the section for ``key`` and whether it came from cache."""
+        section = self._sections.get(key)
+        if section is not None:
+            self._sections.move_to_end(key)
+            self.hits += 1
+            return section, True
+
+        section = render()
+        self.misses += 1
+        self._sections[key] = section
+        if len(self._sections) > self.max_entries:
+            self._sections.popitem(last=False)
+        return section, False
+
+    def clear(self) -> None:
+        self._sections.clear()
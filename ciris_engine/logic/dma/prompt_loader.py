@@ -10,6 +10,7 @@ import logging
 from typing import Any, Optional, Dict
 from pathlib import Path
 from ciris_engine.schemas.dma.prompts import PromptCollection, PromptMetadata
+from .prompt_cache import load_prompt_file
 
 logger = logging.getLogger(__name__)
 
@@ -53,8 +54,8 @@ class DMAPromptLoader:
             raise FileNotFoundError(f"Prompt template not found: {template_path}")
 
         try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                template_data = yaml.safe_load(f)
+            # Parsed once per file version; later loads reuse the cached YAML
+            template_data = load_prompt_file(template_path)
 
             if not isinstance(template_data, dict):
                 raise ValueError(f"Invalid template format in {template_path}: expected dict, got {type(template_data)}")
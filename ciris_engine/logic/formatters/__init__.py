@@ -9,6 +9,12 @@ from .prompt_blocks import (
     format_user_prompt_blocks,
 )
 from .escalation import get_escalation_guidance
+from .context_budget import (
+    assemble_context,
+    estimate_tokens,
+    format_budgeted_context,
+    truncate_to_tokens,
+)
 
 __all__ = [
     "format_system_snapshot",
@@ -18,4 +24,8 @@ __all__ = [
     "format_system_prompt_blocks",
     "format_user_prompt_blocks",
     "get_escalation_guidance",
+    "assemble_context",
+    "estimate_tokens",
+    "format_budgeted_context",
+    "truncate_to_tokens",
 ]
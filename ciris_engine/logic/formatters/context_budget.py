@@ -0,0 +1,145 @@
+"""Token-budgeted assembly of prompt context blocks.
+
+System snapshots and user profiles grow with the agent's age: telemetry
+summaries, service usage and the recalled attribute dumps in
+``UserProfile.notes`` all end up in every DMA prompt. The assembler here
+estimates the tokens of each block, fits blocks into a budget in priority
+order, and summarizes, truncates or drops the ones that do not fit. Blocks
+are always returned in their original order so the prompt layout does not
+change, only its size.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ciris_engine.schemas.dma.prompts import ContextBlock, ContextBudgetReport
+
+from .system_snapshot import system_snapshot_sections
+from .user_profiles import format_user_profiles
+
+# Rough characters-per-token ratio for English prompt text. Good enough to
+# budget with and far cheaper than running a tokenizer on every block.
+CHARS_PER_TOKEN = 4
+TRUNCATION_MARKER = "[... truncated to fit the context budget]"
+
+# Snapshot sections by priority. The header carries the critical resource
+# alerts and is never cut.
+SNAPSHOT_SECTION_PRIORITIES: Dict[str, int] = {
+    "header": 100,
+    "counts": 80,
+    "status": 70,
+    "telemetry": 20,
+}
+USER_PROFILES_PRIORITY = 50
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the prompt tokens of ``text``."""
+    if not text:
+        return 0
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut ``text`` on line boundaries so it fits ``max_tokens``, marking the cut."""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    limit = max_tokens * CHARS_PER_TOKEN - len(TRUNCATION_MARKER) - 1
+    if limit <= 0:
+        return ""
+
+    kept: List[str] = []
+    used = 0
+    for line in text.split("\n"):
+        cost = len(line) + 1
+        if used + cost > limit:
+            break
+        kept.append(line)
+        used += cost
+    if not any(kept):
+        # Not even the first line fits; fall back to a character cut
+        kept = [text[:limit]]
+    return "\n".join(kept + [TRUNCATION_MARKER])
+
+def assemble_context(
+    blocks: Sequence[ContextBlock],
+    budget_tokens: Optional[int],
+) -> Tuple[List[str], ContextBudgetReport]:
+    """Fit ``blocks`` into ``budget_tokens``.
+
+    Required blocks are kept first, then the rest by descending priority:
+    in full if they fit, else their summary, else truncated to what is left
+    if that is at least ``min_tokens``, else dropped. Returns the text for
+    every block in input order ("" for dropped blocks) and a report.
+    """
+    texts = [block.text for block in blocks]
+    original_tokens = sum(estimate_tokens(text) for text in texts)
+    report = ContextBudgetReport(
+        budget_tokens=budget_tokens,
+        original_tokens=original_tokens,
+        assembled_tokens=original_tokens,
+    )
+    if budget_tokens is None or original_tokens <= budget_tokens:
+        return texts, report
+
+    remaining = budget_tokens - sum(estimate_tokens(b.text) for b in blocks if b.required)
+    optional = sorted(
+        (i for i, block in enumerate(blocks) if not block.required),
+        key=lambda i: -blocks[i].priority,
+    )
+    for i in optional:
+        block = blocks[i]
+        if estimate_tokens(block.text) <= remaining:
+            texts[i] = block.text
+        elif block.summary is not None and estimate_tokens(block.summary) <= remaining:
+            texts[i] = block.summary
+            report.summarized.append(block.name)
+        elif remaining >= block.min_tokens:
+            texts[i] = truncate_to_tokens(block.summary or block.text, remaining)
+            report.truncated.append(block.name)
+        else:
+            texts[i] = ""
+            report.dropped.append(block.name)
+        remaining -= estimate_tokens(texts[i])
+
+    report.assembled_tokens = sum(estimate_tokens(text) for text in texts)
+    return texts, report
+
+def format_budgeted_context(
+    system_snapshot: Any,
+    user_profiles: Any,
+    budget_tokens: Optional[int],
+) -> Tuple[str, str, ContextBudgetReport]:
+    """System snapshot and user profile blocks fitted to ``budget_tokens``.
+
+    With no budget (or when everything fits) the result is exactly
+    ``format_system_snapshot`` and ``format_user_profiles``. Over budget,
+    low-priority snapshot sections (telemetry first) are cut and user
+    profiles fall back to names without their notes.
+
+    Returns:
+        ``(system_snapshot_block, user_profiles_block, report)``
+    """
+    blocks: List[ContextBlock] = []
+    if system_snapshot is not None:
+        for name, lines in system_snapshot_sections(system_snapshot):
+            priority = SNAPSHOT_SECTION_PRIORITIES.get(name, 0)
+            blocks.append(ContextBlock(
+                name=f"snapshot.{name}",
+                text="\n".join(lines),
+                priority=priority,
+                required=name == "header",
+            ))
+    snapshot_count = len(blocks)
+
+    profiles_block = format_user_profiles(user_profiles)
+    if profiles_block:
+        summary = format_user_profiles(user_profiles, include_notes=False)
+        blocks.append(ContextBlock(
+            name="user_profiles",
+            text=profiles_block,
+            priority=USER_PROFILES_PRIORITY,
+            summary=summary if summary != profiles_block else None,
+        ))
+
+    texts, report = assemble_context(blocks, budget_tokens)
+    snapshot_block = "\n".join(text for text in texts[:snapshot_count] if text)
+    profiles_text = texts[snapshot_count] if len(texts) > snapshot_count else ""
+    return snapshot_block, profiles_text, report
@@ -1,3 +1,5 @@
+from typing import Any, List, Tuple
+
 from ciris_engine.schemas.runtime.system_context import SystemSnapshot
 
 def format_system_snapshot(system_snapshot: SystemSnapshot) -> str:
@@ -13,7 +15,18 @@ def format_system_snapshot(system_snapshot: SystemSnapshot) -> str:
     str
         Compact block ready to append after task context.
     """
+    lines: List[str] = []
+    for _, section in system_snapshot_sections(system_snapshot):
+        lines.extend(section)
+    return "\n".join(lines)
+
+def system_snapshot_sections(system_snapshot: Any) -> List[Tuple[str, List[str]]]:
+    """Split the snapshot block into named sections, in prompt order.
 
+    Joining every section's lines with newlines gives exactly
+    :func:`format_system_snapshot`; the context budget uses the names to
+    decide which sections to keep when the prompt is over budget.
+    """
     lines = ["=== System Snapshot ==="]
 
     # CRITICAL: Check for resource alerts FIRST
@@ -23,8 +36,10 @@ def format_system_snapshot(system_snapshot: SystemSnapshot) -> str:
             lines.append(alert)
         lines.append("🚨🚨🚨 END CRITICAL ALERTS 🚨🚨🚨")
         lines.append("")  # Empty line for emphasis
+    sections: List[Tuple[str, List[str]]] = [("header", lines)]
 
     # System counts if available
+    lines = []
     if hasattr(system_snapshot, 'system_counts') and system_snapshot.system_counts:
         counts = system_snapshot.system_counts
         if 'pending_tasks' in counts:
@@ -35,8 +50,10 @@ def format_system_snapshot(system_snapshot: SystemSnapshot) -> str:
             lines.append(f"Total Tasks: {counts['total_tasks']}")
         if 'total_thoughts' in counts:
             lines.append(f"Total Thoughts: {counts['total_thoughts']}")
+    sections.append(("counts", lines))
 
     # Telemetry/Resource Usage Summary
+    lines = []
     if hasattr(system_snapshot, 'telemetry_summary') and system_snapshot.telemetry_summary:
         telemetry = system_snapshot.telemetry_summary
         lines.append("")
@@ -69,6 +86,7 @@ def format_system_snapshot(system_snapshot: SystemSnapshot) -> str:
             lines.append("Service Usage:")
             for service, count in sorted(telemetry.service_calls.items(), key=lambda x: x[1], reverse=True)[:5]:
                 lines.append(f"  - {service}: {count} calls")
+    sections.append(("telemetry", lines))
 
     # Legacy fields for backward compatibility
     fields = [
@@ -78,10 +96,12 @@ def format_system_snapshot(system_snapshot: SystemSnapshot) -> str:
         ("error_rate", "Error Rate"),
     ]
 
+    lines = []
     for key, label in fields:
         if hasattr(system_snapshot, key):
             val = getattr(system_snapshot, key)
             if val is not None:
                 lines.append(f"{label}: {val}")
+    sections.append(("status", lines))
 
-    return "\n".join(lines)
+    return [(name, section) for name, section in sections if section]
@@ -1,26 +1,46 @@
-
-from typing import List, Optional, Any
-
-def format_user_profiles(profiles: Optional[dict[str, Any]]) -> str:
-    """Copy of format_user_profiles_for_prompt with new module path."""
-    # *** copied logic – do not modify yet ***
-    if not profiles or not isinstance(profiles, dict):
+from typing import Any, List, Optional, Union
+
+def format_user_profiles(
+    profiles: Optional[Union[dict[str, Any], List[Any]]],
+    include_notes: bool = True,
+) -> str:
+    """Format known user profiles into the prompt's user-context block.
+
+    Accepts the legacy ``{user_key: {...}}`` mapping or the list of
+    ``UserProfile`` models carried by ``SystemSnapshot.user_profiles``.
+    ``include_notes=False`` leaves out each profile's notes (the recalled
+    attribute and connected-node dumps), which is the summary the context
+    budget falls back to.
+    """
+    if not profiles:
         return ""
 
     profile_parts: List[str] = []
-    for user_key, profile_data in profiles.items():
-        if isinstance(profile_data, dict):
-            display_name = profile_data.get('name') or profile_data.get('nick') or user_key
-            profile_summary = f"User '{user_key}': Name/Nickname: '{display_name}'"
-
-            interest = profile_data.get('interest')
-            if interest:
-                profile_summary += f", Interest: '{str(interest)}'"
-
-            channel = profile_data.get('channel')
-            if channel:
-                profile_summary += f", Primary Channel: '{channel}'"
-
+    if isinstance(profiles, dict):
+        for user_key, profile_data in profiles.items():
+            if isinstance(profile_data, dict):
+                display_name = profile_data.get('name') or profile_data.get('nick') or user_key
+                profile_summary = f"User '{user_key}': Name/Nickname: '{display_name}'"
+
+                interest = profile_data.get('interest')
+                if interest:
+                    profile_summary += f", Interest: '{str(interest)}'"
+
+                channel = profile_data.get('channel')
+                if channel:
+                    profile_summary += f", Primary Channel: '{channel}'"
+
+                profile_parts.append(profile_summary)
+    elif isinstance(profiles, list):
+        for profile in profiles:
+            user_id = getattr(profile, 'user_id', None)
+            if not user_id:
+                continue
+            display_name = getattr(profile, 'display_name', None) or user_id
+            profile_summary = f"User '{user_id}': Name/Nickname: '{display_name}'"
+            notes = getattr(profile, 'notes', None)
+            if include_notes and notes:
+                profile_summary += "\n" + "\n".join(f"      {line}" for line in str(notes).splitlines())
             profile_parts.append(profile_summary)
 
     if not profile_parts:
@@ -1,5 +1,6 @@
 import logging
 import inspect
+import time
 from typing import Awaitable, Callable, Dict, Optional
 
 from ciris_engine.schemas.runtime.enums import HandlerActionType, ThoughtStatus
@@ -9,6 +10,7 @@ from ciris_engine.schemas.dma.results import ActionSelectionDMAResult
 from ciris_engine.protocols.services.graph.telemetry import TelemetryServiceProtocol
 from . import BaseActionHandler
 from ciris_engine.logic import persistence
+from ciris_engine.logic.telemetry.latency import latency_registry
 
 logger = logging.getLogger(__name__)
 
@@ -128,7 +130,13 @@ class ActionDispatcher:
                 )
 
             # The handler's `handle` method will take care of everything.
-            follow_up_thought_id = await handler_instance.handle(action_selection_result, thought, dispatch_context)
+            handler_start = time.perf_counter()
+            try:
+                follow_up_thought_id = await handler_instance.handle(action_selection_result, thought, dispatch_context)
+            finally:
+                latency_registry.record(
+                    "handler", action_type.value, (time.perf_counter() - handler_start) * 1000
+                )
 
             # Log completion with follow-up thought ID if available
             import datetime
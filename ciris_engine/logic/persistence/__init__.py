@@ -17,6 +17,7 @@ from .models import (
     get_all_tasks,
     get_task_by_id,
     get_tasks_by_status,
+    get_tasks_by_ids,
     get_recent_completed_tasks,
     get_top_tasks,
     get_pending_tasks_for_activation,
@@ -31,8 +32,10 @@ from .models import (
     async_get_thought_status,
     update_thought_status,
     get_thoughts_by_status,
+    get_recent_thoughts_by_status,
     get_thoughts_older_than,
     get_thoughts_by_task_id,
+    get_thoughts_by_task_ids,
     count_thoughts,
     delete_thoughts_by_ids,
     save_deferral_report_mapping,
@@ -43,13 +46,21 @@ from .models import (
     add_graph_edge,
     delete_graph_edge,
     get_edges_for_node,
+    get_edges_for_nodes,
+    get_graph_nodes_by_ids,
     get_all_graph_nodes,
+    get_graph_node_counts,
+    count_graph_nodes,
+    reconcile_graph_node_stats,
     get_nodes_by_type,
     add_correlation,
     update_correlation,
     get_correlation,
     get_correlations_by_task_and_action,
     get_correlations_by_channel,
+    get_recent_user_messages,
+    query_correlations,
+    CorrelationRecord,
     get_queue_status,
     QueueStatus,
 )
@@ -77,6 +88,7 @@ __all__ = [
     "get_all_tasks",
     "get_task_by_id",
     "get_tasks_by_status",
+    "get_tasks_by_ids",
     "get_recent_completed_tasks",
     "get_top_tasks",
     "get_pending_tasks_for_activation",
@@ -90,7 +102,9 @@ __all__ = [
     "async_get_thought_status",
     "update_thought_status",
     "get_thoughts_by_status",
+    "get_recent_thoughts_by_status",
     "get_thoughts_by_task_id",
+    "get_thoughts_by_task_ids",
     "count_thoughts",
     "delete_thoughts_by_ids",
     "save_deferral_report_mapping",
@@ -101,13 +115,21 @@ __all__ = [
     "add_graph_edge",
     "delete_graph_edge",
     "get_edges_for_node",
+    "get_edges_for_nodes",
+    "get_graph_nodes_by_ids",
     "get_all_graph_nodes",
+    "get_graph_node_counts",
+    "count_graph_nodes",
+    "reconcile_graph_node_stats",
     "get_nodes_by_type",
     "add_correlation",
     "update_correlation",
     "get_correlation",
     "get_correlations_by_task_and_action",
     "get_correlations_by_channel",
+    "get_recent_user_messages",
+    "query_correlations",
+    "CorrelationRecord",
     "get_pending_thoughts_for_active_tasks",
     "count_pending_thoughts_for_active_tasks",
     "count_active_tasks",
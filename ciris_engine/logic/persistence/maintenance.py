@@ -21,6 +21,7 @@ from ciris_engine.logic.persistence import (
     delete_thoughts_by_ids,
     update_thought_status,
     get_thoughts_older_than,
+    reconcile_graph_node_stats,
 )
 from ciris_engine.schemas.runtime.enums import TaskStatus, ThoughtStatus, ServiceType
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
@@ -54,9 +55,17 @@ class DatabaseMaintenanceService(BaseScheduledService, DatabaseMaintenanceServic
 
     async def _perform_periodic_maintenance(self) -> None:
         """Run periodic maintenance tasks."""
+        await self._reconcile_graph_node_stats()
         logger.info("Periodic maintenance tasks executed.")
-        # The actual maintenance logic would go here
-        # For now, this is a placeholder
+
+    async def _reconcile_graph_node_stats(self) -> None:
+        """Repair materialized graph node counts that drifted from graph_nodes."""
+        try:
+            corrected = await asyncio.to_thread(reconcile_graph_node_stats)
+            if not corrected:
+                logger.debug("Graph node stats are consistent")
+        except Exception as e:
+            logger.error(f"Failed to reconcile graph node stats: {e}", exc_info=True)
 
     async def _on_stop(self) -> None:
         """Stop hook for cleanup."""
@@ -0,0 +1,9 @@
+-- Index correlations by the user_id tag so per-user lookups (recent messages
+-- from other channels in user profiles) seek instead of scanning tags with LIKE.
+-- The json_valid guard keeps a malformed tags value from failing writes.
+-- Queries must use the identical expression (see USER_TAG_SQL in correlations.py).
+CREATE INDEX IF NOT EXISTS idx_correlations_tag_user_created
+    ON service_correlations(
+        (CASE WHEN json_valid(tags) THEN json_extract(tags, '$.user_id') END),
+        created_at
+    );
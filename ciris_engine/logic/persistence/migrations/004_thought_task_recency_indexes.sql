@@ -0,0 +1,6 @@
+-- Index thoughts and tasks for bounded "most recent N" and per-task lookups,
+-- so visibility snapshots and reasoning traces read a handful of rows from an
+-- index instead of scanning and sorting the full history.
+CREATE INDEX IF NOT EXISTS idx_thoughts_status_created ON thoughts(status, created_at);
+CREATE INDEX IF NOT EXISTS idx_thoughts_task_created ON thoughts(source_task_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_status_updated ON tasks(status, updated_at);
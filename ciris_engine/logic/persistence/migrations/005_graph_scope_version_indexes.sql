@@ -0,0 +1,4 @@
+-- Index graph nodes by (scope, updated_at) so the memory visualizer's graph
+-- version probe (COUNT and MAX(updated_at) per scope) and windowed node
+-- queries read from an index instead of scanning graph_nodes.
+CREATE INDEX IF NOT EXISTS idx_graph_nodes_scope_updated ON graph_nodes(scope, updated_at);
@@ -0,0 +1,55 @@
+-- Materialized node counts by (scope, node_type, day of created_at), kept in
+-- step with graph_nodes by triggers so every write path - persistence models,
+-- TSDB consolidation, raw cleanup deletes - updates them in the same
+-- transaction. Stats endpoints and health checks read this table instead of
+-- counting and grouping graph_nodes. DatabaseMaintenanceService reconciles it
+-- against graph_nodes periodically.
+CREATE TABLE IF NOT EXISTS graph_node_stats (
+    scope TEXT NOT NULL,
+    node_type TEXT NOT NULL,
+    day TEXT NOT NULL,
+    node_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (scope, node_type, day)
+);
+
+INSERT OR REPLACE INTO graph_node_stats (scope, node_type, day, node_count)
+SELECT scope, node_type, substr(created_at, 1, 10), COUNT(*)
+FROM graph_nodes
+GROUP BY scope, node_type, substr(created_at, 1, 10);
+
+CREATE TRIGGER IF NOT EXISTS trg_graph_node_stats_insert
+AFTER INSERT ON graph_nodes
+BEGIN
+    INSERT INTO graph_node_stats (scope, node_type, day, node_count)
+    VALUES (NEW.scope, NEW.node_type, substr(NEW.created_at, 1, 10), 1)
+    ON CONFLICT (scope, node_type, day) DO UPDATE SET node_count = node_count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_graph_node_stats_delete
+AFTER DELETE ON graph_nodes
+BEGIN
+    UPDATE graph_node_stats SET node_count = node_count - 1
+    WHERE scope = OLD.scope AND node_type = OLD.node_type AND day = substr(OLD.created_at, 1, 10);
+    DELETE FROM graph_node_stats
+    WHERE scope = OLD.scope AND node_type = OLD.node_type AND day = substr(OLD.created_at, 1, 10)
+      AND node_count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_graph_node_stats_update
+AFTER UPDATE OF scope, node_type, created_at ON graph_nodes
+WHEN OLD.scope IS NOT NEW.scope
+  OR OLD.node_type IS NOT NEW.node_type
+  OR substr(OLD.created_at, 1, 10) IS NOT substr(NEW.created_at, 1, 10)
+BEGIN
+    UPDATE graph_node_stats SET node_count = node_count - 1
+    WHERE scope = OLD.scope AND node_type = OLD.node_type AND day = substr(OLD.created_at, 1, 10);
+    DELETE FROM graph_node_stats
+    WHERE scope = OLD.scope AND node_type = OLD.node_type AND day = substr(OLD.created_at, 1, 10)
+      AND node_count <= 0;
+    INSERT INTO graph_node_stats (scope, node_type, day, node_count)
+    VALUES (NEW.scope, NEW.node_type, substr(NEW.created_at, 1, 10), 1)
+    ON CONFLICT (scope, node_type, day) DO UPDATE SET node_count = node_count + 1;
+END;
+
+-- Recent-activity and date-range lookups in the stats endpoint
+CREATE INDEX IF NOT EXISTS idx_graph_nodes_updated ON graph_nodes(updated_at);
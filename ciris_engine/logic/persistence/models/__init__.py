@@ -5,6 +5,7 @@ from .tasks import (
     get_all_tasks,
     get_task_by_id,
     get_tasks_by_status,
+    get_tasks_by_ids,
     get_recent_completed_tasks,
     get_top_tasks,
     get_pending_tasks_for_activation,
@@ -21,8 +22,10 @@ from .thoughts import (
     async_get_thought_status,
     update_thought_status,
     get_thoughts_by_status,
+    get_recent_thoughts_by_status,
     get_thoughts_older_than,
     get_thoughts_by_task_id,
+    get_thoughts_by_task_ids,
     count_thoughts,
     delete_thoughts_by_ids,
 )
@@ -34,7 +37,12 @@ from .graph import (
     add_graph_edge,
     delete_graph_edge,
     get_edges_for_node,
+    get_edges_for_nodes,
+    get_graph_nodes_by_ids,
     get_all_graph_nodes,
+    get_graph_node_counts,
+    count_graph_nodes,
+    reconcile_graph_node_stats,
     get_nodes_by_type,
 )
 from .correlations import (
@@ -43,6 +51,9 @@ from .correlations import (
     get_correlation,
     get_correlations_by_task_and_action,
     get_correlations_by_channel,
+    get_recent_user_messages,
+    query_correlations,
+    CorrelationRecord,
 )
 from .identity import (
     store_agent_identity,
@@ -63,6 +74,7 @@ __all__ = [
     "get_all_tasks",
     "get_task_by_id",
     "get_tasks_by_status",
+    "get_tasks_by_ids",
     "get_recent_completed_tasks",
     "get_top_tasks",
     "get_pending_tasks_for_activation",
@@ -75,8 +87,10 @@ __all__ = [
     "async_get_thought_status",
     "update_thought_status",
     "get_thoughts_by_status",
+    "get_recent_thoughts_by_status",
     "get_thoughts_older_than",
     "get_thoughts_by_task_id",
+    "get_thoughts_by_task_ids",
     "count_thoughts",
     "delete_thoughts_by_ids",
     "save_deferral_report_mapping",
@@ -87,11 +101,19 @@ __all__ = [
     "add_graph_edge",
     "delete_graph_edge",
     "get_edges_for_node",
+    "get_edges_for_nodes",
+    "get_graph_nodes_by_ids",
+    "get_graph_node_counts",
+    "count_graph_nodes",
+    "reconcile_graph_node_stats",
     "add_correlation",
     "update_correlation",
     "get_correlation",
     "get_correlations_by_task_and_action",
     "get_correlations_by_channel",
+    "get_recent_user_messages",
+    "query_correlations",
+    "CorrelationRecord",
     "store_agent_identity",
     "retrieve_agent_identity",
     "update_agent_identity",
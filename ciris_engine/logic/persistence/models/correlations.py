@@ -1,28 +1,212 @@
-import json
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Any, Dict, Union
+from typing import List, Optional, Any, Dict, Union, Sequence, Tuple
 
+from ciris_engine.utils import serialization
 from ciris_engine.logic.persistence import get_db_connection
-from ciris_engine.schemas.telemetry.core import ServiceCorrelation, ServiceCorrelationStatus, CorrelationType
+from ciris_engine.schemas.telemetry.core import (
+    ServiceCorrelation,
+    ServiceCorrelationStatus,
+    CorrelationType,
+    MetricData,
+    LogData,
+    TraceContext,
+)
 from ciris_engine.schemas.persistence.core import CorrelationUpdateRequest, MetricsQuery
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.constants import UTC_TIMEZONE_SUFFIX
 
 logger = logging.getLogger(__name__)
 
+# Column order of the service_correlations table. Queries select these
+# explicitly (never SELECT *) so projections and records share one layout.
+CORRELATION_COLUMNS: Tuple[str, ...] = (
+    "correlation_id",
+    "service_type",
+    "handler_name",
+    "action_type",
+    "request_data",
+    "response_data",
+    "status",
+    "created_at",
+    "updated_at",
+    "correlation_type",
+    "timestamp",
+    "metric_name",
+    "metric_value",
+    "log_level",
+    "trace_id",
+    "span_id",
+    "parent_span_id",
+    "tags",
+    "retention_policy",
+)
+
+_JSON_COLUMNS = frozenset({"request_data", "response_data", "tags"})
+_ALL_COLUMNS_SQL = ", ".join(CORRELATION_COLUMNS)
+_UNSET: Any = object()
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse a stored ISO timestamp, accepting both 'Z' and '+00:00' suffixes."""
+    if not value:
+        return None
+    try:
+        if value.endswith('Z'):
+            value = value[:-1] + UTC_TIMEZONE_SUFFIX
+        return datetime.fromisoformat(value)
+    except (ValueError, AttributeError):
+        return None
+
+
+def _loads_json(value: Optional[str]) -> Any:
+    """Decode a JSON column, treating NULL/empty as None."""
+    return serialization.loads(value) if value else None
+
+
 def _parse_response_data(response_data_json: Optional[Dict[str, Any]], timestamp: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
     """Parse response data JSON with backward compatibility for missing fields."""
     if not response_data_json:
         return None
-    
+
     # Ensure response_timestamp exists for backward compatibility
     if isinstance(response_data_json, dict) and "response_timestamp" not in response_data_json:
         # Use the correlation timestamp or current time as fallback
         response_data_json["response_timestamp"] = (timestamp or datetime.now(timezone.utc)).isoformat()
-    
+
     return response_data_json
 
+
+class CorrelationRecord:
+    """Lightweight read-only view over a (possibly projected) correlation row.
+
+    Values are kept as the raw tuple returned by SQLite. JSON columns
+    (request_data, response_data, tags) are only decoded on first access,
+    so bulk readers that look at a couple of scalar columns never pay for
+    json.loads or Pydantic validation. Accessing a column that was not
+    selected raises AttributeError.
+    """
+
+    __slots__ = ("_index", "_values", "_decoded")
+
+    def __init__(self, index: Dict[str, int], values: Sequence[Any]) -> None:
+        self._index = index
+        self._values = values
+        self._decoded: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, column: str) -> Any:
+        """Return the raw (undecoded) column value, like sqlite3.Row."""
+        try:
+            return self._values[self._index[column]]
+        except KeyError:
+            raise KeyError(f"Column '{column}' was not selected") from None
+
+    def __getattr__(self, column: str) -> Any:
+        index = self._index
+        if column not in index:
+            raise AttributeError(f"Column '{column}' was not selected")
+        raw = self._values[index[column]]
+        if column not in _JSON_COLUMNS:
+            return raw
+        if self._decoded is None:
+            self._decoded = {}
+        value = self._decoded.get(column, _UNSET)
+        if value is _UNSET:
+            value = _loads_json(raw)
+            self._decoded[column] = value
+        return value
+
+    def __repr__(self) -> str:
+        return f"CorrelationRecord({', '.join(f'{k}={self[k]!r}' for k in self._index)})"
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Columns present in this record."""
+        return tuple(self._index)
+
+    @property
+    def parsed_timestamp(self) -> Optional[datetime]:
+        """The timestamp column parsed into a datetime."""
+        return _parse_timestamp(self["timestamp"])
+
+    def to_correlation(self) -> ServiceCorrelation:
+        """Build the full ServiceCorrelation model (requires all columns)."""
+        return _row_to_correlation(self)
+
+
+def _row_to_correlation(row: Any) -> ServiceCorrelation:
+    """Decode a full service_correlations row into a ServiceCorrelation.
+
+    This is the single decoder used by every read path. ``row`` may be a
+    sqlite3.Row or a CorrelationRecord carrying all columns.
+    """
+    timestamp = _parse_timestamp(row["timestamp"])
+
+    # Map 'success' to 'completed' for backwards compatibility
+    status_value = row["status"]
+    if status_value == "success":
+        status_value = "completed"
+
+    tags = _loads_json(row["tags"])
+
+    correlation_data: Dict[str, Any] = {
+        "correlation_id": row["correlation_id"],
+        "service_type": row["service_type"],
+        "handler_name": row["handler_name"],
+        "action_type": row["action_type"],
+        "request_data": _loads_json(row["request_data"]) or None,
+        "response_data": _parse_response_data(_loads_json(row["response_data"]), timestamp),
+        "status": ServiceCorrelationStatus(status_value),
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "correlation_type": CorrelationType(row["correlation_type"] or "service_interaction"),
+        "timestamp": timestamp or datetime.now(timezone.utc),
+        "tags": {k: str(v) for k, v in tags.items()} if tags else {},
+        "retention_policy": row["retention_policy"] or "raw",
+    }
+
+    # Only add optional TSDB fields if they have values
+    if row["metric_name"] and row["metric_value"] is not None:
+        correlation_data["metric_data"] = MetricData(
+            metric_name=row["metric_name"],
+            metric_value=row["metric_value"],
+            metric_unit="count",
+            metric_type="gauge",
+            labels={}
+        )
+
+    if row["log_level"]:
+        correlation_data["log_data"] = LogData(
+            log_level=row["log_level"],
+            log_message="",  # Not stored in DB
+            logger_name="",
+            module_name="",
+            function_name="",
+            line_number=0
+        )
+
+    if row["trace_id"]:
+        correlation_data["trace_context"] = TraceContext(
+            trace_id=row["trace_id"],
+            span_id=row["span_id"] or "",
+            span_name="",
+            parent_span_id=row["parent_span_id"] or None,
+        )
+
+    return ServiceCorrelation(**correlation_data)
+
+
+def _resolve_columns(columns: Optional[Sequence[str]]) -> Tuple[str, ...]:
+    """Validate a projection against the known column set."""
+    if not columns:
+        return CORRELATION_COLUMNS
+    unknown = [c for c in columns if c not in CORRELATION_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown service_correlations columns: {', '.join(unknown)}")
+    # Preserve caller order, drop duplicates
+    return tuple(dict.fromkeys(columns))
+
+
 def add_correlation(corr: ServiceCorrelation, time_service: Optional[TimeServiceProtocol] = None, db_path: Optional[str] = None) -> str:
     sql = """
         INSERT INTO service_correlations (
@@ -40,8 +224,8 @@ def add_correlation(corr: ServiceCorrelation, time_service: Optional[TimeService
         corr.service_type,
         corr.handler_name,
         corr.action_type,
-        corr.request_data.model_dump_json() if corr.request_data and hasattr(corr.request_data, 'model_dump_json') else json.dumps(corr.request_data) if corr.request_data else None,
-        corr.response_data.model_dump_json() if corr.response_data and hasattr(corr.response_data, 'model_dump_json') else json.dumps(corr.response_data) if corr.response_data else None,
+        corr.request_data.model_dump_json() if corr.request_data and hasattr(corr.request_data, 'model_dump_json') else serialization.dumps(corr.request_data) if corr.request_data else None,
+        corr.response_data.model_dump_json() if corr.response_data and hasattr(corr.response_data, 'model_dump_json') else serialization.dumps(corr.response_data) if corr.response_data else None,
         corr.status.value,
         corr.created_at.isoformat() if isinstance(corr.created_at, datetime) else str(corr.created_at) if corr.created_at else (time_service.now().isoformat() if time_service else datetime.now(timezone.utc).isoformat()),
         corr.updated_at.isoformat() if isinstance(corr.updated_at, datetime) else str(corr.updated_at) if corr.updated_at else (time_service.now().isoformat() if time_service else datetime.now(timezone.utc).isoformat()),
@@ -53,7 +237,7 @@ def add_correlation(corr: ServiceCorrelation, time_service: Optional[TimeService
         corr.trace_context.trace_id if corr.trace_context else None,
         corr.trace_context.span_id if corr.trace_context else None,
         corr.trace_context.parent_span_id if corr.trace_context else None,
-        json.dumps(corr.tags) if corr.tags else None,
+        serialization.dumps(corr.tags) if corr.tags else None,
         corr.retention_policy,
     )
     try:
@@ -105,7 +289,7 @@ def _update_correlation_impl(update_request: CorrelationUpdateRequest, time_serv
     params: List[Any] = []
     if update_request.response_data is not None:
         updates.append("response_data = ?")
-        params.append(json.dumps(update_request.response_data))
+        params.append(serialization.dumps(update_request.response_data))
     if update_request.status is not None:
         updates.append("status = ?")
         params.append(update_request.status.value)
@@ -114,7 +298,7 @@ def _update_correlation_impl(update_request: CorrelationUpdateRequest, time_serv
         params.append(update_request.metric_value)
     if update_request.tags is not None:
         updates.append("tags = ?")
-        params.append(json.dumps(update_request.tags))
+        params.append(serialization.dumps(update_request.tags))
     updates.append("updated_at = ?")
     params.append(time_service.now().isoformat())
     params.append(update_request.correlation_id)
@@ -129,175 +313,145 @@ def _update_correlation_impl(update_request: CorrelationUpdateRequest, time_serv
         logger.exception("Failed to update correlation %s: %s", update_request.correlation_id, e)
         return False
 
+
+def _fetch_rows(
+    columns: Sequence[str],
+    where: str,
+    params: Sequence[Any],
+    suffix: str = "",
+    db_path: Optional[str] = None,
+) -> List[Any]:
+    """Run a projected SELECT against service_correlations and return raw rows."""
+    sql = f"SELECT {', '.join(columns)} FROM service_correlations WHERE {where}{suffix}"  # nosec B608 - columns validated against CORRELATION_COLUMNS
+    with get_db_connection(db_path=db_path) as conn:
+        cursor = conn.cursor()
+        cursor.execute(sql, list(params))
+        return cursor.fetchall()
+
+
+def _build_filters(
+    correlation_type: Optional[Union[CorrelationType, str]] = None,
+    start_time: Optional[Union[datetime, str]] = None,
+    end_time: Optional[Union[datetime, str]] = None,
+    metric_names: Optional[List[str]] = None,
+    log_levels: Optional[List[str]] = None,
+    action_types: Optional[List[str]] = None,
+    channel_id: Optional[str] = None,
+) -> Tuple[str, List[Any]]:
+    """Build a WHERE clause shared by the time-series style queries."""
+    clauses: List[str] = []
+    params: List[Any] = []
+
+    if correlation_type is not None:
+        clauses.append("correlation_type = ?")
+        params.append(correlation_type.value if hasattr(correlation_type, 'value') else str(correlation_type))
+
+    if start_time:
+        clauses.append("timestamp >= ?")
+        params.append(start_time.isoformat() if hasattr(start_time, 'isoformat') else start_time)
+
+    if end_time:
+        clauses.append("timestamp <= ?")
+        params.append(end_time.isoformat() if hasattr(end_time, 'isoformat') else end_time)
+
+    if metric_names:
+        placeholders = ",".join("?" * len(metric_names))
+        clauses.append(f"metric_name IN ({placeholders})")  # nosec B608 - placeholders are '?' strings, not user input
+        params.extend(metric_names)
+
+    if log_levels:
+        placeholders = ",".join("?" * len(log_levels))
+        clauses.append(f"log_level IN ({placeholders})")  # nosec B608 - placeholders are '?' strings, not user input
+        params.extend(log_levels)
+
+    if action_types:
+        placeholders = ",".join("?" * len(action_types))
+        clauses.append(f"action_type IN ({placeholders})")  # nosec B608 - placeholders are '?' strings, not user input
+        params.extend(action_types)
+
+    if channel_id is not None:
+        clauses.append("json_extract(request_data, '$.channel_id') = ?")
+        params.append(channel_id)
+
+    return (" AND ".join(clauses) or "1 = 1"), params
+
+
+def query_correlations(
+    columns: Optional[Sequence[str]] = None,
+    *,
+    correlation_type: Optional[Union[CorrelationType, str]] = None,
+    start_time: Optional[Union[datetime, str]] = None,
+    end_time: Optional[Union[datetime, str]] = None,
+    metric_names: Optional[List[str]] = None,
+    log_levels: Optional[List[str]] = None,
+    action_types: Optional[List[str]] = None,
+    channel_id: Optional[str] = None,
+    limit: int = 1000,
+    ascending: bool = False,
+    db_path: Optional[str] = None,
+) -> List[CorrelationRecord]:
+    """
+    Projection-aware bulk read of correlations.
+
+    Only the requested columns are selected and rows are returned as
+    CorrelationRecord views, so callers that need e.g. just metric_name,
+    metric_value and timestamp skip JSON decoding and model validation
+    entirely. Use ``record.to_correlation()`` (with all columns selected)
+    when a full ServiceCorrelation is needed.
+
+    Args:
+        columns: Columns to select (default: all). Unknown names raise ValueError.
+        correlation_type: Restrict to one correlation type
+        start_time: Inclusive lower bound on timestamp
+        end_time: Inclusive upper bound on timestamp
+        metric_names: Restrict to these metric names
+        log_levels: Restrict to these log levels
+        action_types: Restrict to these action types
+        channel_id: Restrict to correlations whose request_data targets this channel
+        limit: Maximum rows returned
+        ascending: Order by timestamp ascending instead of descending
+        db_path: Optional database path
+
+    Returns:
+        List of CorrelationRecord
+    """
+    selected = _resolve_columns(columns)
+    where, params = _build_filters(
+        correlation_type, start_time, end_time, metric_names, log_levels, action_types, channel_id
+    )
+    suffix = f" ORDER BY timestamp {'ASC' if ascending else 'DESC'} LIMIT ?"
+    params.append(limit)
+
+    try:
+        rows = _fetch_rows(selected, where, params, suffix, db_path)
+    except Exception as e:
+        logger.exception("Failed to query correlations: %s", e)
+        return []
+
+    index = {name: i for i, name in enumerate(selected)}
+    return [CorrelationRecord(index, row) for row in rows]
+
+
 def get_correlation(correlation_id: str, db_path: Optional[str] = None) -> Optional[ServiceCorrelation]:
-    sql = "SELECT * FROM service_correlations WHERE correlation_id = ?"
     try:
-        with get_db_connection(db_path=db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, (correlation_id,))
-            row = cursor.fetchone()
-            if row:
-                # Parse timestamp if present
-                timestamp = None
-                if row["timestamp"]:
-                    try:
-                        # Handle both 'Z' and '+00:00' formats
-                        timestamp_str = row["timestamp"]
-                        if timestamp_str.endswith('Z'):
-                            timestamp_str = timestamp_str[:-1] + UTC_TIMEZONE_SUFFIX
-                        timestamp = datetime.fromisoformat(timestamp_str)
-                    except (ValueError, AttributeError):
-                        timestamp = None
-
-                # Parse request_data
-                request_data_json = json.loads(row["request_data"]) if row["request_data"] else {}
-                
-                # Build the correlation without None values for optional fields
-                correlation_data = {
-                    "correlation_id": row["correlation_id"],
-                    "service_type": row["service_type"],
-                    "handler_name": row["handler_name"],
-                    "action_type": row["action_type"],
-                    "request_data": request_data_json if request_data_json else None,
-                    "response_data": _parse_response_data(json.loads(row["response_data"]) if row["response_data"] else None, timestamp),
-                    "status": ServiceCorrelationStatus(row["status"]),
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                    "correlation_type": CorrelationType(row["correlation_type"] or "service_interaction"),
-                    "timestamp": timestamp or datetime.now(timezone.utc),
-                    "tags": json.loads(row["tags"]) if row["tags"] else {},
-                    "retention_policy": row["retention_policy"] or "raw",
-                }
-
-                # Only add optional TSDB fields if they have values
-                if row["metric_name"] and row["metric_value"] is not None:
-                    from ciris_engine.schemas.telemetry.core import MetricData
-                    correlation_data["metric_data"] = MetricData(
-                        metric_name=row["metric_name"],
-                        metric_value=row["metric_value"],
-                        metric_unit="count",
-                        metric_type="gauge",
-                        labels={}
-                    )
-
-                if row["log_level"]:
-                    from ciris_engine.schemas.telemetry.core import LogData
-                    correlation_data["log_data"] = LogData(
-                        log_level=row["log_level"],
-                        log_message="",
-                        logger_name="",
-                        module_name="",
-                        function_name="",
-                        line_number=0
-                    )
-
-                if row["trace_id"]:
-                    from ciris_engine.schemas.telemetry.core import TraceContext
-                    trace_context = TraceContext(
-                        trace_id=row["trace_id"],
-                        span_id=row["span_id"] or "",
-                        span_name=""
-                    )
-                    if row["parent_span_id"]:
-                        trace_context.parent_span_id = row["parent_span_id"]
-                    correlation_data["trace_context"] = trace_context
-
-                return ServiceCorrelation(**correlation_data)
-            return None
+        rows = _fetch_rows(CORRELATION_COLUMNS, "correlation_id = ?", (correlation_id,), db_path=db_path)
+        return _row_to_correlation(rows[0]) if rows else None
     except Exception as e:
         logger.exception("Failed to fetch correlation %s: %s", correlation_id, e)
         return None
 
 def get_correlations_by_task_and_action(task_id: str, action_type: str, status: Optional[ServiceCorrelationStatus] = None, db_path: Optional[str] = None) -> List[ServiceCorrelation]:
     """Get correlations for a specific task and action type."""
-    sql = """
-        SELECT * FROM service_correlations
-        WHERE action_type = ?
-        AND json_extract(request_data, '$.task_id') = ?
-    """
-    params = [action_type, task_id]
+    where = "action_type = ? AND json_extract(request_data, '$.task_id') = ?"
+    params: List[Any] = [action_type, task_id]
 
     if status is not None:
-        sql += " AND status = ?"
+        where += " AND status = ?"
         params.append(status.value)
 
-    sql += " ORDER BY created_at DESC"
-
     try:
-        with get_db_connection(db_path=db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-
-            correlations = []
-            for row in rows:
-                # Parse timestamp if present
-                timestamp = None
-                if row["timestamp"]:
-                    try:
-                        # Handle both 'Z' and '+00:00' formats
-                        timestamp_str = row["timestamp"]
-                        if timestamp_str.endswith('Z'):
-                            timestamp_str = timestamp_str[:-1] + UTC_TIMEZONE_SUFFIX
-                        timestamp = datetime.fromisoformat(timestamp_str)
-                    except (ValueError, AttributeError):
-                        timestamp = None
-
-                # Parse request_data
-                request_data_json = json.loads(row["request_data"]) if row["request_data"] else {}
-                
-                # Build the correlation without None values for optional fields
-                correlation_data = {
-                    "correlation_id": row["correlation_id"],
-                    "service_type": row["service_type"],
-                    "handler_name": row["handler_name"],
-                    "action_type": row["action_type"],
-                    "request_data": request_data_json if request_data_json else None,
-                    "response_data": _parse_response_data(json.loads(row["response_data"]) if row["response_data"] else None, timestamp),
-                    "status": ServiceCorrelationStatus(row["status"]),
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                    "correlation_type": CorrelationType(row["correlation_type"] or "service_interaction"),
-                    "timestamp": timestamp or datetime.now(timezone.utc),
-                    "tags": json.loads(row["tags"]) if row["tags"] else {},
-                    "retention_policy": row["retention_policy"] or "raw",
-                }
-
-                # Only add optional TSDB fields if they have values
-                if row["metric_name"] and row["metric_value"] is not None:
-                    from ciris_engine.schemas.telemetry.core import MetricData
-                    correlation_data["metric_data"] = MetricData(
-                        metric_name=row["metric_name"],
-                        metric_value=row["metric_value"],
-                        metric_unit="count",
-                        metric_type="gauge",
-                        labels={}
-                    )
-
-                if row["log_level"]:
-                    from ciris_engine.schemas.telemetry.core import LogData
-                    correlation_data["log_data"] = LogData(
-                        log_level=row["log_level"],
-                        log_message="",
-                        logger_name="",
-                        module_name="",
-                        function_name="",
-                        line_number=0
-                    )
-
-                if row["trace_id"]:
-                    from ciris_engine.schemas.telemetry.core import TraceContext
-                    trace_context = TraceContext(
-                        trace_id=row["trace_id"],
-                        span_id=row["span_id"] or "",
-                        span_name=""
-                    )
-                    if row["parent_span_id"]:
-                        trace_context.parent_span_id = row["parent_span_id"]
-                    correlation_data["trace_context"] = trace_context
-
-                correlations.append(ServiceCorrelation(**correlation_data))
-            return correlations
+        rows = _fetch_rows(CORRELATION_COLUMNS, where, params, " ORDER BY created_at DESC", db_path)
+        return [_row_to_correlation(row) for row in rows]
     except Exception as e:
         logger.exception("Failed to fetch correlations for task %s and action %s: %s", task_id, action_type, e)
         return []
@@ -312,113 +466,12 @@ def get_correlations_by_type_and_time(
     db_path: Optional[str] = None
 ) -> List[ServiceCorrelation]:
     """Get correlations by type with optional time filtering for TSDB queries."""
-    sql = "SELECT * FROM service_correlations WHERE correlation_type = ?"
-    if hasattr(correlation_type, 'value'):
-        params: List[Any] = [correlation_type.value]
-    else:
-        params = [str(correlation_type)]
-
-    if start_time:
-        sql += " AND timestamp >= ?"
-        params.append(start_time)
-
-    if end_time:
-        sql += " AND timestamp <= ?"
-        params.append(end_time)
-
-    if metric_names:
-        placeholders = ",".join("?" * len(metric_names))
-        sql += f" AND metric_name IN ({placeholders})"  # nosec B608 - placeholders are '?' strings, not user input
-        params.extend(metric_names)
-
-    if log_levels:
-        placeholders = ",".join("?" * len(log_levels))
-        sql += f" AND log_level IN ({placeholders})"  # nosec B608 - placeholders are '?' strings, not user input
-        params.extend(log_levels)
-
-    sql += " ORDER BY timestamp DESC LIMIT ?"
+    where, params = _build_filters(correlation_type, start_time, end_time, metric_names, log_levels)
     params.append(limit)
 
     try:
-        with get_db_connection(db_path=db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-
-            correlations = []
-            for row in rows:
-                timestamp = None
-                if row["timestamp"]:
-                    try:
-                        # Handle both 'Z' and '+00:00' formats
-                        timestamp_str = row["timestamp"]
-                        if timestamp_str.endswith('Z'):
-                            timestamp_str = timestamp_str[:-1] + UTC_TIMEZONE_SUFFIX
-                        timestamp = datetime.fromisoformat(timestamp_str)
-                    except (ValueError, AttributeError):
-                        timestamp = None
-
-                # Import required types
-                from ciris_engine.schemas.telemetry.core import MetricData, LogData, TraceContext
-
-                # Build metric_data if this is a metric correlation
-                metric_data = None
-                if row["metric_name"] and row["metric_value"] is not None:
-                    metric_data = MetricData(
-                        metric_name=row["metric_name"],
-                        metric_value=row["metric_value"],
-                        metric_unit="count",
-                        metric_type="gauge",
-                        labels={}
-                    )
-
-                # Build log_data if this is a log correlation
-                log_data = None
-                if row["log_level"]:
-                    log_data = LogData(
-                        log_level=row["log_level"],
-                        log_message="",  # Not stored in DB
-                        logger_name="",
-                        module_name="",
-                        function_name="",
-                        line_number=0
-                    )
-
-                # Build trace_context if this is a trace correlation
-                trace_context = None
-                if row["trace_id"]:
-                    trace_context = TraceContext(
-                        trace_id=row["trace_id"],
-                        span_id=row["span_id"] or "",
-                        span_name=""
-                    )
-                    if row["parent_span_id"]:
-                        trace_context.parent_span_id = row["parent_span_id"]
-
-                # Map 'success' to 'completed' for backwards compatibility
-                status_value = row["status"]
-                if status_value == "success":
-                    status_value = "completed"
-                
-                correlations.append(ServiceCorrelation(
-                    correlation_id=row["correlation_id"],
-                    service_type=row["service_type"],
-                    handler_name=row["handler_name"],
-                    action_type=row["action_type"],
-                    request_data=json.loads(row["request_data"]) if row["request_data"] else None,
-                    response_data=_parse_response_data(json.loads(row["response_data"]) if row["response_data"] else None, timestamp),
-                    status=ServiceCorrelationStatus(status_value),
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"],
-                    correlation_type=CorrelationType(row["correlation_type"] or "service_interaction"),
-                    timestamp=timestamp,
-                    metric_data=metric_data,
-                    log_data=log_data,
-                    trace_context=trace_context,
-                    tags={k: str(v) for k, v in json.loads(row["tags"]).items()} if row["tags"] else {},
-                    retention_policy=row["retention_policy"] or "raw"
-                ))
-            return correlations
+        rows = _fetch_rows(CORRELATION_COLUMNS, where, params, " ORDER BY timestamp DESC LIMIT ?", db_path)
+        return [_row_to_correlation(row) for row in rows]
     except Exception as e:
         logger.exception("Failed to fetch correlations by type %s: %s", correlation_type, e)
         return []
@@ -430,187 +483,108 @@ def get_correlations_by_channel(
     db_path: Optional[str] = None
 ) -> List[ServiceCorrelation]:
     """Get correlations for a specific channel (for message history)."""
-    sql = """
-        SELECT * FROM service_correlations
-        WHERE (
-            (action_type = 'speak' AND json_extract(request_data, '$.channel_id') = ?) OR
-            (action_type = 'observe' AND json_extract(request_data, '$.channel_id') = ?)
-        )
-    """
-    params: List[Any] = [channel_id, channel_id]
-    
+    where = (
+        "action_type IN ('speak', 'observe') "
+        "AND json_extract(request_data, '$.channel_id') = ?"
+    )
+    params: List[Any] = [channel_id]
+
     if before:
-        sql += " AND timestamp < ?"
-        before_str = before.isoformat() if hasattr(before, 'isoformat') else str(before)
-        params.append(before_str)
-    
-    sql += " ORDER BY timestamp DESC LIMIT ?"
+        where += " AND timestamp < ?"
+        params.append(before.isoformat() if hasattr(before, 'isoformat') else str(before))
+
     params.append(limit)
-    
+
     try:
-        with get_db_connection(db_path=db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-            
-            correlations = []
-            for row in rows:
-                # Parse timestamp if present
-                timestamp = None
-                if row["timestamp"]:
-                    try:
-                        # Handle both 'Z' and '+00:00' formats
-                        timestamp_str = row["timestamp"]
-                        if timestamp_str.endswith('Z'):
-                            timestamp_str = timestamp_str[:-1] + UTC_TIMEZONE_SUFFIX
-                        timestamp = datetime.fromisoformat(timestamp_str)
-                    except (ValueError, AttributeError):
-                        timestamp = None
-                
-                # Parse request_data
-                request_data_json = json.loads(row["request_data"]) if row["request_data"] else {}
-                
-                # Build the correlation without None values for optional fields
-                correlation_data = {
-                    "correlation_id": row["correlation_id"],
-                    "service_type": row["service_type"],
-                    "handler_name": row["handler_name"],
-                    "action_type": row["action_type"],
-                    "request_data": request_data_json if request_data_json else None,
-                    "response_data": _parse_response_data(json.loads(row["response_data"]) if row["response_data"] else None, timestamp),
-                    "status": ServiceCorrelationStatus(row["status"]),
-                    "created_at": row["created_at"],
-                    "updated_at": row["updated_at"],
-                    "correlation_type": CorrelationType(row["correlation_type"] or "service_interaction"),
-                    "timestamp": timestamp or datetime.now(timezone.utc),
-                    "tags": json.loads(row["tags"]) if row["tags"] else {},
-                    "retention_policy": row["retention_policy"] or "raw",
-                }
-                
-                correlations.append(ServiceCorrelation(**correlation_data))
-            
-            # Reverse to get chronological order (oldest first)
-            correlations.reverse()
-            return correlations
+        rows = _fetch_rows(CORRELATION_COLUMNS, where, params, " ORDER BY timestamp DESC LIMIT ?", db_path)
+        correlations = [_row_to_correlation(row) for row in rows]
+        # Reverse to get chronological order (oldest first)
+        correlations.reverse()
+        return correlations
     except Exception as e:
         logger.exception("Failed to fetch correlations for channel %s: %s", channel_id, e)
         return []
 
+# Must match the expression of idx_correlations_tag_user_created (migration 003)
+USER_TAG_SQL = "(CASE WHEN json_valid(tags) THEN json_extract(tags, '$.user_id') END)"
+_CHANNEL_TAG_SQL = "(CASE WHEN json_valid(tags) THEN json_extract(tags, '$.channel_id') END)"
+
+
+def get_recent_user_messages(
+    user_ids: Sequence[str],
+    exclude_channel_id: Optional[str] = None,
+    limit_per_user: int = 3,
+    handler_names: Sequence[str] = ("ObserveHandler", "SpeakHandler"),
+    db_path: Optional[str] = None,
+) -> Dict[str, List[CorrelationRecord]]:
+    """Most recent message correlations tagged with each user, in one query.
+
+    Rows are found through the user_id tag index and cut to
+    ``limit_per_user`` per user with a window function, newest first.
+    Correlations tagged with ``exclude_channel_id`` are skipped.
+
+    Returns:
+        Dict mapping user_id to its CorrelationRecords (correlation_id,
+        handler_name, request_data, created_at, tags)
+    """
+    if not user_ids or not handler_names:
+        return {}
+
+    user_marks = ",".join("?" * len(user_ids))
+    handler_marks = ",".join("?" * len(handler_names))
+    where = f"{USER_TAG_SQL} IN ({user_marks}) AND handler_name IN ({handler_marks})"
+    params: List[Any] = [*user_ids, *handler_names]
+    if exclude_channel_id is not None:
+        where += f" AND ({_CHANNEL_TAG_SQL} IS NULL OR {_CHANNEL_TAG_SQL} != ?)"
+        params.append(exclude_channel_id)
+    params.append(limit_per_user)
+
+    columns = ("correlation_id", "handler_name", "request_data", "created_at", "tags")
+    sql = f"""
+        SELECT tag_user_id, {', '.join(columns)} FROM (
+            SELECT {USER_TAG_SQL} AS tag_user_id, {', '.join(columns)},
+                   ROW_NUMBER() OVER (PARTITION BY {USER_TAG_SQL} ORDER BY created_at DESC) AS rn
+            FROM service_correlations
+            WHERE {where}
+        )
+        WHERE rn <= ?
+        ORDER BY tag_user_id, created_at DESC
+    """  # nosec B608 - fixed expressions, placeholders are '?' strings
+
+    result: Dict[str, List[CorrelationRecord]] = {}
+    index = {name: i for i, name in enumerate(columns)}
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            for row in conn.execute(sql, params):
+                result.setdefault(str(row[0]), []).append(CorrelationRecord(index, tuple(row)[1:]))
+    except Exception as e:
+        logger.exception("Failed to fetch recent messages for users %s: %s", list(user_ids), e)
+    return result
+
 def get_metrics_timeseries(
     query: MetricsQuery,
     db_path: Optional[str] = None
 ) -> List[ServiceCorrelation]:
     """Get metric correlations as time series data."""
-    sql = """
-        SELECT * FROM service_correlations
-        WHERE correlation_type = 'metric_datapoint'
-        AND metric_name = ?
-    """
-    params: List[Any] = [query.metric_name]
-
-    if query.start_time:
-        sql += " AND timestamp >= ?"
-        params.append(query.start_time.isoformat() if hasattr(query.start_time, 'isoformat') else query.start_time)
-
-    if query.end_time:
-        sql += " AND timestamp <= ?"
-        params.append(query.end_time.isoformat() if hasattr(query.end_time, 'isoformat') else query.end_time)
+    where, params = _build_filters(
+        CorrelationType.METRIC_DATAPOINT, query.start_time, query.end_time, [query.metric_name]
+    )
 
     if query.tags:
         for key, value in query.tags.items():
-            sql += " AND json_extract(tags, ?) = ?"
+            where += " AND json_extract(tags, ?) = ?"
             params.extend([f"$.{key}", value])
 
     # Default limit to 1000 if not specified
-    limit = 1000 if not hasattr(query, 'limit') else getattr(query, 'limit', 1000)
-    sql += " ORDER BY timestamp ASC LIMIT ?"
-    params.append(limit)
+    params.append(getattr(query, 'limit', 1000))
 
     try:
-        with get_db_connection(db_path=db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
-
-            correlations = []
-            for row in rows:
-                timestamp = None
-                if row["timestamp"]:
-                    try:
-                        # Handle both 'Z' and '+00:00' formats
-                        timestamp_str = row["timestamp"]
-                        if timestamp_str.endswith('Z'):
-                            timestamp_str = timestamp_str[:-1] + UTC_TIMEZONE_SUFFIX
-                        timestamp = datetime.fromisoformat(timestamp_str)
-                    except (ValueError, AttributeError):
-                        timestamp = None
-
-                # Import required types
-                from ciris_engine.schemas.telemetry.core import MetricData, LogData, TraceContext
-
-                # Build metric_data if this is a metric correlation
-                metric_data = None
-                if row["metric_name"] and row["metric_value"] is not None:
-                    metric_data = MetricData(
-                        metric_name=row["metric_name"],
-                        metric_value=row["metric_value"],
-                        metric_unit="count",
-                        metric_type="gauge",
-                        labels={}
-                    )
-
-                # Build log_data if this is a log correlation
-                log_data = None
-                if row["log_level"]:
-                    log_data = LogData(
-                        log_level=row["log_level"],
-                        log_message="",  # Not stored in DB
-                        logger_name="",
-                        module_name="",
-                        function_name="",
-                        line_number=0
-                    )
-
-                # Build trace_context if this is a trace correlation
-                trace_context = None
-                if row["trace_id"]:
-                    trace_context = TraceContext(
-                        trace_id=row["trace_id"],
-                        span_id=row["span_id"] or "",
-                        span_name=""
-                    )
-                    if row["parent_span_id"]:
-                        trace_context.parent_span_id = row["parent_span_id"]
-
-                # Map 'success' to 'completed' for backwards compatibility
-                status_value = row["status"]
-                if status_value == "success":
-                    status_value = "completed"
-                
-                correlations.append(ServiceCorrelation(
-                    correlation_id=row["correlation_id"],
-                    service_type=row["service_type"],
-                    handler_name=row["handler_name"],
-                    action_type=row["action_type"],
-                    request_data=json.loads(row["request_data"]) if row["request_data"] else None,
-                    response_data=_parse_response_data(json.loads(row["response_data"]) if row["response_data"] else None, timestamp),
-                    status=ServiceCorrelationStatus(status_value),
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"],
-                    correlation_type=CorrelationType(row["correlation_type"] or "service_interaction"),
-                    timestamp=timestamp,
-                    metric_data=metric_data,
-                    log_data=log_data,
-                    trace_context=trace_context,
-                    tags={k: str(v) for k, v in json.loads(row["tags"]).items()} if row["tags"] else {},
-                    retention_policy=row["retention_policy"] or "raw"
-                ))
-            return correlations
+        rows = _fetch_rows(CORRELATION_COLUMNS, where, params, " ORDER BY timestamp ASC LIMIT ?", db_path)
+        return [_row_to_correlation(row) for row in rows]
     except Exception as e:
         logger.exception("Failed to fetch metrics timeseries for %s: %s", query.metric_name, e)
         return []
 
-
 def get_active_channels_by_adapter(
     adapter_type: str,
     since_days: int = 30,
@@ -714,7 +688,7 @@ def get_active_channels_by_adapter(
             for row in rows:
                 if row[0]:
                     try:
-                        node_data = json.loads(row[0])
+                        node_data = serialization.loads(row[0])
                         conversations_by_channel = node_data.get("conversations_by_channel", {})
                         
                         # Extract channels matching our adapter type
@@ -1,27 +1,17 @@
-import json
 import logging
-from typing import Any, List, Optional
-from datetime import datetime
+import sqlite3
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from ciris_engine.logic.persistence import get_db_connection
+from ciris_engine.utils import serialization
+from ciris_engine.schemas.persistence.core import GraphNodeCounts
 from ciris_engine.schemas.services.graph_core import GraphNode, GraphEdge, GraphScope, GraphEdgeAttributes
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 
 logger = logging.getLogger(__name__)
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles datetime objects and Pydantic models."""
-
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        # Handle Pydantic models
-        if hasattr(obj, 'model_dump'):
-            return obj.model_dump()
-        # Handle objects with dict() method
-        if hasattr(obj, 'dict'):
-            return obj.dict()
-        return super().default(obj)
+# Bound on bound parameters per IN (...) list, well under SQLite's limit
+_IN_BATCH_SIZE = 500
 
 def add_graph_node(node: GraphNode, time_service: TimeServiceProtocol, db_path: Optional[str] = None) -> str:
     """Insert or update a graph node, merging attributes if it exists."""
@@ -37,7 +27,7 @@ def add_graph_node(node: GraphNode, time_service: TimeServiceProtocol, db_path:
             
             if existing_row:
                 # Node exists - merge attributes
-                existing_attrs = json.loads(existing_row["attributes_json"]) if existing_row["attributes_json"] else {}
+                existing_attrs = serialization.loads(existing_row["attributes_json"]) if existing_row["attributes_json"] else {}
                 
                 # Convert node.attributes to dict if it's a Pydantic model
                 if hasattr(node.attributes, 'model_dump'):
@@ -62,7 +52,7 @@ def add_graph_node(node: GraphNode, time_service: TimeServiceProtocol, db_path:
                 params = {
                     "node_id": node.id,
                     "scope": node.scope.value,
-                    "attributes_json": json.dumps(merged_attrs, cls=DateTimeEncoder),
+                    "attributes_json": serialization.dumps(merged_attrs),
                     "updated_by": node.updated_by,
                     "updated_at": node.updated_at or time_service.now().isoformat(),
                 }
@@ -78,7 +68,7 @@ def add_graph_node(node: GraphNode, time_service: TimeServiceProtocol, db_path:
                     "node_id": node.id,
                     "scope": node.scope.value,
                     "node_type": node.type.value,
-                    "attributes_json": json.dumps(node.attributes, cls=DateTimeEncoder),
+                    "attributes_json": serialization.dumps(node.attributes),
                     "version": str(node.version),  # Convert to string for SQL params
                     "updated_by": node.updated_by,
                     "updated_at": node.updated_at or time_service.now().isoformat(),
@@ -94,6 +84,22 @@ def add_graph_node(node: GraphNode, time_service: TimeServiceProtocol, db_path:
         logger.exception("Failed to add/update graph node %s: %s", node.id, e)
         raise
 
+def _row_to_node(row: Any, scope: Any) -> GraphNode:
+    attrs = serialization.loads(row["attributes_json"]) if row["attributes_json"] else {}
+    return GraphNode(
+        id=row["node_id"],
+        type=row["node_type"],
+        scope=scope,
+        attributes=attrs,
+        version=row["version"],
+        updated_by=row["updated_by"],
+        updated_at=row["updated_at"],
+    )
+
+def _unique_batches(ids: Iterable[str]) -> List[List[str]]:
+    unique = list(dict.fromkeys(ids))
+    return [unique[i:i + _IN_BATCH_SIZE] for i in range(0, len(unique), _IN_BATCH_SIZE)]
+
 def get_graph_node(node_id: str, scope: GraphScope, db_path: Optional[str] = None) -> Optional[GraphNode]:
     sql = "SELECT * FROM graph_nodes WHERE node_id = ? AND scope = ?"
     try:
@@ -102,21 +108,32 @@ def get_graph_node(node_id: str, scope: GraphScope, db_path: Optional[str] = Non
             cursor.execute(sql, (node_id, scope.value))
             row = cursor.fetchone()
             if row:
-                attrs = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
-                return GraphNode(
-                    id=row["node_id"],
-                    type=row["node_type"],
-                    scope=scope,
-                    attributes=attrs,
-                    version=row["version"],
-                    updated_by=row["updated_by"],
-                    updated_at=row["updated_at"],
-                )
+                return _row_to_node(row, scope)
             return None
     except Exception as e:
         logger.exception("Failed to fetch graph node %s: %s", node_id, e)
         return None
 
+def get_graph_nodes_by_ids(node_ids: Iterable[str], scope: GraphScope, db_path: Optional[str] = None) -> Dict[str, GraphNode]:
+    """Fetch many nodes of one scope with IN queries instead of one query per node.
+
+    Returns a dict mapping node_id to GraphNode; missing nodes are absent.
+    """
+    nodes: Dict[str, GraphNode] = {}
+    batches = _unique_batches(node_ids)
+    if not batches:
+        return nodes
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            for batch in batches:
+                placeholders = ",".join("?" * len(batch))
+                sql = f"SELECT * FROM graph_nodes WHERE scope = ? AND node_id IN ({placeholders})"  # nosec B608 - placeholders are '?' strings
+                for row in conn.execute(sql, [scope.value, *batch]):
+                    nodes[row["node_id"]] = _row_to_node(row, scope)
+    except Exception as e:
+        logger.exception("Failed to batch fetch graph nodes: %s", e)
+    return nodes
+
 def delete_graph_node(node_id: str, scope: GraphScope, db_path: Optional[str] = None) -> int:
     sql = "DELETE FROM graph_nodes WHERE node_id = ? AND scope = ?"
     try:
@@ -142,7 +159,7 @@ def add_graph_edge(edge: GraphEdge, db_path: Optional[str] = None) -> str:
         "scope": edge.scope.value,
         "relationship": edge.relationship,
         "weight": edge.weight,
-        "attributes_json": json.dumps(edge.attributes, cls=DateTimeEncoder),
+        "attributes_json": serialization.dumps(edge.attributes),
     }
     try:
         with get_db_connection(db_path=db_path) as conn:
@@ -165,6 +182,24 @@ def delete_graph_edge(edge_id: str, db_path: Optional[str] = None) -> int:
         logger.exception("Failed to delete graph edge %s: %s", edge_id, e)
         return 0
 
+def _row_to_edge(row: Any, scope: GraphScope) -> GraphEdge:
+    attrs = serialization.loads(row["attributes_json"]) if row["attributes_json"] else {}
+    # Extract only valid GraphEdgeAttributes fields
+    valid_attrs = {}
+    if "created_at" in attrs:
+        valid_attrs["created_at"] = attrs["created_at"]
+    if "context" in attrs:
+        valid_attrs["context"] = attrs["context"]
+
+    return GraphEdge(
+        source=row["source_node_id"],
+        target=row["target_node_id"],
+        relationship=row["relationship"],
+        scope=scope,
+        weight=row["weight"],
+        attributes=GraphEdgeAttributes(**valid_attrs) if valid_attrs else GraphEdgeAttributes(),
+    )
+
 def get_edges_for_node(node_id: str, scope: GraphScope, db_path: Optional[str] = None) -> List[GraphEdge]:
     sql = "SELECT * FROM graph_edges WHERE scope = ? AND (source_node_id = ? OR target_node_id = ?)"
     edges: List[GraphEdge] = []
@@ -174,28 +209,37 @@ def get_edges_for_node(node_id: str, scope: GraphScope, db_path: Optional[str] =
             cursor.execute(sql, (scope.value, node_id, node_id))
             rows = cursor.fetchall()
             for row in rows:
-                attrs = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
-                # Extract only valid GraphEdgeAttributes fields
-                valid_attrs = {}
-                if "created_at" in attrs:
-                    valid_attrs["created_at"] = attrs["created_at"]
-                if "context" in attrs:
-                    valid_attrs["context"] = attrs["context"]
-                
-                edges.append(
-                    GraphEdge(
-                        source=row["source_node_id"],
-                        target=row["target_node_id"],
-                        relationship=row["relationship"],
-                        scope=scope,
-                        weight=row["weight"],
-                        attributes=GraphEdgeAttributes(**valid_attrs) if valid_attrs else GraphEdgeAttributes(),
-                    )
-                )
+                edges.append(_row_to_edge(row, scope))
     except Exception as e:
         logger.exception("Failed to fetch edges for node %s: %s", node_id, e)
     return edges
 
+def get_edges_for_nodes(node_ids: Iterable[str], scope: GraphScope, db_path: Optional[str] = None) -> List[GraphEdge]:
+    """Edges touching any of the given nodes, each edge returned once.
+
+    Uses the source and target indexes with one IN query per batch of ids.
+    """
+    edges: List[GraphEdge] = []
+    batches = _unique_batches(node_ids)
+    if not batches:
+        return edges
+    seen = set()
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            for batch in batches:
+                placeholders = ",".join("?" * len(batch))
+                sql = (
+                    f"SELECT * FROM graph_edges WHERE scope = ? AND source_node_id IN ({placeholders}) "  # nosec B608 - placeholders are '?' strings
+                    f"UNION SELECT * FROM graph_edges WHERE scope = ? AND target_node_id IN ({placeholders})"
+                )
+                for row in conn.execute(sql, [scope.value, *batch, scope.value, *batch]):
+                    if row["edge_id"] in seen:
+                        continue
+                    seen.add(row["edge_id"])
+                    edges.append(_row_to_edge(row, scope))
+    except Exception as e:
+        logger.exception("Failed to batch fetch edges: %s", e)
+    return edges
 
 def get_all_graph_nodes(
     scope: Optional[GraphScope] = None,
@@ -246,7 +290,7 @@ def get_all_graph_nodes(
             rows = cursor.fetchall()
             
             for row in rows:
-                attrs = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
+                attrs = serialization.loads(row["attributes_json"]) if row["attributes_json"] else {}
                 nodes.append(GraphNode(
                     id=row["node_id"],
                     type=row["node_type"],
@@ -293,3 +337,99 @@ def get_nodes_by_type(
         offset=offset,
         db_path=db_path
     )
+
+
+_NODE_STATS_GROUPS_SQL = (
+    "SELECT scope, node_type, substr(created_at, 1, 10) AS day, COUNT(*) AS node_count "
+    "FROM graph_nodes GROUP BY scope, node_type, substr(created_at, 1, 10)"
+)
+
+
+def get_graph_node_counts(db_path: Optional[str] = None) -> GraphNodeCounts:
+    """Node counts by type, scope and creation day.
+
+    Reads the trigger-maintained graph_node_stats table, so the cost depends
+    on the number of (scope, type, day) groups rather than on the number of
+    nodes. Databases without the table fall back to grouping graph_nodes.
+    """
+    with get_db_connection(db_path=db_path) as conn:
+        try:
+            rows = conn.execute(
+                "SELECT scope, node_type, day, node_count FROM graph_node_stats WHERE node_count > 0"
+            ).fetchall()
+        except sqlite3.OperationalError:
+            rows = conn.execute(_NODE_STATS_GROUPS_SQL).fetchall()
+
+    counts = GraphNodeCounts()
+    for row in rows:
+        count = row["node_count"]
+        counts.total += count
+        counts.by_type[row["node_type"]] = counts.by_type.get(row["node_type"], 0) + count
+        counts.by_scope[row["scope"]] = counts.by_scope.get(row["scope"], 0) + count
+        if row["day"]:
+            counts.by_day[row["day"]] = counts.by_day.get(row["day"], 0) + count
+    return counts
+
+
+def count_graph_nodes(
+    node_type: Optional[str] = None,
+    scope: Optional[Union[GraphScope, str]] = None,
+    db_path: Optional[str] = None,
+) -> int:
+    """Number of nodes, optionally of one type and/or scope, from graph_node_stats."""
+    conditions: List[str] = []
+    params: List[Any] = []
+    if node_type is not None:
+        conditions.append("node_type = ?")
+        params.append(node_type)
+    if scope is not None:
+        conditions.append("scope = ?")
+        params.append(scope.value if hasattr(scope, 'value') else scope)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    with get_db_connection(db_path=db_path) as conn:
+        try:
+            row = conn.execute(f"SELECT SUM(node_count) FROM graph_node_stats{where}", params).fetchone()  # nosec B608 - fixed column conditions
+        except sqlite3.OperationalError:
+            row = conn.execute(f"SELECT COUNT(*) FROM graph_nodes{where}", params).fetchone()  # nosec B608 - fixed column conditions
+    return int(row[0] or 0) if row else 0
+
+
+def reconcile_graph_node_stats(db_path: Optional[str] = None) -> int:
+    """Rebuild graph_node_stats groups that drifted from graph_nodes.
+
+    The triggers keep the table exact; this repairs it after writes that
+    bypassed them, such as a restored backup or manual edits.
+
+    Returns:
+        Number of (scope, type, day) groups corrected
+    """
+    with get_db_connection(db_path=db_path) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            actual = {
+                (row["scope"], row["node_type"], row["day"]): row["node_count"]
+                for row in conn.execute(_NODE_STATS_GROUPS_SQL)
+            }
+            stored = {
+                (row["scope"], row["node_type"], row["day"]): row["node_count"]
+                for row in conn.execute("SELECT scope, node_type, day, node_count FROM graph_node_stats")
+            }
+            stale = [key for key in stored if key not in actual]
+            changed = [(*key, count) for key, count in actual.items() if stored.get(key) != count]
+            conn.executemany(
+                "DELETE FROM graph_node_stats WHERE scope = ? AND node_type = ? AND day = ?", stale
+            )
+            conn.executemany(
+                "INSERT OR REPLACE INTO graph_node_stats (scope, node_type, day, node_count) VALUES (?, ?, ?, ?)",
+                changed,
+            )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    corrected = len(stale) + len(changed)
+    if corrected:
+        logger.warning("Reconciled %d drifted graph_node_stats groups", corrected)
+    return corrected
@@ -4,9 +4,9 @@ Identity persistence model for storing and retrieving agent identity from the gr
 This module provides robust functions for managing agent identity as the primary source
 of truth, replacing the legacy profile system.
 """
-import json
 import logging
 from typing import Optional
+from ciris_engine.utils import serialization
 from ciris_engine.logic.persistence import get_db_connection
 from ciris_engine.logic.persistence.models.graph import add_graph_node, get_graph_node
 from ciris_engine.schemas.services.graph_core import GraphNode, GraphScope, NodeType
@@ -202,7 +202,7 @@ def store_creation_ceremony(
             "new_agent_purpose": ceremony_request.proposed_purpose,
             "new_agent_description": ceremony_request.proposed_description,
             "creation_justification": ceremony_request.creation_justification,
-            "expected_capabilities": json.dumps(ceremony_request.expected_capabilities),
+            "expected_capabilities": serialization.dumps(ceremony_request.expected_capabilities),
             "ethical_considerations": ceremony_request.ethical_considerations,
             "template_profile_hash": hash(ceremony_request.template_profile),
             "ceremony_status": "completed"
@@ -1,5 +1,5 @@
-import json
-from typing import List, Optional, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, TYPE_CHECKING
+from ciris_engine.utils import serialization
 from ciris_engine.logic.persistence import get_db_connection
 from ciris_engine.logic.persistence.utils import map_row_to_task
 from ciris_engine.schemas.runtime.enums import TaskStatus
@@ -55,8 +55,8 @@ def add_task(task: Task, db_path: Optional[str] = None) -> str:
     params = {
         **task_dict,
         "status": task.status.value,
-        "context": json.dumps(task_dict.get("context")) if task_dict.get("context") is not None else None,
-        "outcome": json.dumps(task_dict.get("outcome")) if task_dict.get("outcome") is not None else None,
+        "context": serialization.dumps(task_dict.get("context")) if task_dict.get("context") is not None else None,
+        "outcome": serialization.dumps(task_dict.get("outcome")) if task_dict.get("outcome") is not None else None,
         "signed_by": task_dict.get("signed_by"),
         "signature": task_dict.get("signature"),
         "signed_at": task_dict.get("signed_at"),
@@ -137,11 +137,41 @@ async def add_system_task(task: Task, auth_service: Optional["AuthenticationServ
     # Add the task (with or without signature)
     return add_task(task, db_path=db_path)
 
+def get_tasks_by_ids(task_ids: List[str], db_path: Optional[str] = None) -> Dict[str, Task]:
+    """Fetch multiple tasks by their IDs in a single query.
+
+    Returns a dict mapping task_id to Task; unknown IDs are omitted.
+    """
+    if not task_ids:
+        return {}
+
+    placeholders = ','.join(['?'] * len(task_ids))
+    sql = f"SELECT * FROM tasks WHERE task_id IN ({placeholders})"  # nosec B608 - placeholders are '?' strings, not user input
+    result: Dict[str, Task] = {}
+    try:
+        with get_db_connection(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, list(task_ids))
+            for row in cursor.fetchall():
+                task = map_row_to_task(row)
+                result[task.task_id] = task
+    except Exception as e:
+        logger.exception(f"Failed to batch fetch tasks: {e}")
+    return result
+
 def get_recent_completed_tasks(limit: int = 10, db_path: Optional[str] = None) -> List[Task]:
-    tasks_list = get_all_tasks(db_path=db_path)
-    completed = [t for t in tasks_list if getattr(t, 'status', None) == TaskStatus.COMPLETED]
-    completed_sorted = sorted(completed, key=lambda t: getattr(t, 'updated_at', ''), reverse=True)
-    return completed_sorted[:limit]
+    """Returns the ``limit`` most recently updated completed tasks, newest first."""
+    sql = "SELECT * FROM tasks WHERE status = ? ORDER BY updated_at DESC LIMIT ?"
+    tasks_list: List[Task] = []
+    try:
+        with get_db_connection(db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, (TaskStatus.COMPLETED.value, limit))
+            for row in cursor.fetchall():
+                tasks_list.append(map_row_to_task(row))
+    except Exception as e:
+        logger.exception(f"Failed to get recent completed tasks: {e}")
+    return tasks_list
 
 def get_top_tasks(limit: int = 10, db_path: Optional[str] = None) -> List[Task]:
     tasks_list = get_all_tasks(db_path=db_path)
@@ -1,5 +1,5 @@
-import json
-from typing import List, Optional, Any
+from typing import Dict, List, Optional, Any
+from ciris_engine.utils import serialization
 from ciris_engine.logic.persistence import get_db_connection
 import asyncio
 from ciris_engine.logic.persistence.utils import map_row_to_thought
@@ -28,6 +28,23 @@ def get_thoughts_by_status(status: ThoughtStatus, db_path: Optional[str] = None)
         logger.exception(f"Failed to get thoughts with status {status_val}: {e}")
     return thoughts
 
+def get_recent_thoughts_by_status(status: ThoughtStatus, limit: int = 10, db_path: Optional[str] = None) -> List[Thought]:
+    """Returns the ``limit`` most recently created thoughts with the given status, newest first."""
+    if not isinstance(status, ThoughtStatus):
+        raise TypeError(f"Expected ThoughtStatus enum, got {type(status)}: {status}")
+    status_val = status.value
+    sql = "SELECT * FROM thoughts WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+    thoughts: List[Thought] = []
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, (status_val, limit))
+            for row in cursor.fetchall():
+                thoughts.append(map_row_to_thought(row))
+    except Exception as e:
+        logger.exception(f"Failed to get recent thoughts with status {status_val}: {e}")
+    return thoughts
+
 def add_thought(thought: Thought, db_path: Optional[str] = None) -> str:
     thought_dict = thought.model_dump(mode='json')
     sql = """
@@ -40,9 +57,9 @@ def add_thought(thought: Thought, db_path: Optional[str] = None) -> str:
     params = {
         **thought_dict,
         "status": thought.status.value,
-        "context": json.dumps(thought_dict.get("context")) if thought_dict.get("context") is not None else None,
-        "ponder_notes": json.dumps(thought_dict.get("ponder_notes")) if thought_dict.get("ponder_notes") is not None else None,
-        "final_action": json.dumps(thought_dict.get("final_action")) if thought_dict.get("final_action") is not None else None,
+        "context": serialization.dumps(thought_dict.get("context")) if thought_dict.get("context") is not None else None,
+        "ponder_notes": serialization.dumps(thought_dict.get("ponder_notes")) if thought_dict.get("ponder_notes") is not None else None,
+        "final_action": serialization.dumps(thought_dict.get("final_action")) if thought_dict.get("final_action") is not None else None,
     }
     try:
         with get_db_connection(db_path=db_path) as conn:
@@ -135,6 +152,29 @@ def get_thoughts_by_task_id(task_id: str, db_path: Optional[str] = None) -> List
         logger.exception(f"Failed to get thoughts for task {task_id}: {e}")
     return thoughts
 
+def get_thoughts_by_task_ids(task_ids: List[str], db_path: Optional[str] = None) -> Dict[str, List[Thought]]:
+    """Fetch the thoughts of several tasks in a single query.
+
+    Returns a dict mapping each requested task_id to its thoughts, oldest first.
+    Tasks without thoughts map to an empty list.
+    """
+    result: Dict[str, List[Thought]] = {task_id: [] for task_id in task_ids}
+    if not task_ids:
+        return result
+
+    placeholders = ','.join(['?'] * len(task_ids))
+    sql = f"SELECT * FROM thoughts WHERE source_task_id IN ({placeholders}) ORDER BY created_at ASC"  # nosec B608 - placeholders are '?' strings, not user input
+    try:
+        with get_db_connection(db_path=db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(sql, list(task_ids))
+            for row in cursor.fetchall():
+                thought = map_row_to_thought(row)
+                result.setdefault(thought.source_task_id, []).append(thought)
+    except Exception as e:
+        logger.exception(f"Failed to batch fetch thoughts for tasks: {e}")
+    return result
+
 def delete_thoughts_by_ids(thought_ids: List[str], db_path: Optional[str] = None) -> int:
     """Delete thoughts by a list of IDs. Returns the number deleted."""
     if not thought_ids:
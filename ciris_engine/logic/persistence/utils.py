@@ -1,5 +1,6 @@
-import json
-from typing import Any
+from typing import Any, Dict, Optional, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+from ciris_engine.utils import serialization
 from ciris_engine.schemas.runtime.models import Task, Thought, ThoughtContext, TaskContext, TaskOutcome, FinalAction
 from ciris_engine.schemas.runtime.enums import TaskStatus, ThoughtStatus
 import logging
@@ -7,18 +8,93 @@ import uuid
 
 logger = logging.getLogger(__name__)
 
+M = TypeVar("M", bound=BaseModel)
+
+# Rows we wrote ourselves almost always validate; see validate_row
+_fast_row_decoding = True
+
+
+def configure_fast_row_decoding(enabled: bool) -> None:
+    """Enable or disable single-pass row validation (``database.fast_row_decoding``)."""
+    global _fast_row_decoding
+    _fast_row_decoding = enabled
+
+
+def validate_row(model_cls: Type[M], data: Dict[str, Any]) -> Optional[M]:
+    """Validate a decoded row, nested contexts included, in a single pass.
+
+    The mappers build nested models one at a time so they can recover from
+    bad fields individually. For the rows we wrote ourselves that never
+    triggers, so they try this first and only take the field-by-field path
+    when it returns None.
+    """
+    try:
+        return model_cls.model_validate(data)
+    except ValidationError:
+        return None
+
+
+def _fast_map_task(row_dict: Dict[str, Any]) -> Optional[Task]:
+    try:
+        ctx_data = serialization.loads(row_dict["context_json"]) if row_dict.get("context_json") else None
+        outcome_data = serialization.loads(row_dict["outcome_json"]) if row_dict.get("outcome_json") else None
+    except (TypeError, ValueError):
+        return None
+    if isinstance(ctx_data, dict):
+        context = {
+            "channel_id": ctx_data.get("channel_id"),
+            "user_id": ctx_data.get("user_id"),
+            "correlation_id": ctx_data["correlation_id"] if "correlation_id" in ctx_data else str(uuid.uuid4()),
+            "parent_task_id": ctx_data.get("parent_task_id"),
+        }
+    else:
+        context = {"channel_id": None, "user_id": None, "correlation_id": str(uuid.uuid4()), "parent_task_id": None}
+    data = {k: v for k, v in row_dict.items() if k not in ("context_json", "outcome_json", "retry_count")}
+    data["context"] = context
+    data["outcome"] = outcome_data if isinstance(outcome_data, dict) and outcome_data else None
+    return validate_row(Task, data)
+
+
+def _fast_map_thought(row_dict: Dict[str, Any]) -> Optional[Thought]:
+    try:
+        ctx_data = serialization.loads(row_dict["context_json"]) if row_dict.get("context_json") else None
+        ponder_notes = serialization.loads(row_dict["ponder_notes_json"]) if row_dict.get("ponder_notes_json") else None
+        action_data = serialization.loads(row_dict["final_action_json"]) if row_dict.get("final_action_json") else None
+    except (TypeError, ValueError):
+        return None
+    context = None
+    if isinstance(ctx_data, dict) and ctx_data.get("task_id") and ctx_data.get("correlation_id"):
+        context = {
+            "task_id": ctx_data["task_id"],
+            "channel_id": ctx_data.get("channel_id"),
+            "round_number": ctx_data.get("round_number", 0),
+            "depth": ctx_data.get("depth", 0),
+            "parent_thought_id": ctx_data.get("parent_thought_id"),
+            "correlation_id": ctx_data["correlation_id"],
+        }
+    data = {k: v for k, v in row_dict.items() if k not in ("context_json", "ponder_notes_json", "final_action_json")}
+    data["context"] = context
+    data["ponder_notes"] = ponder_notes
+    data["final_action"] = action_data if isinstance(action_data, dict) and action_data else None
+    return validate_row(Thought, data)
+
+
 def map_row_to_task(row: Any) -> Task:
     row_dict = dict(row)
+    if _fast_row_decoding:
+        task = _fast_map_task(row_dict)
+        if task is not None:
+            return task
     if row_dict.get("context_json"):
         try:
-            ctx_data = json.loads(row_dict["context_json"])
+            ctx_data = serialization.loads(row_dict["context_json"])
             if isinstance(ctx_data, dict):
                 # Extract only the fields that TaskContext expects
                 # This makes us resilient to schema changes
                 row_dict["context"] = TaskContext(
                     channel_id=ctx_data.get("channel_id"),
                     user_id=ctx_data.get("user_id"),
-                    correlation_id=ctx_data.get("correlation_id", str(uuid.uuid4())),
+                    correlation_id=ctx_data["correlation_id"] if "correlation_id" in ctx_data else str(uuid.uuid4()),
                     parent_task_id=ctx_data.get("parent_task_id")
                 )
             else:
@@ -46,7 +122,7 @@ def map_row_to_task(row: Any) -> Task:
         )
     if row_dict.get("outcome_json"):
         try:
-            outcome_data = json.loads(row_dict["outcome_json"])
+            outcome_data = serialization.loads(row_dict["outcome_json"])
             # Only set outcome if it's a non-empty dict with required fields
             if isinstance(outcome_data, dict) and outcome_data:
                 row_dict["outcome"] = TaskOutcome.model_validate(outcome_data)
@@ -72,9 +148,13 @@ def map_row_to_task(row: Any) -> Task:
 
 def map_row_to_thought(row: Any) -> Thought:
     row_dict = dict(row)
+    if _fast_row_decoding:
+        thought = _fast_map_thought(row_dict)
+        if thought is not None:
+            return thought
     if row_dict.get("context_json"):
         try:
-            ctx_data = json.loads(row_dict["context_json"])
+            ctx_data = serialization.loads(row_dict["context_json"])
             if isinstance(ctx_data, dict) and ctx_data:  # Check if dict is not empty
                 # Extract only the fields that ThoughtContext expects
                 # This makes us resilient to schema changes
@@ -106,7 +186,7 @@ def map_row_to_thought(row: Any) -> Thought:
         row_dict["context"] = None
     if row_dict.get("ponder_notes_json"):
         try:
-            row_dict["ponder_notes"] = json.loads(row_dict["ponder_notes_json"])
+            row_dict["ponder_notes"] = serialization.loads(row_dict["ponder_notes_json"])
         except Exception:
             logger.warning(f"Failed to decode ponder_notes_json for thought {row_dict.get('thought_id')}")
             row_dict["ponder_notes"] = None
@@ -114,7 +194,7 @@ def map_row_to_thought(row: Any) -> Thought:
         row_dict["ponder_notes"] = None
     if row_dict.get("final_action_json"):
         try:
-            action_data = json.loads(row_dict["final_action_json"])
+            action_data = serialization.loads(row_dict["final_action_json"])
             # Only set final_action if it's a non-empty dict with required fields
             if isinstance(action_data, dict) and action_data:
                 row_dict["final_action"] = FinalAction.model_validate(action_data)
@@ -342,12 +342,12 @@ class AgentProcessor:
                     
                     # Pre-fetch all thoughts in the batch to avoid serialization
                     thought_ids = [t.thought_id for t in batch]
-                    logger.info(f"[DEBUG TIMING] Pre-fetching {len(thought_ids)} thoughts in batch")
+                    logger.debug(f"[DEBUG TIMING] Pre-fetching {len(thought_ids)} thoughts in batch")
                     prefetched_thoughts = await persistence.async_get_thoughts_by_ids(thought_ids)
-                    logger.info(f"[DEBUG TIMING] Pre-fetched {len(prefetched_thoughts)} thoughts")
+                    logger.debug(f"[DEBUG TIMING] Pre-fetched {len(prefetched_thoughts)} thoughts")
                     
                     # Pre-fetch batch context data (same for all thoughts)
-                    logger.info(f"[DEBUG TIMING] Pre-fetching batch context data")
+                    logger.debug(f"[DEBUG TIMING] Pre-fetching batch context data")
                     from ciris_engine.logic.context.batch_context import prefetch_batch_context
                     batch_context_data = await prefetch_batch_context(
                         memory_service=self.services.get('memory_service') if isinstance(self.services, dict) else getattr(self.services, 'memory_service', None),
@@ -355,9 +355,10 @@ class AgentProcessor:
                         service_registry=self.services.get('service_registry') if isinstance(self.services, dict) else getattr(self.services, 'service_registry', None),
                         resource_monitor=self.services.get('resource_monitor') if isinstance(self.services, dict) else getattr(self.services, 'resource_monitor', None),
                         telemetry_service=self.services.get('telemetry_service') if isinstance(self.services, dict) else getattr(self.services, 'telemetry_service', None),
-                        runtime=self.runtime
+                        runtime=self.runtime,
+                        engine=getattr(getattr(self.thought_processor, 'context_builder', None), 'snapshot_engine', None),
                     )
-                    logger.info(f"[DEBUG TIMING] Pre-fetched batch context data")
+                    logger.debug(f"[DEBUG TIMING] Pre-fetched batch context data")
 
                     tasks: List[Any] = []
                     for thought in batch:
@@ -412,7 +413,7 @@ class AgentProcessor:
 
     async def _process_single_thought(self, thought: Thought, prefetched: bool = False, batch_context: Optional[Any] = None) -> bool:
         """Process a single thought and dispatch its action, with comprehensive error handling."""
-        logger.info(f"[DEBUG TIMING] _process_single_thought START for thought {thought.thought_id} (prefetched={prefetched}, has_batch_context={batch_context is not None})")
+        logger.debug(f"[DEBUG TIMING] _process_single_thought START for thought {thought.thought_id} (prefetched={prefetched}, has_batch_context={batch_context is not None})")
         start_time = self._time_service.now()
         trace_id = f"task_{thought.source_task_id or 'unknown'}_{thought.thought_id}"
         span_id = f"agent_processor_{thought.thought_id}"
@@ -498,7 +499,7 @@ class AgentProcessor:
 
             # Use fallback-aware process_thought_item
             try:
-                logger.info(f"[DEBUG TIMING] Calling processor.process_thought_item for thought {thought.thought_id}")
+                logger.debug(f"[DEBUG TIMING] Calling processor.process_thought_item for thought {thought.thought_id}")
                 context = ProcessorContext(
                     origin="wakeup_async",
                     prefetched_thought=thought if prefetched else None,
@@ -3,6 +3,7 @@ ThoughtProcessor: Core logic for processing a single thought in the CIRISAgent p
 Coordinates DMA orchestration, context building, consciences, and pondering.
 """
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional, Any, Union
 
 from ciris_engine.logic.config import ConfigAccessor
@@ -25,6 +26,9 @@ from ciris_engine.protocols.services.graph.telemetry import TelemetryServiceProt
 
 logger = logging.getLogger(__name__)
 
+# How many tasks with verified signatures to remember
+VERIFIED_TASK_MEMO_SIZE = 1024
+
 class ThoughtProcessor:
     def __init__(
         self,
@@ -46,6 +50,8 @@ class ThoughtProcessor:
         self.telemetry_service = telemetry_service
         self._time_service = time_service
         self.auth_service = auth_service
+        # task_id -> signer WA id for tasks whose signature already verified
+        self._verified_task_signers: "OrderedDict[str, str]" = OrderedDict()
 
     async def process_thought(
         self,
@@ -213,7 +219,8 @@ class ThoughtProcessor:
                 thought=thought,
                 batch_data=batch_context_data,
                 memory_service=self.context_builder.memory_service if self.context_builder else None,
-                graphql_provider=None
+                graphql_provider=None,
+                engine=getattr(self.context_builder, 'snapshot_engine', None),
             )
             # Build full thought context with the optimized snapshot
             thought_context = await self.context_builder.build_thought_context(thought, system_snapshot=system_snapshot)
@@ -694,40 +701,49 @@ class ThoughtProcessor:
             logger.warning("No auth service available, allowing thought processing")
             return True
 
-        # Import here to avoid circular import
-        from ciris_engine.logic import persistence
-
-        # Get the parent task
-        task = persistence.get_task_by_id(thought.source_task_id)
-        if not task:
-            logger.error(f"Parent task {thought.source_task_id} not found for thought {thought.thought_id}")
-            return False
-
-        # Check if task is signed
-        if not task.signed_by:
-            logger.error(f"Task {task.task_id} is not signed")
-            return False
-
-        # Verify the signature
-        is_valid = await self.auth_service.verify_task_signature(task)
-        if not is_valid:
-            logger.error(f"Task {task.task_id} has invalid signature")
-            return False
+        # A task's signature is checked once; every later thought of the task
+        # only re-checks the signer, so revoking the WA still takes effect
+        task_id = thought.source_task_id
+        signer_id = self._verified_task_signers.get(task_id)
+        if signer_id is not None:
+            self._verified_task_signers.move_to_end(task_id)
+        else:
+            # Get the parent task
+            task = persistence.get_task_by_id(task_id)
+            if not task:
+                logger.error(f"Parent task {task_id} not found for thought {thought.thought_id}")
+                return False
+
+            # Check if task is signed
+            if not task.signed_by:
+                logger.error(f"Task {task_id} is not signed")
+                return False
+
+            # Verify the signature
+            is_valid = await self.auth_service.verify_task_signature(task)
+            if not is_valid:
+                logger.error(f"Task {task_id} has invalid signature")
+                return False
+
+            signer_id = task.signed_by
+            self._verified_task_signers[task_id] = signer_id
+            while len(self._verified_task_signers) > VERIFIED_TASK_MEMO_SIZE:
+                self._verified_task_signers.popitem(last=False)
 
         # Get the WA that signed it
-        signer_wa = await self.auth_service.get_wa(task.signed_by)
+        signer_wa = await self.auth_service.get_wa(signer_id)
         if not signer_wa:
-            logger.error(f"Signer WA {task.signed_by} not found")
+            logger.error(f"Signer WA {signer_id} not found")
             return False
 
         # Check role - must be at least observer
         from ciris_engine.schemas.services.authority_core import WARole
         allowed_roles = [WARole.OBSERVER, WARole.AUTHORITY, WARole.ROOT]
         if signer_wa.role not in allowed_roles:
-            logger.error(f"Task {task.task_id} signed by {signer_wa.role.value} role, needs at least observer")
+            logger.error(f"Task {task_id} signed by {signer_wa.role.value} role, needs at least observer")
             return False
 
-        logger.debug(f"Task {task.task_id} properly signed by {signer_wa.role.value} {task.signed_by}")
+        logger.debug(f"Task {task_id} properly signed by {signer_wa.role.value} {signer_id}")
         return True
 
     def _describe_action(self, action_result: ActionSelectionDMAResult) -> str:
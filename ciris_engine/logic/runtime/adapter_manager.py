@@ -41,6 +41,7 @@ class AdapterInstance:
     loaded_at: datetime
     is_running: bool = False
     services_registered: List[str] = field(default_factory=list)
+    provider_names: List[str] = field(default_factory=list)  # Returned by ServiceRegistry.register_service
     lifecycle_task: Optional[asyncio.Task[Any]] = field(default=None, init=False)
     lifecycle_runner: Optional[asyncio.Task[Any]] = field(default=None, init=False)
 
@@ -145,7 +146,8 @@ class RuntimeAdapterManager(AdapterManagerInterface):
             instance.is_running = True
 
             self._register_adapter_services(instance)
-            
+            await self._refresh_tool_catalog(f"adapter {adapter_id} loaded")
+
             # Save adapter config to graph
             await self._save_adapter_config_to_graph(adapter_id, adapter_type, adapter_kwargs)
 
@@ -240,6 +242,7 @@ class RuntimeAdapterManager(AdapterManagerInterface):
                 instance.is_running = False
 
             self._unregister_adapter_services(instance)
+            await self._refresh_tool_catalog(f"adapter {adapter_id} unloaded")
 
             # Remove adapter from runtime adapters list (if it was added there)
             # Note: Dynamically loaded adapters are no longer added to runtime.adapters
@@ -635,7 +638,7 @@ class RuntimeAdapterManager(AdapterManagerInterface):
                     # Must be a string from ServiceRegistration
                     service_type_val = ServiceType(str(reg.service_type))
                 
-                self.runtime.service_registry.register_service(
+                provider_name = self.runtime.service_registry.register_service(
                     service_type=service_type_val,  # Ensure it's a ServiceType enum
                     provider=provider,
                     priority=priority,
@@ -644,6 +647,7 @@ class RuntimeAdapterManager(AdapterManagerInterface):
                     strategy=getattr(reg, 'strategy', SelectionStrategy.FALLBACK)  # Default strategy
                 )
                 instance.services_registered.append(f"global:{service_key}")
+                instance.provider_names.append(provider_name)
 
                 logger.info(f"Registered {service_key} from adapter {instance.adapter_id}")
 
@@ -657,14 +661,27 @@ class RuntimeAdapterManager(AdapterManagerInterface):
                 logger.warning("ServiceRegistry not available. Cannot unregister adapter services.")
                 return
 
-            for service_key in instance.services_registered:
-                logger.info(f"Would unregister service: {service_key} from adapter {instance.adapter_id}")
+            for provider_name in instance.provider_names:
+                if self.runtime.service_registry.unregister(provider_name):
+                    logger.info(f"Unregistered service {provider_name} from adapter {instance.adapter_id}")
 
             instance.services_registered.clear()
+            instance.provider_names.clear()
 
         except Exception as e:
             logger.error(f"Error unregistering services for adapter {instance.adapter_id}: {e}", exc_info=True)
 
+    async def _refresh_tool_catalog(self, reason: str) -> None:
+        """Rebuild the ToolBus catalog after adapter services changed."""
+        tool_bus = getattr(getattr(self.runtime, 'bus_manager', None), 'tool', None)
+        if tool_bus is None or not hasattr(tool_bus, 'invalidate_catalog'):
+            return
+        try:
+            tool_bus.invalidate_catalog(reason)
+            await tool_bus.refresh_catalog()
+        except Exception as e:
+            logger.warning(f"Failed to refresh tool catalog ({reason}): {e}")
+
     def get_adapter_info(self, adapter_id: str) -> dict:
         """Get detailed information about a specific adapter."""
         if adapter_id not in self.loaded_adapters:
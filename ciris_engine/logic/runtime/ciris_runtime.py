@@ -849,6 +849,14 @@ class CIRISRuntime:
             except Exception as e:
                 logger.error(f"Error registering services for adapter {adapter.__class__.__name__}: {e}", exc_info=True)
 
+        # Adapter tool services are registered now; build the tool catalog once
+        if self.bus_manager:
+            try:
+                self.bus_manager.tool.invalidate_catalog("adapter services registered")
+                await self.bus_manager.tool.refresh_catalog()
+            except Exception as e:
+                logger.warning(f"Failed to build tool catalog: {e}")
+
 
     async def _build_components(self) -> None:
         """Build all processing components."""
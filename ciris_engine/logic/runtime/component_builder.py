@@ -62,6 +62,7 @@ class ComponentBuilder:
             model_name=self.runtime.llm_service.model_name,
             max_retries=config.services.llm_max_retries,
             sink=self.runtime.bus_manager,
+            context_budget_tokens=config.prompt_budget.budget_for("ethical"),
         )
 
         # Get overrides from agent identity
@@ -75,6 +76,7 @@ class ComponentBuilder:
             max_retries=config.services.llm_max_retries,
             prompt_overrides=csdma_overrides,
             sink=self.runtime.bus_manager,
+            context_budget_tokens=config.prompt_budget.budget_for("csdma"),
         )
 
         # Get action selection overrides from agent identity
@@ -88,6 +90,7 @@ class ComponentBuilder:
             max_retries=config.services.llm_max_retries,
             prompt_overrides=action_selection_overrides,
             sink=self.runtime.bus_manager,
+            context_budget_tokens=config.prompt_budget.budget_for("action_selection"),
         )
 
         # Create DSDMA using agent's identity
@@ -122,6 +125,7 @@ class ComponentBuilder:
             self.runtime.service_registry,
             model_name=self.runtime.llm_service.model_name,
             sink=self.runtime.bus_manager,
+            context_budget_tokens=config.prompt_budget.budget_for("dsdma"),
         )
 
         # Get time service directly from service_initializer (not from registry)
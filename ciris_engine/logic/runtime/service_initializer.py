@@ -33,6 +33,9 @@ from ciris_engine.logic.services.lifecycle.shutdown import ShutdownService
 from ciris_engine.logic.services.lifecycle.initialization import InitializationService
 from ciris_engine.schemas.config.essential import EssentialConfig
 from ciris_engine.logic.config.config_accessor import ConfigAccessor
+from ciris_engine.logic.utils.crypto_executor import configure_crypto_executor
+from ciris_engine.logic.persistence.utils import configure_fast_row_decoding
+from ciris_engine.utils.serialization import configure_json_backend
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +85,14 @@ class ServiceInitializer:
 
     async def initialize_infrastructure_services(self) -> None:
         """Initialize infrastructure services that all other services depend on."""
+        assert self.config_accessor is not None
+        # Size the shared crypto executor before any service hashes or signs
+        crypto_workers = await self.config_accessor.get("security.crypto_workers")
+        configure_crypto_executor(int(crypto_workers) if crypto_workers else None)
+        configure_fast_row_decoding(await self.config_accessor.get_bool("database.fast_row_decoding", True))
+        json_backend = await self.config_accessor.get("database.json_backend")
+        configure_json_backend(str(json_backend) if json_backend else None)
+
         # Initialize TimeService first - everyone needs time
         self.time_service = TimeService()
         await self.time_service.start()
@@ -675,6 +686,10 @@ This directory contains critical cryptographic keys for the CIRIS system.
         audit_db_path = await self.config_accessor.get_path("database.audit_db", Path("data/ciris_audit.db"))
         audit_key_path = await self.config_accessor.get_path("security.audit_key_path", Path(".ciris_keys"))
         retention_days = await self.config_accessor.get_int("security.audit_retention_days", 90)
+        signing_mode = await self.config_accessor.get_str("security.audit_signing_mode", "entry")
+        flush_entries = await self.config_accessor.get_int("security.audit_flush_entries", 64)
+        flush_interval_ms = await self.config_accessor.get_float("security.audit_flush_interval_ms", 50.0)
+        wait_for_commit = await self.config_accessor.get_bool("security.audit_wait_for_commit", True)
 
         from ciris_engine.logic.services.graph.audit_service import GraphAuditService
         graph_audit = GraphAuditService(
@@ -685,7 +700,11 @@ This directory contains critical cryptographic keys for the CIRIS system.
             enable_hash_chain=True,
             db_path=str(audit_db_path),
             key_path=str(audit_key_path),
-            retention_days=retention_days
+            retention_days=retention_days,
+            hash_chain_flush_entries=flush_entries,
+            hash_chain_flush_interval_ms=flush_interval_ms,
+            hash_chain_wait_for_commit=wait_for_commit,
+            hash_chain_signing_mode=signing_mode
         )
         # Set service registry so it can access memory bus
         if self.service_registry:
@@ -3,26 +3,49 @@ Cryptographic functions for CIRIS secrets management.
 
 Provides AES-256-GCM encryption with per-secret keys derived from a master key.
 Implements secure key derivation, rotation, and forward secrecy.
+
+Key derivation formats:
+- v1 (legacy): PBKDF2-HMAC-SHA256, 100,000 iterations over master key + salt,
+  paid on every encrypt/decrypt.
+- v2: the master key is stretched once with PBKDF2, then each per-secret key is
+  derived with HKDF-SHA256 using the salt. v2 ciphertexts carry a short header
+  (also bound as AEAD associated data) so legacy records still decrypt.
 """
 
 import secrets
-from typing import Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
 import logging
 
+from ciris_engine.logic.utils.crypto_executor import run_crypto
+
 logger = logging.getLogger(__name__)
 
+PBKDF2_ITERATIONS = 100000
+
+# Header prepended to v2 ciphertexts; legacy ciphertexts are raw AES-GCM output
+KDF_V2_HEADER = b"CIRIS-KDF2:"
+_STRETCH_SALT = b"ciris-secrets-master-stretch-v2"
+_HKDF_INFO = b"ciris-secret-key-v2"
+
+DEFAULT_KEY_CACHE_SIZE = 1024
+
 class SecretsEncryption:
     """Handles encryption/decryption of secrets using AES-256-GCM"""
 
-    def __init__(self, master_key: Optional[bytes] = None) -> None:
+    def __init__(self, master_key: Optional[bytes] = None, key_cache_size: int = DEFAULT_KEY_CACHE_SIZE) -> None:
         """
         Initialize with a master key. If not provided, generates a new one.
 
         Args:
             master_key: 32-byte master key for deriving per-secret keys
+            key_cache_size: Maximum number of derived keys kept in memory
         """
         if master_key is None:
             self.master_key = self._generate_master_key()
@@ -32,13 +55,31 @@ class SecretsEncryption:
                 raise ValueError("Master key must be exactly 32 bytes")
             self.master_key = master_key
 
+        self._key_cache_size = key_cache_size
+        self._key_cache: "OrderedDict[Tuple[int, bytes], bytes]" = OrderedDict()
+        self._stretched_key: Optional[bytes] = None
+        # Encryption may run in worker threads (see SecretsStore)
+        self._cache_lock = threading.Lock()
+
     def _generate_master_key(self) -> bytes:
         """Generate a new 256-bit master key"""
         return secrets.token_bytes(32)
 
     def _derive_key(self, salt: bytes) -> bytes:
         """
-        Derive a per-secret key from master key + salt using PBKDF2
+        Derive a per-secret key from master key + salt using PBKDF2 (legacy v1 format)
+
+        Args:
+            salt: 16-byte cryptographic salt
+
+        Returns:
+            32-byte derived key
+        """
+        return self._cached_key(1, salt, self._derive_key_pbkdf2)
+
+    def _derive_key_v2(self, salt: bytes) -> bytes:
+        """
+        Derive a per-secret key with HKDF from the once-stretched master key
 
         Args:
             salt: 16-byte cryptographic salt
@@ -46,14 +87,61 @@ class SecretsEncryption:
         Returns:
             32-byte derived key
         """
+        return self._cached_key(2, salt, self._derive_key_hkdf)
+
+    def _derive_key_pbkdf2(self, salt: bytes) -> bytes:
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=32,
             salt=salt,
-            iterations=100000,
+            iterations=PBKDF2_ITERATIONS,
         )
         return kdf.derive(self.master_key)
 
+    def _derive_key_hkdf(self, salt: bytes) -> bytes:
+        hkdf = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=salt,
+            info=_HKDF_INFO,
+        )
+        return hkdf.derive(self._get_stretched_key())
+
+    def _get_stretched_key(self) -> bytes:
+        """Stretch the master key once with PBKDF2; reused for all v2 derivations."""
+        if self._stretched_key is None:
+            kdf = PBKDF2HMAC(
+                algorithm=hashes.SHA256(),
+                length=32,
+                salt=_STRETCH_SALT,
+                iterations=PBKDF2_ITERATIONS,
+            )
+            self._stretched_key = kdf.derive(self.master_key)
+        return self._stretched_key
+
+    def _cached_key(self, version: int, salt: bytes, derive: Callable[[bytes], bytes]) -> bytes:
+        """Look up a derived key in the bounded LRU cache, deriving it on a miss."""
+        cache_key = (version, bytes(salt))
+        with self._cache_lock:
+            key = self._key_cache.get(cache_key)
+            if key is not None:
+                self._key_cache.move_to_end(cache_key)
+                return key
+
+        key = derive(salt)
+
+        if self._key_cache_size > 0:
+            with self._cache_lock:
+                self._key_cache[cache_key] = key
+                while len(self._key_cache) > self._key_cache_size:
+                    self._key_cache.popitem(last=False)
+        return key
+
+    def clear_key_cache(self) -> None:
+        """Drop all cached derived keys."""
+        with self._cache_lock:
+            self._key_cache.clear()
+
     def encrypt_secret(self, value: str) -> Tuple[bytes, bytes, bytes]:
         """
         Encrypt a secret value using AES-256-GCM
@@ -67,10 +155,10 @@ class SecretsEncryption:
         salt = secrets.token_bytes(16)
         nonce = secrets.token_bytes(12)
 
-        key = self._derive_key(salt)
+        key = self._derive_key_v2(salt)
 
         aesgcm = AESGCM(key)
-        encrypted_value = aesgcm.encrypt(nonce, value.encode('utf-8'), None)
+        encrypted_value = KDF_V2_HEADER + aesgcm.encrypt(nonce, value.encode('utf-8'), KDF_V2_HEADER)
 
         logger.debug(f"Encrypted secret of length {len(value)} characters")
         return encrypted_value, salt, nonce
@@ -88,8 +176,20 @@ class SecretsEncryption:
             The decrypted secret string
 
         Raises:
-            InvalidSignature: If decryption fails (wrong key, corrupted data, etc.)
+            InvalidTag: If decryption fails (wrong key, corrupted data, etc.)
         """
+        if encrypted_value.startswith(KDF_V2_HEADER):
+            try:
+                key = self._derive_key_v2(salt)
+                decrypted_bytes = AESGCM(key).decrypt(
+                    nonce, encrypted_value[len(KDF_V2_HEADER):], KDF_V2_HEADER
+                )
+                logger.debug("Successfully decrypted secret")
+                return decrypted_bytes.decode('utf-8')
+            except InvalidTag:
+                # A legacy ciphertext could begin with the header bytes by chance
+                pass
+
         key = self._derive_key(salt)
 
         aesgcm = AESGCM(key)
@@ -98,6 +198,14 @@ class SecretsEncryption:
         logger.debug("Successfully decrypted secret")
         return decrypted_bytes.decode('utf-8')
 
+    async def async_encrypt_secret(self, value: str) -> Tuple[bytes, bytes, bytes]:
+        """Encrypt a secret value on the shared crypto executor."""
+        return await run_crypto("secret_encrypt", self.encrypt_secret, value)
+
+    async def async_decrypt_secret(self, encrypted_value: bytes, salt: bytes, nonce: bytes) -> str:
+        """Decrypt a secret value on the shared crypto executor."""
+        return await run_crypto("secret_decrypt", self.decrypt_secret, encrypted_value, salt, nonce)
+
     def rotate_master_key(self, new_master_key: Optional[bytes] = None) -> bytes:
         """
         Rotate the master key. This should be used with SecretsStore.reencrypt_all()
@@ -117,6 +225,9 @@ class SecretsEncryption:
                 raise ValueError("New master key must be exactly 32 bytes")
             self.master_key = new_master_key
 
+        self._stretched_key = None
+        self.clear_key_cache()
+
         logger.info("Master key rotated successfully")
         return self.master_key
 
@@ -143,7 +254,7 @@ class SecretsEncryption:
             algorithm=hashes.SHA256(),
             length=32,
             salt=salt,
-            iterations=100000,
+            iterations=PBKDF2_ITERATIONS,
         )
 
         key = kdf.derive(password.encode('utf-8'))
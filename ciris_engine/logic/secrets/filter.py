@@ -5,6 +5,7 @@ Automatically detects and protects sensitive information while maintaining
 the agent's ability to reason about and use secrets safely.
 """
 import re
+import time
 import uuid
 import logging
 from typing import Dict, List, Optional, Tuple
@@ -22,31 +23,82 @@ from ciris_engine.schemas.secrets.core import (
 
 logger = logging.getLogger(__name__)
 
+# Leading global inline flags, e.g. "(?i)", which must become scoped groups
+# before a pattern can be embedded in an alternation.
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?([aiLmsux]+)\)")
+# Backreferences depend on group numbering and break when patterns are merged
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _scoped_pattern(pattern: str) -> str:
+    """Wrap a pattern so it can be embedded in an alternation."""
+    match = _GLOBAL_FLAGS_RE.match(pattern)
+    if match:
+        return f"(?{match.group(1)}:{pattern[match.end():]})"
+    return f"(?:{pattern})"
+
+
 class SecretsFilter:
     """
     Automatic secrets detection and filtering system.
 
     Detects secrets in text and replaces them with secure UUID references
     while maintaining context for the agent.
+
+    All enabled patterns are also merged into a single alternation that is
+    used as a prefilter: one scan tells us whether any pattern can match
+    and where the earliest match starts, so text without secrets (the
+    common case) is scanned exactly once.
     """
 
     def __init__(self, detection_config: Optional[SecretsDetectionConfig] = None) -> None:
         self.detection_config = detection_config or SecretsDetectionConfig()
         self._compiled_patterns: Dict[str, re.Pattern] = {}
+        self._pattern_info: Dict[str, ConfigSecretPattern] = {}
+        self._combined_pattern: Optional[re.Pattern[str]] = None
+        # Bumped whenever the active patterns change, so cached scan results can be invalidated
+        self.config_version = 0
+
+        # Scan throughput tracking
+        self._texts_scanned = 0
+        self._texts_prefiltered = 0
+        self._bytes_scanned = 0
+        self._scan_seconds = 0.0
+
         self._compile_patterns()
 
     def _compile_patterns(self) -> None:
         """Compile all active patterns for efficient matching."""
         self._compiled_patterns.clear()
+        self._pattern_info.clear()
+        self._combined_pattern = None
+        self.config_version += 1
 
         # Add all patterns from config
         if self.detection_config.enabled:
             for pattern in self.detection_config.patterns:
+                if not pattern.enabled:
+                    continue
                 try:
                     self._compiled_patterns[pattern.name] = re.compile(pattern.pattern)
+                    self._pattern_info[pattern.name] = pattern
                 except re.error as e:
                     logger.error(f"Failed to compile pattern {pattern.name}: {e}")
 
+        self._compile_combined_pattern()
+
+    def _compile_combined_pattern(self) -> None:
+        """Merge all compiled patterns into one alternation for single-pass prefiltering."""
+        sources = [compiled.pattern for compiled in self._compiled_patterns.values()]
+        if not sources or any(_BACKREF_RE.search(src) for src in sources):
+            return
+        try:
+            self._combined_pattern = re.compile("|".join(_scoped_pattern(src) for src in sources))
+        except re.error as e:
+            # Fall back to scanning each pattern individually
+            logger.debug(f"Could not merge secret patterns into a single scan: {e}")
+            self._combined_pattern = None
+
     def detect_secrets(self, text: str, context_hint: str = "") -> List[DetectedSecret]:
         """
         Detect secrets in the given text.
@@ -58,14 +110,29 @@ class SecretsFilter:
         Returns:
             List of detected secrets with metadata
         """
+        if not text or not self._compiled_patterns:
+            return []
+
+        start = time.perf_counter()
         detected_secrets = []
 
+        # Single pass over the text: if nothing matches, no pattern can match.
+        # Otherwise every match of every pattern starts at or after the
+        # earliest combined match, so per-pattern scans start there.
+        scan_from = 0
+        if self._combined_pattern is not None:
+            first_match = self._combined_pattern.search(text)
+            if first_match is None:
+                self._record_scan(text, start, prefiltered=True)
+                return []
+            scan_from = first_match.start()
+
         for pattern_name, compiled_pattern in self._compiled_patterns.items():
             try:
-                matches = compiled_pattern.finditer(text)
+                matches = compiled_pattern.finditer(text, scan_from)
                 for match in matches:
                     # Get pattern metadata
-                    pattern_info = self._get_pattern_info(pattern_name)
+                    pattern_info = self._pattern_info.get(pattern_name)
                     if not pattern_info:
                         continue
 
@@ -91,8 +158,18 @@ class SecretsFilter:
             except Exception as e:
                 logger.error(f"Error processing pattern {pattern_name}: {e}")
 
+        self._record_scan(text, start, prefiltered=False)
         return detected_secrets
 
+    def _record_scan(self, text: str, start: float, prefiltered: bool) -> None:
+        """Accumulate scan throughput counters."""
+        self._texts_scanned += 1
+        if prefiltered:
+            self._texts_prefiltered += 1
+        # Character count approximates bytes for the (mostly ASCII) scanned text
+        self._bytes_scanned += len(text)
+        self._scan_seconds += time.perf_counter() - start
+
     def filter_text(self, text: str, context_hint: str = "") -> Tuple[str, List[DetectedSecret]]:
         """
         Filter text by detecting and replacing secrets with UUID references.
@@ -122,11 +199,7 @@ class SecretsFilter:
 
     def _get_pattern_info(self, pattern_name: str) -> Optional[ConfigSecretPattern]:
         """Get pattern information by name."""
-        for pattern in self.detection_config.patterns:
-            if pattern.name == pattern_name:
-                return pattern
-
-        return None
+        return self._pattern_info.get(pattern_name)
 
     def add_custom_pattern(self, pattern: ConfigSecretPattern) -> None:
         """Add a new custom pattern."""
@@ -185,7 +258,14 @@ class SecretsFilter:
             custom_patterns=custom_count,
             disabled_patterns=0,  # No disabled patterns in current schema
             builtin_patterns=True,  # Assume builtin patterns are always enabled
-            filter_version="v1.0"
+            filter_version="v1.0",
+            single_pass_scan=self._combined_pattern is not None,
+            texts_scanned=self._texts_scanned,
+            texts_prefiltered=self._texts_prefiltered,
+            bytes_scanned=self._bytes_scanned,
+            scan_throughput_bytes_per_sec=(
+                self._bytes_scanned / self._scan_seconds if self._scan_seconds > 0 else 0.0
+            )
         )
 
     def export_config(self) -> ConfigExport:
@@ -4,7 +4,9 @@ Secrets Management Service for CIRIS Agent.
 Coordinates secrets detection, storage, and retrieval with full audit trail
 and integration with the agent's action pipeline.
 """
-from typing import Dict, List, Optional, Tuple, Union
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, Union
+import asyncio
 import logging
 
 from .filter import SecretsFilter
@@ -26,6 +28,9 @@ from ciris_engine.protocols.runtime.base import ServiceProtocol
 
 logger = logging.getLogger(__name__)
 
+# Marker present in every encapsulated secret reference
+SECRET_REFERENCE_MARKER = "{SECRET:"
+
 class SecretsService(BaseService, SecretsServiceProtocol):
     """
     Central service for secrets management in CIRIS Agent.
@@ -60,6 +65,11 @@ class SecretsService(BaseService, SecretsServiceProtocol):
         self._auto_forget_enabled = True
         self._current_task_secrets: Dict[str, str] = {}  # UUID -> original_value
 
+    @property
+    def filter_version(self) -> int:
+        """Changes whenever the detection patterns change; scan results cached under an older version are stale."""
+        return self.filter.config_version
+
     async def process_incoming_text(
         self,
         text: str,
@@ -126,6 +136,70 @@ class SecretsService(BaseService, SecretsServiceProtocol):
 
         return filtered_text, secret_references
 
+    async def process_incoming_structure(
+        self,
+        obj: Any,
+        source_message_id: str,
+        skip_keys: FrozenSet[str] = frozenset()
+    ) -> Tuple[Any, List[SecretReference]]:
+        """
+        Detect and replace secrets in the string leaves of a nested structure.
+
+        Only strings are scanned, dict keys included; numbers, booleans,
+        datetimes and enums are left alone, as are values under any top-level
+        key in ``skip_keys``. Containers without secrets are returned as the
+        same object, so callers can detect "unchanged" with an identity check
+        and never re-serialize it.
+
+        Args:
+            obj: Nested dict/list/str structure to process
+            source_message_id: ID of source for tracking
+            skip_keys: Top-level dict keys whose values are known not to contain secrets
+
+        Returns:
+            Tuple of (processed_structure, secret_references)
+        """
+        secret_refs: List[SecretReference] = []
+        processed = await self._deep_filter(obj, source_message_id, skip_keys, secret_refs)
+        return processed, secret_refs
+
+    async def _deep_filter(
+        self,
+        obj: Any,
+        source_message_id: str,
+        skip_keys: FrozenSet[str],
+        secret_refs: List[SecretReference]
+    ) -> Any:
+        """Recursively filter strings, rebuilding only containers that changed.
+
+        ``skip_keys`` applies to this level only; nested dicts are scanned in full.
+        """
+        if isinstance(obj, str):
+            if isinstance(obj, Enum):
+                return obj
+            filtered, refs = await self.process_incoming_text(obj, source_message_id)
+            secret_refs.extend(refs)
+            return filtered
+        elif isinstance(obj, dict):
+            changed: Optional[List[Tuple[Any, Any]]] = None
+            for index, (key, value) in enumerate(obj.items()):
+                new_key, new_value = key, value
+                if key not in skip_keys:
+                    new_key = await self._deep_filter(key, source_message_id, frozenset(), secret_refs)
+                    new_value = await self._deep_filter(value, source_message_id, frozenset(), secret_refs)
+                if changed is None and (new_key is not key or new_value is not value):
+                    changed = list(obj.items())[:index]
+                if changed is not None:
+                    changed.append((new_key, new_value))
+            return obj if changed is None else dict(changed)
+        elif isinstance(obj, (list, tuple)):
+            items = [await self._deep_filter(item, source_message_id, frozenset(), secret_refs) for item in obj]
+            if all(new is old for new, old in zip(items, obj)):
+                return obj
+            return items
+        else:
+            return obj
+
     async def recall_secret(
         self,
         secret_uuid: str,
@@ -153,7 +227,7 @@ class SecretsService(BaseService, SecretsServiceProtocol):
             return None
 
         if decrypt:
-            decrypted_value = self.store.decrypt_secret_value(secret_record)
+            decrypted_value = await self.store.async_decrypt_secret_value(secret_record)
             result = SecretRecallResult(
                 found=True,
                 value=decrypted_value,
@@ -205,18 +279,29 @@ class SecretsService(BaseService, SecretsServiceProtocol):
         action_type: str,
         context: DecapsulationContext
     ) -> Union[dict, list, str, int, float, bool, None]:
-        """Recursively decapsulate secrets in nested structures."""
+        """Recursively decapsulate secrets in nested structures.
+
+        Containers without secret references are returned unchanged (same object).
+        """
         if isinstance(obj, str):
+            if SECRET_REFERENCE_MARKER not in obj:
+                return obj
             return await self._decapsulate_string(obj, action_type, context)
         elif isinstance(obj, dict):
-            result: dict = {}
+            result: Optional[dict] = None
             for key, value in obj.items():
-                result[key] = await self._deep_decapsulate(value, action_type, context)
-            return result
+                new_value = await self._deep_decapsulate(value, action_type, context)
+                if new_value is not value:
+                    if result is None:
+                        result = dict(obj)
+                    result[key] = new_value
+            return obj if result is None else result
         elif isinstance(obj, list):
             list_result: List[object] = []
             for item in obj:
                 list_result.append(await self._deep_decapsulate(item, action_type, context))
+            if all(new is old for new, old in zip(list_result, obj)):
+                return obj
             return list_result
         else:
             return obj
@@ -247,7 +332,7 @@ class SecretsService(BaseService, SecretsServiceProtocol):
                 continue  # Leave original reference
 
             if action_type in secret_record.auto_decapsulate_for_actions:
-                decrypted_value = self.store.decrypt_secret_value(secret_record)
+                decrypted_value = await self.store.async_decrypt_secret_value(secret_record)
                 if decrypted_value:
                     logger.info(
                         f"Auto-decapsulated {secret_record.sensitivity_level} secret "
@@ -413,7 +498,7 @@ class SecretsService(BaseService, SecretsServiceProtocol):
     async def encrypt(self, plaintext: str) -> str:
         """Encrypt a secret."""
         # Direct encryption - returns base64 encoded ciphertext
-        encrypted_value, salt, nonce = self.store.encrypt_secret(plaintext)
+        encrypted_value, salt, nonce = await asyncio.to_thread(self.store.encrypt_secret, plaintext)
         # Combine encrypted parts into a single string for transport
         import base64
         combined = salt + nonce + encrypted_value
@@ -429,7 +514,7 @@ class SecretsService(BaseService, SecretsServiceProtocol):
             salt = combined[:16]
             nonce = combined[16:28]
             encrypted_value = combined[28:]
-            return self.store.decrypt_secret(encrypted_value, salt, nonce)
+            return await asyncio.to_thread(self.store.decrypt_secret, encrypted_value, salt, nonce)
         except Exception as e:
             logger.error(f"Failed to decrypt: {e}")
             return ""
@@ -453,7 +538,7 @@ class SecretsService(BaseService, SecretsServiceProtocol):
         try:
             secret_record = await self.store.retrieve_secret(key, decrypt=True)
             if secret_record:
-                decrypted = self.store.decrypt_secret_value(secret_record)
+                decrypted = await self.store.async_decrypt_secret_value(secret_record)
                 return decrypted
             return None
         except Exception:
@@ -567,8 +652,8 @@ class SecretsService(BaseService, SecretsServiceProtocol):
     def _get_actions(self) -> List[str]:
         """Get list of actions this service provides."""
         return [
-            "process_incoming_text", "decapsulate_secrets_in_parameters",
-            "list_stored_secrets", "recall_secret", "update_filter_config",
+            "process_incoming_text", "process_incoming_structure",
+            "decapsulate_secrets_in_parameters", "list_stored_secrets", "recall_secret", "update_filter_config",
             "forget_secret", "get_service_stats", "get_filter_config",
             "encrypt", "decrypt", "store_secret", "retrieve_secret", "reencrypt_all"
         ]
@@ -6,6 +6,7 @@ and comprehensive access auditing.
 """
 import sqlite3
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Literal, Optional, Tuple, cast, Any
 from pathlib import Path
@@ -14,6 +15,7 @@ import logging
 
 from ciris_engine.schemas.secrets.core import SecretRecord, DetectedSecret, SecretAccessLog, SecretReference
 from .encryption import SecretsEncryption
+from ciris_engine.logic.utils.crypto_executor import run_crypto
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 
 logger = logging.getLogger(__name__)
@@ -138,8 +140,10 @@ class SecretsStore:
         """
         async with self._lock:
             try:
-                # Encrypt the secret value
-                encrypted_value, salt, nonce = self.encryption.encrypt_secret(secret.original_value)
+                # Encrypt the secret value off the event loop
+                encrypted_value, salt, nonce = await self.encryption.async_encrypt_secret(
+                    secret.original_value
+                )
 
                 # Create secret record with encryption data
                 secret_record = SecretRecord(
@@ -307,6 +311,10 @@ class SecretsStore:
             logger.error(f"Failed to decrypt secret {secret_record.secret_uuid}: {type(e).__name__}")
             return None
 
+    async def async_decrypt_secret_value(self, secret_record: SecretRecord) -> Optional[str]:
+        """Decrypt the actual secret value on the shared crypto executor, keeping key derivation off the event loop."""
+        return await run_crypto("secret_decrypt", self.decrypt_secret_value, secret_record)
+
     async def delete_secret(self, secret_uuid: str) -> bool:
         """
         Delete secret from storage.
@@ -538,8 +546,18 @@ class SecretsStore:
             logger.error(f"Failed to retrieve access logs: {type(e).__name__}")
         return logs
 
-    async def reencrypt_all(self, new_encryption_key: bytes) -> bool:
-        """Re-encrypt all stored secrets with a new key."""
+    async def reencrypt_all(self, new_encryption_key: bytes, max_workers: Optional[int] = None) -> bool:
+        """
+        Re-encrypt all stored secrets with a new key.
+
+        Decryption with the current key and encryption with the new key run
+        in a worker pool, and the database is updated in a single transaction
+        only if every secret was re-encrypted.
+
+        Args:
+            new_encryption_key: New 32-byte master key
+            max_workers: Worker pool size (defaults to the executor's default)
+        """
         try:
             # Get all secrets
             with sqlite3.connect(self.db_path) as conn:
@@ -550,24 +568,30 @@ class SecretsStore:
                 logger.info("No secrets to re-encrypt")
                 return True
 
-            # Decrypt with old key and re-encrypt with new key
-            updated_secrets = []
-            for secret_uuid, encrypted_value, salt, nonce in secrets:
-                try:
-                    # Decrypt with current key
-                    decrypted_value = self.encryption.decrypt_secret(encrypted_value, salt, nonce)
-
-                    # Create new encryption instance with new key
-                    new_encryption = SecretsEncryption(new_encryption_key)
-
-                    # Re-encrypt with new key
-                    new_encrypted_value, new_salt, new_nonce = new_encryption.encrypt_secret(decrypted_value)
-
-                    updated_secrets.append((new_encrypted_value, new_salt, new_nonce, secret_uuid))
+            old_encryption = self.encryption
+            # One instance for all secrets so the master key is stretched once
+            new_encryption = SecretsEncryption(new_encryption_key)
+
+            def _reencrypt(row: Tuple[str, bytes, bytes, bytes]) -> Tuple[bytes, bytes, bytes, str]:
+                secret_uuid, encrypted_value, salt, nonce = row
+                decrypted_value = old_encryption.decrypt_secret(encrypted_value, salt, nonce)
+                new_encrypted_value, new_salt, new_nonce = new_encryption.encrypt_secret(decrypted_value)
+                return new_encrypted_value, new_salt, new_nonce, secret_uuid
+
+            # Decrypt with old key and re-encrypt with new key in a worker pool
+            loop = asyncio.get_running_loop()
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="secrets-reencrypt") as pool:
+                results = await asyncio.gather(
+                    *(loop.run_in_executor(pool, _reencrypt, row) for row in secrets),
+                    return_exceptions=True,
+                )
 
-                except Exception as decrypt_error:
-                    logger.error(f"Failed to re-encrypt secret {secret_uuid}: {type(decrypt_error).__name__}")
+            updated_secrets = []
+            for row, result in zip(secrets, results):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to re-encrypt secret {row[0]}: {type(result).__name__}")
                     return False
+                updated_secrets.append(result)
 
             # Update all secrets in database
             with sqlite3.connect(self.db_path) as conn:
@@ -578,7 +602,7 @@ class SecretsStore:
                 """, [(enc_val, salt, nonce, "master_key_v2", uuid) for enc_val, salt, nonce, uuid in updated_secrets])
                 conn.commit()
 
-            self.encryption = SecretsEncryption(new_encryption_key)
+            self.encryption = new_encryption
 
             logger.info(f"Successfully re-encrypted {len(updated_secrets)} secrets")
             return True
@@ -28,12 +28,18 @@ from ciris_engine.schemas.runtime.enums import TaskStatus, ThoughtStatus
 from ciris_engine.logic.buses import BusManager
 from ciris_engine.logic.persistence import (
     get_task_by_id,
+    get_tasks_by_ids,
     get_thoughts_by_task_id,
-    get_thoughts_by_status,
+    get_thoughts_by_task_ids,
+    get_recent_thoughts_by_status,
+    get_recent_completed_tasks,
     get_tasks_by_status,
     get_thought_by_id
 )
 
+# How many thoughts of each kind a snapshot shows
+SNAPSHOT_THOUGHT_LIMIT = 10
+
 class VisibilityService(BaseService, VisibilityServiceProtocol):
     """Service providing agent reasoning transparency."""
 
@@ -56,6 +62,8 @@ class VisibilityService(BaseService, VisibilityServiceProtocol):
         return [
             "get_current_state",
             "get_reasoning_trace",
+            "get_reasoning_traces",
+            "get_task_history",
             "get_decision_history",
             "explain_action"
         ]
@@ -85,47 +93,26 @@ class VisibilityService(BaseService, VisibilityServiceProtocol):
         if active_tasks:
             current_task = active_tasks[0]
 
-        # Get active thoughts from persistence
+        # Get the most recent pending thoughts
         active_thoughts = []
         try:
-            # Get recent pending/active thoughts
-            pending_thoughts = get_thoughts_by_status(ThoughtStatus.PENDING, db_path=self._db_path)
-            active_thoughts = pending_thoughts[:10]  # Limit to 10 most recent
+            active_thoughts = get_recent_thoughts_by_status(
+                ThoughtStatus.PENDING, limit=SNAPSHOT_THOUGHT_LIMIT, db_path=self._db_path
+            )
         except Exception:
             pass
 
-        # Get recent decisions from completed thoughts
+        # Get recent decisions from the most recently completed thoughts
         recent_decisions: List[Thought] = []
         try:
-            completed_thoughts = get_thoughts_by_status(ThoughtStatus.COMPLETED, db_path=self._db_path)
-            # Get the most recent thoughts that have final_action (which they all should)
-            for thought in completed_thoughts[:10]:  # Get last 10
-                if thought.final_action:
-                    recent_decisions.append(thought)
+            completed_thoughts = get_recent_thoughts_by_status(
+                ThoughtStatus.COMPLETED, limit=SNAPSHOT_THOUGHT_LIMIT, db_path=self._db_path
+            )
+            recent_decisions = [thought for thought in completed_thoughts if thought.final_action]
         except Exception:
             pass
 
-        # Calculate reasoning depth from active thoughts
-        reasoning_depth = 0
-        if active_thoughts:
-            # Count the depth by checking parent relationships
-            max_depth = 0
-            for thought in active_thoughts:
-                depth = 1
-                parent_id = getattr(thought, 'parent_thought_id', None)
-                while parent_id:
-                    depth += 1
-                    # Find parent thought
-                    parent_found = False
-                    for t in active_thoughts:
-                        if t.thought_id == parent_id:
-                            parent_id = getattr(t, 'parent_thought_id', None)
-                            parent_found = True
-                            break
-                    if not parent_found:
-                        break
-                max_depth = max(max_depth, depth)
-            reasoning_depth = max_depth
+        reasoning_depth = self._chain_depth(active_thoughts)
 
         return VisibilitySnapshot(
             timestamp=self._now(),
@@ -135,84 +122,123 @@ class VisibilityService(BaseService, VisibilityServiceProtocol):
             reasoning_depth=reasoning_depth
         )
 
+    @staticmethod
+    def _chain_depth(thoughts: List[Thought]) -> int:
+        """Longest parent chain among ``thoughts``, counting only parents in the list."""
+        parents = {t.thought_id: t.parent_thought_id for t in thoughts}
+        depths: Dict[str, int] = {}
+        max_depth = 0
+        for thought in thoughts:
+            # Walk up until we reach a thought whose depth is already known
+            chain: List[str] = []
+            current: Optional[str] = thought.thought_id
+            while current in parents and current not in depths and current not in chain:
+                chain.append(current)
+                current = parents[current]
+            depth = depths.get(current, 0) if current else 0
+            for thought_id in reversed(chain):
+                depth += 1
+                depths[thought_id] = depth
+            max_depth = max(max_depth, depths[thought.thought_id])
+        return max_depth
+
+    async def get_task_history(self, limit: int = 10) -> List[Task]:
+        """Get the most recently completed tasks, newest first."""
+        return get_recent_completed_tasks(limit=limit, db_path=self._db_path)
+
     async def get_reasoning_trace(self, task_id: str) -> ReasoningTrace:
         """Get reasoning trace for a task."""
-        from ciris_engine.schemas.services.visibility import ThoughtStep
-
-        # Get the task from persistence
         task = get_task_by_id(task_id, db_path=self._db_path)
         if not task:
-            # Return empty trace if task not found
-            return ReasoningTrace(
-                task=Task(
-                    task_id=task_id,
-                    channel_id="system",
-                    description="Task not found",
-                    created_at=self._now().isoformat(),
-                    updated_at=self._now().isoformat(),
-                    parent_task_id=None,
-                    context=None,
-                    outcome=None
-                ),
-                thought_steps=[],
-                total_thoughts=0,
-                actions_taken=[],
-                processing_time_ms=0.0
-            )
-
-        # Get all thoughts for this task from persistence
-        thought_steps = []
-        actions_taken = []
+            return self._missing_task_trace(task_id)
 
         try:
             thoughts = get_thoughts_by_task_id(task_id, db_path=self._db_path)
+        except Exception:
+            thoughts = []
+        return self._build_trace(task, thoughts)
+
+    async def get_reasoning_traces(self, task_ids: List[str]) -> Dict[str, ReasoningTrace]:
+        """Get reasoning traces for several tasks.
+
+        Loads the tasks and all of their thoughts with one query each, rather
+        than two queries per task. Unknown task IDs get an empty trace, as
+        with ``get_reasoning_trace``.
+        """
+        if not task_ids:
+            return {}
+        tasks = get_tasks_by_ids(task_ids, db_path=self._db_path)
+        try:
+            thoughts_by_task = get_thoughts_by_task_ids(list(tasks), db_path=self._db_path)
+        except Exception:
+            thoughts_by_task = {}
 
-            for thought in thoughts:
-                try:
+        traces: Dict[str, ReasoningTrace] = {}
+        for task_id in task_ids:
+            task = tasks.get(task_id)
+            if task is None:
+                traces[task_id] = self._missing_task_trace(task_id)
+            else:
+                traces[task_id] = self._build_trace(task, thoughts_by_task.get(task_id, []))
+        return traces
 
-                    # Get conscience results from the thought's final_action
-                    conscience_results = None
-                    if thought.final_action and thought.final_action.action_type not in ["TASK_COMPLETE", "REJECT"]:
-                        # Conscience results are stored in the final_action
-                        if hasattr(thought.final_action, 'conscience_results') and thought.final_action.conscience_results:
-                            conscience_results = thought.final_action.conscience_results
-
-                    # Handler result is represented by the thought's status and final_action
-                    # If thought is COMPLETED, the handler succeeded
-                    handler_result = None
-                    if thought.status == ThoughtStatus.COMPLETED and thought.final_action:
-                        # For now, we don't have HandlerResult objects in persistence
-                        # This would require storing handler results separately
-                        pass
+    def _missing_task_trace(self, task_id: str) -> ReasoningTrace:
+        """Empty trace returned for a task that is not in persistence."""
+        return ReasoningTrace(
+            task=Task(
+                task_id=task_id,
+                channel_id="system",
+                description="Task not found",
+                created_at=self._now().isoformat(),
+                updated_at=self._now().isoformat(),
+                parent_task_id=None,
+                context=None,
+                outcome=None
+            ),
+            thought_steps=[],
+            total_thoughts=0,
+            actions_taken=[],
+            processing_time_ms=0.0
+        )
 
-                    # Get followup thought IDs by checking parent_thought_id
-                    followup_thoughts = []
-                    for other_thought in thoughts:
-                        if hasattr(other_thought, 'parent_thought_id') and other_thought.parent_thought_id == thought.thought_id:
-                            followup_thoughts.append(other_thought.thought_id)
-
-                    # Create thought step
-                    step = ThoughtStep(
-                        thought=thought,
-                        conscience_results=conscience_results,
-                        handler_result=handler_result,
-                        followup_thoughts=followup_thoughts
-                    )
-                    thought_steps.append(step)
-
-                    # Track actions taken
-                    if thought.final_action:
-                        actions_taken.append(thought.final_action.action_type)
+    def _build_trace(self, task: Task, thoughts: List[Thought]) -> ReasoningTrace:
+        """Assemble a trace from a task and its thoughts, oldest first."""
+        from ciris_engine.schemas.services.visibility import ThoughtStep
 
-                except Exception:
-                    # Skip malformed thoughts
-                    pass
-        except Exception:
-            pass
+        # Followups of each thought, built once for the whole trace
+        children: Dict[str, List[str]] = {}
+        for thought in thoughts:
+            if thought.parent_thought_id:
+                children.setdefault(thought.parent_thought_id, []).append(thought.thought_id)
+
+        thought_steps = []
+        actions_taken = []
+        for thought in thoughts:
+            try:
+                # Conscience results are stored in the final_action for non-terminal actions
+                conscience_results = None
+                if thought.final_action and thought.final_action.action_type not in ["TASK_COMPLETE", "REJECT"]:
+                    if hasattr(thought.final_action, 'conscience_results') and thought.final_action.conscience_results:
+                        conscience_results = thought.final_action.conscience_results
+
+                # Handler results are not persisted; a COMPLETED thought means the handler succeeded
+                step = ThoughtStep(
+                    thought=thought,
+                    conscience_results=conscience_results,
+                    handler_result=None,
+                    followup_thoughts=children.get(thought.thought_id, [])
+                )
+                thought_steps.append(step)
+
+                if thought.final_action:
+                    actions_taken.append(thought.final_action.action_type)
+            except Exception:
+                # Skip malformed thoughts
+                pass
 
         # Calculate processing time
         processing_time_ms = 0.0
-        if task and thought_steps:
+        if thought_steps:
             try:
                 start_time = datetime.fromisoformat(task.created_at)
                 last_thought_time = datetime.fromisoformat(thought_steps[-1].thought.updated_at)
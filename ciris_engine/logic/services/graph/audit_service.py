@@ -46,14 +46,22 @@ from ciris_engine.schemas.services.nodes import AuditEntry as AuditEntryNode, Au
 AuditEntry = AuditEntryNode
 from ciris_engine.schemas.services.operations import MemoryOpStatus, MemoryQuery
 from ciris_engine.schemas.services.graph.audit import (
-    AuditEventData, VerificationReport, AuditQuery
+    AuditEventData, VerificationReport, AuditQuery, AuditQueryPage
 )
 from ciris_engine.logic.services.base_graph_service import BaseGraphService
 from ciris_engine.logic.buses.memory_bus import MemoryBus
 from ciris_engine.logic.audit.hash_chain import AuditHashChain
+from ciris_engine.logic.audit.query import count_entries, fetch_page
+from ciris_engine.logic.audit.exporter import (
+    AuditExporter, COMPRESSION_GZIP, DEFAULT_MAX_CHUNK_BYTES, EXPORT_FORMATS
+)
+from ciris_engine.logic.audit.writer import (
+    AuditChainWriter, DEFAULT_FLUSH_BATCH_SIZE, DEFAULT_FLUSH_INTERVAL_MS, SIGNING_MODE_ENTRY
+)
 from ciris_engine.protocols.services.lifecycle.time import TimeServiceProtocol
 from ciris_engine.logic.audit.verifier import AuditVerifier
-from ciris_engine.schemas.audit.verification import CompleteVerificationResult
+from ciris_engine.schemas.audit.verification import CompleteVerificationResult, VerificationProgress
+from ciris_engine.schemas.audit.export import AuditExportManifest
 from ciris_engine.constants import UTC_TIMEZONE_SUFFIX
 
 logger = logging.getLogger(__name__)
@@ -83,13 +91,20 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         # File export options
         export_path: Optional[str] = None,
         export_format: str = "jsonl",  # jsonl, csv, or sqlite
+        export_compression: str = COMPRESSION_GZIP,  # gzip, zstd or none
+        export_max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
         # Hash chain options
         enable_hash_chain: bool = True,
         db_path: str = "ciris_audit.db",
         key_path: str = "audit_keys",
         # Retention options
         retention_days: int = 90,
-        cache_size: int = 1000
+        cache_size: int = 1000,
+        # Hash chain durability options
+        hash_chain_flush_entries: int = DEFAULT_FLUSH_BATCH_SIZE,
+        hash_chain_flush_interval_ms: float = DEFAULT_FLUSH_INTERVAL_MS,
+        hash_chain_wait_for_commit: bool = True,
+        hash_chain_signing_mode: str = SIGNING_MODE_ENTRY
     ) -> None:
         """
         Initialize the consolidated audit service.
@@ -99,11 +114,18 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             time_service: Time service for consistent timestamps
             export_path: Optional path for file exports
             export_format: Format for exports (jsonl, csv, sqlite)
+            export_compression: Compression of streamed export chunks (gzip, zstd, none)
+            export_max_chunk_bytes: Rotate streamed export chunks at this size on disk
             enable_hash_chain: Whether to maintain cryptographic hash chain
             db_path: Path for hash chain database
             key_path: Directory for signing keys
             retention_days: How long to retain audit data
             cache_size: Size of in-memory cache
+            hash_chain_flush_entries: Commit the hash chain after this many queued entries
+            hash_chain_flush_interval_ms: Commit queued hash chain entries at least this often
+            hash_chain_wait_for_commit: Make log calls wait until their chain entry is committed;
+                when False they return once queued, and entries still queued are lost on a crash
+            hash_chain_signing_mode: 'entry' to sign every entry, 'merkle' to sign one Merkle root per batch
         """
         if not time_service:
             raise RuntimeError("CRITICAL: TimeService is required for GraphAuditService")
@@ -116,11 +138,23 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         # Export configuration
         self.export_path = Path(export_path) if export_path else None
         self.export_format = export_format
+        self.export_compression = export_compression
+        self.export_max_chunk_bytes = export_max_chunk_bytes
+        # Incremental chunks stream out of audit_log next to the export file
+        self.export_stream_dir = (
+            self.export_path.parent / f"{self.export_path.stem}_chunks" if self.export_path else None
+        )
+        self._stream_exports = False
+        self._export_lock = asyncio.Lock()
 
         # Hash chain configuration
         self.enable_hash_chain = enable_hash_chain
         self.db_path = Path(db_path)
         self.key_path = Path(key_path)
+        self.hash_chain_flush_entries = hash_chain_flush_entries
+        self.hash_chain_flush_interval_ms = hash_chain_flush_interval_ms
+        self.hash_chain_wait_for_commit = hash_chain_wait_for_commit
+        self.hash_chain_signing_mode = hash_chain_signing_mode
 
         # Retention configuration
         self.retention_days = retention_days
@@ -133,7 +167,8 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         self.hash_chain: Optional[AuditHashChain] = None
         self.signature_manager: Optional[AuditSignatureManager] = None
         self.verifier: Optional[AuditVerifier] = None
-        self._db_connection: Optional[sqlite3.Connection] = None
+        self._chain_writer: Optional[AuditChainWriter] = None
+        self._verification_task: Optional[asyncio.Task[CompleteVerificationResult]] = None
 
         # Export buffer
         self._export_buffer: List[AuditRequest] = []
@@ -144,9 +179,6 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         
         # Track uptime
         self._start_time: Optional[datetime] = None
-        
-        # Lock for hash chain operations
-        self._hash_chain_lock = asyncio.Lock()
 
     def _set_service_registry(self, registry: object) -> None:
         """Set the service registry for accessing memory bus."""
@@ -182,6 +214,8 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         # Create export directory if needed
         if self.export_path:
             self.export_path.parent.mkdir(parents=True, exist_ok=True)
+            # With the hash chain, exports stream from audit_log instead of the in-memory buffer
+            self._stream_exports = self._audit_log_available() and self.export_format in EXPORT_FORMATS
 
         # Start export task if configured
         if self.export_path:
@@ -195,6 +229,15 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         if self._export_buffer:
             await self._flush_exports()
 
+        # Stop an in-flight verification run; its checkpoint lets the next run resume
+        if self._verification_task and not self._verification_task.done():
+            if self.verifier:
+                self.verifier.cancel()
+            try:
+                await self._verification_task
+            except Exception as e:
+                logger.warning(f"Chain verification ended with error during shutdown: {e}")
+
         # Cancel export task
         if self._export_task:
             self._export_task.cancel()
@@ -223,9 +266,17 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         except Exception as e:
             logger.warning(f"Failed to log shutdown event: {e}")
 
-        # Close database connection AFTER logging
-        if self._db_connection:
-            self._db_connection.close()
+        # Commit queued chain entries and close the writer AFTER logging
+        if self._chain_writer:
+            await self._chain_writer.stop()
+            self._chain_writer = None
+
+        # Export everything committed so far, including the shutdown event
+        if self._stream_exports:
+            try:
+                await self.export_incremental()
+            except Exception as e:
+                logger.error(f"Final audit export failed: {e}")
 
         logger.info("GraphAuditService stopped")
         
@@ -268,7 +319,7 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             self._cache_entry(entry)
 
             # Queue for export if configured
-            if self.export_path:
+            if self.export_path and not self._stream_exports:
                 self._export_buffer.append(entry)
 
         except Exception as e:
@@ -374,11 +425,9 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
 
             # Cache and export
             self._cache_entry(entry)
-            if self.export_path:
+            if self.export_path and not self._stream_exports:
                 logger.debug(f"Adding to export buffer, path={self.export_path}")
                 self._export_buffer.append(entry)
-            else:
-                logger.debug(f"No export path configured")
 
         except Exception as e:
             logger.error(f"Failed to log event {event_type}: {e}")
@@ -477,6 +526,74 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         query: AuditQuery
     ) -> List[AuditEntry]:
         """Query audit trail with advanced filters - implements AuditServiceProtocol."""
+        page = await self.query_audit_page(query)
+        return page.entries
+
+    async def query_audit_page(self, query: AuditQuery) -> AuditQueryPage:
+        """Query one page of the audit trail, with a cursor for the next page.
+
+        Answered in SQL from the signed audit_log when the hash chain is
+        enabled; otherwise falls back to filtering graph audit nodes.
+        """
+        if self._audit_log_available():
+            # Read our own writes: queued chain entries are not in audit_log yet
+            await self.flush_hash_chain()
+            rows, next_cursor, has_more = await asyncio.to_thread(fetch_page, str(self.db_path), query)
+            return AuditQueryPage(
+                entries=[self._audit_row_to_entry(row) for row in rows],
+                next_cursor=next_cursor,
+                has_more=has_more
+            )
+
+        entries = await self._query_graph_audit_trail(query)
+        return AuditQueryPage(entries=entries)
+
+    async def count_audit_entries(self, query: AuditQuery) -> int:
+        """Count entries matching the query's filters without loading them."""
+        if self._audit_log_available():
+            await self.flush_hash_chain()
+            return await asyncio.to_thread(count_entries, str(self.db_path), query)
+
+        unpaged = query.model_copy(update={"limit": None, "offset": 0, "cursor": None})
+        return len(await self._query_graph_audit_trail(unpaged))
+
+    def _audit_log_available(self) -> bool:
+        return self.enable_hash_chain and self.db_path.exists()
+
+    def _audit_row_to_entry(self, row: Dict[str, Any]) -> AuditEntry:
+        """Build an audit entry from an audit_log row."""
+        details: Dict[str, Union[str, int, float, bool]] = {}
+        payload = row.get("event_payload")
+        if payload:
+            try:
+                decoded = json.loads(payload)
+            except (TypeError, ValueError):
+                decoded = {}
+            if isinstance(decoded, dict):
+                for key, value in decoded.items():
+                    if isinstance(value, (str, int, float, bool)):
+                        details[key] = value
+                    elif value is not None:
+                        details[key] = str(value)
+
+        return AuditEntryNode(
+            id=f"audit_{row['event_id']}",
+            action=row["event_type"],
+            actor=row.get("actor") or "",
+            timestamp=datetime.fromisoformat(row["event_timestamp"]),
+            context=AuditEntryContext(
+                service_name=str(details.get("handler_name", "")),
+                correlation_id=row["event_id"],
+                additional_data=details
+            ),
+            signature=row.get("signature"),
+            hash_chain=row.get("previous_hash"),
+            scope=GraphScope.LOCAL,
+            attributes={}
+        )
+
+    async def _query_graph_audit_trail(self, query: AuditQuery) -> List[AuditEntry]:
+        """Filter audit nodes from graph memory (used without the hash chain)."""
         if not self._memory_bus:
             return []
             
@@ -600,6 +717,8 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             )
 
         try:
+            # Verify what has been logged so far, not just what has been committed
+            await self.flush_hash_chain()
             result = await asyncio.to_thread(self.verifier.verify_complete_chain)
             end_time = self._time_service.now() if self._time_service else datetime.now()
 
@@ -674,15 +793,57 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
                 errors=[str(e)]
             )
 
+    async def start_integrity_verification(self, resume: bool = True) -> VerificationProgress:
+        """Start a streaming chain verification in the background.
+
+        Only one run is active at a time; calling this while a run is in
+        progress just returns its progress. With ``resume`` the run picks up
+        after the last checkpointed, verified sequence number.
+        """
+        if not self.enable_hash_chain or not self.verifier:
+            return VerificationProgress(state="failed")
+
+        if self._verification_task is None or self._verification_task.done():
+            await self.flush_hash_chain()
+            self.verifier.mark_started()
+            self._verification_task = asyncio.create_task(
+                asyncio.to_thread(self.verifier.verify_complete_chain, resume),
+                name="audit_chain_verification"
+            )
+
+        return self.verifier.get_progress()
+
+    async def get_verification_progress(self) -> VerificationProgress:
+        """Get progress of the current or last chain verification."""
+        if not self.verifier:
+            return VerificationProgress()
+        return self.verifier.get_progress()
+
     async def export_audit_data(
         self,
         start_time: Optional[datetime] = None,
         end_time: Optional[datetime] = None,
         format: Optional[str] = None
     ) -> str:
-        """Export audit data to file."""
+        """Export audit data to file.
+
+        JSONL and CSV exports stream straight from audit_log into compressed,
+        size-rotated chunks in a fresh directory; the returned path is that
+        directory's manifest. Without the hash chain, or for SQLite output,
+        matching entries are queried and written in one file.
+        """
         format = format or self.export_format
 
+        if not self.export_path:
+            raise ValueError("Export path not configured")
+
+        if self._audit_log_available() and format in EXPORT_FORMATS:
+            await self.flush_hash_chain()
+            timestamp = (self._time_service.now() if self._time_service else datetime.now()).strftime("%Y%m%d_%H%M%S")
+            exporter = self._make_exporter(self.export_path.parent / f"audit_export_{timestamp}", format)
+            await asyncio.to_thread(exporter.export, start_time=start_time, end_time=end_time, resume=False)
+            return str(exporter.manifest_path)
+
         # Query data
         from ciris_engine.schemas.services.graph.audit import AuditQuery
         query = AuditQuery(
@@ -694,8 +855,6 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
 
         # Generate filename
         timestamp = (self._time_service.now() if self._time_service else datetime.now()).strftime("%Y%m%d_%H%M%S")
-        if not self.export_path:
-            raise ValueError("Export path not configured")
         filename = self.export_path.parent / f"audit_export_{timestamp}.{format}"
 
         # Convert AuditEntry to AuditRequest for export methods
@@ -728,6 +887,34 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
 
         return str(filename)
 
+    async def export_incremental(self) -> AuditExportManifest:
+        """Export audit_log entries committed since the last incremental export.
+
+        Chunks and their manifest accumulate in ``export_stream_dir``; an
+        interrupted run leaves the manifest at the last sealed chunk, so the
+        next run picks up from there.
+        """
+        if not self.export_stream_dir:
+            raise ValueError("Export path not configured")
+        if not self._audit_log_available():
+            raise RuntimeError("Incremental export requires the audit hash chain")
+
+        await self.flush_hash_chain()
+        exporter = self._make_exporter(self.export_stream_dir, self.export_format)
+        async with self._export_lock:
+            return await asyncio.to_thread(exporter.export, resume=True)
+
+    def _make_exporter(self, export_dir: Path, format: str) -> AuditExporter:
+        assert self._time_service is not None
+        return AuditExporter(
+            str(self.db_path),
+            export_dir,
+            self._time_service,
+            format=format,
+            compression=self.export_compression,
+            max_chunk_bytes=self.export_max_chunk_bytes,
+        )
+
     # ========== GraphServiceProtocol Implementation ==========
 
     def get_node_type(self) -> str:
@@ -755,6 +942,15 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             "hash_chain_enabled": float(self.enable_hash_chain),
             "cache_size_mb": cache_size_mb
         })
+
+        if self._chain_writer:
+            writer_stats = self._chain_writer.get_stats()
+            metrics.update({
+                "hash_chain_queue_depth": float(writer_stats.queue_depth),
+                "hash_chain_entries_written": float(writer_stats.entries_written),
+                "hash_chain_batches_committed": float(writer_stats.batches_committed),
+                "hash_chain_average_batch_size": writer_stats.average_batch_size
+            })
         
         return metrics
 
@@ -832,6 +1028,17 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
             # Initialize in thread
             await asyncio.to_thread(self._init_components_sync)
 
+            # Single writer owns the chain tip from here on
+            self._chain_writer = AuditChainWriter(
+                str(self.db_path),
+                self.hash_chain,
+                self.signature_manager,
+                flush_batch_size=self.hash_chain_flush_entries,
+                flush_interval_ms=self.hash_chain_flush_interval_ms,
+                signing_mode=self.hash_chain_signing_mode
+            )
+            await self._chain_writer.start()
+
             logger.info("Hash chain audit system initialized")
 
         except Exception as e:
@@ -864,6 +1071,7 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
                     event_timestamp TEXT NOT NULL,
                     event_type TEXT NOT NULL,
                     originator_id TEXT NOT NULL,
+                    actor TEXT,
                     target_id TEXT,
                     event_summary TEXT,
                     event_payload TEXT,
@@ -889,76 +1097,101 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
                 )
             """)
 
+            # Signed Merkle roots, one per batch in merkle signing mode
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS audit_roots (
+                    root_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sequence_start INTEGER NOT NULL,
+                    sequence_end INTEGER NOT NULL,
+                    root_hash TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    external_anchor TEXT,
+                    signature TEXT,
+                    signing_key_id TEXT,
+                    UNIQUE(sequence_start, sequence_end)
+                )
+            """)
+
+            # Older databases created audit_roots without signature columns
+            root_columns = {row[1] for row in cursor.execute("PRAGMA table_info(audit_roots)")}
+            for column in ("signature", "signing_key_id"):
+                if column not in root_columns:
+                    cursor.execute(f"ALTER TABLE audit_roots ADD COLUMN {column} TEXT")  # nosec B608 - fixed column names
+
+            # Older databases have no actor column; recover it from "<event_type> by <actor>"
+            log_columns = {row[1] for row in cursor.execute("PRAGMA table_info(audit_log)")}
+            if "actor" not in log_columns:
+                cursor.execute("ALTER TABLE audit_log ADD COLUMN actor TEXT")
+                cursor.execute("""
+                    UPDATE audit_log
+                    SET actor = substr(event_summary, length(event_type) + 5)
+                    WHERE event_summary LIKE event_type || ' by %'
+                """)
+
+            # Inclusion proof of each Merkle-signed entry
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS audit_merkle_proofs (
+                    sequence_number INTEGER PRIMARY KEY,
+                    root_id INTEGER NOT NULL,
+                    leaf_index INTEGER NOT NULL,
+                    proof TEXT NOT NULL
+                )
+            """)
+
             # Indexes
             cursor.execute("""
                 CREATE INDEX IF NOT EXISTS idx_audit_log_event_timestamp
                 ON audit_log(event_timestamp)
             """)
 
+            # Query indexes end in event_timestamp so filtered pages come back in order
+            cursor.execute("DROP INDEX IF EXISTS idx_audit_log_event_type")
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_audit_log_event_type_time
+                ON audit_log(event_type, event_timestamp)
+            """)
+
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_audit_log_actor_time
+                ON audit_log(actor, event_timestamp)
+            """)
+
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_audit_log_event_type
-                ON audit_log(event_type)
+                CREATE INDEX IF NOT EXISTS idx_audit_log_originator_time
+                ON audit_log(originator_id, event_timestamp)
             """)
 
             conn.commit()
             conn.close()
 
         await asyncio.to_thread(_create_tables)
-        self._db_connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
 
     async def _add_to_hash_chain(self, entry: AuditRequest) -> None:
-        """Add an entry to the hash chain."""
+        """Queue an entry for the group-commit hash chain writer."""
         if not self.enable_hash_chain:
             return
 
-        async with self._hash_chain_lock:
-            def _write_to_chain() -> None:
-                entry_dict = {
-                    "event_id": entry.entry_id,
-                    "event_timestamp": entry.timestamp.isoformat(),
-                    "event_type": entry.event_type,
-                    "originator_id": entry.entity_id,
-                    "event_payload": json.dumps(entry.details)
-                }
-
-                if not self.hash_chain or not self.signature_manager:
-                    raise RuntimeError("Hash chain not available")
-
-                prepared = self.hash_chain.prepare_entry(entry_dict)
-                signature = self.signature_manager.sign_entry(prepared["entry_hash"])
-
-                if not self._db_connection:
-                    raise RuntimeError("Database connection not available")
-
-                cursor = self._db_connection.cursor()
-                cursor.execute("""
-                    INSERT INTO audit_log
-                    (event_id, event_timestamp, event_type, originator_id,
-                     event_summary, event_payload, sequence_number, previous_hash,
-                     entry_hash, signature, signing_key_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    entry.entry_id,
-                    entry.timestamp.isoformat(),
-                    entry.event_type,
-                    entry.entity_id,
-                    f"{entry.event_type} by {entry.actor}",
-                    json.dumps(entry.details),
-                    prepared["sequence_number"],
-                    prepared["previous_hash"],
-                    prepared["entry_hash"],
-                    signature,
-                    self.signature_manager.key_id or "unknown"
-                ))
+        entry_dict = {
+            "event_id": entry.entry_id,
+            "event_timestamp": entry.timestamp.isoformat(),
+            "event_type": entry.event_type,
+            "originator_id": entry.entity_id,
+            "actor": entry.actor,
+            "event_summary": f"{entry.event_type} by {entry.actor}",
+            "event_payload": json.dumps(entry.details)
+        }
 
-                self._db_connection.commit()
+        try:
+            if not self._chain_writer:
+                raise RuntimeError("Hash chain not available")
+            await self._chain_writer.submit(entry_dict, wait=self.hash_chain_wait_for_commit)
+        except Exception as e:
+            logger.error(f"Failed to add to hash chain: {e}", exc_info=True)
 
-            try:
-                logger.debug(f"About to write to hash chain for entry {entry.entry_id}")
-                await asyncio.to_thread(_write_to_chain)
-                logger.debug(f"Successfully wrote to hash chain for entry {entry.entry_id}")
-            except Exception as e:
-                logger.error(f"Failed to add to hash chain: {e}", exc_info=True)
+    async def flush_hash_chain(self) -> None:
+        """Wait until every queued hash chain entry has been committed."""
+        if self._chain_writer:
+            await self._chain_writer.flush()
 
     def _cache_entry(self, entry: AuditRequest) -> None:
         """Add entry to cache."""
@@ -971,7 +1204,9 @@ class GraphAuditService(BaseGraphService, AuditServiceProtocol):
         while True:
             try:
                 await asyncio.sleep(60)  # Export every minute
-                if self._export_buffer:
+                if self._stream_exports:
+                    await self.export_incremental()
+                elif self._export_buffer:
                     await self._flush_exports()
             except asyncio.CancelledError:
                 logger.debug("Export worker cancelled")
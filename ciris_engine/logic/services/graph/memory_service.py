@@ -1,7 +1,7 @@
 from __future__ import annotations
 import logging
-from typing import Optional, Dict, List, Union, TYPE_CHECKING
-import json
+from collections import OrderedDict
+from typing import Optional, Dict, List, Tuple, Union, TYPE_CHECKING
 from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
@@ -17,7 +17,8 @@ if TYPE_CHECKING:
     from psutil import Process
 
 from ciris_engine.logic.config import get_sqlite_db_full_path
-from ciris_engine.logic.persistence import initialize_database, get_db_connection
+from ciris_engine.logic.persistence import initialize_database, get_db_connection, count_graph_nodes
+from ciris_engine.utils import serialization
 
 from ciris_engine.schemas.services.graph_core import (
     GraphScope,
@@ -49,19 +50,46 @@ from ciris_engine.constants import UTC_TIMEZONE_SUFFIX
 
 logger = logging.getLogger(__name__)
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder that handles datetime objects and Pydantic models."""
-
-    def default(self, obj: object) -> Union[str, dict, list, int, float, bool, None]:
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        # Handle Pydantic models
-        if hasattr(obj, 'model_dump'):
-            return obj.model_dump()  # type: ignore[no-any-return]
-        # Handle any object with to_dict method
-        if hasattr(obj, 'to_dict'):
-            return obj.to_dict()  # type: ignore[no-any-return]
-        return super().default(obj)  # type: ignore[no-any-return]
+# Top-level attribute keys whose values are typed data (timestamps, hashes,
+# ids and metric payloads) that never carry user-supplied secrets. Nested
+# dicts are scanned in full, whatever their keys.
+SECRET_SCAN_SKIP_KEYS = frozenset({
+    "created_at", "updated_at", "timestamp", "period_start", "period_end",
+    "consolidation_timestamp", "expires_at", "approval_timestamp",
+    "identity_created_at", "identity_modified_at",
+    "metrics", "metric_value", "action_counts", "errors_by_component",
+    "component_calls", "component_failures", "component_latency_ms",
+    "events_by_type", "events_by_actor", "events_by_service", "service_calls",
+    "tasks_by_status", "thoughts_by_type", "dma_decisions", "handler_actions",
+    "audit_hash", "identity_hash", "hash_chain", "signature",
+    "first_event_id", "last_event_id", "unique_task_ids", "secret_refs",
+})
+
+# Bound on remembered (node, version) scans that found no secrets
+_SECRET_SCAN_MEMO_SIZE = 2048
+
+
+def _string_leaf_fingerprint(obj: object) -> int:
+    """Cheap fingerprint of the scannable strings (keys and leaves) of an attribute tree.
+
+    str hashes are cached by CPython, so re-fingerprinting the same tree is
+    a walk without any regex or serialization work.
+    """
+    leaves: List[str] = []
+    stack: List[object] = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, str):
+            leaves.append(current)
+        elif isinstance(current, dict):
+            for key, value in current.items():
+                if current is obj and key in SECRET_SCAN_SKIP_KEYS:
+                    continue
+                stack.append(key)
+                stack.append(value)
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+    return hash(tuple(leaves))
 
 class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServiceProtocol):
     """Graph memory backed by the persistence database."""
@@ -73,6 +101,8 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
         self.db_path = db_path or get_sqlite_db_full_path()
         initialize_database(db_path=self.db_path)
         self.secrets_service = secrets_service  # Must be provided, not created here
+        # (node_id, scope, version, updated_at, filter version) -> fingerprint of a secret-free scan
+        self._secret_scan_memo: "OrderedDict[Tuple[str, str, int, str, int], int]" = OrderedDict()
         self._start_time: Optional[datetime] = None
         self._process: Optional["Process"] = None
         if PSUTIL_AVAILABLE and psutil is not None:
@@ -318,39 +348,62 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
                 (GraphScope.IDENTITY.value,)
             )
             for row in cursor.fetchall():
-                attrs = json.loads(row["attributes_json"]) if row["attributes_json"] else {}
+                attrs = serialization.loads(row["attributes_json"]) if row["attributes_json"] else {}
                 lines.append(f"{row['node_id']}: {attrs}")
         return "\n".join(lines)
 
     async def _process_secrets_for_memorize(self, node: GraphNode) -> GraphNode:
-        """Process secrets in node attributes during memorization."""
-        if not node.attributes:
+        """Process secrets in node attributes during memorization.
+
+        Walks the attribute tree and scans only strings, skipping the
+        top-level typed fields listed in SECRET_SCAN_SKIP_KEYS. Scans that
+        find no secrets are memoized per node version and filter
+        configuration, and untouched attributes are passed through as-is
+        rather than re-serialized.
+        """
+        if not node.attributes or not self.secrets_service:
             return node
 
-        # Convert attributes to JSON string for processing
         # Handle both dict and Pydantic model attributes
         if hasattr(node.attributes, 'model_dump'):
             attributes_dict = node.attributes.model_dump()
         else:
             attributes_dict = node.attributes
-        attributes_str = json.dumps(attributes_dict, cls=DateTimeEncoder)
+
+        memo_key = None
+        fingerprint = 0
+        if node.updated_at is not None:
+            memo_key = (
+                node.id, str(node.scope), node.version or 0, node.updated_at.isoformat(),
+                self.secrets_service.filter_version
+            )
+            fingerprint = _string_leaf_fingerprint(attributes_dict)
+            if self._secret_scan_memo.get(memo_key) == fingerprint:
+                self._secret_scan_memo.move_to_end(memo_key)
+                return node
 
         # Process for secrets detection and replacement
         # SecretsService requires source_message_id
-        if not self.secrets_service:
-            return node
-        processed_text, secret_refs = await self.secrets_service.process_incoming_text(
-            attributes_str,
-            source_message_id=f"memorize_{node.id}"
+        processed_attributes, secret_refs = await self.secrets_service.process_incoming_structure(
+            attributes_dict,
+            source_message_id=f"memorize_{node.id}",
+            skip_keys=SECRET_SCAN_SKIP_KEYS
         )
 
-        # Create new node with processed attributes
-        processed_attributes = json.loads(processed_text) if processed_text != attributes_str else node.attributes
+        if processed_attributes is attributes_dict:
+            if memo_key is not None:
+                self._secret_scan_memo[memo_key] = fingerprint
+                if len(self._secret_scan_memo) > _SECRET_SCAN_MEMO_SIZE:
+                    self._secret_scan_memo.popitem(last=False)
+            return node
 
         # Add secret references to node metadata if any were found
         if secret_refs:
             if isinstance(processed_attributes, dict):
-                processed_attributes.setdefault("secret_refs", []).extend([ref.uuid for ref in secret_refs])
+                # Copy rather than extend: the list may be shared with the caller's attributes
+                processed_attributes["secret_refs"] = list(processed_attributes.get("secret_refs", [])) + [
+                    ref.uuid for ref in secret_refs
+                ]
             logger.info(f"Stored {len(secret_refs)} secret references in memory node {node.id}")
 
         return GraphNode(
@@ -386,8 +439,6 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
             should_decrypt = action_type in getattr(self.secrets_service.filter.detection_config, "auto_decrypt_for_actions", ["speak", "tool"])
 
         if should_decrypt:
-            _attributes_str = json.dumps(attributes_dict, cls=DateTimeEncoder)
-
             if not self.secrets_service:
                 return attributes_dict
             decapsulated_attributes = await self.secrets_service.decapsulate_secrets_in_parameters(
@@ -497,7 +548,7 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
             for row in rows:
                     try:
                         # Parse attributes
-                        attrs = json.loads(row['attributes_json']) if row['attributes_json'] else {}
+                        attrs = serialization.loads(row['attributes_json']) if row['attributes_json'] else {}
                         
                         # Extract metric data
                         metric_name = attrs.get('metric_name')
@@ -632,6 +683,44 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
             logger.exception(f"Error getting edges for node {node_id}: {e}")
             return []
 
+    def get_nodes_edges(self, node_ids: List[str], scope: GraphScope) -> List[GraphEdge]:
+        """Get all edges connected to any of the given nodes in batched queries."""
+        try:
+            from ciris_engine.logic.persistence.models.graph import get_edges_for_nodes
+
+            return get_edges_for_nodes(node_ids, scope, db_path=self.db_path)
+        except Exception as e:
+            logger.exception(f"Error getting edges for {len(node_ids)} nodes: {e}")
+            return []
+
+    async def recall_nodes(self, node_ids: List[str], scope: GraphScope) -> Dict[str, GraphNode]:
+        """Recall several nodes by id in batched queries, without edges.
+
+        Attributes go through the same secrets handling as ``recall``.
+        Returns a dict mapping node_id to node; missing nodes are absent.
+        """
+        try:
+            from ciris_engine.logic.persistence.models.graph import get_graph_nodes_by_ids
+
+            stored = get_graph_nodes_by_ids(node_ids, scope, db_path=self.db_path)
+            recalled: Dict[str, GraphNode] = {}
+            for node_id, node in stored.items():
+                if node.attributes:
+                    node = GraphNode(
+                        id=node.id,
+                        type=node.type,
+                        scope=node.scope,
+                        attributes=await self._process_secrets_for_recall(node.attributes, "recall"),
+                        version=node.version,
+                        updated_by=node.updated_by,
+                        updated_at=node.updated_at
+                    )
+                recalled[node_id] = node
+            return recalled
+        except Exception as e:
+            logger.exception(f"Error recalling {len(node_ids)} nodes: {e}")
+            return {}
+
     async def memorize_log(self, log_message: str, log_level: str = "INFO", tags: Optional[Dict[str, str]] = None, scope: str = "local") -> MemoryOpResult:
         """
         Convenience method to memorize a log entry as both a graph node and TSDB correlation.
@@ -763,7 +852,7 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
                     
                     # Search in attributes
                     if node.attributes:
-                        attrs_str = json.dumps(node.attributes, cls=DateTimeEncoder).lower()
+                        attrs_str = serialization.dumps(node.attributes).lower()
                         if any(term in attrs_str for term in search_terms):
                             filtered_nodes.append(node)
                 
@@ -819,11 +908,7 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
         # Count graph nodes for metrics
         node_count = 0
         try:
-            with get_db_connection(db_path=self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM graph_nodes")
-                result = cursor.fetchone()
-                node_count = result[0] if result else 0
+            node_count = count_graph_nodes(db_path=self.db_path)
         except Exception:
             pass
         
@@ -844,10 +929,7 @@ class LocalGraphMemoryService(BaseGraphService, MemoryService, GraphMemoryServic
             
         try:
             # Try a simple database operation
-            with get_db_connection(db_path=self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT COUNT(*) FROM graph_nodes")
-                cursor.fetchone()
+            count_graph_nodes(db_path=self.db_path)
             return True
         except Exception:
             return False
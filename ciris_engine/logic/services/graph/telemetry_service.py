@@ -41,6 +41,9 @@ from ciris_engine.schemas.services.graph_core import GraphNode, NodeType, GraphS
 from ciris_engine.schemas.services.core import ServiceStatus, ServiceCapabilities
 from ciris_engine.logic.services.base_graph_service import BaseGraphService
 from ciris_engine.logic.buses.memory_bus import MemoryBus
+from ciris_engine.logic.telemetry.latency import latency_registry
+from ciris_engine.logic.utils.crypto_executor import get_crypto_executor
+from ciris_engine.schemas.telemetry.core import LatencySummary
 
 logger = logging.getLogger(__name__)
 
@@ -785,6 +788,18 @@ class GraphTelemetryService(BaseGraphService, TelemetryServiceProtocol):
             "cache_size_mb": cache_size_mb,
             "max_cached_metrics_per_type": float(self._max_cached_metrics)
         })
+
+        # Load on the shared crypto executor; per-operation latencies are in
+        # get_latency_percentiles("crypto") and ("crypto_queue")
+        crypto = get_crypto_executor().get_stats()
+        metrics.update({
+            "crypto_workers": float(crypto.max_workers),
+            "crypto_queue_depth": float(crypto.queue_depth),
+            "crypto_peak_queue_depth": float(crypto.peak_queue_depth),
+            "crypto_running": float(crypto.running),
+            "crypto_completed": float(crypto.completed),
+            "crypto_failed": float(crypto.failed),
+        })
         
         return metrics
 
@@ -803,8 +818,8 @@ class GraphTelemetryService(BaseGraphService, TelemetryServiceProtocol):
                 logger.debug("Memory bus not available, returning 0 metric count")
                 return 0
             
-            # Query the database directly to count TSDB_DATA nodes
-            from ciris_engine.logic.persistence import get_db_connection
+            # Read the TSDB_DATA count from the materialized graph node stats
+            from ciris_engine.logic.persistence import count_graph_nodes
             
             # Get the memory service to access its db_path
             memory_service = await self._memory_bus.get_service(handler_name="telemetry_service")
@@ -813,22 +828,29 @@ class GraphTelemetryService(BaseGraphService, TelemetryServiceProtocol):
                 return 0
             
             db_path = getattr(memory_service, 'db_path', None)
-            with get_db_connection(db_path=db_path) as conn:
-                cursor = conn.cursor()
-                # Count all TSDB_DATA nodes
-                cursor.execute(
-                    "SELECT COUNT(*) FROM graph_nodes WHERE node_type = 'tsdb_data'"
-                )
-                result = cursor.fetchone()
-                count = result[0] if result else 0
-                
-                logger.debug(f"Total metric count from graph nodes: {count}")
-                return count
+            count = count_graph_nodes(node_type='tsdb_data', db_path=db_path)
+            
+            logger.debug(f"Total metric count from graph nodes: {count}")
+            return count
                 
         except Exception as e:
             logger.error(f"Failed to get metric count: {e}")
             return 0
 
+    def get_latency_percentiles(self, category: Optional[str] = None) -> Dict[str, Dict[str, LatencySummary]]:
+        """Get latency percentiles per service, bus operation and handler.
+
+        Histograms from every instance recording under the same name are
+        merged, so e.g. two LLM providers of the same class report together.
+
+        Args:
+            category: Only this category ("service", "handler", "llm", "memory_bus", ...)
+
+        Returns:
+            Summaries keyed by category, then name
+        """
+        return latency_registry.summaries(category)
+
     async def get_telemetry_summary(self) -> TelemetrySummary:
         """Get aggregated telemetry summary for system snapshot.
 
@@ -1099,6 +1121,7 @@ class GraphTelemetryService(BaseGraphService, TelemetryServiceProtocol):
             "get_metric_summary",
             "get_metric_count",
             "get_telemetry_summary",
+            "get_latency_percentiles",
             "process_system_snapshot",
             "get_resource_usage",
             "get_telemetry_status"
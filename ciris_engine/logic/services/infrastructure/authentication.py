@@ -10,8 +10,9 @@ import asyncio
 import functools
 import inspect
 import logging
-from typing import Optional, List, Dict, Tuple, Callable, TypeVar, Union, TYPE_CHECKING, Any
-from datetime import datetime, timezone
+from collections import OrderedDict
+from typing import Optional, List, Dict, Tuple, Callable, TypeVar, Union, TYPE_CHECKING, Any, NamedTuple
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import aiofiles
 
@@ -36,6 +37,7 @@ from ciris_engine.logic.services.base_infrastructure_service import BaseInfrastr
 from ciris_engine.schemas.services.core import ServiceCapabilities, ServiceStatus
 from ciris_engine.schemas.runtime.enums import ServiceType
 from ciris_engine.logic.services.lifecycle.time import TimeService
+from ciris_engine.logic.utils.crypto_executor import run_crypto
 
 if TYPE_CHECKING:
     from ciris_engine.schemas.runtime.models import Task
@@ -45,6 +47,20 @@ logger = logging.getLogger(__name__)
 # Type variable for decorators
 F = TypeVar('F', bound=Callable)
 
+# Bounds for the in-memory verification caches
+TOKEN_CACHE_SIZE = 1024
+WA_CACHE_SIZE = 256
+# Cached entries are revalidated against the database after this long, so
+# revocations and key rotations made by other processes are picked up
+CACHE_TTL = timedelta(seconds=30)
+
+class _VerifiedToken(NamedTuple):
+    """A token that passed full verification, cached by its hash."""
+    context: AuthorizationContext
+    expiration: Optional[datetime]
+    wa_id: str
+    cached_at: datetime
+
 class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProtocol):
     """Infrastructure service for WA authentication and identity management."""
 
@@ -67,8 +83,13 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
         # Initialize gateway secret
         self.gateway_secret = self._get_or_create_gateway_secret()
 
-        # Cache for tokens and WAs
-        self._token_cache: Dict[str, AuthorizationContext] = {}
+        # Cache for tokens and WAs. Verified tokens are keyed by their SHA-256 so
+        # raw bearer tokens are not kept in memory; both LRU caches are
+        # invalidated per WA by update_wa/revoke_wa, and entries older than
+        # CACHE_TTL are re-read to see changes made by other processes.
+        self._token_cache: "OrderedDict[str, _VerifiedToken]" = OrderedDict()
+        self._wa_cache: "OrderedDict[str, Tuple[WACertificate, datetime]]" = OrderedDict()
+        self._wa_kid_index: Dict[str, str] = {}
         self._channel_token_cache: Dict[str, str] = {}
 
         # Initialize database
@@ -290,8 +311,44 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
 
     # WAStore Protocol Implementation
 
+    def _cached_wa(self, wa_id: Optional[str]) -> Optional[WACertificate]:
+        """Return a copy of a cached active WA certificate, if present and fresh."""
+        entry = self._wa_cache.get(wa_id) if wa_id else None
+        if entry is None:
+            return None
+        wa, cached_at = entry
+        if self._now() - cached_at >= CACHE_TTL:
+            self._invalidate_wa(wa.wa_id, include_tokens=False)
+            return None
+        self._wa_cache.move_to_end(wa.wa_id)
+        return wa.model_copy()
+
+    def _cache_wa(self, wa: WACertificate) -> None:
+        """Remember an active WA certificate, evicting the least recently used."""
+        self._wa_cache[wa.wa_id] = (wa.model_copy(), self._now())
+        self._wa_cache.move_to_end(wa.wa_id)
+        self._wa_kid_index[wa.jwt_kid] = wa.wa_id
+        while len(self._wa_cache) > WA_CACHE_SIZE:
+            evicted_id, (evicted, _) = self._wa_cache.popitem(last=False)
+            if self._wa_kid_index.get(evicted.jwt_kid) == evicted_id:
+                del self._wa_kid_index[evicted.jwt_kid]
+
+    def _invalidate_wa(self, wa_id: str, include_tokens: bool = True) -> None:
+        """Drop a WA's cached certificate and, optionally, tokens it verified."""
+        cached = self._wa_cache.pop(wa_id, None)
+        if cached is not None and self._wa_kid_index.get(cached[0].jwt_kid) == wa_id:
+            del self._wa_kid_index[cached[0].jwt_kid]
+        if include_tokens:
+            stale = [key for key, entry in self._token_cache.items() if entry.wa_id == wa_id]
+            for key in stale:
+                del self._token_cache[key]
+
     async def get_wa(self, wa_id: str) -> Optional[WACertificate]:
         """Get WA certificate by ID."""
+        cached = self._cached_wa(wa_id)
+        if cached is not None:
+            return cached
+
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
@@ -324,11 +381,17 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
                     'created_at': row_dict['created'],
                     'last_auth': row_dict.get('last_login')
                 }
-                return WACertificate(**wa_dict)
+                wa = WACertificate(**wa_dict)
+                self._cache_wa(wa)
+                return wa
             return None
 
     async def _get_wa_by_kid(self, jwt_kid: str) -> Optional[WACertificate]:
         """Get WA certificate by JWT key ID."""
+        cached = self._cached_wa(self._wa_kid_index.get(jwt_kid))
+        if cached is not None:
+            return cached
+
         with sqlite3.connect(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
@@ -361,7 +424,9 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
                     'created_at': row_dict['created'],
                     'last_auth': row_dict.get('last_login')
                 }
-                return WACertificate(**wa_dict)
+                wa = WACertificate(**wa_dict)
+                self._cache_wa(wa)
+                return wa
             return None
 
     async def get_wa_by_oauth(self, provider: str, external_id: str) -> Optional[WACertificate]:
@@ -440,6 +505,7 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
 
     async def _store_wa_certificate(self, wa: WACertificate) -> None:
         """Store a WA certificate in the database."""
+        self._invalidate_wa(wa.wa_id)
         with sqlite3.connect(self.db_path) as conn:
             # Convert WA to dict for insertion
             wa_dict = wa.model_dump()
@@ -539,6 +605,10 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             )
             conn.commit()
 
+        # A login timestamp does not change what a token proves; anything else
+        # (role, scopes, keys, active) must be re-verified
+        self._invalidate_wa(wa_id, include_tokens=set(kwargs) != {'last_login'})
+
         # Return updated WA
         return await self.get_wa(wa_id)
 
@@ -683,8 +753,40 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             headers={'kid': wa.jwt_kid}
         )
 
+    @staticmethod
+    def _token_cache_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _get_verified_token(self, cache_key: str) -> Optional[_VerifiedToken]:
+        """Return a cached verification, dropping it once the token's exp or CACHE_TTL has passed."""
+        entry = self._token_cache.get(cache_key)
+        if entry is None:
+            return None
+        now = self._now()
+        if (entry.expiration is not None and entry.expiration <= now) or now - entry.cached_at >= CACHE_TTL:
+            del self._token_cache[cache_key]
+            return None
+        self._token_cache.move_to_end(cache_key)
+        return entry
+
+    def _cache_verified_token(self, cache_key: str, entry: _VerifiedToken) -> None:
+        self._token_cache[cache_key] = entry
+        self._token_cache.move_to_end(cache_key)
+        while len(self._token_cache) > TOKEN_CACHE_SIZE:
+            self._token_cache.popitem(last=False)
+
     async def _verify_jwt_and_get_context(self, token: str) -> Optional[Tuple[AuthorizationContext, Optional[datetime]]]:
-        """Verify any JWT token and return auth context and expiration (internal method)."""
+        """Verify any JWT token and return auth context and expiration (internal method).
+
+        Successful verifications are cached by token hash for up to
+        ``CACHE_TTL`` and never past the token's ``exp``, so repeat requests
+        skip the certificate lookup and signature checks.
+        """
+        cache_key = self._token_cache_key(token)
+        cached = self._get_verified_token(cache_key)
+        if cached is not None:
+            return (cached.context, cached.expiration)
+
         try:
             # Decode header to get kid
             header = jwt.get_unverified_header(token)
@@ -698,53 +800,38 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             if not wa:
                 return None
 
-            # Try to verify with different keys/algorithms based on the issuer (kid)
+            # Try to verify with different keys/algorithms based on the issuer (kid),
+            # remembering which key actually verified the token
             decoded = None
-            
+            verified_with_gateway = False
+            verified_with_wa_key = False
+
             # First try gateway-signed tokens (most common)
             try:
                 decoded = jwt.decode(token, self.gateway_secret, algorithms=['HS256'])
+                verified_with_gateway = True
             except jwt.InvalidTokenError:
                 pass
-            
+
             # If gateway verification failed, try WA-signed tokens
             if not decoded:
                 try:
                     public_key_bytes = self._decode_public_key(wa.pubkey)
                     public_key = ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
                     decoded = jwt.decode(token, public_key, algorithms=['EdDSA'])
+                    verified_with_wa_key = True
                 except jwt.InvalidTokenError:
                     pass
-            
+
             # If no verification succeeded, token is invalid
             if not decoded:
                 return None
-            
+
             # Validate sub_type and algorithm after verification
             # IMPORTANT: We must validate that the token was verified with the expected algorithm
             # to prevent algorithm confusion attacks
             sub_type = decoded.get('sub_type')
-            
-            # Determine which verification succeeded based on the algorithm
-            verified_with_gateway = False
-            verified_with_wa_key = False
-            
-            # Re-verify to determine which key actually verified the token
-            try:
-                jwt.decode(token, self.gateway_secret, algorithms=['HS256'])
-                verified_with_gateway = True
-            except jwt.InvalidTokenError:
-                pass
-                
-            if not verified_with_gateway:
-                try:
-                    public_key_bytes = self._decode_public_key(wa.pubkey)
-                    public_key = ed25519.Ed25519PublicKey.from_public_bytes(public_key_bytes)
-                    jwt.decode(token, public_key, algorithms=['EdDSA'])
-                    verified_with_wa_key = True
-                except jwt.InvalidTokenError:
-                    pass
-            
+
             # Validate that the token type matches the verification method
             if sub_type == JWTSubType.AUTHORITY.value:
                 # Authority tokens must be verified with WA key (EdDSA)
@@ -784,6 +871,7 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             if exp_timestamp:
                 expiration = datetime.fromtimestamp(exp_timestamp, tz=timezone.utc)
 
+            self._cache_verified_token(cache_key, _VerifiedToken(context, expiration, wa.wa_id, self._now()))
             return (context, expiration)
 
         except jwt.InvalidTokenError:
@@ -829,6 +917,10 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
         except (InvalidSignature, Exception):
             return False
 
+    async def _verify_signature_async(self, data: bytes, signature: str, public_key: str) -> bool:
+        """Verify an Ed25519 signature on the shared crypto executor."""
+        return await run_crypto("ed25519_verify", self._verify_signature, data, signature, public_key)
+
     def hash_password(self, password: str) -> str:
         """Hash password using PBKDF2."""
         salt = secrets.token_bytes(32)
@@ -1032,17 +1124,10 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
         if not token:
             return None
 
-        # Check cache first
-        if token in self._token_cache:
-            return self._token_cache[token]
-
-        # Verify token
+        # Verification results are cached by _verify_jwt_and_get_context
         result = await self._verify_jwt_and_get_context(token)
-        
         if result:
             context, _ = result  # We don't need expiration here
-            # Cache valid tokens
-            self._token_cache[token] = context
             return context
 
         return None
@@ -1336,7 +1421,7 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
         canonical_json = json.dumps(task_data, sort_keys=True, separators=(',', ':'))
 
         # Verify the signature
-        return self._verify_signature(
+        return await self._verify_signature_async(
             canonical_json.encode('utf-8'),
             task.signature,
             wa.pubkey
@@ -1514,6 +1599,7 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
             "authority_certificates": float(role_counts["AUTHORITY"]),
             "root_certificates": float(role_counts["ROOT"]),
             "auth_contexts_cached": float(auth_context_cached),
+            "wa_certificates_cached": float(len(self._wa_cache)),
             "channel_tokens_cached": float(channel_tokens_cached),
             "total_tokens_cached": float(auth_context_cached + channel_tokens_cached)
         }
@@ -1546,6 +1632,8 @@ class AuthenticationService(BaseInfrastructureService, AuthenticationServiceProt
         self._started = False
         # Clear caches
         self._token_cache.clear()
+        self._wa_cache.clear()
+        self._wa_kid_index.clear()
         self._channel_token_cache.clear()
         logger.info("AuthenticationService stopped")
 
@@ -3,15 +3,19 @@ Request Metrics Mixin - Provides request tracking capabilities for services.
 
 This mixin adds request tracking and metrics collection to any service class.
 Tracks request counts, error rates, and response times with full type safety.
+Response times go into a mergeable latency histogram that is attached to the
+telemetry latency registry under ``("service", <class name>)``.
 """
-from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Deque, Optional, Tuple
+from typing import Any, Optional
 import time
 import logging
 
 from pydantic import BaseModel, Field, ConfigDict
 
+from ciris_engine.logic.telemetry.latency import LatencyHistogram, latency_registry
+from ciris_engine.schemas.telemetry.core import LatencySummary
+
 logger = logging.getLogger(__name__)
 
 
@@ -49,7 +53,8 @@ class RequestMetricsMixin:
         self._requests_handled: int = 0
         self._error_count: int = 0
         self._active_requests: dict[str, float] = {}  # request_id -> start_time
-        self._response_times: Deque[float] = deque(maxlen=100)  # Last 100 response times
+        self._response_times = LatencyHistogram()  # All response times since the last reset
+        latency_registry.attach("service", type(self).__name__, self._response_times)
         self._last_request_time: Optional[datetime] = None
     
     def track_request_start(self) -> str:
@@ -86,7 +91,7 @@ class RequestMetricsMixin:
             self._error_count += 1
         
         # Track response time
-        self._response_times.append(response_time_ms)
+        self._response_times.record(response_time_ms)
         
         logger.debug(
             f"Completed request {request_id} - "
@@ -100,9 +105,7 @@ class RequestMetricsMixin:
             RequestMetrics: Current metrics snapshot
         """
         # Calculate average response time
-        avg_response_time = 0.0
-        if self._response_times:
-            avg_response_time = sum(self._response_times) / len(self._response_times)
+        avg_response_time = self._response_times.mean_ms
         
         # Calculate success rate
         success_rate = 100.0
@@ -122,7 +125,7 @@ class RequestMetricsMixin:
         self._requests_handled = 0
         self._error_count = 0
         self._active_requests.clear()
-        self._response_times.clear()
+        self._response_times.reset()
         self._last_request_time = None
         
         logger.info("Request metrics reset")
@@ -147,12 +150,15 @@ class RequestMetricsMixin:
         if not self._response_times:
             return 0.0
         
-        if not 0 <= percentile <= 100:
-            raise ValueError("Percentile must be between 0 and 100")
+        return self._response_times.percentile(percentile)
+    
+    def get_response_time_summary(self) -> LatencySummary:
+        """Get p50/p95/p99 response times.
         
-        sorted_times = sorted(self._response_times)
-        index = int((percentile / 100) * (len(sorted_times) - 1))
-        return sorted_times[index]
+        Returns:
+            LatencySummary: Response time percentiles in milliseconds
+        """
+        return self._response_times.summary()
     
     def get_recent_error_rate(self, window_size: int = 10) -> float:
         """Get error rate for recent requests.
@@ -3,6 +3,7 @@
 import json
 import re
 import logging
+import time
 import psutil
 from typing import List, Optional, Tuple, Type, cast, Dict, Callable, Awaitable, Protocol
 
@@ -22,6 +23,7 @@ from ciris_engine.schemas.services.core import ServiceCapabilities, ServiceStatu
 from ciris_engine.schemas.services.capabilities import LLMCapabilities
 from ciris_engine.logic.registries.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerError
 from ciris_engine.logic.services.base_service import BaseService
+from ciris_engine.logic.telemetry.latency import LatencyHistogram
 
 # Configuration class for OpenAI-compatible LLM services
 class OpenAIConfig(BaseModel):
@@ -98,6 +100,8 @@ class OpenAICompatibleClient(BaseService, LLMServiceProtocol):
         # Note: We can't check for instructor.exceptions.InstructorRetryException at import time
         # because it might not exist. We'll check it at runtime instead.
         self.non_retryable_exceptions = (APIStatusError,)
+        # Latency of successful API calls
+        self._response_times = LatencyHistogram()
 
         api_key = self.openai_config.api_key
         base_url = self.openai_config.base_url
@@ -228,7 +232,7 @@ class OpenAICompatibleClient(BaseService, LLMServiceProtocol):
             "response_cache_hit_rate": 0.0,  # TODO: Track cache hits
             
             # Performance metrics
-            "avg_response_time_ms": 0.0,  # TODO: Track response times
+            "avg_response_time_ms": self._response_times.mean_ms,
             
             # Model pricing info
             "model_cost_per_1k_tokens": 0.15 if "gpt-4o-mini" in self.model_name else 2.5,  # Cents
@@ -301,6 +305,7 @@ class OpenAICompatibleClient(BaseService, LLMServiceProtocol):
         ) -> Tuple[BaseModel, ResourceUsage]:
 
             try:
+                started = time.perf_counter()
                 # Use instructor but capture the completion for usage data
                 response, completion = await self.instruct_client.chat.completions.create_with_completion(
                     model=self.model_name,
@@ -311,6 +316,8 @@ class OpenAICompatibleClient(BaseService, LLMServiceProtocol):
                     temperature=temp,
                 )
 
+                self._response_times.record((time.perf_counter() - started) * 1000)
+
                 # Extract usage data from completion
                 usage = completion.usage
 
@@ -426,10 +433,8 @@ class OpenAICompatibleClient(BaseService, LLMServiceProtocol):
         # Get circuit breaker stats
         cb_stats = self.circuit_breaker.get_stats()
 
-        # Calculate average response time if we have metrics
-        avg_response_time = None
-        if hasattr(self, '_response_times') and self._response_times:
-            avg_response_time = sum(self._response_times) / len(self._response_times)
+        # Average response time, once there is a successful call
+        avg_response_time = self._response_times.mean_ms if self._response_times.count else None
 
         return LLMStatus(
             available=self.circuit_breaker.is_available(),
@@ -5,7 +5,7 @@ Defines which code paths are HOT (mission-critical, high-frequency) vs COLD (bac
 and enforces telemetry requirements based on the ciris_mypy_toolkit analysis.
 """
 
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass, field
 
 @dataclass
@@ -128,3 +128,43 @@ def get_telemetry_requirements(module: str, operation: str) -> dict[str, Any]:
         "sampling_rate": path_config.sampling_rate,
         "alert_threshold_ms": path_config.alert_threshold_ms,
     }
+
+# Logger name prefixes mapped to the paths above. Log records below WARNING
+# from these loggers are sampled at the path's sampling_rate; warnings and
+# errors are always kept.
+LOGGER_PATHS: Dict[str, str] = {
+    "ciris_engine.logic.audit": "audit_log",
+    "ciris_engine.logic.services.graph.audit_service": "audit_log",
+    "ciris_engine.logic.services.infrastructure.authentication": "auth_verification",
+    "ciris_engine.logic.processors": "thought_processing",
+    "ciris_engine.logic.dma": "dma_execution",
+    "ciris_engine.logic.handlers": "handler_invocation",
+    "ciris_engine.logic.infrastructure.handlers": "handler_invocation",
+    "ciris_engine.logic.conscience": "conscience_check",
+    "ciris_engine.logic.context": "context_building",
+    "ciris_engine.logic.registries": "service_lookup",
+    "ciris_engine.logic.adapters": "message_processing",
+    "ciris_engine.logic.buses.memory_bus": "memory_operation",
+    "ciris_engine.logic.services.graph.memory_service": "memory_operation",
+    "ciris_engine.logic.persistence": "persistence_fetch",
+    "ciris_engine.logic.services.graph.telemetry_service": "telemetry_aggregation",
+    "ciris_engine.logic.services.graph.tsdb_consolidation": "telemetry_aggregation",
+    "ciris_engine.logic.telemetry": "telemetry_aggregation",
+}
+
+def get_logger_path_config(logger_name: str) -> Optional[PathConfig]:
+    """Get the path configuration for a logger, matching the longest prefix."""
+    best = ""
+    for prefix in LOGGER_PATHS:
+        if (logger_name == prefix or logger_name.startswith(prefix + ".")) and len(prefix) > len(best):
+            best = prefix
+    if not best:
+        return None
+    return HOT_COLD_PATH_CONFIG.get(LOGGER_PATHS[best])
+
+def get_log_sampling_rate(logger_name: str) -> float:
+    """Fraction of sub-WARNING records to keep for a logger (1.0 = all)."""
+    path_config = get_logger_path_config(logger_name)
+    if path_config is None:
+        return 1.0
+    return path_config.sampling_rate
@@ -0,0 +1,214 @@
+"""
+Mergeable latency histograms.
+
+Latency used to be kept as the last 100 samples per service and sorted on
+every percentile query, which hid anything older than a burst and could not
+be combined across services or time windows. ``LatencyHistogram`` instead
+counts samples in logarithmic buckets (DDSketch style): memory is bounded by
+the dynamic range rather than the sample count, every quantile is within
+``relative_accuracy`` of the true value, and two histograms with the same
+accuracy merge by adding bucket counts.
+
+``latency_registry`` collects histograms by ``(category, name)`` -- e.g.
+``("service", "LocalGraphMemoryService")`` for calls the buses dispatch to a
+provider, or ``("handler", "speak")`` -- so the telemetry service can report
+p50/p95/p99 for all of them at once.
+"""
+import functools
+import math
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from ciris_engine.schemas.telemetry.core import LatencySummary
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+# Samples at or below this go to the zero bucket
+MIN_TRACKED_MS = 0.001
+
+T = TypeVar("T")
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded relative error."""
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def record(self, value_ms: float) -> None:
+        """Add one sample, in milliseconds."""
+        if value_ms <= MIN_TRACKED_MS:
+            self._zero_count += 1
+            value_ms = max(value_ms, 0.0)
+        else:
+            index = math.ceil(math.log(value_ms) / self._log_gamma)
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.min_ms = min(self.min_ms, value_ms)
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add ``other``'s samples to this histogram and return it."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different relative accuracy")
+        for index, bucket_count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + bucket_count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.min_ms = min(self.min_ms, other.min_ms)
+        self.max_ms = max(self.max_ms, other.max_ms)
+        return self
+
+    def copy(self) -> "LatencyHistogram":
+        return LatencyHistogram(self.relative_accuracy).merge(self)
+
+    def reset(self) -> None:
+        self._buckets.clear()
+        self._zero_count = 0
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = math.inf
+        self.max_ms = 0.0
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Latency at ``percentile`` (0-100), 0.0 when empty."""
+        if not 0 <= percentile <= 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        return self._quantiles([percentile / 100])[0]
+
+    def summary(self) -> LatencySummary:
+        p50, p95, p99 = self._quantiles([0.5, 0.95, 0.99])
+        return LatencySummary(
+            count=self.count,
+            mean_ms=self.mean_ms,
+            p50_ms=p50,
+            p95_ms=p95,
+            p99_ms=p99,
+            max_ms=self.max_ms,
+        )
+
+    def _quantiles(self, quantiles: List[float]) -> List[float]:
+        """Values at ascending ``quantiles`` in a single pass over the buckets."""
+        if self.count == 0:
+            return [0.0] * len(quantiles)
+
+        # (cumulative count, representative value) per non-empty bucket
+        points: List[Tuple[int, float]] = []
+        seen = self._zero_count
+        if seen:
+            points.append((seen, max(self.min_ms, 0.0)))
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            value = 2 * self._gamma ** index / (self._gamma + 1)
+            # The extremes are known exactly; keep estimates inside them
+            points.append((seen, min(max(value, self.min_ms), self.max_ms)))
+
+        results: List[float] = []
+        i = 0
+        for q in quantiles:
+            rank = q * (self.count - 1)
+            while i < len(points) - 1 and points[i][0] <= rank:
+                i += 1
+            results.append(points[i][1])
+        return results
+
+class LatencyRegistry:
+    """Histograms by ``(category, name)``, merged on read.
+
+    ``histogram`` hands out a histogram owned by the registry. Objects that
+    keep their own histogram (one per service instance, say) ``attach`` it
+    instead; attached histograms are held weakly and merged with everything
+    else under the same key when summaries are read.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY) -> None:
+        self.relative_accuracy = relative_accuracy
+        self._owned: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._attached: Dict[Tuple[str, str], "weakref.WeakSet[LatencyHistogram]"] = {}
+
+    def histogram(self, category: str, name: str) -> LatencyHistogram:
+        key = (category, name)
+        hist = self._owned.get(key)
+        if hist is None:
+            hist = self._owned[key] = LatencyHistogram(self.relative_accuracy)
+        return hist
+
+    def record(self, category: str, name: str, value_ms: float) -> None:
+        self.histogram(category, name).record(value_ms)
+
+    def attach(self, category: str, name: str, histogram: LatencyHistogram) -> None:
+        self._attached.setdefault((category, name), weakref.WeakSet()).add(histogram)
+
+    def merged(self, category: Optional[str] = None) -> Dict[str, Dict[str, LatencyHistogram]]:
+        """Merged histograms as ``{category: {name: histogram}}``."""
+        result: Dict[str, Dict[str, LatencyHistogram]] = {}
+        for (cat, name) in set(self._owned) | set(self._attached):
+            if category is not None and cat != category:
+                continue
+            sources: Iterable[LatencyHistogram] = list(self._attached.get((cat, name), ()))
+            if (cat, name) in self._owned:
+                sources = [self._owned[(cat, name)], *sources]
+            combined = LatencyHistogram(self.relative_accuracy)
+            for hist in sources:
+                combined.merge(hist)
+            if combined.count:
+                result.setdefault(cat, {})[name] = combined
+        return result
+
+    def summaries(self, category: Optional[str] = None) -> Dict[str, Dict[str, LatencySummary]]:
+        """Percentile summaries as ``{category: {name: LatencySummary}}``."""
+        return {
+            cat: {name: hist.summary() for name, hist in sorted(by_name.items())}
+            for cat, by_name in sorted(self.merged(category).items())
+        }
+
+    def reset(self) -> None:
+        """Clear owned histograms and forget attached ones."""
+        self._owned.clear()
+        self._attached.clear()
+
+latency_registry = LatencyRegistry()
+
+def timed(category: str, name: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Record the latency of every call to the decorated coroutine function."""
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            start = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                latency_registry.record(category, name, (time.perf_counter() - start) * 1000)
+
+        return wrapper
+
+    return decorator
+
+async def record_call(category: str, name: str, call: Awaitable[T]) -> T:
+    """Await ``call`` and record how long it took."""
+    start = time.perf_counter()
+    try:
+        return await call
+    finally:
+        latency_registry.record(category, name, (time.perf_counter() - start) * 1000)
+
+__all__ = ["LatencyHistogram", "LatencyRegistry", "latency_registry", "record_call", "timed"]
@@ -0,0 +1,139 @@
+"""
+Shared executor for CPU-bound cryptography.
+
+bcrypt password hashing, PBKDF2 key derivation, RSA signing and Ed25519
+verification each take from tens of microseconds to hundreds of
+milliseconds of pure CPU. Run inline on the event loop, a burst of logins
+or secret-bearing messages stalls every conversation for that long.
+
+``run_crypto`` hands such a call to one bounded thread pool shared by the
+whole process and awaits the result. Threads rather than processes: bcrypt
+and OpenSSL (via ``cryptography``) release the GIL while they compute, so
+threads run in parallel without pickling keys across a process boundary.
+The pool size comes from ``security.crypto_workers``; unset, it is
+``min(4, cpu_count)`` so crypto bursts cannot starve the default executor
+used by ``asyncio.to_thread`` for database work.
+
+Per operation, the time spent waiting for a worker and the time spent
+computing are recorded in ``latency_registry`` under the ``crypto_queue``
+and ``crypto`` categories; ``get_stats`` reports queue depth and counts.
+"""
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+from ciris_engine.logic.telemetry.latency import latency_registry
+from ciris_engine.schemas.telemetry.core import CryptoExecutorStats
+
+T = TypeVar("T")
+
+def default_crypto_workers() -> int:
+    return max(1, min(4, os.cpu_count() or 1))
+
+class CryptoExecutor:
+    """Bounded thread pool for CPU-bound crypto, with queue and latency metrics."""
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers or default_crypto_workers()
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ciris-crypto")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._peak_queued = 0
+
+    async def run(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        """Run ``func(*args)`` on the pool and return its result.
+
+        Args:
+            operation: Metric name, e.g. "bcrypt_verify"
+            func: The blocking crypto call
+        """
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+        def job() -> T:
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+            latency_registry.record("crypto_queue", operation, (started - submitted) * 1000)
+            ok = False
+            try:
+                result = func(*args)
+                ok = True
+                return result
+            finally:
+                latency_registry.record("crypto", operation, (time.perf_counter() - started) * 1000)
+                with self._lock:
+                    self._running -= 1
+                    if ok:
+                        self._completed += 1
+                    else:
+                        self._failed += 1
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._pool, job)
+        except RuntimeError:
+            # Pool already shut down; nothing was queued
+            with self._lock:
+                self._queued -= 1
+            raise
+
+    def get_stats(self) -> CryptoExecutorStats:
+        with self._lock:
+            return CryptoExecutorStats(
+                max_workers=self.max_workers,
+                queue_depth=self._queued,
+                running=self._running,
+                completed=self._completed,
+                failed=self._failed,
+                peak_queue_depth=self._peak_queued,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
+
+_executor: Optional[CryptoExecutor] = None
+_executor_lock = threading.Lock()
+
+def configure_crypto_executor(max_workers: Optional[int] = None) -> CryptoExecutor:
+    """Replace the shared executor with one of ``max_workers`` threads.
+
+    Work already submitted to the previous pool finishes on it.
+    """
+    global _executor
+    with _executor_lock:
+        previous, _executor = _executor, CryptoExecutor(max_workers)
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return _executor
+
+def get_crypto_executor() -> CryptoExecutor:
+    """The shared executor, created with the default size on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = CryptoExecutor()
+        return _executor
+
+async def run_crypto(operation: str, func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking crypto call on the shared executor."""
+    return await get_crypto_executor().run(operation, func, *args)
+
+__all__ = [
+    "CryptoExecutor",
+    "configure_crypto_executor",
+    "default_crypto_workers",
+    "get_crypto_executor",
+    "run_crypto",
+]
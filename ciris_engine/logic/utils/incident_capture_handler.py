@@ -3,21 +3,40 @@ Incident Capture Handler for capturing WARNING and ERROR level log messages as i
 """
 import logging
 import asyncio
+import threading
+import time
 import traceback
 import uuid
+from collections import deque
 from pathlib import Path
-from typing import Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Tuple
+from ciris_engine.logic.utils.log_pipeline import get_log_pipeline
 from ciris_engine.protocols.services import TimeServiceProtocol
 from ciris_engine.schemas.services.graph.incident import IncidentNode, IncidentSeverity, IncidentStatus
 from ciris_engine.schemas.services.graph_core import NodeType, GraphScope
 
+# Identical incidents (same logger, level and message) repeated within this
+# many seconds are counted instead of written again
+DEFAULT_RATE_LIMIT_SECONDS = 60.0
+# Incidents memorized per graph batch, and how many wait for the graph at most
+DEFAULT_GRAPH_BATCH_SIZE = 50
+MAX_PENDING_INCIDENTS = 1000
+
 class IncidentCaptureHandler(logging.Handler):
     """
     A logging handler that captures WARNING and ERROR level messages as incidents.
     These incidents are stored in the graph for analysis, pattern detection, and self-improvement.
+
+    The incident file stays open for the handler's lifetime. When ``batched``
+    is set (the queued log pipeline does this) writes are only flushed once
+    per batch. Repeats of an identical incident within ``rate_limit_seconds``
+    are suppressed and summarized on the next occurrence. Incidents are
+    forwarded to the graph in batches of ``graph_batch_size`` on the event
+    loop that injected the graph audit service.
     """
 
-    def __init__(self, log_dir: str = "logs", filename_prefix: str = "incidents", time_service: Optional[TimeServiceProtocol] = None, graph_audit_service: Any = None) -> None:
+    def __init__(self, log_dir: str = "logs", filename_prefix: str = "incidents", time_service: Optional[TimeServiceProtocol] = None, graph_audit_service: Any = None,
+                 rate_limit_seconds: float = DEFAULT_RATE_LIMIT_SECONDS, graph_batch_size: int = DEFAULT_GRAPH_BATCH_SIZE) -> None:
         super().__init__()
         if not time_service:
             raise RuntimeError("CRITICAL: TimeService is required for IncidentCaptureHandler")
@@ -26,6 +45,18 @@ class IncidentCaptureHandler(logging.Handler):
         self._time_service = time_service
 
         self._graph_audit_service = graph_audit_service
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending_incidents: Deque[logging.LogRecord] = deque(maxlen=MAX_PENDING_INCIDENTS)
+        self._forward_lock = threading.Lock()
+        self._forward_scheduled = False
+        self.graph_batch_size = graph_batch_size
+        self.incidents_forwarded = 0
+
+        self.batched = False
+        self.rate_limit_seconds = rate_limit_seconds
+        # (logger, level, message) -> (first seen in window, repeats suppressed)
+        self._recent: Dict[Tuple[str, int, str], Tuple[float, int]] = {}
+        self.suppressed_count = 0
 
         # Create incident log file with timestamp
         timestamp = self._time_service.now().strftime("%Y%m%d_%H%M%S")
@@ -53,10 +84,11 @@ class IncidentCaptureHandler(logging.Handler):
         )
         self.setFormatter(formatter)
 
-        # Write header to the file
-        with open(self.log_file, 'w') as f:
-            f.write(f"=== Incident Log Started at {self._time_service.now_iso()} ===\n")
-            f.write("=== This file contains WARNING and ERROR messages captured as incidents ===\n\n")
+        # Write header to the file, which then stays open for appending
+        self._stream = open(self.log_file, 'w', encoding='utf-8')
+        self._stream.write(f"=== Incident Log Started at {self._time_service.now_iso()} ===\n")
+        self._stream.write("=== This file contains WARNING and ERROR messages captured as incidents ===\n\n")
+        self._stream.flush()
 
     def _create_symlink(self) -> None:
         """Create or update the symlink to the latest incident log."""
@@ -79,28 +111,106 @@ class IncidentCaptureHandler(logging.Handler):
             if record.levelno < logging.WARNING:
                 return
 
+            suppressed = self._check_rate_limit(record)
+            if suppressed is None:
+                return
+
             msg = self.format(record)
+            if suppressed:
+                msg += f" [{suppressed} identical incident(s) suppressed]"
 
             # Add extra context for errors
             if record.levelno >= logging.ERROR and record.exc_info:
-                import traceback
                 msg += "\nException Traceback:\n"
                 msg += ''.join(traceback.format_exception(*record.exc_info))
 
-            # Write to file with proper encoding
-            with open(self.log_file, 'a', encoding='utf-8') as f:
-                f.write(msg + '\n')
+            # Add separator for ERROR and CRITICAL messages
+            if record.levelno >= logging.ERROR:
+                msg += '\n' + '-' * 80
 
-                # Add separator for ERROR and CRITICAL messages
-                if record.levelno >= logging.ERROR:
-                    f.write('-' * 80 + '\n')
+            with self.lock:  # type: ignore[union-attr]
+                if self._stream is None or self._stream.closed:
+                    self._stream = open(self.log_file, 'a', encoding='utf-8')
+                self._stream.write(msg + '\n')
+                if not self.batched:
+                    self._stream.flush()
 
-            # The IncidentManagementService will read from the incidents log file during dream cycles
+            # Failures to reach the graph are logged by this module; don't feed them back
+            if record.name != __name__:
+                self._pending_incidents.append(record)
+                if not self.batched:
+                    self._schedule_graph_forward()
 
         except Exception:
             # Failsafe - if we can't capture incident, don't crash
             self.handleError(record)
 
+    def _check_rate_limit(self, record: logging.LogRecord) -> Optional[int]:
+        """Return None to suppress ``record``, else how many repeats were suppressed before it."""
+        if self.rate_limit_seconds <= 0:
+            return 0
+        now = time.monotonic()
+        key = (record.name, record.levelno, record.getMessage())
+        seen = self._recent.get(key)
+        if seen is not None and now - seen[0] < self.rate_limit_seconds:
+            self._recent[key] = (seen[0], seen[1] + 1)
+            self.suppressed_count += 1
+            return None
+
+        if len(self._recent) > 1024:
+            self._recent = {
+                k: v for k, v in self._recent.items() if now - v[0] < self.rate_limit_seconds
+            }
+        self._recent[key] = (now, 0)
+        return seen[1] if seen is not None else 0
+
+    def flush(self) -> None:
+        """Flush the incident file and hand pending incidents to the graph."""
+        with self.lock:  # type: ignore[union-attr]
+            if self._stream is not None and not self._stream.closed:
+                self._stream.flush()
+        self._schedule_graph_forward()
+
+    def close(self) -> None:
+        with self.lock:  # type: ignore[union-attr]
+            if self._stream is not None and not self._stream.closed:
+                self._stream.close()
+        super().close()
+
+    def _schedule_graph_forward(self) -> None:
+        """Schedule one batch forward on the service loop unless one is already pending."""
+        loop = self._loop
+        if not self._pending_incidents or not self._graph_audit_service or loop is None or loop.is_closed():
+            return
+        with self._forward_lock:
+            if self._forward_scheduled:
+                return
+            self._forward_scheduled = True
+        try:
+            future = asyncio.run_coroutine_threadsafe(self.forward_pending_incidents(), loop)
+            future.add_done_callback(lambda _: self._clear_forward_scheduled())
+        except RuntimeError:
+            self._clear_forward_scheduled()
+
+    def _clear_forward_scheduled(self) -> None:
+        with self._forward_lock:
+            self._forward_scheduled = False
+
+    async def forward_pending_incidents(self) -> int:
+        """Memorize pending incidents in the graph, a batch at a time.
+
+        Returns the number of incidents forwarded.
+        """
+        forwarded = 0
+        while self._pending_incidents and self._graph_audit_service:
+            batch: List[logging.LogRecord] = []
+            while self._pending_incidents and len(batch) < self.graph_batch_size:
+                batch.append(self._pending_incidents.popleft())
+            await asyncio.gather(*(self._save_incident_to_graph(record) for record in batch))
+            forwarded += len(batch)
+        self.incidents_forwarded += forwarded
+        return forwarded
+
     async def _save_incident_to_graph(self, record: logging.LogRecord) -> None:
         """Save log record as incident in graph."""
         try:
@@ -202,18 +312,15 @@ class IncidentCaptureHandler(logging.Handler):
         self._graph_audit_service = graph_audit_service
         logging.getLogger(__name__).info("Graph audit service injected into incident capture handler")
         
-        # Process any pending incidents now that we have the service
-        if hasattr(self, '_pending_incidents') and self._pending_incidents:
-            # Try to process them if we're in an async context
-            try:
-                loop = asyncio.get_running_loop()
-                for record in self._pending_incidents:
-                    loop.create_task(self._save_incident_to_graph(record))
-                logging.getLogger(__name__).info(f"Processing {len(self._pending_incidents)} queued incidents")
-                self._pending_incidents.clear()
-            except RuntimeError:
-                # Still no event loop, keep them queued
-                pass
+        # Incidents are forwarded on this loop; process any already pending
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Still no event loop, keep them queued
+            return
+        if self._pending_incidents:
+            logging.getLogger(__name__).info(f"Processing {len(self._pending_incidents)} queued incidents")
+            self._schedule_graph_forward()
 
 def add_incident_capture_handler(logger_instance: Optional[logging.Logger] = None,
                                log_dir: str = "logs",
@@ -279,6 +386,15 @@ def inject_graph_audit_service_to_handlers(graph_audit_service: Any, logger_inst
                 handler.set_graph_audit_service(graph_audit_service)
                 updated_count += 1
                 inject_logger.info(f"Injected graph audit service into handler for logger: {logger_obj.name}")
+
+    # Handlers behind the queued log pipeline are not attached to any logger
+    pipeline = get_log_pipeline()
+    if pipeline is not None:
+        for handler in pipeline.handlers:
+            if isinstance(handler, IncidentCaptureHandler):
+                handler.set_graph_audit_service(graph_audit_service)
+                updated_count += 1
+                inject_logger.info("Injected graph audit service into queued incident handler")
     
     if updated_count == 0:
         inject_logger.warning("No IncidentCaptureHandler instances found to inject graph audit service")
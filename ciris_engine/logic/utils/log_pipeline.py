@@ -0,0 +1,205 @@
+"""
+Queued logging pipeline.
+
+Loggers hand records to a ``QueueHandler`` and return immediately; a single
+background writer thread drains the queue in batches, passes each record to
+the real handlers (log file, console, incident capture) and flushes them once
+per batch, so files stay open and hot paths never wait on disk I/O.
+
+Sampling is opt-in: when enabled, records below WARNING are sampled per
+logger at the rate of the logger's path in ``telemetry/hot_cold_config.py``;
+warnings and errors are always kept.
+"""
+import atexit
+import copy
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler
+from typing import Callable, Dict, List, Optional
+
+from ciris_engine.logic.telemetry.hot_cold_config import get_log_sampling_rate
+
+DEFAULT_QUEUE_SIZE = 10000
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+_STOP = object()
+
+class LogSamplingFilter(logging.Filter):
+    """Keeps a deterministic fraction of sub-WARNING records per logger."""
+
+    def __init__(self, rate_for: Callable[[str], float] = get_log_sampling_rate) -> None:
+        super().__init__()
+        self._rate_for = rate_for
+        self._periods: Dict[str, int] = {}
+        self._counts: Dict[str, int] = {}
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        period = self._periods.get(record.name)
+        if period is None:
+            rate = self._rate_for(record.name)
+            period = self._periods[record.name] = max(1, round(1.0 / rate)) if rate > 0 else 0
+        if period == 1:
+            return True
+
+        # Every period-th record passes, starting with the first
+        count = self._counts.get(record.name, 0)
+        self._counts[record.name] = count + 1
+        if period and count % period == 0:
+            return True
+        self.sampled_out += 1
+        return False
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that leaves flushing to the writer, once per batch."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """Queue handler that never blocks the caller and keeps records formattable."""
+
+    def __init__(self, log_queue: "queue.Queue[object]") -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message now (args may change before the writer runs) but
+        # leave formatting to the target handlers, which use different formats
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class LogPipeline:
+    """A queue handler plus the background writer that feeds ``handlers``."""
+
+    def __init__(
+        self,
+        handlers: List[logging.Handler],
+        sampling: bool = False,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        self.handlers = handlers
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=queue_size)
+        self.queue_handler = _NonBlockingQueueHandler(self._queue)
+        self.sampling_filter: Optional[LogSamplingFilter] = None
+        if sampling:
+            self.sampling_filter = LogSamplingFilter()
+            self.queue_handler.addFilter(self.sampling_filter)
+        self.batches_written = 0
+        self.records_written = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def dropped(self) -> int:
+        """Records dropped because the queue was full."""
+        return self.queue_handler.dropped
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="ciris-log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write everything still queued, then close the handlers."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._thread = None
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        for handler in self.handlers:
+            try:
+                handler.close()
+            except Exception:
+                pass
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, logging.LogRecord):
+                    self._handle(item)
+            for handler in self.handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    pass
+            self.batches_written += 1
+            if stop:
+                return
+
+    def _handle(self, record: logging.LogRecord) -> None:
+        self.records_written += 1
+        for handler in self.handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+_active_pipeline: Optional[LogPipeline] = None
+
+def install_log_pipeline(target_logger: logging.Logger, handlers: List[logging.Handler], sampling: bool = False) -> LogPipeline:
+    """Route ``target_logger`` through a new pipeline writing to ``handlers``.
+
+    Any previously installed pipeline is stopped first.
+    """
+    global _active_pipeline
+    stop_log_pipeline()
+    pipeline = LogPipeline(handlers, sampling=sampling)
+    pipeline.start()
+    target_logger.addHandler(pipeline.queue_handler)
+    _active_pipeline = pipeline
+    return pipeline
+
+def get_log_pipeline() -> Optional[LogPipeline]:
+    """The pipeline installed by :func:`install_log_pipeline`, if any."""
+    return _active_pipeline
+
+def stop_log_pipeline() -> None:
+    """Drain and stop the active pipeline, detaching its queue handler."""
+    global _active_pipeline
+    pipeline = _active_pipeline
+    if pipeline is None:
+        return
+    _active_pipeline = None
+    for logger_obj in [logging.getLogger()] + [
+        obj for obj in logging.Logger.manager.loggerDict.values() if isinstance(obj, logging.Logger)
+    ]:
+        if pipeline.queue_handler in logger_obj.handlers:
+            logger_obj.removeHandler(pipeline.queue_handler)
+    pipeline.stop()
+
+atexit.register(stop_log_pipeline)
@@ -1,7 +1,8 @@
 import logging
 import sys
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
+from ciris_engine.logic.utils.log_pipeline import BufferedFileHandler, install_log_pipeline, stop_log_pipeline
 from ciris_engine.protocols.services import TimeServiceProtocol
 
 logger = logging.getLogger(__name__)
@@ -18,10 +19,16 @@ def setup_basic_logging(level: int = logging.INFO,
                         log_dir: str = "logs",
                         console_output: bool = False,
                         enable_incident_capture: bool = True,
-                        time_service: Optional[TimeServiceProtocol] = None) -> None:
+                        time_service: Optional[TimeServiceProtocol] = None,
+                        queued: bool = True,
+                        log_sampling: bool = False) -> None:
     """
     Sets up basic logging configuration with file output and optional console output.
 
+    By default records go through the queued log pipeline: callers only
+    enqueue, and a background writer batches them into the console, log file
+    and incident handlers.
+
     Args:
         level: The logging level (e.g., logging.INFO, logging.DEBUG)
         log_format: The format string for log messages
@@ -32,6 +39,8 @@ def setup_basic_logging(level: int = logging.INFO,
         log_dir: Directory for log files
         console_output: Whether to also output to console (default: False for clean log-file-only operation)
         enable_dead_letter: Whether to enable dead letter queue for WARNING/ERROR messages
+        queued: Whether to write through the background log pipeline
+        log_sampling: Whether to sample sub-WARNING records of cold-path loggers (queued only, off by default)
     """
 
     from ciris_engine.logic.config.env_utils import get_env_var
@@ -51,12 +60,14 @@ def setup_basic_logging(level: int = logging.INFO,
 
     target_logger = logger_instance or logging.getLogger()
 
+    stop_log_pipeline()
     target_logger.handlers = []
+    handlers: List[logging.Handler] = []
 
     if console_output:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        target_logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     if log_to_file:
         log_path = Path(log_dir)
@@ -67,9 +78,10 @@ def setup_basic_logging(level: int = logging.INFO,
         timestamp = time_service.now().strftime("%Y%m%d_%H%M%S")
         log_filename = log_path / f"ciris_agent_{timestamp}.log"
 
-        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        file_handler_class = BufferedFileHandler if queued else logging.FileHandler
+        file_handler = file_handler_class(log_filename, encoding='utf-8')
         file_handler.setFormatter(formatter)
-        target_logger.addHandler(file_handler)
+        handlers.append(file_handler)
 
         latest_link = log_path / "latest.log"
         if latest_link.exists():
@@ -92,16 +104,23 @@ def setup_basic_logging(level: int = logging.INFO,
 
     # Add incident capture handler if enabled
     if enable_incident_capture:
-        from ciris_engine.logic.utils.incident_capture_handler import add_incident_capture_handler
+        from ciris_engine.logic.utils.incident_capture_handler import IncidentCaptureHandler
         # Note: Graph audit service will be set later if available
         # Cannot use async service lookup in sync function
 
-        _incident_handler = add_incident_capture_handler(
-            target_logger,
+        incident_handler = IncidentCaptureHandler(
             log_dir=log_dir,
             time_service=time_service,
             graph_audit_service=None  # Will be set later by runtime
         )
+        incident_handler.batched = queued
+        handlers.append(incident_handler)
+
+    if queued:
+        install_log_pipeline(target_logger, handlers, sampling=log_sampling)
+    else:
+        for handler in handlers:
+            target_logger.addHandler(handler)
 
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("discord").setLevel(logging.WARNING)
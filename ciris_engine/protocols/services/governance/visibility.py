@@ -1,6 +1,6 @@
 """Visibility Service Protocol."""
 
-from typing import Protocol
+from typing import Dict, List, Protocol
 from abc import abstractmethod
 
 from ...runtime.base import ServiceProtocol
@@ -21,6 +21,11 @@ class VisibilityServiceProtocol(ServiceProtocol, Protocol):
         """Get reasoning trace for a task."""
         ...
 
+    @abstractmethod
+    async def get_reasoning_traces(self, task_ids: List[str]) -> Dict[str, ReasoningTrace]:
+        """Get reasoning traces for several tasks, keyed by task ID."""
+        ...
+
     @abstractmethod
     async def get_decision_history(self, task_id: str) -> TaskDecisionHistory:
         """Get decision history for a task."""
@@ -6,7 +6,8 @@ from datetime import datetime
 
 from ...runtime.base import GraphServiceProtocol
 from ciris_engine.schemas.services.nodes import AuditEntry
-from ciris_engine.schemas.services.graph.audit import AuditQuery, VerificationReport
+from ciris_engine.schemas.services.graph.audit import AuditQuery, AuditQueryPage, VerificationReport
+from ciris_engine.schemas.audit.verification import VerificationProgress
 from ciris_engine.schemas.runtime.enums import HandlerActionType
 from ciris_engine.schemas.runtime.audit import AuditActionContext
 
@@ -57,6 +58,16 @@ class AuditServiceProtocol(GraphServiceProtocol, Protocol):
         """Query audit trail with advanced filters."""
         ...
 
+    @abstractmethod
+    async def query_audit_page(self, query: AuditQuery) -> AuditQueryPage:
+        """Query one page of the audit trail with a cursor for the next page."""
+        ...
+
+    @abstractmethod
+    async def count_audit_entries(self, query: AuditQuery) -> int:
+        """Count entries matching a query without loading them."""
+        ...
+
     @abstractmethod
     async def verify_audit_integrity(self) -> VerificationReport:
         """Verify audit trail integrity."""
@@ -67,6 +78,16 @@ class AuditServiceProtocol(GraphServiceProtocol, Protocol):
         """Get detailed verification report."""
         ...
 
+    @abstractmethod
+    async def start_integrity_verification(self, resume: bool = True) -> VerificationProgress:
+        """Start a background chain verification, resuming from the last checkpoint."""
+        ...
+
+    @abstractmethod
+    async def get_verification_progress(self) -> VerificationProgress:
+        """Get progress of the current or last chain verification."""
+        ...
+
     @abstractmethod
     async def export_audit_data(
         self,
@@ -1,6 +1,6 @@
 """Secrets Service Protocol."""
 
-from typing import Protocol, List, Optional, Tuple
+from typing import Any, FrozenSet, Protocol, List, Optional, Tuple
 from abc import abstractmethod
 
 from ...runtime.base import ServiceProtocol
@@ -42,6 +42,16 @@ class SecretsServiceProtocol(ServiceProtocol, Protocol):
         """Process incoming text to detect and store secrets."""
         ...
 
+    @abstractmethod
+    async def process_incoming_structure(
+        self,
+        obj: Any,
+        source_message_id: str,
+        skip_keys: FrozenSet[str] = frozenset()
+    ) -> Tuple[Any, List[SecretReference]]:
+        """Detect and store secrets in the string leaves of a nested structure."""
+        ...
+
     @abstractmethod
     async def decapsulate_secrets_in_parameters(
         self,
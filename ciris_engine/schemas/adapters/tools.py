@@ -4,6 +4,7 @@ Tool schemas for adapter-provided tools.
 Tools are provided by adapters (Discord, API, CLI) not by the runtime.
 This is the single source of truth for all tool-related schemas.
 """
+from datetime import datetime
 from typing import Dict, List, Optional, Any
 from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict
@@ -60,10 +61,43 @@ class ToolExecutionResult(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class ToolCatalogEntry(BaseModel):
+    """One tool offered by one tool service."""
+    name: str = Field(..., description="Tool name")
+    adapter_id: str = Field(..., description="ID of the adapter providing the tool")
+    description: str = Field("", description="What the tool does")
+    info: Optional[ToolInfo] = Field(None, description="Full tool information, if the service provides it")
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class ToolCatalog(BaseModel):
+    """Snapshot of every registered tool, rebuilt when adapters load or unload."""
+    version: int = Field(..., description="Catalog version; bumped on every invalidation")
+    entries: List[ToolCatalogEntry] = Field(default_factory=list, description="Tools sorted by adapter and name")
+    prompt_fragment: str = Field("", description="Pre-rendered tool list for action selection prompts")
+    built_at: datetime = Field(..., description="When the catalog was built")
+
+    model_config = ConfigDict(extra="forbid")
+
+    def by_adapter_type(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Tools grouped by adapter type (the adapter_id prefix), as used by SystemSnapshot."""
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in self.entries:
+            adapter_type = entry.adapter_id.split('_')[0] if '_' in entry.adapter_id else entry.adapter_id
+            tool: Dict[str, Any] = {'name': entry.name, 'adapter_id': entry.adapter_id}
+            if entry.description:
+                tool['description'] = entry.description
+            grouped.setdefault(adapter_type, []).append(tool)
+        return grouped
+
+
 __all__ = [
     "ToolExecutionStatus",
     "ToolParameterSchema",
     "ToolInfo",
     "ToolResult",
-    "ToolExecutionResult"
+    "ToolExecutionResult",
+    "ToolCatalogEntry",
+    "ToolCatalog",
 ]
@@ -85,4 +85,22 @@ class ServiceMetrics(BaseModel):
     error_count: Optional[int] = Field(None, description="Error count")
     avg_response_time_ms: Optional[float] = Field(None, description="Average response time")
     memory_mb: Optional[float] = Field(None, description="Memory usage")
-    custom_metrics: Optional[dict] = Field(None, description="Service-specific metrics")
\ No newline at end of file
+    custom_metrics: Optional[dict] = Field(None, description="Service-specific metrics")
+
+class RouteCacheStats(BaseModel):
+    """Response cache counters for one route."""
+    ttl_seconds: float = Field(..., description="How long responses are kept")
+    hits: int = Field(0, description="Requests served from the cache, including coalesced ones")
+    misses: int = Field(0, description="Requests that ran the route handler")
+
+
+class ResponseCacheStats(BaseModel):
+    """API response cache counters."""
+    entries: int = Field(0, description="Responses currently stored")
+    hits: int = Field(0, description="Requests served without running the handler")
+    misses: int = Field(0, description="Requests that ran the handler")
+    coalesced: int = Field(0, description="Hits that waited on a concurrent identical request")
+    not_modified: int = Field(0, description="304 responses to a matching If-None-Match")
+    bypassed: int = Field(0, description="Requests on cached routes skipped for invalid credentials")
+    hit_rate: float = Field(0.0, description="hits / (hits + misses)")
+    routes: Dict[str, RouteCacheStats] = Field(default_factory=dict, description="Counters by route path")
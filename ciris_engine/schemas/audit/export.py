@@ -0,0 +1,31 @@
+"""
+Schemas for streaming audit exports.
+
+These describe the manifest written next to exported audit_log chunks.
+"""
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+class AuditExportChunk(BaseModel):
+    """One rotated export file and the slice of the hash chain it holds."""
+    file_name: str = Field(..., description="Chunk file name, relative to the export directory")
+    first_sequence: int = Field(..., description="First sequence number in the chunk")
+    last_sequence: int = Field(..., description="Last sequence number in the chunk")
+    entry_count: int = Field(..., description="Entries in the chunk")
+    first_previous_hash: str = Field(..., description="previous_hash of the first entry (links to the prior chunk)")
+    last_entry_hash: str = Field(..., description="entry_hash of the last entry")
+    size_bytes: int = Field(..., description="Size of the file on disk")
+    sha256: str = Field(..., description="SHA-256 of the file on disk")
+    created_at: str = Field(..., description="When the chunk was written (ISO8601)")
+
+class AuditExportManifest(BaseModel):
+    """Index of an export directory; the resume point for incremental exports."""
+    version: int = Field(1, description="Manifest format version")
+    format: str = Field(..., description="Row format: jsonl or csv")
+    compression: str = Field(..., description="Chunk compression: gzip, zstd or none")
+    chunks: List[AuditExportChunk] = Field(default_factory=list, description="Chunks in sequence order")
+    first_sequence: Optional[int] = Field(None, description="First exported sequence number")
+    last_sequence: Optional[int] = Field(None, description="Last exported sequence number")
+    last_entry_hash: Optional[str] = Field(None, description="entry_hash at last_sequence")
+    total_entries: int = Field(0, description="Entries across all chunks")
+    updated_at: Optional[str] = Field(None, description="When the manifest was last written (ISO8601)")
@@ -36,8 +36,23 @@ class ChainSummary(BaseModel):
     newest_entry: Optional[str] = Field(None, description="Timestamp of newest entry")
     error: Optional[str] = Field(None, description="Error if any")
 
+class AuditWriterStats(BaseModel):
+    """Throughput and durability counters for the group-commit audit writer."""
+    running: bool = Field(False, description="Whether the writer task is running")
+    queue_depth: int = Field(0, description="Entries waiting to be committed")
+    entries_written: int = Field(0, description="Entries committed to audit_log")
+    batches_committed: int = Field(0, description="Transactions committed")
+    failed_entries: int = Field(0, description="Entries whose batch failed to commit")
+    largest_batch: int = Field(0, description="Largest batch committed so far")
+    average_batch_size: float = Field(0.0, description="Mean entries per committed batch")
+    last_commit_ms: float = Field(0.0, description="Duration of the last batch commit")
+    flush_batch_size: int = Field(..., description="Flush after this many queued entries")
+    flush_interval_ms: float = Field(..., description="Flush at most this long after the first queued entry")
+    signing_mode: str = Field("entry", description="'entry' signs every entry, 'merkle' signs one root per batch")
+
 __all__ = [
     "HashChainAuditEntry",
     "HashChainVerificationResult",
-    "ChainSummary"
+    "ChainSummary",
+    "AuditWriterStats"
 ]
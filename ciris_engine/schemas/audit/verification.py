@@ -34,6 +34,8 @@ class CompleteVerificationResult(BaseModel):
     chain_summary: Optional[dict] = Field(None, description="Chain summary information")
     summary: Optional[str] = Field(None, description="Summary message")
     error: Optional[str] = Field(None, description="Error message if verification failed")
+    resumed_from_sequence: Optional[int] = Field(None, description="Checkpointed sequence this run resumed after")
+    checkpoint_sequence: Optional[int] = Field(None, description="Highest sequence verified clean, after this run")
 
 class EntryVerificationResult(BaseModel):
     """Result of single entry verification."""
@@ -85,3 +87,19 @@ class RootAnchorVerificationResult(BaseModel):
     total_count: int = Field(0, description="Total number of anchors")
     errors: List[str] = Field(default_factory=list, description="Verification errors")
     message: Optional[str] = Field(None, description="Status message")
+
+class VerificationProgress(BaseModel):
+    """Progress of a streaming chain verification run."""
+    state: str = Field("idle", description="idle, running, completed, cancelled or failed")
+    started_at: Optional[datetime] = Field(None, description="When the run started")
+    completed_at: Optional[datetime] = Field(None, description="When the run finished")
+    start_sequence: int = Field(1, description="First sequence checked by this run")
+    current_sequence: int = Field(0, description="Last sequence whose hash link was checked")
+    target_sequence: int = Field(0, description="Last sequence in the chain when the run started")
+    entries_checked: int = Field(0, description="Entries hash-checked by this run")
+    signatures_checked: int = Field(0, description="Entries whose signature result is known")
+    errors_found: int = Field(0, description="Hash chain and signature errors so far")
+    checkpoint_sequence: int = Field(0, description="Highest sequence verified clean so far")
+    resumed: bool = Field(False, description="Whether the run resumed from a checkpoint")
+    percent_complete: float = Field(0.0, description="Progress through the run's sequence range")
+    result: Optional[CompleteVerificationResult] = Field(None, description="Final result once completed")
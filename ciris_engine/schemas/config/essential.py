@@ -5,7 +5,7 @@ Mission-critical configuration only. No ambiguity allowed.
 This replaces AppConfig for a cleaner, graph-based config system.
 """
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Literal, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
 class DatabaseConfig(BaseModel):
@@ -22,6 +22,14 @@ class DatabaseConfig(BaseModel):
         Path("data/ciris_audit.db"),
         description="Audit trail database with signatures"
     )
+    fast_row_decoding: bool = Field(
+        True,
+        description="Validate task and thought rows in one pass, falling back to field-by-field decoding"
+    )
+    json_backend: Optional[str] = Field(
+        None,
+        description="JSON backend for stored rows and API responses: 'orjson' or 'json' (default: orjson when installed)"
+    )
 
     model_config = ConfigDict(extra = "forbid")
 
@@ -64,6 +72,30 @@ class SecurityConfig(BaseModel):
         True,
         description="Enable cryptographic signing of audit entries"
     )
+    audit_signing_mode: Literal["entry", "merkle"] = Field(
+        "entry",
+        description="Sign every audit entry, or one Merkle root per committed batch"
+    )
+    audit_flush_entries: int = Field(
+        64,
+        ge=1,
+        description="Commit the audit hash chain after this many queued entries"
+    )
+    audit_flush_interval_ms: float = Field(
+        50.0,
+        ge=0,
+        description="Commit queued audit hash chain entries at least this often"
+    )
+    audit_wait_for_commit: bool = Field(
+        True,
+        description="Audit log calls return only once their chain entry is committed; "
+                    "when false, entries still queued are lost on a crash or failed batch"
+    )
+    crypto_workers: Optional[int] = Field(
+        None,
+        ge=1,
+        description="Threads in the shared pool for password hashing, key derivation and signing (default: min(4, CPUs))"
+    )
     max_thought_depth: int = Field(
         7,
         description="Maximum thought chain depth before auto-defer"
@@ -138,6 +170,23 @@ class WorkflowConfig(BaseModel):
 
     model_config = ConfigDict(extra = "forbid")
 
+class PromptBudgetConfig(BaseModel):
+    """Token budgets for the context blocks (system snapshot, user profiles) of DMA prompts."""
+    default_context_tokens: Optional[int] = Field(
+        1500,
+        description="Context budget for DMAs without their own entry (None = unlimited)"
+    )
+    per_dma: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Context budget by DMA type: ethical, csdma, dsdma, action_selection"
+    )
+
+    model_config = ConfigDict(extra = "forbid")
+
+    def budget_for(self, dma_type: str) -> Optional[int]:
+        """Context token budget for one DMA type."""
+        return self.per_dma.get(dma_type, self.default_context_tokens)
+
 class GraphConfig(BaseModel):
     """Graph service configuration."""
     # TSDB Consolidation settings
@@ -175,6 +224,7 @@ class EssentialConfig(BaseModel):
     telemetry: TelemetryConfig = Field(default_factory=lambda: TelemetryConfig())
     workflow: WorkflowConfig = Field(default_factory=lambda: WorkflowConfig())
     graph: GraphConfig = Field(default_factory=lambda: GraphConfig())
+    prompt_budget: PromptBudgetConfig = Field(default_factory=lambda: PromptBudgetConfig())
 
     # Runtime settings
     log_level: str = Field(
@@ -167,4 +167,45 @@ class PromptMetadata(BaseModel):
     usage_count: int = Field(0, description="How many times loaded")
     last_used: Optional[str] = Field(None, description="ISO timestamp of last use")
     
-    model_config = ConfigDict(extra="forbid")
\ No newline at end of file
+    model_config = ConfigDict(extra="forbid")
+
+class PromptRenderReport(BaseModel):
+    """How much of one DMA prompt was rendered versus reused from cache."""
+
+    thought_id: str = Field(..., description="Thought the prompt was built for")
+    total_bytes: int = Field(0, description="UTF-8 size of all prompt messages")
+    rendered_bytes: int = Field(0, description="Bytes rendered for this thought")
+    cached_bytes: int = Field(0, description="Bytes reused from cached static sections")
+    stable_prefix_bytes: int = Field(0, description="Size of the leading messages identical across thoughts")
+    static_cache_hit: bool = Field(False, description="Whether the static sections came from cache")
+
+    model_config = ConfigDict(extra="forbid")
+
+class ContextBlock(BaseModel):
+    """One block of prompt context competing for the context budget."""
+
+    name: str = Field(..., description="Block name, e.g. 'snapshot.telemetry' or 'user_profiles'")
+    text: str = Field(..., description="Full rendering of the block")
+    priority: int = Field(0, description="Higher priority blocks are fitted first")
+    required: bool = Field(False, description="Always kept in full, whatever the budget")
+    summary: Optional[str] = Field(None, description="Shorter rendering used when the full text does not fit")
+    min_tokens: int = Field(16, description="Drop the block rather than truncate it below this size")
+
+    model_config = ConfigDict(extra="forbid")
+
+class ContextBudgetReport(BaseModel):
+    """What the context budget did to one prompt's context blocks."""
+
+    budget_tokens: Optional[int] = Field(None, description="Budget applied; None when unlimited")
+    original_tokens: int = Field(0, description="Estimated tokens of all blocks in full")
+    assembled_tokens: int = Field(0, description="Estimated tokens actually placed in the prompt")
+    summarized: List[str] = Field(default_factory=list, description="Blocks replaced by their summary")
+    truncated: List[str] = Field(default_factory=list, description="Blocks cut to fit the budget")
+    dropped: List[str] = Field(default_factory=list, description="Blocks left out entirely")
+
+    model_config = ConfigDict(extra="forbid")
+
+    @property
+    def saved_tokens(self) -> int:
+        """Estimated prompt tokens saved by the budget."""
+        return self.original_tokens - self.assembled_tokens
@@ -112,6 +112,15 @@ class PersistenceHealth(BaseModel):
 
     model_config = ConfigDict(extra = "forbid")
 
+class GraphNodeCounts(BaseModel):
+    """Graph node counts from the materialized graph_node_stats table."""
+    total: int = Field(0, description="Total number of nodes")
+    by_type: Dict[str, int] = Field(default_factory=dict, description="Node count by node type")
+    by_scope: Dict[str, int] = Field(default_factory=dict, description="Node count by scope")
+    by_day: Dict[str, int] = Field(default_factory=dict, description="Node count by creation day (YYYY-MM-DD)")
+
+    model_config = ConfigDict(extra = "forbid")
+
 __all__ = [
     "DeferralPackage",
     "DeferralReportContext",
@@ -121,5 +130,6 @@ __all__ = [
     "ThoughtSummary",
     "TaskSummaryInfo",
     "QueryTimeRange",
-    "PersistenceHealth"
+    "PersistenceHealth",
+    "GraphNodeCounts"
 ]
@@ -322,6 +322,18 @@ class TelemetrySummary(BaseModel):
 
     model_config = ConfigDict(extra = "forbid")
 
+class SnapshotComponentTiming(BaseModel):
+    """Timing of one snapshot component, accumulated by the snapshot engine."""
+    component: str = Field(..., description="Component name, e.g. recent_tasks")
+    layer: str = Field(..., description="Layer the component belongs to: round, batch or thought")
+    calls: int = Field(0, description="Times the component was computed")
+    cache_hits: int = Field(0, description="Times a memoized value was reused instead")
+    total_ms: float = Field(0.0, description="Total time spent computing the component")
+    last_ms: float = Field(0.0, description="Duration of the most recent computation")
+    max_ms: float = Field(0.0, description="Slowest computation")
+
+    model_config = ConfigDict(extra = "forbid")
+
 __all__ = [
     "SystemSnapshot",
     "TaskSummary",
@@ -331,5 +343,6 @@ __all__ = [
     "ResourceUsage",  # Re-exported from resources module
     "AuditVerification",
     "TelemetrySummary",
-    "ThoughtSummary"
+    "ThoughtSummary",
+    "SnapshotComponentTiming",
 ]
@@ -197,6 +197,11 @@ class PatternStats(BaseModel):
     disabled_patterns: int = Field(0, description="Number of disabled patterns")
     builtin_patterns: bool = Field(True, description="Whether builtin patterns are enabled")
     filter_version: str = Field("v1.0", description="Filter version")
+    single_pass_scan: bool = Field(False, description="Whether patterns are merged into a single prefilter scan")
+    texts_scanned: int = Field(0, description="Number of texts scanned since startup")
+    texts_prefiltered: int = Field(0, description="Texts rejected by the single-pass prefilter")
+    bytes_scanned: int = Field(0, description="Total bytes scanned since startup")
+    scan_throughput_bytes_per_sec: float = Field(0.0, description="Average detection throughput in bytes/sec")
 
     model_config = ConfigDict(extra = "forbid")
 
@@ -7,6 +7,8 @@ from typing import Dict, List, Optional, Union
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 
+from ciris_engine.schemas.services.nodes import AuditEntry
+
 class AuditEventData(BaseModel):
     """Data for an audit event."""
     entity_id: str = Field("system", description="Entity involved in event")
@@ -88,3 +90,11 @@ class AuditQuery(BaseModel):
     order_desc: bool = Field(True, description="Order descending")
     limit: Optional[int] = Field(100, description="Maximum results")
     offset: int = Field(0, description="Results offset")
+    cursor: Optional[str] = Field(None, description="Keyset cursor returned with the previous page")
+    include_details: bool = Field(True, description="Load and decode each entry's event payload")
+
+class AuditQueryPage(BaseModel):
+    """One keyset-paginated page of audit entries."""
+    entries: List[AuditEntry] = Field(default_factory=list, description="Entries on this page")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the following page")
+    has_more: bool = Field(False, description="Whether more entries match the query")
@@ -252,6 +252,28 @@ class CorrelationSummary(BaseModel):
 
     model_config = ConfigDict(extra = "forbid")
 
+class LatencySummary(BaseModel):
+    """Percentiles of one latency histogram."""
+    count: int = Field(0, description="Samples recorded")
+    mean_ms: float = Field(0.0, description="Mean latency")
+    p50_ms: float = Field(0.0, description="Median latency")
+    p95_ms: float = Field(0.0, description="95th percentile latency")
+    p99_ms: float = Field(0.0, description="99th percentile latency")
+    max_ms: float = Field(0.0, description="Slowest sample")
+
+    model_config = ConfigDict(extra = "forbid")
+
+class CryptoExecutorStats(BaseModel):
+    """Load on the shared executor for CPU-bound cryptography."""
+    max_workers: int = Field(..., description="Worker threads in the pool")
+    queue_depth: int = Field(0, description="Operations submitted but not yet started")
+    running: int = Field(0, description="Operations currently executing")
+    completed: int = Field(0, description="Operations finished successfully")
+    failed: int = Field(0, description="Operations that raised")
+    peak_queue_depth: int = Field(0, description="Largest queue depth seen")
+
+    model_config = ConfigDict(extra = "forbid")
+
 __all__ = [
     "ServiceCorrelationStatus",
     "CorrelationType",
@@ -262,5 +284,7 @@ __all__ = [
     "LogData",
     "ServiceCorrelation",
     "CorrelationQuery",
-    "CorrelationSummary"
+    "CorrelationSummary",
+    "LatencySummary",
+    "CryptoExecutorStats"
 ]
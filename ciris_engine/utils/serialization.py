@@ -1,6 +1,47 @@
-"""Serialization utilities for CIRIS."""
-from datetime import datetime
-from typing import Optional, Any
+"""
+Serialization utilities for CIRIS.
+
+Besides the timestamp helpers used by Pydantic field serializers, this
+module owns JSON encoding for persistence (graph node attributes, task and
+thought contexts, correlation tags) and API response bodies, behind a
+pluggable backend:
+
+- ``orjson`` when installed (the default): encodes datetimes, enums, UUIDs
+  and dataclasses natively and parses several times faster than the
+  standard library.
+- ``json``: the standard library, used when orjson is missing or selected
+  with ``configure_json_backend("json")``.
+
+Both backends produce the same compact UTF-8 output: datetimes as
+``isoformat()``, enums as their value, Pydantic models via
+``model_dump(mode="json")``, NaN and infinities as ``null``. Strings with
+lone surrogates, which UTF-8 cannot carry, are written with every
+non-ASCII character escaped. Integers outside orjson's 64-bit range raise
+TypeError rather than being stored, since orjson would read them back as
+floats. Text orjson cannot parse (``NaN`` literals or escaped lone
+surrogates in older rows) is decoded by the standard library.
+"""
+import dataclasses
+import json
+import logging
+import math
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any, Callable, Optional, Union
+from uuid import UUID
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None  # type: ignore
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKENDS = ("orjson", "json")
 
 
 def serialize_timestamp(timestamp: datetime, _info: Any = None) -> Optional[str]:
@@ -31,4 +72,161 @@ def serialize_datetime(dt: datetime) -> Optional[str]:
     Returns:
         ISO format string or None if dt is None
     """
-    return dt.isoformat() if dt else None
\ No newline at end of file
+    return dt.isoformat() if dt else None
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types neither JSON backend handles natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    # Handle objects with to_dict() or dict() methods
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "dict"):
+        return obj.dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Integers orjson can encode and read back exactly
+_INT_MIN = -(2 ** 63)
+_INT_MAX = 2 ** 64 - 1
+
+
+def _check_ints(obj: Any) -> Any:
+    """Reject integers outside orjson's range, as orjson itself does."""
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple)):
+            stack.extend(current)
+        elif isinstance(current, int) and not _INT_MIN <= current <= _INT_MAX:
+            raise TypeError(f"Integer {current} exceeds the 64-bit range of stored JSON")
+    return obj
+
+
+def _finite(obj: Any) -> Any:
+    """Copy of ``obj`` with NaN and infinities replaced by None."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _stdlib_default(obj: Any) -> Any:
+    return _check_ints(_default(obj))
+
+
+def _stdlib_dumps(obj: Any, ensure_ascii: bool = False) -> str:
+    _check_ints(obj)
+    try:
+        text = json.dumps(obj, default=_stdlib_default, ensure_ascii=ensure_ascii,
+                          separators=(",", ":"), allow_nan=False)
+    except ValueError:
+        # NaN or infinity somewhere: write null, as orjson does
+        text = json.dumps(_finite(obj), default=lambda o: _finite(_stdlib_default(o)),
+                          ensure_ascii=ensure_ascii, separators=(",", ":"))
+    if not ensure_ascii and not text.isascii():
+        try:
+            text.encode("utf-8")
+        except UnicodeEncodeError:
+            return _stdlib_dumps(obj, ensure_ascii=True)
+    return text
+
+
+def _stdlib_dumps_bytes(obj: Any) -> bytes:
+    return _stdlib_dumps(obj).encode("utf-8")
+
+
+def _orjson_dumps_bytes(obj: Any) -> bytes:
+    try:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Lone surrogates are escaped by the stdlib; out-of-range integers
+        # and unserializable objects raise there too
+        return _stdlib_dumps(obj, ensure_ascii=True).encode("utf-8")
+
+
+def _orjson_dumps(obj: Any) -> str:
+    return _orjson_dumps_bytes(obj).decode("utf-8")
+
+
+def _orjson_loads(data: Union[str, bytes, bytearray]) -> Any:
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # NaN literals and escaped lone surrogates; the stdlib raises if the text is not JSON
+        return json.loads(data)
+
+
+_dumps: Callable[[Any], str] = _stdlib_dumps
+_dumps_bytes: Callable[[Any], bytes] = _stdlib_dumps_bytes
+_loads: Callable[[Union[str, bytes, bytearray]], Any] = json.loads
+_backend = "json"
+
+
+def configure_json_backend(name: Optional[str] = None) -> str:
+    """
+    Select the JSON backend.
+
+    Args:
+        name: "orjson" or "json"; None picks orjson when it is installed
+
+    Returns:
+        The backend now in use
+    """
+    global _dumps, _dumps_bytes, _loads, _backend
+    if name is None:
+        name = "orjson" if ORJSON_AVAILABLE else "json"
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name!r}; expected one of {', '.join(JSON_BACKENDS)}")
+    if name == "orjson" and not ORJSON_AVAILABLE:
+        logger.warning("orjson is not installed; using the standard library JSON backend")
+        name = "json"
+
+    if name == "orjson":
+        _dumps, _dumps_bytes, _loads = _orjson_dumps, _orjson_dumps_bytes, _orjson_loads
+    else:
+        _dumps, _dumps_bytes, _loads = _stdlib_dumps, _stdlib_dumps_bytes, json.loads
+    _backend = name
+    return name
+
+
+def json_backend() -> str:
+    """Name of the JSON backend in use."""
+    return _backend
+
+
+def dumps(obj: Any) -> str:
+    """Encode ``obj`` as a JSON string, e.g. for a TEXT column."""
+    return _dumps(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON bytes, e.g. for a response body."""
+    return _dumps_bytes(obj)
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Decode JSON text or bytes.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON (json.JSONDecodeError or a subclass)
+    """
+    return _loads(data)
+
+
+configure_json_backend()
@@ -574,14 +574,14 @@ The mock LLM provides deterministic responses for testing CIRIS functionality of
         # Step 1: Check if this is a follow-up thought by looking at the THOUGHT_TYPE in the system message
         is_followup = False
         
-        # The first message should be the system message with covenant
-        if messages and len(messages) > 0:
-            first_msg = messages[0]
-            if isinstance(first_msg, dict) and first_msg.get('role') == 'system':
-                content = first_msg.get('content', '')
+        # THOUGHT_TYPE leads the per-thought system context message
+        for msg in messages or []:
+            if isinstance(msg, dict) and msg.get('role') == 'system':
+                content = msg.get('content', '')
                 # Check if this is a follow_up thought type
                 if content.startswith('THOUGHT_TYPE=follow_up'):
                     is_followup = True
+                    break
         
         if is_followup:
             # Check the content of the follow-up thought to determine if it's from a SPEAK handler
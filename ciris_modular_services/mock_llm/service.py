@@ -1,3 +1,5 @@
+import asyncio
+import random
 from types import SimpleNamespace
 from typing import Any, Optional, List, Dict, Type, Tuple
 import instructor
@@ -5,6 +7,7 @@ import logging
 
 from pydantic import BaseModel
 from ciris_engine.logic.adapters.base import Service
+from ciris_engine.logic.config.env_utils import get_env_var
 from ciris_engine.protocols.services import LLMService as MockLLMServiceProtocol
 from ciris_engine.schemas.runtime.resources import ResourceUsage
 from ciris_engine.schemas.runtime.enums import ServiceType
@@ -123,13 +126,36 @@ class MockLLMClient:
             return self._create
         raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
+def _env_ms(name: str) -> float:
+    value = get_env_var(name)
+    try:
+        return max(0.0, float(value)) if value else 0.0
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}")
+        return 0.0
+
 class MockLLMService(Service, MockLLMServiceProtocol):
-    """Mock LLM service used for offline testing."""
+    """Mock LLM service used for offline testing.
+
+    Responses are instant unless a simulated latency is configured, either
+    with ``delay_ms``/``jitter_ms`` or the ``CIRIS_MOCK_LLM_DELAY_MS`` and
+    ``CIRIS_MOCK_LLM_JITTER_MS`` environment variables. Each call then
+    sleeps ``delay_ms`` plus a uniform offset in ``[-jitter_ms, jitter_ms]``,
+    which is what benchmarks use to stand in for a real provider.
+    """
 
-    def __init__(self, *_: Any, **__: Any) -> None:
+    def __init__(
+        self,
+        *_: Any,
+        delay_ms: Optional[float] = None,
+        jitter_ms: Optional[float] = None,
+        **__: Any,
+    ) -> None:
         super().__init__()
         self._client: Optional[MockLLMClient] = None
         self.model_name = "mock-model"
+        self.delay_ms = delay_ms if delay_ms is not None else _env_ms("CIRIS_MOCK_LLM_DELAY_MS")
+        self.jitter_ms = jitter_ms if jitter_ms is not None else _env_ms("CIRIS_MOCK_LLM_JITTER_MS")
     
     def get_service_type(self) -> ServiceType:
         """Get the service type."""
@@ -188,6 +214,10 @@ class MockLLMService(Service, MockLLMServiceProtocol):
         
         logger.debug(f"Mock call_llm_structured with response_model: {response_model}")
         
+        if self.delay_ms or self.jitter_ms:
+            delay_ms = self.delay_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+            await asyncio.sleep(max(0.0, delay_ms) / 1000)
+        
         response = await self._client._create(
             messages=messages,
             response_model=response_model,
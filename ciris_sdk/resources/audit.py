@@ -83,6 +83,38 @@ class AuditResource:
         data = await self._transport.request("GET", "/v1/audit/entries", params=params)
         return AuditEntriesResponse(**data)
     
+    async def count_entries(
+        self,
+        *,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        actor: Optional[str] = None,
+        event_type: Optional[str] = None,
+        entity_id: Optional[str] = None,
+        search: Optional[str] = None
+    ) -> int:
+        """Count audit entries matching the filters without fetching them.
+
+        Returns:
+            Number of matching entries
+        """
+        params: Dict[str, Any] = {}
+        if start_time:
+            params["start_time"] = start_time.isoformat()
+        if end_time:
+            params["end_time"] = end_time.isoformat()
+        if actor:
+            params["actor"] = actor
+        if event_type:
+            params["event_type"] = event_type
+        if entity_id:
+            params["entity_id"] = entity_id
+        if search:
+            params["search"] = search
+
+        data = await self._transport.request("GET", "/v1/audit/entries/count", params=params)
+        return int(data["total"])
+
     def query_iter(
         self,
         *,
@@ -185,6 +217,22 @@ class AuditResource:
         data = await self._transport.request("POST", "/v1/audit/export", params=params)
         return AuditExportResponse(**data)
     
+    async def start_verification(self, *, resume: bool = True) -> Dict[str, Any]:
+        """Start a background verification of the whole audit hash chain.
+
+        Args:
+            resume: Continue after the last verified checkpoint instead of starting at genesis
+
+        Returns:
+            Verification progress (state, sequences checked, percent complete)
+        """
+        params = {"resume": str(resume).lower()}
+        return await self._transport.request("POST", "/v1/audit/verify", params=params)
+
+    async def verification_progress(self) -> Dict[str, Any]:
+        """Get progress of the current or last chain verification, including its result once completed."""
+        return await self._transport.request("GET", "/v1/audit/verify")
+
     # Aliases for backward compatibility with tests
     async def entries(self, limit: int = 20) -> AuditEntriesResponse:
         """Get recent audit entries. Alias for query_entries."""
@@ -0,0 +1,207 @@
+"""
+Tests for memory graph layout caching.
+
+Tests cover:
+- Graph version changes when nodes or edges change
+- Cached layouts reused for the same view and graph version
+- Incremental force layouts keeping surviving node positions
+- The /memory/visualize/layout JSON endpoint and SVG cache header
+- Version probe and timeline sampling queries kept off the event loop
+"""
+import threading
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from ciris_engine.logic.adapters.api.dependencies.auth import require_observer
+from ciris_engine.logic.adapters.api.routes import memory as memory_routes
+from ciris_engine.logic.adapters.api.services.graph_layout import (
+    LayoutCache,
+    build_layout,
+    compute_layout,
+    get_graph_version,
+    layout_cache,
+    make_view,
+)
+from ciris_engine.logic.persistence.db.core import get_db_connection, initialize_database
+from ciris_engine.logic.persistence.models.graph import add_graph_edge, add_graph_node
+from ciris_engine.schemas.services.graph_core import GraphEdge, GraphEdgeAttributes, GraphNode, GraphScope, NodeType
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "graph.db")
+    initialize_database(path)
+    return path
+
+
+@pytest.fixture
+def time_service():
+    service = MagicMock()
+    service.now.return_value = datetime.now(timezone.utc)
+    return service
+
+
+@pytest.fixture(autouse=True)
+def clear_layout_cache():
+    layout_cache.clear()
+    yield
+    layout_cache.clear()
+
+
+def _node(node_id):
+    return GraphNode(id=node_id, type=NodeType.CONCEPT, scope=GraphScope.LOCAL, attributes={"title": node_id})
+
+
+def _view(**overrides):
+    params = dict(
+        scope=GraphScope.LOCAL, node_type=None, layout="force", hours=None,
+        limit=500, include_metrics=False, width=800, height=600,
+    )
+    params.update(overrides)
+    return make_view(**params)
+
+
+class TestGraphVersion:
+    """The version probe tracks changes to a scope."""
+
+    def test_version_moves_with_nodes_and_edges(self, db_path, time_service):
+        empty = get_graph_version("local", db_path=db_path)
+        add_graph_node(_node("a"), time_service, db_path=db_path)
+        add_graph_node(_node("b"), time_service, db_path=db_path)
+        with_nodes = get_graph_version("local", db_path=db_path)
+        add_graph_edge(GraphEdge(
+            source="a", target="b", relationship="related_to", scope=GraphScope.LOCAL,
+            attributes=GraphEdgeAttributes(),
+        ), db_path=db_path)
+
+        assert len({empty, with_nodes, get_graph_version("local", db_path=db_path)}) == 3
+        assert get_graph_version("identity", db_path=db_path) == empty
+
+
+class TestLayoutCache:
+    """Layouts are cached per view and graph version."""
+
+    @pytest.mark.asyncio
+    async def test_hit_requires_matching_version(self, db_path):
+        cache = LayoutCache()
+        view = _view()
+        layout = await compute_layout(view, "v1", [_node("a"), _node("b")], db_path=db_path, cache=cache)
+
+        assert cache.get(view, "v1") is layout
+        assert cache.get(view, "v2") is None
+        assert cache.get(_view(layout="hierarchical"), "v1") is None
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert layout.svg() is layout.svg()
+
+    def test_windowed_views_bucket_the_clock(self):
+        now = datetime(2025, 1, 1, 12, 0, 5, tzinfo=timezone.utc)
+        later = datetime(2025, 1, 1, 12, 0, 30, tzinfo=timezone.utc)
+        next_minute = datetime(2025, 1, 1, 12, 1, 5, tzinfo=timezone.utc)
+
+        assert _view(hours=24, now=now) == _view(hours=24, now=later)
+        assert _view(hours=24, now=now) != _view(hours=24, now=next_minute)
+        assert _view(now=now) == _view(now=next_minute)
+
+    def test_cache_is_bounded(self, db_path):
+        cache = LayoutCache(max_views=2)
+        for width in (800, 900, 1000):
+            cache.put(build_layout(_view(width=width), "v1", [_node("a")], db_path=db_path))
+
+        assert cache.latest(_view(width=800)) is None
+        assert cache.latest(_view(width=1000)) is not None
+
+
+class TestIncrementalLayout:
+    """Small graph changes keep existing positions."""
+
+    def test_new_nodes_are_placed_around_fixed_ones(self, db_path):
+        view = _view()
+        nodes = [_node(f"n{i}") for i in range(12)]
+        first = build_layout(view, "v1", nodes, db_path=db_path)
+        second = build_layout(view, "v2", nodes + [_node("new")], db_path=db_path, previous=first)
+
+        assert not first.incremental
+        assert second.incremental
+        assert "new" in second.positions
+        for node in nodes:
+            assert second.raw_positions[node.id] == pytest.approx(first.raw_positions[node.id])
+
+    def test_large_changes_relayout_from_scratch(self, db_path):
+        view = _view()
+        first = build_layout(view, "v1", [_node(f"a{i}") for i in range(5)], db_path=db_path)
+        second = build_layout(view, "v2", [_node(f"b{i}") for i in range(40)], db_path=db_path, previous=first)
+
+        assert not second.incremental
+
+
+class TestLayoutEndpoints:
+    """The JSON layout endpoint and SVG endpoint share the cache."""
+
+    @pytest.fixture
+    def app(self, db_path, time_service):
+        for node_id in ("a", "b", "c"):
+            add_graph_node(_node(node_id), time_service, db_path=db_path)
+        add_graph_edge(GraphEdge(
+            source="a", target="b", relationship="related_to", scope=GraphScope.LOCAL,
+            attributes=GraphEdgeAttributes(),
+        ), db_path=db_path)
+
+        memory_service = MagicMock()
+        memory_service.db_path = db_path
+        memory_service.recall = AsyncMock(return_value=[_node("a"), _node("b"), _node("c")])
+        app = FastAPI()
+        app.include_router(memory_routes.router, prefix="/v1")
+        app.state.memory_service = memory_service
+        app.dependency_overrides[require_observer] = lambda: None
+        return app
+
+    @pytest.mark.asyncio
+    async def test_layout_json_then_cached_svg(self, app, db_path, time_service):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get("/v1/memory/visualize/layout", params={"width": 800, "height": 600})
+            svg = await client.get("/v1/memory/visualize/graph", params={"width": 800, "height": 600})
+            add_graph_node(_node("d"), time_service, db_path=db_path)
+            after_write = await client.get("/v1/memory/visualize/layout", params={"width": 800, "height": 600})
+
+        data = first.json()["data"]
+        assert first.status_code == 200
+        assert not data["cached"]
+        assert {node["id"] for node in data["nodes"]} == {"a", "b", "c"}
+        assert [(edge["source"], edge["target"]) for edge in data["edges"]] == [("a", "b")]
+        assert svg.headers["x-layout-cache"] == "HIT"
+        assert svg.text.startswith("<svg")
+        assert not after_write.json()["data"]["cached"]
+        assert after_write.json()["data"]["graph_version"] != data["graph_version"]
+        assert app.state.memory_service.recall.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_timeline_queries_run_off_the_event_loop(self, app, db_path, monkeypatch):
+        loop_thread = threading.get_ident()
+        query_threads = []
+
+        def probe(scope, path=None):
+            query_threads.append(threading.get_ident())
+            return get_graph_version(scope, db_path=path)
+
+        def connection():
+            query_threads.append(threading.get_ident())
+            return get_db_connection(db_path=db_path)
+
+        monkeypatch.setattr(memory_routes, "get_graph_version", probe)
+        monkeypatch.setattr(memory_routes, "get_db_connection", connection)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/v1/memory/visualize/layout", params={"layout": "timeline", "hours": 24}
+            )
+
+        assert response.status_code == 200
+        assert {node["id"] for node in response.json()["data"]["nodes"]} == {"a", "b", "c"}
+        assert len(query_threads) == 2
+        assert loop_thread not in query_threads
+        app.state.memory_service.recall.assert_not_awaited()
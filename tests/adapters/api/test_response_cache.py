@@ -0,0 +1,196 @@
+"""
+Tests for the API response cache middleware.
+
+Tests cover:
+- Hits within the route TTL and expiry after it
+- ETag and If-None-Match 304 responses
+- Role-aware keys and bypass for invalid credentials
+- Single-flight coalescing of concurrent misses
+- Hit/miss counters and the app wiring from adapter config
+"""
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+
+from ciris_engine.logic.adapters.api.app import create_app
+from ciris_engine.logic.adapters.api.config import APIAdapterConfig
+from ciris_engine.logic.adapters.api.middleware.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    ResponseCacheMiddleware,
+)
+from ciris_engine.logic.adapters.api.services.auth_service import APIAuthService
+from ciris_engine.schemas.api.auth import UserRole
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def cached_app():
+    clock = FakeClock()
+    cache = ResponseCache(route_ttls={"/stats": 5.0}, clock=clock)
+    middleware = ResponseCacheMiddleware(cache)
+    app = FastAPI()
+    app.state.auth_service = APIAuthService()
+    app.state.auth_service.store_api_key("observer-key", user_id="obs", role=UserRole.OBSERVER)
+    app.state.auth_service.store_api_key("admin-key", user_id="adm", role=UserRole.ADMIN)
+    calls = []
+
+    @app.middleware("http")
+    async def cache_wrapper(request: Request, call_next):
+        return await middleware(request, call_next)
+
+    @app.get("/stats")
+    async def stats(request: Request):
+        calls.append(request.headers.get("authorization"))
+        return {"calls": len(calls)}
+
+    @app.get("/uncached")
+    async def uncached():
+        calls.append("uncached")
+        return {"calls": len(calls)}
+
+    return app, cache, clock, calls
+
+
+def _client(app):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def _auth(key):
+    return {"Authorization": f"Bearer {key}"}
+
+
+class TestResponseCacheMiddleware:
+    """Caching through a FastAPI app."""
+
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl_and_refresh_after(self, cached_app):
+        app, cache, clock, calls = cached_app
+        async with _client(app) as client:
+            first = await client.get("/stats", headers=_auth("observer-key"))
+            second = await client.get("/stats", headers=_auth("observer-key"))
+            clock.now += 6
+            third = await client.get("/stats", headers=_auth("observer-key"))
+            await client.get("/uncached")
+            await client.get("/uncached")
+
+        assert (first.headers["x-cache"], second.headers["x-cache"], third.headers["x-cache"]) == ("MISS", "HIT", "MISS")
+        assert first.json() == second.json() == {"calls": 1}
+        assert third.json() == {"calls": 2}
+        assert first.headers["cache-control"] == "private, max-age=5"
+        assert len(calls) == 4
+        stats = cache.get_stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 1)
+        assert stats.routes["/stats"].hits == 1
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_returns_304(self, cached_app):
+        app, cache, _, _ = cached_app
+        async with _client(app) as client:
+            first = await client.get("/stats", headers=_auth("observer-key"))
+            etag = first.headers["etag"]
+            revalidated = await client.get("/stats", headers={**_auth("observer-key"), "If-None-Match": etag})
+            stale = await client.get("/stats", headers={**_auth("observer-key"), "If-None-Match": '"other"'})
+
+        assert revalidated.status_code == 304
+        assert revalidated.content == b""
+        assert revalidated.headers["etag"] == etag
+        assert stale.status_code == 200
+        assert cache.get_stats().not_modified == 1
+
+    @pytest.mark.asyncio
+    async def test_keys_are_role_aware_and_invalid_keys_bypass(self, cached_app):
+        app, cache, _, calls = cached_app
+        async with _client(app) as client:
+            await client.get("/stats", headers=_auth("observer-key"))
+            admin = await client.get("/stats", headers=_auth("admin-key"))
+            await client.get("/stats", headers=_auth("not-a-key"))
+            await client.get("/stats", headers=_auth("not-a-key"))
+            anonymous = await client.get("/stats")
+
+        assert admin.headers["x-cache"] == "MISS"
+        assert anonymous.headers["x-cache"] == "MISS"
+        assert calls.count("Bearer not-a-key") == 2
+        assert cache.get_stats().bypassed == 2
+
+    def test_app_wires_cache_from_adapter_config(self):
+        app = create_app(adapter_config=APIAdapterConfig())
+        assert "/v1/memory/stats" in app.state.response_cache.route_ttls
+
+        disabled = create_app(adapter_config=APIAdapterConfig(response_cache_enabled=False))
+        assert not hasattr(disabled.state, "response_cache")
+
+
+class TestSingleFlight:
+    """Concurrent identical misses run the handler once."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesce(self):
+        cache = ResponseCache(route_ttls={"/stats": 5.0})
+        release = asyncio.Event()
+        runs = []
+
+        async def compute():
+            runs.append(1)
+            await release.wait()
+            return CachedResponse(body=b"{}", status_code=200, headers={}, etag='"x"', expires_at=0.0)
+
+        key = ("/stats", "", "OBSERVER")
+        waiters = [asyncio.create_task(cache.fetch(key, 5.0, compute)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert len(runs) == 1
+        assert sorted(outcome for _, outcome in results) == ["COALESCED"] * 4 + ["MISS"]
+        assert cache.get_stats().coalesced == 4
+
+    @pytest.mark.asyncio
+    async def test_followers_recompute_when_leader_fails(self):
+        cache = ResponseCache(route_ttls={"/stats": 5.0})
+        release = asyncio.Event()
+        runs = []
+
+        async def compute():
+            runs.append(1)
+            await release.wait()
+            if len(runs) == 1:
+                raise RuntimeError("handler failed")
+            return CachedResponse(body=b"{}", status_code=200, headers={}, etag='"x"', expires_at=0.0)
+
+        key = ("/stats", "", "OBSERVER")
+        leader = asyncio.create_task(cache.fetch(key, 5.0, compute))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(cache.fetch(key, 5.0, compute))
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(RuntimeError):
+            await leader
+        entry, outcome = await follower
+        assert outcome == "MISS"
+        assert entry.status_code == 200
+        assert len(runs) == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_stored(self):
+        cache = ResponseCache(route_ttls={"/stats": 5.0})
+
+        async def compute():
+            return CachedResponse(body=b"{}", status_code=500, headers={}, etag="", expires_at=0.0)
+
+        key = ("/stats", "", "OBSERVER")
+        await cache.fetch(key, 5.0, compute)
+        _, outcome = await cache.fetch(key, 5.0, compute)
+
+        assert outcome == "MISS"
+        assert cache.get_stats().entries == 0
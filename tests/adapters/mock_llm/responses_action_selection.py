@@ -353,15 +353,15 @@ The mock LLM provides deterministic responses for testing CIRIS functionality of
         # Check if this is a follow-up thought by looking at the THOUGHT_TYPE in the system message
         is_followup = False
 
-        # The first message should be the system message with covenant
+        # THOUGHT_TYPE leads the per-thought system context message
         messages_to_check = messages_extracted if messages_extracted else messages or []
-        if messages_to_check and len(messages_to_check) > 0:
-            first_msg = messages_to_check[0]
-            if isinstance(first_msg, dict) and first_msg.get('role') == 'system':
-                msg_content = first_msg.get('content', '')
+        for msg in messages_to_check:
+            if isinstance(msg, dict) and msg.get('role') == 'system':
+                msg_content = msg.get('content', '')
                 # Check if this is a follow_up thought type
                 if msg_content.startswith('THOUGHT_TYPE=follow_up'):
                     is_followup = True
+                    break
 
         if is_followup:
             # Follow-up thought → TASK_COMPLETE
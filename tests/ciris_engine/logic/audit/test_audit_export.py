@@ -0,0 +1,200 @@
+"""
+Tests for the streaming audit exporter.
+
+Tests cover:
+- Compressed JSONL and CSV chunks that round-trip the exported rows
+- Size-based rotation with chunk boundaries that link up through the chain
+- Incremental exports resuming after the last exported sequence
+- Refusing to resume when the chain no longer links onto the export
+- Time windows widened to contiguous sequence ranges
+- Service-level one-shot and incremental exports
+"""
+import csv
+import gzip
+import io
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.audit import exporter as exporter_module
+from ciris_engine.logic.audit.exporter import AuditExporter
+from ciris_engine.logic.audit.hash_chain import AuditHashChain
+from ciris_engine.logic.audit.signature_manager import AuditSignatureManager
+from ciris_engine.logic.audit.writer import AuditChainWriter
+from ciris_engine.logic.services.graph.audit_service import GraphAuditService
+from ciris_engine.schemas.services.operations import MemoryOpResult, MemoryOpStatus
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _entry(i: int) -> dict:
+    return {
+        "event_id": f"event_{i}",
+        "event_timestamp": (BASE_TIME + timedelta(minutes=i)).isoformat(),
+        "event_type": "test_event",
+        "originator_id": "tester",
+        "actor": "tester",
+        "event_summary": "test_event by tester",
+        "event_payload": json.dumps({"index": i, "padding": "x" * 200}),
+    }
+
+
+@pytest.fixture
+def time_service():
+    return Mock(now=Mock(return_value=BASE_TIME), now_iso=Mock(return_value=BASE_TIME.isoformat()))
+
+
+@pytest.fixture
+async def audit_db(tmp_path, time_service):
+    db_path = str(tmp_path / "audit.db")
+    await GraphAuditService(time_service=time_service, db_path=db_path)._init_database()
+    signer = AuditSignatureManager(str(tmp_path / "keys"), db_path, time_service)
+    signer.initialize()
+    return db_path, signer
+
+
+async def _append(db_path, signer, start, count):
+    writer = AuditChainWriter(db_path, AuditHashChain(db_path), signer)
+    await writer.start()
+    for i in range(start, start + count):
+        await writer.submit(_entry(i))
+    await writer.stop()
+
+
+def _read_jsonl(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+class TestChunks:
+    """Rows are streamed into compressed, rotated chunks."""
+
+    @pytest.mark.asyncio
+    async def test_rotated_gzip_chunks_link_up(self, audit_db, tmp_path, time_service):
+        db_path, signer = audit_db
+        await _append(db_path, signer, 0, 40)
+        exporter = AuditExporter(db_path, tmp_path / "export", time_service, max_chunk_bytes=1, chunk_size=7)
+
+        manifest = exporter.export()
+
+        assert manifest.total_entries == 40
+        assert len(manifest.chunks) > 1
+        rows = [row for chunk in manifest.chunks for row in _read_jsonl(tmp_path / "export" / chunk.file_name)]
+        assert [row["sequence_number"] for row in rows] == list(range(1, 41))
+        assert manifest.chunks[0].first_previous_hash == "genesis"
+        for previous, current in zip(manifest.chunks, manifest.chunks[1:]):
+            assert current.first_sequence == previous.last_sequence + 1
+            assert current.first_previous_hash == previous.last_entry_hash
+        assert exporter.load_manifest() == manifest
+        assert not list((tmp_path / "export").glob("*.partial"))
+
+    @pytest.mark.asyncio
+    async def test_uncompressed_csv(self, audit_db, tmp_path, time_service):
+        db_path, signer = audit_db
+        await _append(db_path, signer, 0, 3)
+        exporter = AuditExporter(db_path, tmp_path / "export", time_service, format="csv", compression="none")
+
+        manifest = exporter.export()
+
+        text = (tmp_path / "export" / manifest.chunks[0].file_name).read_text(encoding="utf-8")
+        rows = list(csv.DictReader(io.StringIO(text)))
+        assert [row["event_id"] for row in rows] == ["event_0", "event_1", "event_2"]
+        assert json.loads(rows[1]["event_payload"])["index"] == 1
+
+    def test_zstd_requires_package(self, tmp_path, time_service, monkeypatch):
+        monkeypatch.setattr(exporter_module, "ZSTD_AVAILABLE", False)
+
+        with pytest.raises(ValueError):
+            AuditExporter(str(tmp_path / "audit.db"), tmp_path, time_service, compression="zstd")
+
+
+class TestIncremental:
+    """Incremental exports resume from the manifest."""
+
+    @pytest.mark.asyncio
+    async def test_resume_after_last_sequence(self, audit_db, tmp_path, time_service):
+        db_path, signer = audit_db
+        await _append(db_path, signer, 0, 10)
+        exporter = AuditExporter(db_path, tmp_path / "export", time_service)
+        exporter.export()
+        (tmp_path / "export" / "audit_000000000011.jsonl.gz.partial").write_bytes(b"torn")
+
+        await _append(db_path, signer, 10, 5)
+        manifest = exporter.export()
+        unchanged = exporter.export()
+
+        assert [(c.first_sequence, c.last_sequence) for c in manifest.chunks] == [(1, 10), (11, 15)]
+        assert manifest.last_sequence == 15
+        assert unchanged.total_entries == 15
+        assert not list((tmp_path / "export").glob("*.partial"))
+
+    @pytest.mark.asyncio
+    async def test_refuses_when_chain_does_not_link(self, audit_db, tmp_path, time_service):
+        db_path, signer = audit_db
+        await _append(db_path, signer, 0, 5)
+        exporter = AuditExporter(db_path, tmp_path / "export", time_service)
+        exporter.export()
+        await _append(db_path, signer, 5, 2)
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE audit_log SET previous_hash = ? WHERE sequence_number = 6", ("0" * 64,))
+        conn.commit()
+        conn.close()
+
+        with pytest.raises(ValueError, match="sequence 6"):
+            exporter.export()
+        assert exporter.load_manifest().last_sequence == 5
+
+    @pytest.mark.asyncio
+    async def test_format_mismatch_rejected(self, audit_db, tmp_path, time_service):
+        db_path, signer = audit_db
+        await _append(db_path, signer, 0, 2)
+        AuditExporter(db_path, tmp_path / "export", time_service).export()
+
+        with pytest.raises(ValueError):
+            AuditExporter(db_path, tmp_path / "export", time_service, format="csv").export()
+
+    @pytest.mark.asyncio
+    async def test_time_window(self, audit_db, tmp_path, time_service):
+        db_path, signer = audit_db
+        await _append(db_path, signer, 0, 10)
+        exporter = AuditExporter(db_path, tmp_path / "export", time_service)
+
+        manifest = exporter.export(start_time=BASE_TIME + timedelta(minutes=3),
+                                   end_time=BASE_TIME + timedelta(minutes=5))
+
+        assert (manifest.first_sequence, manifest.last_sequence) == (4, 6)
+
+
+class TestServiceExports:
+    """The audit service streams exports from audit_log."""
+
+    @pytest.mark.asyncio
+    async def test_one_shot_and_incremental(self, tmp_path, time_service):
+        memory_bus = Mock()
+        memory_bus.memorize = AsyncMock(return_value=MemoryOpResult(status=MemoryOpStatus.OK))
+        service = GraphAuditService(
+            memory_bus=memory_bus,
+            time_service=time_service,
+            db_path=str(tmp_path / "audit.db"),
+            key_path=str(tmp_path / "keys"),
+            export_path=str(tmp_path / "exports" / "audit_logs.jsonl"),
+        )
+        await service.start()
+        try:
+            for i in range(4):
+                await service.log_event("test_event", {"entity_id": f"entity_{i}"})
+            manifest_path = await service.export_audit_data(format="jsonl")
+            incremental = await service.export_incremental()
+        finally:
+            await service.stop()
+
+        one_shot = json.loads(open(manifest_path, encoding="utf-8").read())
+        assert one_shot["total_entries"] == 4
+        assert incremental.last_sequence == 4
+        assert service._export_buffer == []
+        # stop() exports the shutdown event too
+        final = AuditExporter(str(tmp_path / "audit.db"), service.export_stream_dir, time_service).load_manifest()
+        assert final.last_sequence == 5
@@ -0,0 +1,189 @@
+"""
+Tests for SQL-backed audit queries.
+
+Tests cover:
+- Filtering by event type, actor, entity, time range and summary text
+- Keyset pagination across pages without gaps or repeats
+- Counting without loading rows
+- Summary-only projection leaving the payload unread
+- Recovering the actor column on databases created before it existed
+- Service queries reading entries still queued for the chain writer
+"""
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.audit.hash_chain import AuditHashChain
+from ciris_engine.logic.audit.query import count_entries, decode_cursor, fetch_page
+from ciris_engine.logic.audit.signature_manager import AuditSignatureManager
+from ciris_engine.logic.audit.writer import AuditChainWriter
+from ciris_engine.logic.services.graph.audit_service import GraphAuditService
+from ciris_engine.schemas.services.graph.audit import AuditQuery
+from ciris_engine.schemas.services.operations import MemoryOpResult, MemoryOpStatus
+
+BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _entry(i: int) -> dict:
+    event_type = "tool_call" if i % 2 else "speak"
+    actor = "handler_a" if i % 3 else "handler_b"
+    return {
+        "event_id": f"event_{i}",
+        "event_timestamp": (BASE_TIME + timedelta(minutes=i)).isoformat(),
+        "event_type": event_type,
+        "originator_id": f"thought_{i % 4}",
+        "actor": actor,
+        "event_summary": f"{event_type} by {actor}",
+        "event_payload": f'{{"index": {i}, "handler_name": "{actor}"}}',
+    }
+
+
+@pytest.fixture
+def time_service():
+    return Mock(now=Mock(return_value=BASE_TIME), now_iso=Mock(return_value=BASE_TIME.isoformat()))
+
+
+@pytest.fixture
+async def audit_db(tmp_path, time_service):
+    """Audit database with the service's schema and 20 chained entries."""
+    db_path = str(tmp_path / "audit.db")
+    await GraphAuditService(time_service=time_service, db_path=db_path)._init_database()
+    signer = AuditSignatureManager(str(tmp_path / "keys"), db_path, time_service)
+    signer.initialize()
+    writer = AuditChainWriter(db_path, AuditHashChain(db_path), signer)
+    await writer.start()
+    for i in range(20):
+        await writer.submit(_entry(i))
+    await writer.stop()
+    return db_path
+
+
+class TestFilters:
+    """Filters become WHERE clauses on indexed columns."""
+
+    @pytest.mark.asyncio
+    async def test_filters_match(self, audit_db):
+        by_type, _, _ = fetch_page(audit_db, AuditQuery(event_type="tool_call", limit=None))
+        by_actor, _, _ = fetch_page(audit_db, AuditQuery(actor="handler_b", limit=None))
+        by_entity, _, _ = fetch_page(audit_db, AuditQuery(entity_id="thought_1", limit=None))
+        by_text, _, _ = fetch_page(audit_db, AuditQuery(search_text="SPEAK BY HANDLER_B", limit=None))
+
+        assert {r["event_id"] for r in by_type} == {f"event_{i}" for i in range(1, 20, 2)}
+        assert {r["event_id"] for r in by_actor} == {f"event_{i}" for i in range(0, 20, 3)}
+        assert {r["event_id"] for r in by_entity} == {"event_1", "event_5", "event_9", "event_13", "event_17"}
+        assert {r["event_id"] for r in by_text} == {"event_0", "event_6", "event_12", "event_18"}
+
+    @pytest.mark.asyncio
+    async def test_time_range_accepts_naive_utc(self, audit_db):
+        query = AuditQuery(
+            start_time=datetime(2025, 1, 1, 0, 5),
+            end_time=BASE_TIME + timedelta(minutes=7),
+            order_desc=False,
+        )
+
+        rows, _, _ = fetch_page(audit_db, query)
+
+        assert [r["event_id"] for r in rows] == ["event_5", "event_6", "event_7"]
+
+
+class TestPagination:
+    """Keyset cursors walk the result set."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_cover_everything_once(self, audit_db):
+        seen = []
+        cursor = None
+        while True:
+            rows, cursor, has_more = fetch_page(audit_db, AuditQuery(limit=6, cursor=cursor))
+            seen.extend(r["event_id"] for r in rows)
+            if not has_more:
+                break
+
+        assert seen == [f"event_{i}" for i in range(19, -1, -1)]
+        assert cursor is None
+
+    def test_malformed_cursor_rejected(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_count_ignores_paging(self, audit_db):
+        query = AuditQuery(event_type="speak", limit=2, offset=3)
+
+        assert count_entries(audit_db, query) == 10
+        assert count_entries(audit_db, AuditQuery()) == 20
+
+    @pytest.mark.asyncio
+    async def test_summary_projection_skips_payload(self, audit_db):
+        rows, _, _ = fetch_page(audit_db, AuditQuery(limit=1, include_details=False))
+
+        assert "event_payload" not in rows[0]
+        assert "entry_hash" not in rows[0]
+
+
+class TestSchema:
+    """Databases created before the actor column are migrated."""
+
+    @pytest.mark.asyncio
+    async def test_actor_backfilled_from_summary(self, tmp_path, time_service):
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE audit_log (
+                entry_id INTEGER PRIMARY KEY AUTOINCREMENT, event_id TEXT NOT NULL UNIQUE,
+                event_timestamp TEXT NOT NULL, event_type TEXT NOT NULL, originator_id TEXT NOT NULL,
+                target_id TEXT, event_summary TEXT, event_payload TEXT, sequence_number INTEGER NOT NULL,
+                previous_hash TEXT NOT NULL, entry_hash TEXT NOT NULL, signature TEXT NOT NULL,
+                signing_key_id TEXT NOT NULL, created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "INSERT INTO audit_log (event_id, event_timestamp, event_type, originator_id, event_summary, "
+            "sequence_number, previous_hash, entry_hash, signature, signing_key_id) "
+            "VALUES ('e1', '2025-01-01T00:00:00+00:00', 'speak', 't1', 'speak by handler by proxy', 1, 'genesis', 'h', 's', 'k')"
+        )
+        conn.commit()
+        conn.close()
+
+        await GraphAuditService(time_service=time_service, db_path=db_path)._init_database()
+        rows, _, _ = fetch_page(db_path, AuditQuery(actor="handler by proxy"))
+
+        assert [r["event_id"] for r in rows] == ["e1"]
+
+
+class TestServiceQueries:
+    """The service answers queries from audit_log."""
+
+    @pytest.mark.asyncio
+    async def test_query_sees_queued_entries(self, tmp_path, time_service):
+        memory_bus = Mock()
+        memory_bus.memorize = AsyncMock(return_value=MemoryOpResult(status=MemoryOpStatus.OK))
+        memory_bus.search = AsyncMock(return_value=[])
+        service = GraphAuditService(
+            memory_bus=memory_bus,
+            time_service=time_service,
+            db_path=str(tmp_path / "audit.db"),
+            key_path=str(tmp_path / "keys"),
+            hash_chain_flush_interval_ms=10000,
+            hash_chain_wait_for_commit=False,
+        )
+        await service.start()
+        try:
+            for i in range(3):
+                await service.log_event("test_event", {"entity_id": f"entity_{i}", "actor": "tester"})
+
+            page = await service.query_audit_page(AuditQuery(actor="tester", limit=2))
+            total = await service.count_audit_entries(AuditQuery(event_type="test_event"))
+        finally:
+            await service.stop()
+
+        memory_bus.search.assert_not_called()
+        assert len(page.entries) == 2
+        assert page.has_more and page.next_cursor
+        assert total == 3
+        entry = page.entries[0]
+        assert entry.actor == "tester"
+        assert entry.action == "test_event"
+        assert entry.context.additional_data["entity_id"] in {"entity_0", "entity_1", "entity_2"}
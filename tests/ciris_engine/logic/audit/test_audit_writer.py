@@ -0,0 +1,243 @@
+"""
+Tests for the group-commit audit hash chain writer.
+
+Tests cover:
+- Size- and interval-triggered batch commits
+- Committing early for callers waiting on their entry
+- In-order hashing and signing that verifies as a valid chain
+- Resuming from an existing chain tip
+- Rolling back the in-memory tip when a batch fails
+- GraphAuditService routing log calls through the writer
+"""
+import asyncio
+import sqlite3
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.audit.hash_chain import AuditHashChain
+from ciris_engine.logic.audit.signature_manager import AuditSignatureManager
+from ciris_engine.logic.audit.writer import AuditChainWriter
+from ciris_engine.logic.services.graph.audit_service import GraphAuditService
+from ciris_engine.schemas.services.operations import MemoryOpResult, MemoryOpStatus
+
+AUDIT_TABLES = """
+CREATE TABLE IF NOT EXISTS audit_log (
+    entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL UNIQUE,
+    event_timestamp TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    originator_id TEXT NOT NULL,
+    actor TEXT,
+    target_id TEXT,
+    event_summary TEXT,
+    event_payload TEXT,
+    sequence_number INTEGER NOT NULL,
+    previous_hash TEXT NOT NULL,
+    entry_hash TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    signing_key_id TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(sequence_number)
+);
+CREATE TABLE IF NOT EXISTS audit_signing_keys (
+    key_id TEXT PRIMARY KEY,
+    public_key TEXT NOT NULL,
+    algorithm TEXT NOT NULL DEFAULT 'rsa-pss',
+    key_size INTEGER NOT NULL DEFAULT 2048,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    revoked_at TEXT
+);
+"""
+
+
+@pytest.fixture
+def time_service():
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return Mock(now=Mock(return_value=now), now_iso=Mock(return_value=now.isoformat()))
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "audit.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(AUDIT_TABLES)
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def signer(tmp_path, db_path, time_service):
+    manager = AuditSignatureManager(str(tmp_path / "keys"), db_path, time_service)
+    manager.initialize()
+    return manager
+
+
+def _entry(i: int) -> dict:
+    return {
+        "event_id": f"event_{i}",
+        "event_timestamp": f"2025-01-01T00:00:{i % 60:02d}+00:00",
+        "event_type": "test_event",
+        "originator_id": "tester",
+        "event_summary": f"test_event {i}",
+        "event_payload": f'{{"index": {i}}}',
+    }
+
+
+def _sequences(db_path: str) -> list:
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT sequence_number FROM audit_log ORDER BY sequence_number").fetchall()
+    conn.close()
+    return [row[0] for row in rows]
+
+
+class TestBatching:
+    """Entries are committed in batches bounded by size and time."""
+
+    @pytest.mark.asyncio
+    async def test_size_triggered_batches(self, db_path, signer):
+        chain = AuditHashChain(db_path)
+        writer = AuditChainWriter(db_path, chain, signer, flush_batch_size=4, flush_interval_ms=10000)
+        await writer.start()
+
+        for i in range(10):
+            await writer.submit(_entry(i))
+        await writer.flush()
+
+        stats = writer.get_stats()
+        await writer.stop()
+
+        assert stats.entries_written == 10
+        assert stats.batches_committed == 3
+        assert stats.largest_batch == 4
+        assert _sequences(db_path) == list(range(1, 11))
+        assert chain.verify_chain_integrity().valid
+
+    @pytest.mark.asyncio
+    async def test_interval_triggered_flush(self, db_path, signer):
+        chain = AuditHashChain(db_path)
+        writer = AuditChainWriter(db_path, chain, signer, flush_batch_size=1000, flush_interval_ms=20)
+        await writer.start()
+
+        committed = await asyncio.wait_for(writer.submit(_entry(0), wait=True), timeout=5)
+        await writer.stop()
+
+        assert committed["sequence_number"] == 1
+        assert committed["previous_hash"] == "genesis"
+        assert signer.verify_signature(committed["entry_hash"], committed["signature"])
+
+    @pytest.mark.asyncio
+    async def test_waiting_caller_not_held_for_interval(self, db_path, signer):
+        writer = AuditChainWriter(db_path, AuditHashChain(db_path), signer,
+                                  flush_batch_size=1000, flush_interval_ms=60000)
+        await writer.start()
+
+        committed = await asyncio.wait_for(writer.submit(_entry(0), wait=True), timeout=5)
+        await writer.stop()
+
+        assert committed["sequence_number"] == 1
+        assert _sequences(db_path) == [1]
+
+    @pytest.mark.asyncio
+    async def test_stop_commits_pending_entries(self, db_path, signer):
+        writer = AuditChainWriter(db_path, AuditHashChain(db_path), signer, flush_interval_ms=10000)
+        await writer.start()
+
+        for i in range(5):
+            await writer.submit(_entry(i))
+        await writer.stop()
+
+        assert _sequences(db_path) == [1, 2, 3, 4, 5]
+        with pytest.raises(RuntimeError):
+            await writer.submit(_entry(99))
+
+
+class TestChainState:
+    """The writer owns the chain tip and keeps it consistent."""
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_existing_tip(self, db_path, signer):
+        first = AuditChainWriter(db_path, AuditHashChain(db_path), signer)
+        await first.start()
+        for i in range(3):
+            await first.submit(_entry(i))
+        await first.stop()
+
+        chain = AuditHashChain(db_path)
+        second = AuditChainWriter(db_path, chain, signer)
+        await second.start()
+        resumed = await second.submit(_entry(3), wait=True)
+        await second.stop()
+
+        assert resumed["sequence_number"] == 4
+        assert chain.verify_chain_integrity().valid
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_restores_tip(self, db_path, signer):
+        chain = AuditHashChain(db_path)
+        writer = AuditChainWriter(db_path, chain, signer, flush_batch_size=1)
+        await writer.start()
+
+        await writer.submit(_entry(0), wait=True)
+        with pytest.raises(sqlite3.IntegrityError):
+            await writer.submit(_entry(0), wait=True)  # duplicate event_id
+        after = await writer.submit(_entry(1), wait=True)
+
+        stats = writer.get_stats()
+        await writer.stop()
+
+        assert after["sequence_number"] == 2
+        assert stats.failed_entries == 1
+        assert chain.verify_chain_integrity().valid
+
+
+class TestGraphAuditServiceIntegration:
+    """GraphAuditService appends through the writer."""
+
+    @pytest.mark.asyncio
+    async def test_logged_events_form_valid_chain(self, tmp_path, time_service):
+        memory_bus = Mock()
+        memory_bus.memorize = AsyncMock(return_value=MemoryOpResult(status=MemoryOpStatus.OK))
+        service = GraphAuditService(
+            memory_bus=memory_bus,
+            time_service=time_service,
+            db_path=str(tmp_path / "audit.db"),
+            key_path=str(tmp_path / "keys"),
+            hash_chain_flush_entries=8,
+        )
+        await service.start()
+        try:
+            await asyncio.gather(*[
+                service.log_event("test_event", {"entity_id": f"entity_{i}"}) for i in range(20)
+            ])
+            report = await service.verify_audit_integrity()
+            metrics = service._collect_custom_metrics()
+        finally:
+            await service.stop()
+
+        assert report.verified
+        assert report.total_entries == 20
+        assert metrics["hash_chain_entries_written"] == 20.0
+        assert metrics["hash_chain_batches_committed"] < 20
+
+    @pytest.mark.asyncio
+    async def test_log_call_returns_after_commit_by_default(self, tmp_path, time_service):
+        memory_bus = Mock()
+        memory_bus.memorize = AsyncMock(return_value=MemoryOpResult(status=MemoryOpStatus.OK))
+        db_path = str(tmp_path / "audit.db")
+        service = GraphAuditService(
+            memory_bus=memory_bus,
+            time_service=time_service,
+            db_path=db_path,
+            key_path=str(tmp_path / "keys"),
+            hash_chain_flush_interval_ms=60000,
+        )
+        await service.start()
+        try:
+            await asyncio.wait_for(service.log_event("test_event", {"entity_id": "entity_0"}), timeout=5)
+            committed = _sequences(db_path)
+        finally:
+            await service.stop()
+
+        assert committed == [1]
@@ -0,0 +1,250 @@
+"""
+Tests for Merkle-root batch signing of audit entries.
+
+Tests cover:
+- Tree construction and inclusion proofs for every leaf count
+- Writer in merkle mode: one signed root per batch plus stored proofs
+- Verifier checking roots once per batch and detecting tampering
+- Single-entry verification through the inclusion proof
+- Mixed chains with per-entry and batch-signed entries
+"""
+import hashlib
+import sqlite3
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from ciris_engine.logic.audit.hash_chain import AuditHashChain
+from ciris_engine.logic.audit.merkle import (
+    build_tree, inclusion_proof, merkle_root, verify_inclusion
+)
+from ciris_engine.logic.audit.verifier import AuditVerifier
+from ciris_engine.logic.audit.writer import AuditChainWriter, SIGNING_MODE_MERKLE
+from ciris_engine.logic.services.graph.audit_service import GraphAuditService
+
+
+def _hashes(count: int) -> list:
+    return [hashlib.sha256(str(i).encode()).hexdigest() for i in range(count)]
+
+
+def _entry(i: int) -> dict:
+    return {
+        "event_id": f"event_{i}",
+        "event_timestamp": "2025-01-01T00:00:00+00:00",
+        "event_type": "test_event",
+        "originator_id": "tester",
+        "event_summary": "test_event by tester",
+        "event_payload": f'{{"index": {i}}}',
+    }
+
+
+@pytest.fixture
+def time_service():
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return Mock(now=Mock(return_value=now), now_iso=Mock(return_value=now.isoformat()))
+
+
+@pytest.fixture
+async def audit_env(tmp_path, time_service):
+    """Audit database with the service's schema, plus a verifier sharing its keys."""
+    db_path = str(tmp_path / "audit.db")
+    key_path = str(tmp_path / "keys")
+    await GraphAuditService(time_service=time_service, db_path=db_path, key_path=key_path)._init_database()
+    verifier = AuditVerifier(db_path, key_path, time_service)
+    verifier.initialize()
+    return db_path, verifier
+
+
+async def _write(db_path, signer, count, batch_size, mode=SIGNING_MODE_MERKLE, start=0):
+    writer = AuditChainWriter(db_path, AuditHashChain(db_path), signer,
+                              flush_batch_size=batch_size, flush_interval_ms=10000, signing_mode=mode)
+    await writer.start()
+    for i in range(start, start + count):
+        await writer.submit(_entry(i))
+    await writer.stop()
+
+
+class TestMerkleTree:
+    """Tree construction and inclusion proofs."""
+
+    @pytest.mark.parametrize("count", [1, 2, 3, 5, 8, 13])
+    def test_every_leaf_has_a_valid_proof(self, count):
+        leaves = _hashes(count)
+        levels = build_tree(leaves)
+        root = levels[-1][0].hex()
+
+        for index, leaf in enumerate(leaves):
+            assert verify_inclusion(leaf, inclusion_proof(levels, index), root)
+
+    def test_proof_rejects_other_leaf_and_odd_extension(self):
+        leaves = _hashes(3)
+        levels = build_tree(leaves)
+        root = levels[-1][0].hex()
+
+        assert not verify_inclusion(_hashes(4)[3], inclusion_proof(levels, 0), root)
+        # Promoting (not duplicating) the odd leaf keeps N and N+1 leaf trees distinct
+        assert merkle_root(leaves) != merkle_root(leaves + [leaves[-1]])
+
+    def test_empty_tree_rejected(self):
+        with pytest.raises(ValueError):
+            merkle_root([])
+
+
+class TestMerkleWriter:
+    """The writer signs one root per batch."""
+
+    @pytest.mark.asyncio
+    async def test_one_root_signature_per_batch(self, audit_env):
+        db_path, verifier = audit_env
+        signer = verifier.signature_manager
+        calls = []
+        original = signer.sign_entry
+        signer.sign_entry = lambda data: calls.append(data) or original(data)
+
+        await _write(db_path, signer, count=10, batch_size=4)
+
+        conn = sqlite3.connect(db_path)
+        roots = conn.execute("SELECT sequence_start, sequence_end FROM audit_roots ORDER BY root_id").fetchall()
+        proofs = conn.execute("SELECT COUNT(*) FROM audit_merkle_proofs").fetchone()[0]
+        signatures = {row[0] for row in conn.execute("SELECT signature FROM audit_log")}
+        conn.close()
+
+        assert roots == [(1, 4), (5, 8), (9, 10)]
+        assert len(calls) == 3
+        assert proofs == 10
+        assert all(sig.startswith("merkle:") for sig in signatures)
+
+
+class TestMerkleVerification:
+    """The verifier checks batch roots and inclusion proofs."""
+
+    @pytest.mark.asyncio
+    async def test_valid_chain_verifies(self, audit_env):
+        db_path, verifier = audit_env
+        await _write(db_path, verifier.signature_manager, count=12, batch_size=5)
+
+        result = verifier.verify_complete_chain()
+
+        assert result.valid
+        assert result.entries_verified == 12
+        assert verifier.verify_root_anchors().valid
+
+    @pytest.mark.asyncio
+    async def test_single_entry_verifies_with_proof(self, audit_env):
+        db_path, verifier = audit_env
+        await _write(db_path, verifier.signature_manager, count=7, batch_size=7)
+
+        assert all(verifier.verify_entry(entry_id).valid for entry_id in range(1, 8))
+
+    @pytest.mark.asyncio
+    async def test_tampered_root_signature_detected(self, audit_env):
+        db_path, verifier = audit_env
+        await _write(db_path, verifier.signature_manager, count=6, batch_size=3)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE audit_roots SET root_hash = ? WHERE root_id = 2", ("0" * 64,))
+        conn.commit()
+        conn.close()
+
+        result = verifier.verify_complete_chain()
+
+        assert not result.signatures_valid
+        assert any("Merkle root 2" in error for error in result.signature_errors)
+        assert not verifier.verify_entry(5).signature_valid
+        assert verifier.verify_entry(1).valid
+
+    @pytest.mark.asyncio
+    async def test_rewritten_entry_breaks_root(self, audit_env):
+        db_path, verifier = audit_env
+        await _write(db_path, verifier.signature_manager, count=4, batch_size=4)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE audit_log SET entry_hash = ? WHERE sequence_number = 2", ("f" * 64,))
+        conn.commit()
+        conn.close()
+
+        result = verifier.verify_complete_chain()
+
+        assert not result.valid
+        assert any("mismatch" in error for error in result.signature_errors)
+
+    @pytest.mark.asyncio
+    async def test_mixed_signing_modes(self, audit_env):
+        db_path, verifier = audit_env
+        await _write(db_path, verifier.signature_manager, count=3, batch_size=3, mode="entry")
+        await _write(db_path, verifier.signature_manager, count=3, batch_size=3, start=3)
+
+        result = verifier.verify_complete_chain()
+
+        assert result.valid
+        assert result.entries_verified == 6
+        assert verifier.verify_range(2, 5).valid
+
+
+def _append_forged(db_path, marker):
+    """Append an unsigned entry with a correct chain link that claims a batch root."""
+    entry = AuditHashChain(db_path).prepare_entry(_entry(99))
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        """INSERT INTO audit_log
+           (event_id, event_timestamp, event_type, originator_id, actor, event_summary, event_payload,
+            sequence_number, previous_hash, entry_hash, signature, signing_key_id)
+           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        (entry["event_id"], entry["event_timestamp"], entry["event_type"], entry["originator_id"],
+         entry["originator_id"], entry["event_summary"], entry["event_payload"], entry["sequence_number"],
+         entry["previous_hash"], entry["entry_hash"], marker, "forged")
+    )
+    conn.commit()
+    conn.close()
+    return entry
+
+
+class TestMerkleForgery:
+    """A Merkle marker only vouches for entries the root actually covers."""
+
+    @pytest.mark.asyncio
+    async def test_entry_outside_root_range_rejected(self, audit_env):
+        db_path, verifier = audit_env
+        await _write(db_path, verifier.signature_manager, count=4, batch_size=4)
+        forged = _append_forged(db_path, "merkle:1")
+        assert forged["sequence_number"] == 5
+
+        signatures = verifier._verify_all_signatures()
+
+        assert not signatures.valid
+        assert signatures.entries_verified == 4
+        assert not verifier.verify_entry(5).signature_valid
+        assert not verifier.verify_range(1, 5).valid
+
+    @pytest.mark.asyncio
+    async def test_missing_proof_rejected(self, audit_env):
+        db_path, verifier = audit_env
+        await _write(db_path, verifier.signature_manager, count=4, batch_size=4)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("DELETE FROM audit_merkle_proofs WHERE sequence_number = 3")
+        conn.commit()
+        conn.close()
+
+        signatures = verifier._verify_all_signatures()
+
+        assert not signatures.valid
+        assert signatures.entries_verified == 3
+        assert any("entry 3" in error for error in signatures.errors)
+        assert not verifier.verify_entry(3).signature_valid
+
+    @pytest.mark.asyncio
+    async def test_proof_for_other_root_rejected(self, audit_env):
+        db_path, verifier = audit_env
+        await _write(db_path, verifier.signature_manager, count=6, batch_size=3)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE audit_merkle_proofs SET root_id = 2 WHERE sequence_number = 1")
+        conn.commit()
+        conn.close()
+
+        signatures = verifier._verify_all_signatures()
+
+        assert not signatures.valid
+        assert signatures.entries_verified == 5
@@ -0,0 +1,239 @@
+"""
+Tests for streaming, checkpointed audit chain verification.
+
+Tests cover:
+- Chunked row streaming with the same results as a full pass
+- Checkpointing the verified prefix and resuming after it
+- Falling back to genesis when the checkpointed entry changed
+- Signature checks in a process pool
+- Progress reporting, cancellation and the service-level background run
+"""
+import sqlite3
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.audit import verifier as verifier_module
+from ciris_engine.logic.audit.hash_chain import AuditHashChain
+from ciris_engine.logic.audit.verifier import AuditVerifier
+from ciris_engine.logic.audit.writer import AuditChainWriter
+from ciris_engine.logic.services.graph.audit_service import GraphAuditService
+from ciris_engine.schemas.services.operations import MemoryOpResult, MemoryOpStatus
+
+
+def _entry(i: int) -> dict:
+    return {
+        "event_id": f"event_{i}",
+        "event_timestamp": "2025-01-01T00:00:00+00:00",
+        "event_type": "test_event",
+        "originator_id": "tester",
+        "event_summary": "test_event by tester",
+        "event_payload": f'{{"index": {i}}}',
+    }
+
+
+@pytest.fixture
+def time_service():
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return Mock(now=Mock(return_value=now), now_iso=Mock(return_value=now.isoformat()))
+
+
+@pytest.fixture
+async def audit_env(tmp_path, time_service):
+    db_path = str(tmp_path / "audit.db")
+    key_path = str(tmp_path / "keys")
+    await GraphAuditService(time_service=time_service, db_path=db_path, key_path=key_path)._init_database()
+    verifier = AuditVerifier(db_path, key_path, time_service, chunk_size=3, signature_workers=0)
+    verifier.initialize()
+    return db_path, verifier
+
+
+async def _append(db_path, verifier, start, count):
+    writer = AuditChainWriter(db_path, AuditHashChain(db_path), verifier.signature_manager)
+    await writer.start()
+    for i in range(start, start + count):
+        await writer.submit(_entry(i))
+    await writer.stop()
+
+
+def _execute(db_path, sql, params=()):
+    conn = sqlite3.connect(db_path)
+    conn.execute(sql, params)
+    conn.commit()
+    conn.close()
+
+
+class TestStreaming:
+    """Rows are read in bounded chunks."""
+
+    @pytest.mark.asyncio
+    async def test_iter_entries_chunks(self, audit_env):
+        db_path, verifier = audit_env
+        await _append(db_path, verifier, 0, 10)
+
+        chunks = list(verifier.hash_chain.iter_entries(chunk_size=4))
+
+        assert [len(c) for c in chunks] == [4, 4, 2]
+        assert [e["sequence_number"] for c in chunks for e in c] == list(range(1, 11))
+
+    @pytest.mark.asyncio
+    async def test_streamed_chain_check_matches_errors(self, audit_env):
+        db_path, verifier = audit_env
+        await _append(db_path, verifier, 0, 10)
+        _execute(db_path, "UPDATE audit_log SET event_payload = 'x' WHERE sequence_number = 6")
+
+        result = verifier.hash_chain.verify_chain_integrity(chunk_size=3)
+
+        assert not result.valid
+        assert result.entries_checked == 10
+        assert result.errors == ["Entry hash mismatch at sequence 6"]
+
+
+class TestCheckpoints:
+    """The verified prefix is checkpointed and can be resumed from."""
+
+    @pytest.mark.asyncio
+    async def test_resume_after_checkpoint(self, audit_env):
+        db_path, verifier = audit_env
+        await _append(db_path, verifier, 0, 10)
+
+        first = verifier.verify_complete_chain()
+        assert first.valid
+        assert first.checkpoint_sequence == 10
+
+        await _append(db_path, verifier, 10, 5)
+        second = verifier.verify_complete_chain(resume=True)
+        progress = verifier.get_progress()
+
+        assert second.valid
+        assert second.entries_verified == 5
+        assert second.resumed_from_sequence == 10
+        assert second.checkpoint_sequence == 15
+        assert progress.state == "completed"
+        assert progress.entries_checked == 5
+        assert progress.start_sequence == 11
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_stops_before_first_error(self, audit_env):
+        db_path, verifier = audit_env
+        await _append(db_path, verifier, 0, 12)
+        _execute(db_path, "UPDATE audit_log SET signature = 'AAAA' WHERE sequence_number = 8")
+
+        result = verifier.verify_complete_chain()
+
+        assert not result.signatures_valid
+        assert result.checkpoint_sequence == 6  # last clean chunk of 3
+        assert verifier.get_checkpoint()[0] == 6
+
+    @pytest.mark.asyncio
+    async def test_changed_checkpoint_entry_restarts_at_genesis(self, audit_env):
+        db_path, verifier = audit_env
+        await _append(db_path, verifier, 0, 6)
+        verifier.verify_complete_chain()
+        _execute(db_path, "UPDATE audit_log SET entry_hash = ? WHERE sequence_number = 6", ("0" * 64,))
+
+        result = verifier.verify_complete_chain(resume=True)
+
+        assert result.resumed_from_sequence is None
+        assert not result.hash_chain_valid
+
+
+class TestMerkleEntries:
+    """Batch-signed entries are checked one by one while streaming."""
+
+    @pytest.mark.asyncio
+    async def test_entry_outside_root_range_rejected(self, audit_env):
+        db_path, verifier = audit_env
+        writer = AuditChainWriter(db_path, AuditHashChain(db_path), verifier.signature_manager,
+                                  flush_batch_size=4, signing_mode="merkle")
+        await writer.start()
+        for i in range(4):
+            await writer.submit(_entry(i))
+        await writer.stop()
+
+        # Unsigned entry with a correct chain link claiming root 1 (seq 1-4)
+        forged = AuditHashChain(db_path).prepare_entry(_entry(4))
+        _execute(db_path, """
+            INSERT INTO audit_log
+            (event_id, event_timestamp, event_type, originator_id, actor, event_summary, event_payload,
+             sequence_number, previous_hash, entry_hash, signature, signing_key_id)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'merkle:1', 'forged')
+        """, (forged["event_id"], forged["event_timestamp"], forged["event_type"], forged["originator_id"],
+              forged["originator_id"], forged["event_summary"], forged["event_payload"],
+              forged["sequence_number"], forged["previous_hash"], forged["entry_hash"]))
+
+        result = verifier.verify_complete_chain()
+
+        assert result.hash_chain_valid
+        assert not result.valid
+        assert result.signature_errors == ["Invalid Merkle inclusion for entry 5"]
+        assert result.checkpoint_sequence == 3
+
+
+class TestParallelSignatures:
+    """Signature checks can run in a process pool."""
+
+    @pytest.mark.asyncio
+    async def test_process_pool_detects_bad_signature(self, audit_env, monkeypatch):
+        db_path, verifier = audit_env
+        await _append(db_path, verifier, 0, 9)
+        _execute(db_path, "UPDATE audit_log SET signature = 'AAAA' WHERE sequence_number = 5")
+        monkeypatch.setattr(verifier_module, "PROCESS_POOL_MIN_ENTRIES", 1)
+        verifier.signature_workers = 2
+
+        result = verifier.verify_complete_chain()
+
+        assert result.hash_chain_valid
+        assert result.signature_errors == ["Invalid signature for entry 5"]
+
+
+class TestProgressAndCancellation:
+    """Progress is observable and runs can be cancelled."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_keeps_checkpoint(self, audit_env, monkeypatch):
+        db_path, verifier = audit_env
+        await _append(db_path, verifier, 0, 9)
+        original = verifier.hash_chain.iter_entries
+
+        def cancelling_iter(*args, **kwargs):
+            for index, chunk in enumerate(original(*args, **kwargs)):
+                if index == 1:
+                    verifier.cancel()
+                yield chunk
+
+        monkeypatch.setattr(verifier.hash_chain, "iter_entries", cancelling_iter)
+
+        result = verifier.verify_complete_chain()
+
+        assert result.error == "Verification cancelled"
+        assert verifier.get_progress().state == "cancelled"
+        assert result.checkpoint_sequence == 3
+
+    @pytest.mark.asyncio
+    async def test_service_background_verification(self, tmp_path, time_service):
+        memory_bus = Mock()
+        memory_bus.memorize = AsyncMock(return_value=MemoryOpResult(status=MemoryOpStatus.OK))
+        service = GraphAuditService(
+            memory_bus=memory_bus,
+            time_service=time_service,
+            db_path=str(tmp_path / "audit.db"),
+            key_path=str(tmp_path / "keys"),
+        )
+        await service.start()
+        try:
+            for i in range(5):
+                await service.log_event("test_event", {"entity_id": f"entity_{i}"})
+
+            started = await service.start_integrity_verification(resume=False)
+            await service._verification_task
+            progress = await service.get_verification_progress()
+        finally:
+            await service.stop()
+
+        assert started.state in ("running", "completed")
+        assert progress.state == "completed"
+        assert progress.result.valid
+        assert progress.checkpoint_sequence == 5
+        assert progress.percent_complete == 100.0
@@ -0,0 +1,204 @@
+"""
+Tests for the ToolBus tool catalog.
+
+Tests cover:
+- Catalog built once from every tool service and reused
+- get_all_tool_info preferred over per-tool lookups
+- Concurrent readers sharing one build
+- Invalidation on adapter load and unload through RuntimeAdapterManager
+- The pre-rendered prompt fragment reused by action selection
+- Batch prefetch reading tools from the catalog
+"""
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ciris_engine.logic.buses.tool_bus import ToolBus
+from ciris_engine.logic.context.batch_context import prefetch_batch_context
+from ciris_engine.logic.context.snapshot_engine import SnapshotEngine
+from ciris_engine.logic.dma.action_selection.context_builder import ActionSelectionContextBuilder
+from ciris_engine.logic.persistence.models.queue_status import QueueStatus
+from ciris_engine.logic.registries.base import ServiceRegistry
+from ciris_engine.logic.runtime.adapter_manager import RuntimeAdapterManager
+from ciris_engine.schemas.adapters.registration import AdapterServiceRegistration
+from ciris_engine.schemas.adapters.tools import ToolInfo, ToolParameterSchema
+from ciris_engine.schemas.runtime.enums import HandlerActionType, ServiceType
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeToolService:
+    def __init__(self, adapter_id: str, tools: dict) -> None:
+        self.adapter_id = adapter_id
+        self.tools = tools
+        self.calls = {"get_available_tools": 0, "get_all_tool_info": 0, "get_tool_info": 0}
+
+    def _info(self, name: str) -> ToolInfo:
+        return ToolInfo(name=name, description=self.tools[name],
+                        parameters=ToolParameterSchema(type="object", properties={}))
+
+    async def get_available_tools(self) -> list:
+        self.calls["get_available_tools"] += 1
+        await asyncio.sleep(0)
+        return list(self.tools)
+
+    async def get_all_tool_info(self) -> list:
+        self.calls["get_all_tool_info"] += 1
+        return [self._info(name) for name in self.tools]
+
+    async def get_tool_info(self, name: str):
+        self.calls["get_tool_info"] += 1
+        return self._info(name)
+
+
+@pytest.fixture
+def registry():
+    return ServiceRegistry()
+
+
+@pytest.fixture
+def tool_bus(registry):
+    return ToolBus(registry, Mock(now=Mock(return_value=NOW)))
+
+
+class TestCatalog:
+    """Catalog building and invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_catalog_is_built_once_and_rendered(self, registry, tool_bus):
+        api = FakeToolService("api_1", {"curl": "Fetch a URL", "http_get": "GET a URL"})
+        cli = FakeToolService("cli_1", {"list_files": "List files"})
+        registry.register_service(ServiceType.TOOL, api)
+        registry.register_service(ServiceType.TOOL, cli)
+
+        first = await tool_bus.get_catalog()
+        second = await tool_bus.get_catalog()
+
+        assert first is second
+        assert api.calls == {"get_available_tools": 1, "get_all_tool_info": 1, "get_tool_info": 0}
+        assert [(e.adapter_id, e.name) for e in first.entries] == [
+            ("api_1", "curl"), ("api_1", "http_get"), ("cli_1", "list_files"),
+        ]
+        assert first.by_adapter_type()["cli"] == [
+            {"name": "list_files", "adapter_id": "cli_1", "description": "List files"}
+        ]
+        assert tool_bus.get_tools_prompt_fragment() == (
+            "\nAvailable Tools (use with the TOOL action):"
+            "\n  - curl [api_1]: Fetch a URL"
+            "\n  - http_get [api_1]: GET a URL"
+            "\n  - list_files [cli_1]: List files"
+        )
+
+    @pytest.mark.asyncio
+    async def test_per_tool_lookup_when_no_bulk_info(self, registry, tool_bus):
+        class Service:
+            adapter_id = "discord_1"
+            calls = 0
+
+            def get_available_tools(self):  # sync, like the Discord tool service
+                return ["send_dm", "ban"]
+
+            async def get_tool_info(self, name):
+                Service.calls += 1
+                return ToolInfo(name=name, description=f"{name} tool",
+                                parameters=ToolParameterSchema(type="object", properties={}))
+
+        registry.register_service(ServiceType.TOOL, Service())
+
+        catalog = await tool_bus.get_catalog()
+
+        assert Service.calls == 2
+        assert [e.description for e in catalog.entries] == ["ban tool", "send_dm tool"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_readers_share_one_build(self, registry, tool_bus):
+        service = FakeToolService("api_1", {"curl": "Fetch a URL"})
+        registry.register_service(ServiceType.TOOL, service)
+
+        catalogs = await asyncio.gather(*(tool_bus.get_catalog() for _ in range(5)))
+
+        assert service.calls["get_available_tools"] == 1
+        assert all(catalog is catalogs[0] for catalog in catalogs)
+
+    @pytest.mark.asyncio
+    async def test_invalidation_rebuilds(self, registry, tool_bus):
+        registry.register_service(ServiceType.TOOL, FakeToolService("api_1", {"curl": "Fetch a URL"}))
+        before = await tool_bus.get_catalog()
+
+        registry.register_service(ServiceType.TOOL, FakeToolService("cli_1", {"list_files": "List files"}))
+        assert (await tool_bus.get_catalog()) is before  # unchanged until invalidated
+        tool_bus.invalidate_catalog("test")
+        assert tool_bus.get_tools_prompt_fragment() == ""
+        after = await tool_bus.get_catalog()
+
+        assert after.version == before.version + 1
+        assert {e.name for e in after.entries} == {"curl", "list_files"}
+
+
+class TestAdapterEvents:
+    """RuntimeAdapterManager refreshes the catalog when adapters change."""
+
+    @pytest.mark.asyncio
+    async def test_load_and_unload_refresh_catalog(self, registry, tool_bus):
+        tool_service = FakeToolService("mcp_1", {"search": "Search the web"})
+
+        class ToolAdapter:
+            def __init__(self, runtime, **kwargs):
+                pass
+
+            async def start(self):
+                pass
+
+            async def stop(self):
+                pass
+
+            def get_services_to_register(self):
+                return [AdapterServiceRegistration(service_type=ServiceType.TOOL, provider=tool_service)]
+
+        runtime = SimpleNamespace(service_registry=registry, bus_manager=SimpleNamespace(tool=tool_bus), adapters=[])
+        manager = RuntimeAdapterManager(runtime, Mock(now=Mock(return_value=NOW)))
+
+        with patch("ciris_engine.logic.runtime.adapter_manager.load_adapter", return_value=ToolAdapter):
+            assert (await manager.load_adapter("mcp", "mcp_1")).success
+        assert "search [mcp_1]" in tool_bus.get_tools_prompt_fragment()
+
+        assert (await manager.unload_adapter("mcp_1")).success
+        assert registry.get_services_by_type(ServiceType.TOOL) == []
+        assert tool_bus.get_tools_prompt_fragment() == ""
+        assert (await tool_bus.get_catalog()).entries == []
+
+
+class TestCatalogConsumers:
+    """Action selection and batch prefetch reuse the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_action_selection_reuses_fragment(self, registry, tool_bus):
+        registry.register_service(ServiceType.TOOL, FakeToolService("api_1", {"curl": "Fetch a URL"}))
+        await tool_bus.get_catalog()
+        builder = ActionSelectionContextBuilder({}, registry, SimpleNamespace(tool=tool_bus))
+
+        assert builder._get_available_tools_str([HandlerActionType.TOOL]) == tool_bus.get_tools_prompt_fragment()
+        assert builder._get_available_tools_str([HandlerActionType.SPEAK]) == ""
+        assert ActionSelectionContextBuilder({}, None, Mock())._get_available_tools_str([HandlerActionType.TOOL]) == ""
+
+    @pytest.mark.asyncio
+    async def test_prefetch_reads_catalog_and_follows_version(self, registry, tool_bus):
+        service = FakeToolService("api_1", {"curl": "Fetch a URL"})
+        registry.register_service(ServiceType.TOOL, service)
+        runtime = SimpleNamespace(bus_manager=SimpleNamespace(tool=tool_bus), service_registry=registry)
+        engine = SnapshotEngine()
+
+        with patch("ciris_engine.logic.persistence.get_recent_completed_tasks", Mock(return_value=[])), \
+             patch("ciris_engine.logic.persistence.get_top_tasks", Mock(return_value=[])), \
+             patch("ciris_engine.logic.persistence.get_queue_status", Mock(return_value=QueueStatus(pending_tasks=0, pending_thoughts=0))):
+            first = await prefetch_batch_context(runtime=runtime, engine=engine)
+            registry.register_service(ServiceType.TOOL, FakeToolService("cli_1", {"list_files": "List files"}))
+            tool_bus.invalidate_catalog("adapter loaded")
+            second = await prefetch_batch_context(runtime=runtime, engine=engine)
+
+        assert first.available_tools == {"api": [{"name": "curl", "adapter_id": "api_1", "description": "Fetch a URL"}]}
+        assert set(second.available_tools) == {"api", "cli"}  # memo dropped despite its TTL
+        assert service.calls["get_tool_info"] == 0
@@ -0,0 +1,187 @@
+"""
+Tests for the layered snapshot engine.
+
+Tests cover:
+- Round-layer memoization honouring TTLs and explicit invalidation
+- Concurrent callers sharing one in-flight computation
+- Per-component timings and cache-hit counts
+- Independent batch components gathered concurrently
+- Round components reused across batches while batch components refresh
+- Snapshots built from batch data without querying services again
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from ciris_engine.logic.context.batch_context import prefetch_batch_context
+from ciris_engine.logic.context.snapshot_engine import SnapshotEngine, SnapshotLayer
+from ciris_engine.logic.context.system_snapshot import build_system_snapshot
+from ciris_engine.logic.persistence.models.queue_status import QueueStatus
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _counter():
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return len(calls)
+
+    return calls, factory
+
+
+@pytest.fixture
+def quiet_persistence():
+    """Batch-layer reads against an empty queue."""
+    with patch("ciris_engine.logic.persistence.get_recent_completed_tasks", Mock(return_value=[])) as recent, \
+         patch("ciris_engine.logic.persistence.get_top_tasks", Mock(return_value=[])), \
+         patch("ciris_engine.logic.persistence.get_queue_status",
+               Mock(return_value=QueueStatus(pending_tasks=2, pending_thoughts=3, processing_thoughts=1))):
+        yield recent
+
+
+class TestMemoization:
+    """Round-layer components are memoized with TTLs."""
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_invalidate(self):
+        clock = FakeClock()
+        engine = SnapshotEngine(ttls={"health": 5.0}, clock=clock)
+        calls, factory = _counter()
+
+        assert await engine.memoized("health", factory) == 1
+        clock.now = 4.9
+        assert await engine.memoized("health", factory) == 1
+        clock.now = 5.1
+        assert await engine.memoized("health", factory) == 2
+        engine.invalidate("health")
+        assert await engine.memoized("health", factory) == 3
+
+    @pytest.mark.asyncio
+    async def test_component_without_ttl_is_recomputed(self):
+        engine = SnapshotEngine(ttls={})
+        calls, factory = _counter()
+
+        await engine.memoized("tools", factory)
+        await engine.memoized("tools", factory)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_computation(self):
+        engine = SnapshotEngine(ttls={"identity": 60.0})
+        release = asyncio.Event()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await release.wait()
+            return "identity"
+
+        waiters = [asyncio.ensure_future(engine.memoized("identity", slow)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == ["identity"] * 3
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_timings(self):
+        engine = SnapshotEngine(ttls={"identity": 60.0})
+        _, factory = _counter()
+
+        await engine.memoized("identity", factory)
+        await engine.memoized("identity", factory)
+        await engine.timed("user_profiles", SnapshotLayer.THOUGHT, factory)
+
+        timings = {t.component: t for t in engine.get_component_timings()}
+        assert (timings["identity"].calls, timings["identity"].cache_hits) == (1, 1)
+        assert timings["identity"].layer == "round"
+        assert timings["user_profiles"].layer == "thought"
+        assert timings["user_profiles"].total_ms >= timings["user_profiles"].last_ms >= 0
+
+
+class TestPrefetch:
+    """Batch prefetch gathers components through the engine."""
+
+    @pytest.mark.asyncio
+    async def test_independent_components_run_concurrently(self, quiet_persistence):
+        # Each service waits for the other; sequential collection would deadlock
+        health_started = asyncio.Event()
+        telemetry_started = asyncio.Event()
+
+        async def health_status():
+            health_started.set()
+            await telemetry_started.wait()
+            return {"healthy": True}
+
+        async def telemetry_summary():
+            telemetry_started.set()
+            await health_started.wait()
+            return None
+
+        service = SimpleNamespace(get_health_status=health_status)
+        registry = Mock(get_provider_info=Mock(return_value={"global_services": {"llm": [service]}}))
+        telemetry = SimpleNamespace(get_telemetry_summary=telemetry_summary)
+
+        batch = await asyncio.wait_for(
+            prefetch_batch_context(service_registry=registry, telemetry_service=telemetry), timeout=5
+        )
+
+        assert batch.service_health == {"global.llm": {"healthy": True}}
+        assert batch.system_counts["pending_thoughts"] == 4
+
+    @pytest.mark.asyncio
+    async def test_round_components_reused_across_batches(self, quiet_persistence):
+        engine = SnapshotEngine()
+        telemetry = Mock(get_telemetry_summary=AsyncMock(return_value=None))
+        tool_service = Mock(adapter_id="api_1", get_available_tools=AsyncMock(return_value=["curl", "grep"]),
+                            get_tool_info=AsyncMock(return_value=SimpleNamespace(description="a tool")))
+        runtime = SimpleNamespace(
+            bus_manager=Mock(),
+            service_registry=Mock(get_services_by_type=Mock(return_value=[tool_service])),
+        )
+
+        first = await prefetch_batch_context(telemetry_service=telemetry, runtime=runtime, engine=engine)
+        await prefetch_batch_context(telemetry_service=telemetry, runtime=runtime, engine=engine)
+
+        assert telemetry.get_telemetry_summary.await_count == 1
+        assert tool_service.get_available_tools.await_count == 1
+        assert tool_service.get_tool_info.await_count == 2
+        assert quiet_persistence.call_count == 2  # batch layer refreshes every batch
+        assert first.available_tools == {"api": [
+            {"name": "curl", "adapter_id": "api_1", "description": "a tool"},
+            {"name": "grep", "adapter_id": "api_1", "description": "a tool"},
+        ]}
+        timings = {t.component: t for t in engine.get_component_timings()}
+        assert timings["available_tools"].cache_hits == 1
+        assert timings["recent_tasks"].calls == 2
+
+
+class TestSnapshotFromBatch:
+    """The per-thought layer reuses the batch."""
+
+    @pytest.mark.asyncio
+    async def test_batch_data_is_not_refetched(self, quiet_persistence):
+        telemetry = Mock(get_telemetry_summary=AsyncMock(return_value=None))
+        monitor = Mock(snapshot=Mock(critical=["memory"], healthy=True))
+        batch = await prefetch_batch_context(resource_monitor=monitor, telemetry_service=telemetry)
+
+        snapshots = [
+            await build_system_snapshot(None, None, None, telemetry_service=telemetry, batch_data=batch)
+            for _ in range(3)
+        ]
+
+        assert telemetry.get_telemetry_summary.await_count == 1
+        assert quiet_persistence.call_count == 1
+        assert all(s.system_counts["pending_tasks"] == 2 for s in snapshots)
+        assert "memory" in snapshots[0].resource_alerts[0]
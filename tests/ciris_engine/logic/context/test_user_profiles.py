@@ -0,0 +1,196 @@
+"""
+Tests for bulk user-profile loading.
+
+Tests cover:
+- Batched node and edge reads returning the same data as per-node reads
+- Cross-channel message lookup through the user_id tag index
+- Profiles with attributes, connected nodes and other-channel messages
+- The per-batch memo loading each (user, channel) pair once
+- Snapshot builders using the bulk loader
+"""
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from ciris_engine.logic import persistence
+from ciris_engine.logic.context.batch_context import BatchContextData, build_system_snapshot_with_batch
+from ciris_engine.logic.context.user_profiles import UserProfileMemo, collect_user_ids, load_user_profiles
+from ciris_engine.logic.persistence.models.correlations import USER_TAG_SQL
+from ciris_engine.logic.services.graph.memory_service import LocalGraphMemoryService
+from ciris_engine.schemas.services.graph_core import GraphEdge, GraphNode, GraphScope, NodeType
+from ciris_engine.schemas.telemetry.core import ServiceCorrelation, ServiceCorrelationStatus, ServiceRequestData
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def time_service():
+    return Mock(now=Mock(return_value=NOW), now_iso=Mock(return_value=NOW.isoformat()))
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "ciris.db")
+    persistence.initialize_database(path)
+    return path
+
+
+@pytest.fixture
+def memory_service(db_path, time_service):
+    service = LocalGraphMemoryService(db_path=db_path, time_service=time_service)
+    for user_id, name in (("1", "alice"), ("2", "bob"), ("3", "carol")):
+        persistence.add_graph_node(
+            GraphNode(id=f"user/{user_id}", type=NodeType.USER, scope=GraphScope.LOCAL,
+                      attributes={"username": name, "trust_level": 0.7}),
+            time_service, db_path=db_path,
+        )
+    persistence.add_graph_node(
+        GraphNode(id="concept/chess", type=NodeType.CONCEPT, scope=GraphScope.LOCAL, attributes={"name": "chess"}),
+        time_service, db_path=db_path,
+    )
+    for source, target, relationship in (("user/1", "concept/chess", "likes"),
+                                         ("user/2", "concept/chess", "likes"),
+                                         ("user/1", "user/2", "knows")):
+        persistence.add_graph_edge(
+            GraphEdge(source=source, target=target, relationship=relationship, scope=GraphScope.LOCAL),
+            db_path=db_path,
+        )
+    return service
+
+
+def _message(db_path, time_service, n, user_id, channel_id, content):
+    persistence.add_correlation(
+        ServiceCorrelation(
+            correlation_id=f"corr_{n}",
+            service_type="discord",
+            handler_name="ObserveHandler",
+            action_type="observe",
+            request_data=ServiceRequestData(
+                service_type="discord", method_name="observe", channel_id=channel_id,
+                parameters={"content": content}, request_timestamp=NOW,
+            ),
+            status=ServiceCorrelationStatus.COMPLETED,
+            created_at=(NOW + timedelta(minutes=n)).isoformat(),
+            updated_at=NOW.isoformat(),
+            timestamp=NOW + timedelta(minutes=n),
+            tags={"user_id": user_id, "channel_id": channel_id},
+        ),
+        time_service, db_path=db_path,
+    )
+
+
+class TestBulkReads:
+    """Batched persistence reads."""
+
+    def test_nodes_and_edges_match_single_reads(self, memory_service, db_path):
+        ids = ["user/1", "user/2", "user/missing"]
+
+        nodes = persistence.get_graph_nodes_by_ids(ids, GraphScope.LOCAL, db_path=db_path)
+        edges = persistence.get_edges_for_nodes(ids, GraphScope.LOCAL, db_path=db_path)
+
+        assert set(nodes) == {"user/1", "user/2"}
+        assert nodes["user/1"] == persistence.get_graph_node("user/1", GraphScope.LOCAL, db_path=db_path)
+        single = {(e.source, e.target) for i in ids for e in persistence.get_edges_for_node(i, GraphScope.LOCAL, db_path=db_path)}
+        assert {(e.source, e.target) for e in edges} == single
+        assert len(edges) == 3  # user/1 -> user/2 only once
+
+    def test_recent_messages_per_user_skip_current_channel(self, db_path, time_service):
+        for n in range(5):
+            _message(db_path, time_service, n, "1", "other", f"hello {n}")
+        _message(db_path, time_service, 10, "1", "here", "same channel")
+        _message(db_path, time_service, 11, "2", "other", "from bob")
+
+        records = persistence.get_recent_user_messages(["1", "2", "3"], exclude_channel_id="here", db_path=db_path)
+
+        assert [r.request_data["parameters"]["content"] for r in records["1"]] == ["hello 4", "hello 3", "hello 2"]
+        assert [r.correlation_id for r in records["2"]] == ["corr_11"]
+        assert "3" not in records
+
+    def test_user_lookup_uses_tag_index(self, db_path):
+        with persistence.get_db_connection(db_path=db_path) as conn:
+            plan = conn.execute(
+                f"EXPLAIN QUERY PLAN SELECT correlation_id FROM service_correlations WHERE {USER_TAG_SQL} IN (?, ?)",
+                ("1", "2"),
+            ).fetchall()
+
+        assert any("idx_correlations_tag_user_created" in row[3] for row in plan)
+
+
+class TestLoadUserProfiles:
+    """Profiles are assembled from the bulk reads."""
+
+    @pytest.mark.asyncio
+    async def test_profiles_carry_attributes_neighbours_and_messages(self, memory_service, db_path, time_service):
+        _message(db_path, time_service, 1, "1", "other", "elsewhere")
+
+        profiles = await load_user_profiles({"1", "3", "404"}, memory_service, channel_id="here", db_path=db_path)
+
+        assert set(profiles) == {"1", "3"}
+        alice = profiles["1"]
+        assert alice.display_name == "alice"
+        assert alice.trust_level == 0.7
+        connected = json.loads(alice.notes.split("\nConnected nodes: ")[1].split("\nRecent")[0])
+        assert {(c["node_id"], c["relationship"]) for c in connected} == {("concept/chess", "likes"), ("user/2", "knows")}
+        assert '"content": "elsewhere"' in alice.notes
+        assert profiles["3"].notes == 'All attributes: {"username": "carol", "trust_level": 0.7}'
+
+    @pytest.mark.asyncio
+    async def test_query_count_does_not_grow_with_users(self, memory_service, db_path):
+        memory_service.recall_nodes = Mock(wraps=memory_service.recall_nodes)
+        memory_service.get_nodes_edges = Mock(wraps=memory_service.get_nodes_edges)
+
+        await load_user_profiles({"1", "2", "3"}, memory_service, db_path=db_path)
+
+        assert memory_service.recall_nodes.call_count == 2  # users, then neighbours
+        assert memory_service.get_nodes_edges.call_count == 1
+
+    def test_collect_user_ids(self):
+        thought = SimpleNamespace(content="<@1> asked about ID: 2", context=SimpleNamespace(user_id=3))
+
+        assert collect_user_ids(thought) == {"1", "2", "3"}
+
+
+class TestUserProfileMemo:
+    """The memo shares loads across thoughts of a batch."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_thoughts_share_one_load(self, memory_service, db_path, monkeypatch):
+        from ciris_engine.logic.context import user_profiles as module
+        calls = []
+        real = module.load_user_profiles
+
+        async def counting(user_ids, *args, **kwargs):
+            calls.append(sorted(user_ids))
+            await asyncio.sleep(0)
+            return await real(user_ids, *args, **kwargs)
+
+        monkeypatch.setattr(module, "load_user_profiles", counting)
+        memo = UserProfileMemo(db_path=db_path)
+
+        first, second = await asyncio.gather(
+            memo.get_profiles({"1", "2"}, memory_service, "here"),
+            memo.get_profiles({"1", "2"}, memory_service, "here"),
+        )
+        third = await memo.get_profiles({"2", "3"}, memory_service, "here")
+
+        assert calls == [["1", "2"], ["3"]]
+        assert [p.user_id for p in first] == [p.user_id for p in second] == ["1", "2"]
+        assert [p.user_id for p in third] == ["2", "3"]
+        first[0].notes = "edited"
+        assert (await memo.get_profiles({"1"}, memory_service, "here"))[0].notes != "edited"
+
+    @pytest.mark.asyncio
+    async def test_batch_snapshot_includes_profiles(self, memory_service, db_path):
+        batch = BatchContextData()
+        batch.user_profiles = UserProfileMemo(db_path=db_path)
+        thought = SimpleNamespace(thought_id="t1", content="hi <@2>", context=None, status=None,
+                                  source_task_id=None, thought_type=None, thought_depth=None)
+
+        snapshot = await build_system_snapshot_with_batch(None, thought, batch, memory_service=memory_service)
+
+        assert [p.display_name for p in snapshot.user_profiles] == ["bob"]
+        assert batch.user_profiles.misses == 1
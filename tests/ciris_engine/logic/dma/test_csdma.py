@@ -0,0 +1,27 @@
+"""
+Tests for the common sense DMA.
+
+Tests cover:
+- Identity prompt overrides applied to the loaded prompt collection
+"""
+from unittest.mock import Mock
+
+from ciris_engine.logic.dma.csdma import CSDMAEvaluator
+
+
+class TestCSDMAOverrides:
+    """Overrides from an agent template's csdma_overrides."""
+
+    def test_overrides_update_prompt_collection(self):
+        overrides = {
+            "system_guidance_header": "Measure precisely.",
+            "system_prompt": "You are Datum.",
+        }
+
+        dma = CSDMAEvaluator(service_registry=Mock(), prompt_overrides=overrides)
+
+        assert dma.prompt_template_data.system_guidance_header == "Measure precisely."
+        assert dma.prompt_template_data.custom_prompts["system_prompt"] == "You are Datum."
+        assert "Measure precisely." in dma.prompt_loader.get_system_message(
+            dma.prompt_template_data, context_summary="", original_thought_content=""
+        )
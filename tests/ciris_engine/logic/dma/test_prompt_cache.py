@@ -0,0 +1,152 @@
+"""
+Tests for prompt compilation caches.
+
+Tests cover:
+- Prompt YAML parsed once per file version
+- Static sections rendered once per (profile, permitted actions, tools)
+- Action selection messages with a byte-stable static prefix
+- Per-thought prompt render reports
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.dma import prompt_cache
+from ciris_engine.logic.dma.action_selection_pdma import ActionSelectionPDMAEvaluator
+from ciris_engine.logic.dma.prompt_cache import StaticSectionCache, load_prompt_file
+from ciris_engine.logic.dma.prompt_loader import DMAPromptLoader
+from ciris_engine.logic.utils import COVENANT_TEXT
+from ciris_engine.schemas.actions.parameters import SpeakParams
+from ciris_engine.schemas.dma.faculty import EnhancedDMAInputs
+from ciris_engine.schemas.dma.results import ActionSelectionDMAResult, CSDMAResult, EthicalDMAResult
+from ciris_engine.schemas.runtime.enums import HandlerActionType, ThoughtType
+from ciris_engine.schemas.runtime.models import Thought
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    prompt_cache.clear_prompt_file_cache()
+    real = prompt_cache.yaml.safe_load
+    parses = []
+
+    def counting(stream):
+        parses.append(getattr(stream, "name", None))
+        return real(stream)
+
+    monkeypatch.setattr(prompt_cache.yaml, "safe_load", counting)
+    yield parses
+    prompt_cache.clear_prompt_file_cache()
+
+
+class TestPromptFiles:
+    """Prompt files are parsed once per version."""
+
+    def test_file_parsed_once_until_changed(self, tmp_path, count_parses):
+        path = tmp_path / "prompts.yml"
+        path.write_text("system_header: one\n")
+
+        first = load_prompt_file(path)
+        first["system_header"] = "mutated"
+        assert load_prompt_file(path) == {"system_header": "one"}
+        assert len(count_parses) == 1
+
+        path.write_text("system_header: changed\n")
+        assert load_prompt_file(path) == {"system_header": "changed"}
+        assert len(count_parses) == 2
+
+    def test_prompt_loader_reuses_parsed_templates(self, count_parses):
+        loader = DMAPromptLoader()
+
+        first = loader.load_prompt_template("csdma_common_sense")
+        second = DMAPromptLoader().load_prompt_template("csdma_common_sense")
+
+        assert first == second
+        assert len(count_parses) == 1
+
+    def test_missing_template_still_raises(self):
+        with pytest.raises(FileNotFoundError):
+            DMAPromptLoader().load_prompt_template("no_such_template")
+
+
+class TestStaticSectionCache:
+    """Rendered sections are reused per key."""
+
+    def test_hits_misses_and_eviction(self):
+        cache = StaticSectionCache(max_entries=2)
+        renders = []
+
+        def render(text):
+            return lambda: renders.append(text) or text
+
+        assert cache.get_or_render("a", render("A")) == ("A", False)
+        assert cache.get_or_render("a", render("A")) == ("A", True)
+        cache.get_or_render("b", render("B"))
+        cache.get_or_render("c", render("C"))  # evicts "a"
+        assert cache.get_or_render("a", render("A")) == ("A", False)
+
+        assert renders == ["A", "B", "C", "A"]
+        assert (cache.hits, cache.misses) == (1, 4)
+
+
+def _inputs(thought_id, content, thought_type=ThoughtType.STANDARD, permitted=None):
+    thought = Thought(
+        thought_id=thought_id, source_task_id="task-1", content=content, thought_type=thought_type,
+        created_at="2025-01-01T00:00:00+00:00", updated_at="2025-01-01T00:00:00+00:00",
+    )
+    return EnhancedDMAInputs(
+        original_thought=thought,
+        ethical_pdma_result=EthicalDMAResult(decision="approve", reasoning="fine", alignment_check={}),
+        csdma_result=CSDMAResult(plausibility_score=0.9, flags=[], reasoning="plausible"),
+        processing_context=None,
+        permitted_actions=permitted,
+    )
+
+
+@pytest.fixture
+def evaluator():
+    result = ActionSelectionDMAResult(
+        selected_action=HandlerActionType.SPEAK, action_parameters=SpeakParams(content="hi"), rationale="ok"
+    )
+    sink = SimpleNamespace(llm=Mock(call_llm_structured=AsyncMock(return_value=(result, None))))
+    return ActionSelectionPDMAEvaluator(service_registry=Mock(), sink=sink)
+
+
+def _messages(evaluator, call=-1):
+    return evaluator.sink.llm.call_llm_structured.call_args_list[call].kwargs["messages"]
+
+
+class TestActionSelectionPrompt:
+    """Action selection prompts keep a stable prefix and report their size."""
+
+    @pytest.mark.asyncio
+    async def test_static_prefix_is_byte_stable(self, evaluator):
+        await evaluator.evaluate(_inputs("t1", "What time is it?"))
+        first = _messages(evaluator)
+        await evaluator.evaluate(_inputs("t2", "Tell me a joke", thought_type=ThoughtType.FOLLOW_UP))
+        second = _messages(evaluator)
+
+        assert first[0] == second[0] == {"role": "system", "content": COVENANT_TEXT}
+        assert first[1] == second[1]
+        assert first[2]["content"].startswith("THOUGHT_TYPE=standard")
+        assert second[2]["content"].startswith("THOUGHT_TYPE=follow_up")
+        static_prefix = first[3]["content"].split("Original Thought:")[0]
+        assert second[3]["content"].startswith(static_prefix)
+        assert 'Original Thought: "Tell me a joke"' in second[3]["content"]
+
+    @pytest.mark.asyncio
+    async def test_render_report(self, evaluator):
+        await evaluator.evaluate(_inputs("t1", "first"))
+        cold = evaluator.last_prompt_report
+        await evaluator.evaluate(_inputs("t2", "second"))
+        warm = evaluator.last_prompt_report
+        await evaluator.evaluate(_inputs("t3", "third", permitted=[HandlerActionType.SPEAK]))
+        other_actions = evaluator.last_prompt_report
+
+        total = sum(len(m["content"].encode("utf-8")) for m in _messages(evaluator, 1))
+        assert warm.thought_id == "t2"
+        assert warm.total_bytes == total
+        assert not cold.static_cache_hit and warm.static_cache_hit and not other_actions.static_cache_hit
+        assert warm.stable_prefix_bytes == cold.stable_prefix_bytes > len(COVENANT_TEXT)
+        assert warm.rendered_bytes + warm.cached_bytes == warm.total_bytes
+        assert warm.rendered_bytes < cold.rendered_bytes
@@ -0,0 +1,138 @@
+"""
+Tests for the token-budgeted context assembler.
+
+Tests cover:
+- Unchanged output when everything fits
+- Priority order, summaries, truncation and dropping over budget
+- Snapshot sections and user profile notes under a budget
+- Budgets threaded from EssentialConfig and savings reported by DMAs
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.dma.pdma import EthicalPDMAEvaluator
+from ciris_engine.logic.formatters import (
+    assemble_context,
+    estimate_tokens,
+    format_budgeted_context,
+    format_system_snapshot,
+    format_user_profiles,
+    truncate_to_tokens,
+)
+from ciris_engine.logic.formatters.context_budget import TRUNCATION_MARKER
+from ciris_engine.schemas.config.essential import EssentialConfig
+from ciris_engine.schemas.dma.prompts import ContextBlock
+from ciris_engine.schemas.runtime.system_context import SystemSnapshot, TelemetrySummary, UserProfile
+
+NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def snapshot():
+    return SystemSnapshot(
+        resource_alerts=["CRITICAL: memory at 95%"],
+        system_counts={"pending_tasks": 2, "pending_thoughts": 5},
+        telemetry_summary=TelemetrySummary(
+            window_start=NOW, window_end=NOW, uptime_seconds=60.0,
+            messages_processed_24h=40, thoughts_processed_24h=90,
+            service_calls={f"service_{i}": i for i in range(10)},
+        ),
+        user_profiles=[
+            UserProfile(user_id="u1", display_name="Alice", created_at=NOW,
+                        notes="All attributes: " + '{"k": "v"}, ' * 300),
+        ],
+    )
+
+
+class TestAssembleContext:
+    """Fitting blocks into a budget."""
+
+    def test_within_budget_is_untouched(self):
+        blocks = [ContextBlock(name="a", text="alpha"), ContextBlock(name="b", text="beta")]
+
+        texts, report = assemble_context(blocks, 100)
+
+        assert texts == ["alpha", "beta"]
+        assert report.saved_tokens == 0
+        assert assemble_context(blocks, None)[0] == ["alpha", "beta"]
+
+    def test_priority_summary_truncation_and_drop(self):
+        blocks = [
+            ContextBlock(name="low", text="l" * 400, priority=1),
+            ContextBlock(name="required", text="r" * 80, required=True),
+            ContextBlock(name="high", text="h" * 120, priority=9),
+            ContextBlock(name="mid", text="m" * 400, priority=5, summary="m" * 40),
+        ]
+
+        texts, report = assemble_context(blocks, 70)
+
+        # Order is preserved even though blocks were fitted by priority
+        assert texts[1:3] == ["r" * 80, "h" * 120]
+        assert texts[3] == "m" * 40
+        assert texts[0] == ""
+        assert report.summarized == ["mid"] and report.dropped == ["low"]
+        assert report.assembled_tokens <= 70
+        assert report.saved_tokens == report.original_tokens - report.assembled_tokens
+
+    def test_truncates_on_line_boundaries(self):
+        text = "\n".join(f"line {i:03d}" for i in range(100))
+
+        cut = truncate_to_tokens(text, 40)
+
+        assert estimate_tokens(cut) <= 40
+        assert cut.startswith("line 000\nline 001")
+        assert cut.endswith(TRUNCATION_MARKER)
+        assert all(line in text.split("\n") for line in cut.split("\n")[:-1])
+
+
+class TestBudgetedContext:
+    """Snapshot and profile blocks under a budget."""
+
+    def test_no_budget_matches_formatters(self, snapshot):
+        snapshot_block, profiles_block, report = format_budgeted_context(snapshot, snapshot.user_profiles, None)
+
+        assert snapshot_block == format_system_snapshot(snapshot)
+        assert profiles_block == format_user_profiles(snapshot.user_profiles)
+        assert "All attributes" in profiles_block
+        assert report.saved_tokens == 0
+
+    def test_over_budget_keeps_alerts_and_drops_notes(self, snapshot):
+        snapshot_block, profiles_block, report = format_budgeted_context(snapshot, snapshot.user_profiles, 150)
+
+        assert "CRITICAL: memory at 95%" in snapshot_block
+        assert "Pending Thoughts: 5" in snapshot_block
+        assert "service_9" not in snapshot_block
+        assert "User 'u1': Name/Nickname: 'Alice'" in profiles_block
+        assert "All attributes" not in profiles_block
+        assert report.summarized == ["user_profiles"]
+        assert estimate_tokens(snapshot_block) + estimate_tokens(profiles_block) <= 150
+        assert report.saved_tokens > 500
+
+
+class TestDMABudgets:
+    """Budgets from config reach the DMAs, which report their savings."""
+
+    def test_budget_per_dma_type(self):
+        config = EssentialConfig()
+        config.prompt_budget.per_dma["csdma"] = 400
+
+        assert config.prompt_budget.budget_for("csdma") == 400
+        assert config.prompt_budget.budget_for("ethical") == config.prompt_budget.default_context_tokens
+
+    @pytest.mark.asyncio
+    async def test_dma_records_tokens_saved(self, snapshot):
+        telemetry = Mock(record_metric=AsyncMock())
+        dma = EthicalPDMAEvaluator(
+            service_registry=Mock(), sink=SimpleNamespace(telemetry_service=telemetry), context_budget_tokens=150
+        )
+
+        snapshot_block, profiles_block = await dma.format_context_blocks(snapshot)
+
+        assert "All attributes" not in profiles_block
+        saved = dma.last_context_report.saved_tokens
+        telemetry.record_metric.assert_awaited_once_with(
+            "dma_context_tokens_saved", float(saved), tags={"dma": "EthicalPDMAEvaluator"}
+        )
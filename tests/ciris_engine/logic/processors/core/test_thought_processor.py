@@ -491,3 +491,48 @@ class TestThoughtProcessor:
         assert result is not None
         # Verify context builder was called
         thought_processor.context_builder.build_thought_context.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_task_signature_verified_once_per_task(
+        self, thought_processor: ThoughtProcessor, mock_persistence: Mock
+    ) -> None:
+        """A task's signature is verified once; later thoughts only re-check the signer."""
+        from ciris_engine.schemas.services.authority_core import WARole
+
+        task = Task(
+            task_id="signed_task",
+            channel_id="test_channel",
+            description="Signed task",
+            status=TaskStatus.ACTIVE,
+            created_at=datetime.now(timezone.utc).isoformat(),
+            updated_at=datetime.now(timezone.utc).isoformat(),
+            signed_by="wa-signer",
+            signature="sig",
+            signed_at=datetime.now(timezone.utc).isoformat(),
+        )
+        auth_service = Mock()
+        auth_service.verify_task_signature = AsyncMock(return_value=True)
+        auth_service.get_wa = AsyncMock(return_value=Mock(role=WARole.OBSERVER))
+        thought_processor.auth_service = auth_service
+
+        def thought(i: int) -> Thought:
+            return Thought(
+                thought_id=f"thought_{i}",
+                source_task_id="signed_task",
+                content=f"Thought {i}",
+                status=ThoughtStatus.PROCESSING,
+                created_at=datetime.now(timezone.utc).isoformat(),
+                updated_at=datetime.now(timezone.utc).isoformat(),
+            )
+
+        mock_persistence.get_task_by_id.return_value = task
+        results = [await thought_processor._verify_task_authorization(thought(i)) for i in range(3)]
+
+        assert results == [True, True, True]
+        assert mock_persistence.get_task_by_id.call_count == 1
+        assert auth_service.verify_task_signature.await_count == 1
+        assert auth_service.get_wa.await_count == 3
+
+        # A revoked signer is still caught for memoized tasks
+        auth_service.get_wa = AsyncMock(return_value=None)
+        assert await thought_processor._verify_task_authorization(thought(3)) is False
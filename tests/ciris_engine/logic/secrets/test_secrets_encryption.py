@@ -0,0 +1,136 @@
+"""
+Tests for SecretsEncryption key derivation.
+
+Tests cover:
+- v2 (stretched master key + HKDF) round trips
+- Legacy v1 (per-secret PBKDF2) ciphertexts still decrypt
+- Bounded derived-key cache and cache reset on rotation
+- Worker-pool re-encryption in SecretsStore
+"""
+import os
+import secrets
+import tempfile
+from unittest.mock import Mock
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from ciris_engine.logic.secrets.encryption import SecretsEncryption, KDF_V2_HEADER
+from ciris_engine.logic.secrets.store import SecretsStore
+from ciris_engine.schemas.secrets.core import DetectedSecret
+from ciris_engine.schemas.runtime.enums import SensitivityLevel
+
+
+def _legacy_encrypt(encryption: SecretsEncryption, value: str):
+    """Produce a ciphertext in the original v1 format."""
+    salt = secrets.token_bytes(16)
+    nonce = secrets.token_bytes(12)
+    key = encryption._derive_key_pbkdf2(salt)
+    return AESGCM(key).encrypt(nonce, value.encode("utf-8"), None), salt, nonce
+
+
+class TestKeyDerivation:
+    """Versioned key derivation."""
+
+    def test_v2_round_trip(self):
+        encryption = SecretsEncryption()
+        encrypted, salt, nonce = encryption.encrypt_secret("hunter2")
+
+        assert encrypted.startswith(KDF_V2_HEADER)
+        assert encryption.decrypt_secret(encrypted, salt, nonce) == "hunter2"
+
+    def test_legacy_ciphertext_decrypts(self):
+        encryption = SecretsEncryption()
+        encrypted, salt, nonce = _legacy_encrypt(encryption, "legacy-value")
+
+        assert encryption.decrypt_secret(encrypted, salt, nonce) == "legacy-value"
+
+    def test_v2_header_is_authenticated(self):
+        encryption = SecretsEncryption()
+        encrypted, salt, nonce = encryption.encrypt_secret("value")
+
+        with pytest.raises(InvalidTag):
+            encryption.decrypt_secret(encrypted[len(KDF_V2_HEADER):], salt, nonce)
+
+    def test_wrong_master_key_fails(self):
+        encrypted, salt, nonce = SecretsEncryption().encrypt_secret("value")
+
+        with pytest.raises(InvalidTag):
+            SecretsEncryption().decrypt_secret(encrypted, salt, nonce)
+
+    def test_master_key_stretched_once(self):
+        encryption = SecretsEncryption()
+        encryption.encrypt_secret("a")
+        stretched = encryption._stretched_key
+        encryption.encrypt_secret("b")
+
+        assert stretched is not None
+        assert encryption._stretched_key is stretched
+
+    def test_key_cache_is_bounded(self):
+        encryption = SecretsEncryption(key_cache_size=2)
+        for _ in range(5):
+            encryption.encrypt_secret("value")
+
+        assert len(encryption._key_cache) == 2
+
+    def test_cache_hit_skips_derivation(self):
+        encryption = SecretsEncryption()
+        encrypted, salt, nonce = _legacy_encrypt(encryption, "cached")
+        encryption.decrypt_secret(encrypted, salt, nonce)
+
+        encryption._derive_key_pbkdf2 = Mock(side_effect=AssertionError("should hit cache"))
+
+        assert encryption.decrypt_secret(encrypted, salt, nonce) == "cached"
+
+    def test_rotation_clears_cache(self):
+        encryption = SecretsEncryption()
+        encryption.encrypt_secret("value")
+        encryption.rotate_master_key()
+
+        assert len(encryption._key_cache) == 0
+        assert encryption._stretched_key is None
+
+
+class TestStoreReencryption:
+    """Bulk re-encryption through the worker pool."""
+
+    @pytest.fixture
+    def store(self):
+        fd, path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        time_service = Mock()
+        from datetime import datetime, timezone
+        time_service.now.return_value = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        yield SecretsStore(time_service=time_service, db_path=path)
+        os.unlink(path)
+
+    @pytest.mark.asyncio
+    async def test_reencrypt_all_mixed_formats(self, store):
+        for i in range(4):
+            await store.store_secret(DetectedSecret(
+                secret_uuid=f"s{i}",
+                original_value=f"value-{i}",
+                replacement_text=f"{{SECRET:s{i}:test}}",
+                pattern_name="test",
+                description="test",
+                sensitivity=SensitivityLevel.LOW,
+                context_hint="test",
+            ))
+        # Rewrite one record in the legacy format
+        import sqlite3
+        encrypted, salt, nonce = _legacy_encrypt(store.encryption, "value-0")
+        with sqlite3.connect(store.db_path) as conn:
+            conn.execute(
+                "UPDATE secrets SET encrypted_value = ?, salt = ?, nonce = ? WHERE secret_uuid = 's0'",
+                (encrypted, salt, nonce),
+            )
+
+        new_key = secrets.token_bytes(32)
+        assert await store.reencrypt_all(new_key, max_workers=2) is True
+
+        assert store.encryption.get_master_key() == new_key
+        for i in range(4):
+            record = await store.retrieve_secret(f"s{i}")
+            assert await store.async_decrypt_secret_value(record) == f"value-{i}"
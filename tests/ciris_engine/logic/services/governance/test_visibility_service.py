@@ -154,7 +154,7 @@ async def test_visibility_empty_state(visibility_service):
 
     # With no data in persistence, should return empty state
     with patch('ciris_engine.logic.services.governance.visibility.get_tasks_by_status', return_value=[]):
-        with patch('ciris_engine.logic.services.governance.visibility.get_thoughts_by_status', return_value=[]):
+        with patch('ciris_engine.logic.services.governance.visibility.get_recent_thoughts_by_status', return_value=[]):
             snapshot = await visibility_service.get_current_state()
 
     assert isinstance(snapshot, VisibilitySnapshot)
@@ -174,7 +174,7 @@ async def test_visibility_with_active_task(visibility_service):
 
     # Mock persistence to return the task
     with patch('ciris_engine.logic.services.governance.visibility.get_tasks_by_status', return_value=[task]):
-        with patch('ciris_engine.logic.services.governance.visibility.get_thoughts_by_status', return_value=[]):
+        with patch('ciris_engine.logic.services.governance.visibility.get_recent_thoughts_by_status', return_value=[]):
             snapshot = await visibility_service.get_current_state()
 
     assert isinstance(snapshot, VisibilitySnapshot)
@@ -196,7 +196,7 @@ async def test_visibility_with_active_thoughts(visibility_service):
 
     # Mock persistence
     with patch('ciris_engine.logic.services.governance.visibility.get_tasks_by_status', return_value=[]):
-        with patch('ciris_engine.logic.services.governance.visibility.get_thoughts_by_status', return_value=thoughts):
+        with patch('ciris_engine.logic.services.governance.visibility.get_recent_thoughts_by_status', return_value=thoughts):
             snapshot = await visibility_service.get_current_state()
 
     assert isinstance(snapshot, VisibilitySnapshot)
@@ -217,9 +217,9 @@ async def test_visibility_with_recent_decisions(visibility_service):
 
     # Mock persistence
     with patch('ciris_engine.logic.services.governance.visibility.get_tasks_by_status', return_value=[]):
-        with patch('ciris_engine.logic.services.governance.visibility.get_thoughts_by_status') as mock_get_thoughts:
+        with patch('ciris_engine.logic.services.governance.visibility.get_recent_thoughts_by_status') as mock_get_thoughts:
             # Return empty for PENDING, decisions for COMPLETED
-            def side_effect(status, db_path):
+            def side_effect(status, limit, db_path):
                 if status == ThoughtStatus.PENDING:
                     return []
                 elif status == ThoughtStatus.COMPLETED:
@@ -249,7 +249,7 @@ async def test_visibility_reasoning_depth(visibility_service):
 
     # Mock persistence
     with patch('ciris_engine.logic.services.governance.visibility.get_tasks_by_status', return_value=[]):
-        with patch('ciris_engine.logic.services.governance.visibility.get_thoughts_by_status', return_value=thoughts):
+        with patch('ciris_engine.logic.services.governance.visibility.get_recent_thoughts_by_status', return_value=thoughts):
             snapshot = await visibility_service.get_current_state()
 
     assert isinstance(snapshot, VisibilitySnapshot)
@@ -402,3 +402,82 @@ async def test_explain_action_no_final_action(visibility_service):
         explanation = await visibility_service.explain_action("thought-123")
 
     assert "did not result in an action" in explanation
+
+
+@pytest.fixture
+def seeded_service(time_service, temp_db):
+    """VisibilityService over an initialized database with two tasks of thoughts."""
+    from ciris_engine.logic.persistence import add_task, add_thought, initialize_database
+    from ciris_engine.logic.registries.base import ServiceRegistry
+    from ciris_engine.logic.buses import BusManager
+
+    initialize_database(temp_db)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for t, task_id in enumerate(["task-a", "task-b"]):
+        task = create_test_task(task_id, TaskStatus.COMPLETED)
+        task.created_at = task.updated_at = (base + timedelta(hours=t)).isoformat()
+        add_task(task, db_path=temp_db)
+        parent = None
+        for i in range(3):
+            thought = create_test_thought(
+                f"{task_id}-thought-{i}", task_id, ThoughtStatus.COMPLETED, "SPEAK", parent_thought_id=parent
+            )
+            thought.created_at = thought.updated_at = (base + timedelta(hours=t, minutes=i)).isoformat()
+            add_thought(thought, db_path=temp_db)
+            parent = thought.thought_id
+
+    bus_manager = BusManager(ServiceRegistry(), time_service)
+    return VisibilityService(bus_manager=bus_manager, time_service=time_service, db_path=temp_db)
+
+
+@pytest.mark.asyncio
+async def test_snapshot_keeps_most_recent_completed_thoughts(seeded_service):
+    """Recent decisions are the newest completed thoughts, newest first."""
+    snapshot = await seeded_service.get_current_state()
+
+    assert [t.thought_id for t in snapshot.recent_decisions][:2] == ["task-b-thought-2", "task-b-thought-1"]
+    assert len(snapshot.recent_decisions) == 6
+
+
+@pytest.mark.asyncio
+async def test_reasoning_depth_handles_missing_parents_and_cycles(visibility_service):
+    """Depth only follows parents present in the snapshot and stops on cycles."""
+    thoughts = [
+        create_test_thought("a", "task", parent_thought_id="outside"),
+        create_test_thought("b", "task", parent_thought_id="a"),
+        create_test_thought("x", "task", parent_thought_id="y"),
+        create_test_thought("y", "task", parent_thought_id="x"),
+    ]
+
+    assert VisibilityService._chain_depth(thoughts) == 2
+    assert VisibilityService._chain_depth([]) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_reasoning_traces_batches_tasks(seeded_service):
+    """Batched traces match single traces and use one query per table."""
+    from ciris_engine.logic.persistence import get_thoughts_by_task_ids
+
+    with patch(
+        'ciris_engine.logic.services.governance.visibility.get_thoughts_by_task_ids',
+        wraps=get_thoughts_by_task_ids,
+    ) as batch_thoughts:
+        traces = await seeded_service.get_reasoning_traces(["task-a", "task-b", "missing"])
+
+    assert batch_thoughts.call_count == 1
+    assert set(traces) == {"task-a", "task-b", "missing"}
+    assert traces["missing"].task.description == "Task not found"
+    single = await seeded_service.get_reasoning_trace("task-b")
+    assert traces["task-b"].thought_steps == single.thought_steps
+    assert [s.followup_thoughts for s in single.thought_steps] == [
+        ["task-b-thought-1"], ["task-b-thought-2"], []
+    ]
+    assert single.processing_time_ms == 2 * 60 * 1000
+
+
+@pytest.mark.asyncio
+async def test_task_history_is_newest_first(seeded_service):
+    """Task history returns recently completed tasks, bounded by limit."""
+    history = await seeded_service.get_task_history(limit=1)
+
+    assert [task.task_id for task in history] == ["task-b"]
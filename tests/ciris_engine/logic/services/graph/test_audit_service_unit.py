@@ -1,10 +1,11 @@
 """Unit tests for GraphAuditService."""
 
 import pytest
+import pytest_asyncio
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional, Generator
+from typing import Dict, Any, List, Optional, Generator, AsyncGenerator
 
 from ciris_engine.logic.services.graph.audit_service import GraphAuditService
 from ciris_engine.schemas.services.graph_core import GraphNode, NodeType, GraphScope
@@ -36,8 +37,8 @@ class TestGraphAuditService:
         bus.search = AsyncMock(return_value=[])
         return bus
 
-    @pytest.fixture
-    def audit_service(self, mock_time_service: Mock, mock_memory_bus: Mock) -> Generator[GraphAuditService, None, None]:
+    @pytest_asyncio.fixture
+    async def audit_service(self, mock_time_service: Mock, mock_memory_bus: Mock) -> AsyncGenerator[GraphAuditService, None]:
         """Create GraphAuditService instance."""
         import tempfile
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -49,6 +50,9 @@ class TestGraphAuditService:
                 export_path=f"{temp_dir}/audit_export.jsonl"  # Provide export path
             )
             yield service
+            # Stop background tasks (export worker, chain writer) before the loop closes
+            if service._started:
+                await service.stop()
 
     @pytest.mark.asyncio
     async def test_start_stop(self, audit_service: GraphAuditService) -> None:
@@ -246,7 +250,7 @@ class TestGraphAuditService:
         
         await audit_service.start()
 
-        # Mock search to return empty list (since query_audit_trail now uses search)
+        # With the hash chain enabled, queries are answered from audit_log
         mock_memory_bus.search = AsyncMock(return_value=[])
 
         # Create query object
@@ -259,8 +263,8 @@ class TestGraphAuditService:
         # Query audit trail
         entries = await audit_service.query_audit_trail(query)
 
-        # Should call search
-        mock_memory_bus.search.assert_called_once()
+        # Should not scan graph nodes
+        mock_memory_bus.search.assert_not_called()
 
         # Should return list (empty in this case)
         assert isinstance(entries, list)
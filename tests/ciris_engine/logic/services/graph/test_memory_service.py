@@ -35,6 +35,8 @@ def secrets_service():
     service.filter_string = AsyncMock(side_effect=lambda x, _: x)  # Pass through
     # process_incoming_text should return the original text unchanged and empty secret refs
     service.process_incoming_text = AsyncMock(side_effect=lambda text, **kwargs: (text, []))
+    # process_incoming_structure walks attribute trees and returns them unchanged
+    service.process_incoming_structure = AsyncMock(side_effect=lambda obj, **kwargs: (obj, []))
     return service
 
 
@@ -285,7 +287,7 @@ async def test_memory_service_secrets_integration(memory_service, secrets_servic
     await memory_service.memorize(node)
 
     # Verify secrets service was called
-    assert secrets_service.process_incoming_text.called
+    assert secrets_service.process_incoming_structure.called
 
     # Recall node - secrets should be decrypted
     query = MemoryQuery(node_id="secret_node", scope=GraphScope.LOCAL)
@@ -335,3 +337,109 @@ async def test_memory_service_graph_query(memory_service):
     # Should get parent node
     assert len(nodes) >= 1
     assert nodes[0].id == "parent_node"
+
+
+@pytest.mark.asyncio
+async def test_memorize_secret_scan_memoized_per_version(memory_service, secrets_service):
+    """Unchanged nodes at the same version are not rescanned."""
+    updated_at = datetime.now(timezone.utc)
+    node = GraphNode(
+        id="memo_node",
+        type=NodeType.CONCEPT,
+        scope=GraphScope.LOCAL,
+        attributes={"content": "nothing secret", "created_by": "test_user"},
+        version=3,
+        updated_at=updated_at,
+    )
+
+    await memory_service.memorize(node)
+    await memory_service.memorize(node)
+    assert secrets_service.process_incoming_structure.call_count == 1
+
+    # Changing a string leaf invalidates the memo even at the same version
+    changed = node.model_copy(update={"attributes": {"content": "different", "created_by": "test_user"}})
+    await memory_service.memorize(changed)
+    assert secrets_service.process_incoming_structure.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_memorize_with_real_secrets_service_scans_leaves(temp_db, time_service):
+    """String leaves are filtered, typed fields are skipped and refs recorded."""
+    secrets_db = temp_db.replace('.db', '_secrets.db')
+    secrets_service = SecretsService(db_path=secrets_db, time_service=time_service)
+    service = LocalGraphMemoryService(db_path=temp_db, secrets_service=secrets_service, time_service=time_service)
+    try:
+        attributes = {
+            "content": "use api_key=abcdefghijklmnopqrstuvwxyz0123 here",
+            "nested": {"items": ["plain", "Bearer tok.abc"]},
+            "signature": "Bearer not-a-secret-signature",
+            "created_by": "test_user",
+        }
+        node = GraphNode(id="leaf_node", type=NodeType.CONCEPT, scope=GraphScope.LOCAL, attributes=attributes)
+
+        processed = await service._process_secrets_for_memorize(node)
+
+        attrs = processed.attributes
+        assert "{SECRET:" in attrs["content"]
+        assert attrs["nested"]["items"][0] == "plain"
+        assert "{SECRET:" in attrs["nested"]["items"][1]
+        assert attrs["signature"] == "Bearer not-a-secret-signature"
+        assert len(attrs["secret_refs"]) == 2
+        # The caller's attributes are not mutated
+        assert attributes["content"].startswith("use api_key=")
+    finally:
+        if os.path.exists(secrets_db):
+            os.unlink(secrets_db)
+
+
+@pytest.mark.asyncio
+async def test_memorize_scans_keys_and_nested_skip_key_names(temp_db, time_service):
+    """Secrets used as dict keys, or nested under a skip-listed key name, are filtered."""
+    secrets_db = temp_db.replace('.db', '_secrets.db')
+    secrets_service = SecretsService(db_path=secrets_db, time_service=time_service)
+    service = LocalGraphMemoryService(db_path=temp_db, secrets_service=secrets_service, time_service=time_service)
+    try:
+        attributes = {
+            "lookup": {"api_key=abcdefghijklmnopqrstuvwxyz0123": "value"},
+            "payload": {"signature": "Bearer tok.abc", "metrics": ["Bearer tok.def"]},
+            "created_by": "test_user",
+        }
+        node = GraphNode(id="key_node", type=NodeType.CONCEPT, scope=GraphScope.LOCAL, attributes=attributes)
+
+        attrs = (await service._process_secrets_for_memorize(node)).attributes
+
+        [key] = attrs["lookup"].keys()
+        assert key.startswith("{SECRET:") and attrs["lookup"][key] == "value"
+        assert "{SECRET:" in attrs["payload"]["signature"]
+        assert "{SECRET:" in attrs["payload"]["metrics"][0]
+        assert len(attrs["secret_refs"]) == 3
+    finally:
+        if os.path.exists(secrets_db):
+            os.unlink(secrets_db)
+
+
+@pytest.mark.asyncio
+async def test_memorize_memo_invalidated_by_pattern_change(temp_db, time_service):
+    """A node memoized as secret-free is rescanned once the detection patterns change."""
+    from ciris_engine.schemas.secrets.core import SecretPattern, SensitivityLevel
+
+    secrets_db = temp_db.replace('.db', '_secrets.db')
+    secrets_service = SecretsService(db_path=secrets_db, time_service=time_service)
+    service = LocalGraphMemoryService(db_path=temp_db, secrets_service=secrets_service, time_service=time_service)
+    try:
+        node = GraphNode(
+            id="memo_real", type=NodeType.CONCEPT, scope=GraphScope.LOCAL,
+            attributes={"content": "launch code ZEBRA-4471"}, version=1, updated_at=datetime.now(timezone.utc),
+        )
+        assert (await service._process_secrets_for_memorize(node)) is node
+
+        secrets_service.filter.add_custom_pattern(SecretPattern(
+            name="launch_code", pattern=r"ZEBRA-\d{4}", description="Launch code",
+            sensitivity=SensitivityLevel.HIGH,
+        ))
+        processed = await service._process_secrets_for_memorize(node)
+
+        assert "{SECRET:" in processed.attributes["content"]
+    finally:
+        if os.path.exists(secrets_db):
+            os.unlink(secrets_db)
@@ -398,3 +398,98 @@ async def test_jwt_expiration_extraction(auth_service):
     assert channel_verification.valid is True
     # When no expiration in token, should use current time as fallback
     assert channel_verification.expires_at is not None
+
+
+async def _store_test_wa(auth_service, wa_id: str, kid: str) -> WACertificate:
+    _, public_key = auth_service.generate_keypair()
+    wa = WACertificate(
+        wa_id=wa_id,
+        name="Cache Test",
+        role=WARole.OBSERVER,
+        pubkey=auth_service._encode_public_key(public_key),
+        jwt_kid=kid,
+        scopes_json='["read:self"]',
+        created_at=datetime.now(timezone.utc)
+    )
+    await auth_service._store_wa_certificate(wa)
+    return wa
+
+
+@pytest.mark.asyncio
+async def test_verified_token_cache_skips_lookup_and_honors_exp(auth_service, monkeypatch):
+    """Verified tokens are served from cache until their exp passes."""
+    from unittest.mock import AsyncMock
+
+    wa = await _store_test_wa(auth_service, "wa-2025-06-24-CACHE1", "cache-kid")
+    token = auth_service.create_gateway_token(wa, expires_hours=1)
+    lookup = AsyncMock(wraps=auth_service._get_wa_by_kid)
+    monkeypatch.setattr(auth_service, "_get_wa_by_kid", lookup)
+
+    first = await auth_service._verify_jwt_and_get_context(token)
+    second = await auth_service._verify_jwt_and_get_context(token)
+    assert first is not None and second == first
+    assert lookup.await_count == 1
+    assert token not in auth_service._token_cache
+
+    # Once the clock passes exp the cached entry is dropped and the token re-verified
+    expired_at = first[1] + timedelta(seconds=1)
+    monkeypatch.setattr(auth_service, "_now", lambda: expired_at)
+    assert auth_service._get_verified_token(auth_service._token_cache_key(token)) is None
+    await auth_service._verify_jwt_and_get_context(token)
+    assert lookup.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_revocation_invalidates_wa_and_token_caches(auth_service):
+    """Revoking a WA drops its cached certificate and tokens."""
+    wa = await _store_test_wa(auth_service, "wa-2025-06-24-CACHE2", "cache-kid-2")
+    token = auth_service.create_gateway_token(wa)
+
+    assert await auth_service._verify_token_internal(token) is not None
+    assert (await auth_service.get_wa(wa.wa_id)) is not None
+    assert wa.wa_id in auth_service._wa_cache
+
+    # Login bookkeeping keeps verified tokens
+    await auth_service.update_last_login(wa.wa_id)
+    assert len(auth_service._token_cache) == 1
+
+    await auth_service.revoke_wa(wa.wa_id, "test")
+    assert wa.wa_id not in auth_service._wa_cache
+    assert len(auth_service._token_cache) == 0
+    assert await auth_service._verify_token_internal(token) is None
+    assert await auth_service.get_wa(wa.wa_id) is None
+
+
+@pytest.mark.asyncio
+async def test_revocation_by_another_process_seen_after_ttl(auth_service, temp_db, time_service, monkeypatch):
+    """Caches are revalidated after CACHE_TTL, so out-of-process revocations take effect."""
+    from ciris_engine.logic.services.infrastructure.authentication import CACHE_TTL
+
+    wa = await _store_test_wa(auth_service, "wa-2025-06-24-CACHE4", "cache-kid-4")
+    token = auth_service.create_gateway_token(wa)
+    assert await auth_service._verify_token_internal(token) is not None
+
+    # A second service on the same database stands in for the WA CLI
+    other = AuthenticationService(db_path=temp_db, time_service=time_service)
+    assert await other.revoke_wa(wa.wa_id, "revoked elsewhere")
+
+    # Within the TTL the cached verification is still served
+    assert await auth_service._verify_token_internal(token) is not None
+
+    later = auth_service._now() + CACHE_TTL
+    monkeypatch.setattr(auth_service, "_now", lambda: later)
+    assert await auth_service._verify_token_internal(token) is None
+    assert await auth_service.get_wa(wa.wa_id) is None
+    assert wa.wa_id not in auth_service._wa_cache
+
+
+@pytest.mark.asyncio
+async def test_cached_wa_is_a_copy(auth_service):
+    """Callers mutating a returned certificate do not change the cache."""
+    wa = await _store_test_wa(auth_service, "wa-2025-06-24-CACHE3", "cache-kid-3")
+
+    fetched = await auth_service.get_wa(wa.wa_id)
+    fetched.name = "Mutated"
+
+    assert (await auth_service.get_wa(wa.wa_id)).name == "Cache Test"
+    assert (await auth_service._get_wa_by_kid("cache-kid-3")).wa_id == wa.wa_id
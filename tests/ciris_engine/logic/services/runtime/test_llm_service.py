@@ -92,6 +92,11 @@ async def test_llm_service_call_structured(llm_service):
         assert result.rationale == "Test response reasoning"
         assert hasattr(usage, 'tokens_used')
 
+    # Successful calls feed the response time average
+    assert llm_service._response_times.count == 1
+    assert llm_service._get_status().response_time_avg == llm_service._response_times.mean_ms
+    assert llm_service.get_status().metrics["avg_response_time_ms"] == llm_service._response_times.mean_ms
+
 
 @pytest.mark.asyncio
 async def test_llm_service_retry_logic(llm_service):
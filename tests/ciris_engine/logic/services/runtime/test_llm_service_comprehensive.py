@@ -100,9 +100,6 @@ def llm_service(llm_config, mock_time_service, mock_telemetry_service):
                     service.client = mock_client
                     service.instruct_client = mock_instruct_client
                     
-                    # Set up proper response times for metrics
-                    service._response_times = []
-                    
                     return service
 
 
@@ -451,8 +448,9 @@ class TestOpenAICompatibleClient:
         })
         llm_service.circuit_breaker.is_available = MagicMock(return_value=True)
         
-        # Add mock response times
-        llm_service._response_times = [100, 200, 150]
+        # Add response times
+        for value in (100, 200, 150):
+            llm_service._response_times.record(value)
         
         status = llm_service._get_status()
         
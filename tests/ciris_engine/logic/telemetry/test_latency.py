@@ -0,0 +1,161 @@
+"""
+Tests for mergeable latency histograms.
+
+Tests cover:
+- Percentiles within the configured relative accuracy
+- Merging histograms equals recording all samples into one
+- Registry merging owned and weakly attached histograms
+- Request metrics, LLM bus and per-provider bus dispatch latencies reaching the registry
+"""
+import gc
+import random
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.buses.llm_bus import LLMBus
+from ciris_engine.logic.buses.memory_bus import MemoryBus
+from ciris_engine.logic.services.mixins.request_metrics import RequestMetricsMixin
+from ciris_engine.logic.telemetry.latency import LatencyHistogram, latency_registry, timed
+from ciris_engine.schemas.services.graph_core import GraphScope
+from ciris_engine.schemas.services.operations import MemoryQuery
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    latency_registry.reset()
+    yield latency_registry
+    latency_registry.reset()
+
+
+def _exact(samples, percentile):
+    ordered = sorted(samples)
+    return ordered[int(percentile / 100 * (len(ordered) - 1))]
+
+
+class TestLatencyHistogram:
+    """Histogram accuracy and merging."""
+
+    def test_percentiles_within_relative_accuracy(self):
+        rng = random.Random(7)
+        samples = [rng.lognormvariate(3, 1) for _ in range(20000)]
+        hist = LatencyHistogram(relative_accuracy=0.01)
+        for value in samples:
+            hist.record(value)
+
+        for percentile in (0, 50, 95, 99, 100):
+            exact = _exact(samples, percentile)
+            assert hist.percentile(percentile) == pytest.approx(exact, rel=0.02)
+        summary = hist.summary()
+        assert summary.count == 20000
+        assert summary.mean_ms == pytest.approx(sum(samples) / len(samples))
+        assert summary.max_ms == max(samples)
+
+    def test_empty_zero_and_invalid(self):
+        hist = LatencyHistogram()
+        assert hist.percentile(99) == 0.0
+        hist.record(0.0)
+        hist.record(10.0)
+        assert hist.percentile(0) == 0.0
+        assert hist.percentile(100) == 10.0
+        with pytest.raises(ValueError):
+            hist.percentile(150)
+
+    def test_merge_matches_single_histogram(self):
+        rng = random.Random(3)
+        windows = [[rng.expovariate(1 / 40) for _ in range(1000)] for _ in range(3)]
+        combined = LatencyHistogram()
+        merged = LatencyHistogram()
+        for window in windows:
+            part = LatencyHistogram()
+            for value in window:
+                part.record(value)
+                combined.record(value)
+            merged.merge(part)
+
+        merged_summary, combined_summary = merged.summary(), combined.summary()
+        assert merged_summary.count == combined_summary.count == 3000
+        assert (merged_summary.p50_ms, merged_summary.p95_ms, merged_summary.p99_ms, merged_summary.max_ms) == (
+            combined_summary.p50_ms, combined_summary.p95_ms, combined_summary.p99_ms, combined_summary.max_ms
+        )
+        assert merged_summary.mean_ms == pytest.approx(combined_summary.mean_ms)
+        with pytest.raises(ValueError):
+            merged.merge(LatencyHistogram(relative_accuracy=0.05))
+
+
+class TestLatencyRegistry:
+    """Histograms grouped by category and name."""
+
+    def test_owned_and_attached_are_merged(self, clean_registry):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(10.0)
+        second.record(30.0)
+        clean_registry.attach("service", "Svc", first)
+        clean_registry.attach("service", "Svc", second)
+        clean_registry.record("service", "Svc", 20.0)
+        clean_registry.record("handler", "speak", 5.0)
+
+        summaries = clean_registry.summaries()
+        assert summaries["service"]["Svc"].count == 3
+        assert summaries["service"]["Svc"].p50_ms == pytest.approx(20.0, rel=0.01)
+        assert set(clean_registry.summaries("handler")) == {"handler"}
+
+        del second
+        gc.collect()
+        assert clean_registry.summaries()["service"]["Svc"].count == 2
+
+    @pytest.mark.asyncio
+    async def test_timed_records_failures_too(self, clean_registry):
+        @timed("tool_bus", "execute_tool")
+        async def execute(fail):
+            if fail:
+                raise RuntimeError("boom")
+            return "ok"
+
+        assert await execute(False) == "ok"
+        with pytest.raises(RuntimeError):
+            await execute(True)
+        assert clean_registry.summaries()["tool_bus"]["execute_tool"].count == 2
+
+
+class TestLatencySources:
+    """Services and buses record into the registry."""
+
+    def test_request_metrics_use_histogram(self, clean_registry):
+        class Service(RequestMetricsMixin):
+            pass
+
+        service = Service()
+        for value in range(1, 201):
+            service._response_times.record(float(value))
+
+        assert service.get_response_time_percentile(50) == pytest.approx(100.0, rel=0.02)
+        assert service.get_response_time_summary().p99_ms == pytest.approx(198.0, rel=0.02)
+        assert clean_registry.summaries()["service"]["Service"].count == 200
+
+    def test_llm_bus_reports_percentiles(self, clean_registry):
+        time_service = Mock(now=Mock(return_value=datetime(2025, 1, 1, tzinfo=timezone.utc)))
+        bus = LLMBus(service_registry=Mock(), time_service=time_service)
+        for value in (100.0, 200.0, 300.0):
+            bus._record_success("MockLLM_1", value)
+
+        stats = bus.get_service_stats()["MockLLM_1"]
+        assert stats["average_latency_ms"] == "200.00"
+        assert float(stats["p50_latency_ms"]) == pytest.approx(200.0, rel=0.01)
+        assert clean_registry.summaries("llm")["llm"]["MockLLM_1"].count == 3
+
+    @pytest.mark.asyncio
+    async def test_bus_dispatch_records_per_provider(self, clean_registry):
+        class LocalMemory:
+            recall = AsyncMock(return_value=[])
+
+        registry = Mock(get_service=AsyncMock(return_value=LocalMemory()))
+        bus = MemoryBus(service_registry=registry, time_service=Mock())
+        query = MemoryQuery(node_id="n1", scope=GraphScope.LOCAL)
+        await bus.recall(query)
+        await bus.recall(query)
+
+        summaries = clean_registry.summaries()
+        assert summaries["service"]["LocalMemory"].count == 2
+        assert summaries["memory_bus"]["recall"].count == 2
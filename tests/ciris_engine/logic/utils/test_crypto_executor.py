@@ -0,0 +1,119 @@
+"""
+Tests for the shared crypto executor.
+
+Tests cover:
+- Results, failures and queue-depth counters
+- Queue-wait and compute latency recorded per operation
+- Reconfiguring the shared executor size
+- Password logins and audit signing running on the executor
+"""
+import asyncio
+import threading
+
+import pytest
+
+from ciris_engine.logic.adapters.api.services.auth_service import APIAuthService
+from ciris_engine.logic.telemetry.latency import latency_registry
+from ciris_engine.logic.utils.crypto_executor import (
+    CryptoExecutor,
+    configure_crypto_executor,
+    get_crypto_executor,
+)
+
+
+@pytest.fixture
+def executor():
+    executor = configure_crypto_executor(2)
+    latency_registry.reset()
+    yield executor
+    latency_registry.reset()
+    configure_crypto_executor()
+
+
+class TestCryptoExecutor:
+    """Running blocking calls on the pool."""
+
+    @pytest.mark.asyncio
+    async def test_runs_off_the_event_loop_and_records_latency(self, executor):
+        loop_thread = threading.get_ident()
+
+        result = await executor.run("probe", lambda x: (x * 2, threading.get_ident()), 21)
+
+        assert result[0] == 42
+        assert result[1] != loop_thread
+        stats = executor.get_stats()
+        assert (stats.max_workers, stats.completed, stats.failed, stats.queue_depth) == (2, 1, 0, 0)
+        summaries = latency_registry.summaries()
+        assert summaries["crypto"]["probe"].count == 1
+        assert summaries["crypto_queue"]["probe"].count == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_propagate_and_are_counted(self, executor):
+        def fail():
+            raise ValueError("bad key")
+
+        with pytest.raises(ValueError):
+            await executor.run("probe", fail)
+
+        stats = executor.get_stats()
+        assert (stats.completed, stats.failed, stats.running) == (0, 1, 0)
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_tracks_waiting_work(self):
+        executor = CryptoExecutor(max_workers=1)
+        release = threading.Event()
+        try:
+            first = asyncio.create_task(executor.run("hold", release.wait))
+            waiting = [asyncio.create_task(executor.run("hold", lambda: None)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+
+            stats = executor.get_stats()
+            assert stats.running == 1
+            assert stats.queue_depth == 3
+            release.set()
+            await asyncio.gather(first, *waiting)
+            stats = executor.get_stats()
+            assert (stats.queue_depth, stats.completed) == (0, 4)
+            assert stats.peak_queue_depth >= 3
+        finally:
+            release.set()
+            executor.shutdown()
+
+    def test_configure_replaces_shared_executor(self, executor):
+        assert get_crypto_executor() is executor
+        resized = configure_crypto_executor(3)
+        assert get_crypto_executor() is resized
+        assert resized.get_stats().max_workers == 3
+        with pytest.raises(ValueError):
+            CryptoExecutor(max_workers=0)
+
+
+class TestCryptoCallSites:
+    """Services hand their crypto to the shared executor."""
+
+    @pytest.mark.asyncio
+    async def test_password_login_uses_executor(self, executor):
+        service = APIAuthService()
+        admin = service.get_user_by_username("admin")
+        admin.password_hash = service._hash_password("s3cret")
+
+        assert await service.verify_user_password("admin", "s3cret") is admin
+        assert await service.verify_user_password("admin", "wrong") is None
+        assert executor.get_stats().completed == 2
+
+        # An account without a password hash never matches, and costs no bcrypt work
+        admin.password_hash = None
+        assert await service.verify_user_password("admin", "s3cret") is None
+        assert not await service.change_password(admin.wa_id, "new", current_password="s3cret")
+        assert executor.get_stats().completed == 2
+        assert latency_registry.summaries()["crypto"]["bcrypt_verify"].count == 2
+
+    @pytest.mark.asyncio
+    async def test_change_password_hashes_once(self, executor):
+        service = APIAuthService()
+        admin = service.get_user_by_username("admin")
+        admin.password_hash = service._hash_password("old")
+
+        assert await service.change_password(admin.wa_id, "new", current_password="old")
+        assert await service.verify_user_password("admin", "new") is admin
+        assert latency_registry.summaries()["crypto"]["bcrypt_hash"].count == 1
@@ -0,0 +1,172 @@
+"""
+Tests for the queued logging pipeline and incident capture.
+
+Tests cover:
+- Per-logger sampling from hot/cold path classifications, off unless enabled
+- Background writer batching records and flushing once per batch
+- Incident file kept open, with identical incidents rate-limited
+- Incidents forwarded to the graph in batches
+- setup_basic_logging routing everything through the pipeline
+"""
+import asyncio
+import logging
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ciris_engine.logic.telemetry.hot_cold_config import get_log_sampling_rate
+from ciris_engine.logic.utils import incident_capture_handler as ich
+from ciris_engine.logic.utils.incident_capture_handler import (
+    IncidentCaptureHandler,
+    inject_graph_audit_service_to_handlers,
+)
+from ciris_engine.logic.utils.log_pipeline import (
+    LogPipeline,
+    LogSamplingFilter,
+    get_log_pipeline,
+    stop_log_pipeline,
+)
+from ciris_engine.logic.utils.logging_config import setup_basic_logging
+from ciris_engine.schemas.services.operations import MemoryOpResult, MemoryOpStatus
+
+
+@pytest.fixture
+def time_service():
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return Mock(now=Mock(return_value=now), now_iso=Mock(return_value=now.isoformat()))
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    saved = (list(root.handlers), root.level, root.propagate)
+    yield root
+    stop_log_pipeline()
+    root.handlers, root.level, root.propagate = saved[0], saved[1], saved[2]
+
+
+def _record(name, level, msg):
+    return logging.LogRecord(name, level, __file__, 1, msg, None, None)
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.flushes = 0
+
+    def emit(self, record):
+        self.records.append(record.getMessage())
+
+    def flush(self):
+        self.flushes += 1
+
+
+class TestSampling:
+    """Sub-WARNING records are sampled by path classification."""
+
+    def test_rates_follow_hot_cold_paths(self):
+        assert get_log_sampling_rate("ciris_engine.logic.processors.core.main_processor") == 1.0
+        assert get_log_sampling_rate("ciris_engine.logic.persistence.models.tasks") == 0.2
+        assert get_log_sampling_rate("some.third_party") == 1.0
+
+    def test_filter_keeps_every_nth_and_all_warnings(self):
+        sampling = LogSamplingFilter()
+        cold = "ciris_engine.logic.persistence.models.tasks"
+
+        kept = [sampling.filter(_record(cold, logging.INFO, f"m{i}")) for i in range(10)]
+        warnings = [sampling.filter(_record(cold, logging.WARNING, "w")) for _ in range(3)]
+        hot = [sampling.filter(_record("ciris_engine.logic.dma.csdma", logging.INFO, "h")) for _ in range(3)]
+
+        assert kept == [True, False, False, False, False] * 2
+        assert all(warnings) and all(hot)
+        assert sampling.sampled_out == 8
+
+    def test_sampling_is_opt_in(self):
+        assert LogPipeline([CollectingHandler()]).sampling_filter is None
+        assert LogPipeline([CollectingHandler()], sampling=True).sampling_filter is not None
+
+
+class TestPipeline:
+    """The background writer drains the queue in batches."""
+
+    def test_records_written_in_order_with_batched_flushes(self):
+        target = CollectingHandler()
+        pipeline = LogPipeline([target], sampling=False)
+        logger = logging.getLogger("test_log_pipeline.batching")
+        logger.addHandler(pipeline.queue_handler)
+        logger.propagate = False
+        try:
+            for i in range(500):
+                logger.warning("message %d", i)
+            pipeline.start()
+        finally:
+            pipeline.stop()
+            logger.removeHandler(pipeline.queue_handler)
+
+        assert target.records == [f"message {i}" for i in range(500)]
+        assert target.flushes == pipeline.batches_written < 500
+        assert pipeline.dropped == 0
+
+
+class TestIncidentCapture:
+    """Incident file writes, rate limiting and graph forwarding."""
+
+    def test_identical_incidents_are_rate_limited(self, tmp_path, time_service, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr(ich.time, "monotonic", lambda: clock[0])
+        handler = IncidentCaptureHandler(log_dir=str(tmp_path), time_service=time_service, rate_limit_seconds=60)
+
+        for _ in range(5):
+            handler.emit(_record("svc", logging.WARNING, "disk slow"))
+        handler.emit(_record("svc", logging.WARNING, "disk full"))
+        clock[0] += 61
+        handler.emit(_record("svc", logging.WARNING, "disk slow"))
+        handler.close()
+
+        lines = [line for line in handler.log_file.read_text().splitlines() if " - svc - " in line]
+        assert len(lines) == 3
+        assert lines[2].endswith("disk slow [4 identical incident(s) suppressed]")
+        assert handler.suppressed_count == 4
+
+    @pytest.mark.asyncio
+    async def test_incidents_forwarded_to_graph_in_batches(self, tmp_path, time_service):
+        memorize = AsyncMock(return_value=MemoryOpResult(status=MemoryOpStatus.OK))
+        audit_service = SimpleNamespace(_memory_bus=SimpleNamespace(memorize=memorize))
+        handler = IncidentCaptureHandler(
+            log_dir=str(tmp_path), time_service=time_service, rate_limit_seconds=0, graph_batch_size=2
+        )
+        handler.batched = True
+        for i in range(5):
+            handler.emit(_record("svc", logging.ERROR, f"failure {i}"))
+        assert memorize.await_count == 0  # nothing until the service is injected
+
+        handler.set_graph_audit_service(audit_service)
+        for _ in range(50):
+            if handler.incidents_forwarded == 5:
+                break
+            await asyncio.sleep(0.01)
+        handler.close()
+
+        assert memorize.await_count == 5
+        descriptions = [call.kwargs["node"].attributes["description"] for call in memorize.await_args_list]
+        assert descriptions == [f"failure {i}" for i in range(5)]
+
+
+class TestSetup:
+    """setup_basic_logging installs the pipeline."""
+
+    def test_setup_routes_through_pipeline(self, tmp_path, time_service, restore_root_logger):
+        setup_basic_logging(log_dir=str(tmp_path), time_service=time_service)
+        pipeline = get_log_pipeline()
+
+        assert restore_root_logger.handlers == [pipeline.queue_handler]
+        assert inject_graph_audit_service_to_handlers(SimpleNamespace(_memory_bus=None)) == 1
+
+        logging.getLogger("test_log_pipeline.setup").info("through the queue")
+        stop_log_pipeline()
+
+        log_file = next(tmp_path.glob("ciris_agent_*.log"))
+        assert "through the queue" in log_file.read_text()
@@ -556,14 +556,15 @@ class TestAuthenticationServiceJWT:
         token = auth_service.create_gateway_token(wa)
         
         # First verification - not cached
-        assert token not in auth_service._token_cache
+        cache_key = auth_service._token_cache_key(token)
+        assert cache_key not in auth_service._token_cache
         
         context = await auth_service._verify_token_internal(token)
         assert context is not None
         
-        # Should now be cached
-        assert token in auth_service._token_cache
-        assert auth_service._token_cache[token] == context
+        # Should now be cached by token hash, never by the raw token
+        assert token not in auth_service._token_cache
+        assert auth_service._token_cache[cache_key].context == context
         
         # Second verification should use cache
         context2 = await auth_service._verify_token_internal(token)
@@ -20,6 +20,7 @@ async def test_memory_operations():
         mock_secrets_service = Mock()
         # Return the JSON string and empty secret refs
         mock_secrets_service.process_incoming_text = AsyncMock(return_value=('{"value": "test_data"}', []))
+        mock_secrets_service.process_incoming_structure = AsyncMock(side_effect=lambda obj, **kwargs: (obj, []))
         mock_secrets_service.process_outgoing_data = AsyncMock(return_value={"value": "test_data"})
 
         mock_time_service = Mock()
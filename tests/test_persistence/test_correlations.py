@@ -0,0 +1,200 @@
+"""
+Tests for correlation persistence read paths.
+
+Tests cover:
+- Shared row decoder used by all correlation queries
+- Projection-aware query_correlations API
+- Lazy JSON decoding in CorrelationRecord
+"""
+import os
+import tempfile
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from ciris_engine.logic.persistence.db.core import initialize_database, get_db_connection
+from ciris_engine.logic.persistence.models import correlations as corr_models
+from ciris_engine.logic.persistence.models.correlations import (
+    add_correlation,
+    get_correlation,
+    get_correlations_by_channel,
+    get_correlations_by_type_and_time,
+    get_metrics_timeseries,
+    query_correlations,
+    CorrelationRecord,
+    CORRELATION_COLUMNS,
+)
+from ciris_engine.schemas.persistence.core import MetricsQuery
+from ciris_engine.schemas.telemetry.core import (
+    ServiceCorrelation,
+    ServiceCorrelationStatus,
+    CorrelationType,
+    MetricData,
+)
+
+
+@pytest.fixture
+def db_path():
+    """Create a temporary initialized database."""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    initialize_database(path)
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+def _metric(i: int, base: datetime) -> ServiceCorrelation:
+    ts = base + timedelta(seconds=i)
+    return ServiceCorrelation(
+        correlation_id=f"metric_{i}",
+        correlation_type=CorrelationType.METRIC_DATAPOINT,
+        service_type="telemetry",
+        handler_name="telemetry_service",
+        action_type="record_metric",
+        status=ServiceCorrelationStatus.COMPLETED,
+        created_at=ts,
+        updated_at=ts,
+        timestamp=ts,
+        metric_data=MetricData(
+            metric_name="tokens_used" if i % 2 == 0 else "llm_latency",
+            metric_value=float(i),
+            metric_unit="count",
+            metric_type="gauge",
+            labels={},
+        ),
+        tags={"source": "test", "index": str(i)},
+    )
+
+
+def _speak(i: int, channel_id: str, base: datetime) -> ServiceCorrelation:
+    ts = base + timedelta(seconds=i)
+    return ServiceCorrelation(
+        correlation_id=f"speak_{i}",
+        service_type="api",
+        handler_name="SpeakHandler",
+        action_type="speak",
+        request_data={
+            "service_type": "api",
+            "method_name": "speak",
+            "channel_id": channel_id,
+            "parameters": {"content": f"hello {i}"},
+            "request_timestamp": ts,
+        },
+        status=ServiceCorrelationStatus.COMPLETED,
+        created_at=ts,
+        updated_at=ts,
+        timestamp=ts,
+    )
+
+
+class TestSharedDecoder:
+    """All read paths decode through the same row decoder."""
+
+    def test_get_correlation_round_trip(self, db_path):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        add_correlation(_metric(0, base), db_path=db_path)
+
+        result = get_correlation("metric_0", db_path=db_path)
+
+        assert result is not None
+        assert result.metric_data.metric_name == "tokens_used"
+        assert result.timestamp == base
+        assert result.tags == {"source": "test", "index": "0"}
+
+    def test_missing_correlation_returns_none(self, db_path):
+        assert get_correlation("nope", db_path=db_path) is None
+
+    def test_z_suffix_and_legacy_status(self, db_path):
+        with get_db_connection(db_path) as conn:
+            conn.execute(
+                "INSERT INTO service_correlations (correlation_id, service_type, handler_name, action_type, "
+                "status, correlation_type, timestamp, tags) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ("legacy", "svc", "h", "a", "success", "service_interaction",
+                 "2025-01-01T00:00:00Z", '{"count": 3}'),
+            )
+            conn.commit()
+
+        result = get_correlation("legacy", db_path=db_path)
+
+        assert result.status == ServiceCorrelationStatus.COMPLETED
+        assert result.timestamp == datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert result.tags == {"count": "3"}
+
+    def test_type_and_time_and_timeseries(self, db_path):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for i in range(6):
+            add_correlation(_metric(i, base), db_path=db_path)
+
+        by_type = get_correlations_by_type_and_time(
+            CorrelationType.METRIC_DATAPOINT, metric_names=["tokens_used"], db_path=db_path
+        )
+        assert [c.correlation_id for c in by_type] == ["metric_4", "metric_2", "metric_0"]
+
+        series = get_metrics_timeseries(MetricsQuery(metric_name="llm_latency"), db_path=db_path)
+        assert [c.metric_data.metric_value for c in series] == [1.0, 3.0, 5.0]
+
+    def test_channel_history_is_chronological(self, db_path):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for i in range(3):
+            add_correlation(_speak(i, "api_test", base), db_path=db_path)
+        add_correlation(_speak(9, "api_other", base), db_path=db_path)
+
+        history = get_correlations_by_channel("api_test", db_path=db_path)
+
+        assert [c.correlation_id for c in history] == ["speak_0", "speak_1", "speak_2"]
+
+
+class TestProjectionQueries:
+    """query_correlations selects only requested columns."""
+
+    def test_projection_only_exposes_selected_columns(self, db_path):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        for i in range(4):
+            add_correlation(_metric(i, base), db_path=db_path)
+
+        records = query_correlations(
+            ["metric_name", "metric_value"],
+            correlation_type=CorrelationType.METRIC_DATAPOINT,
+            ascending=True,
+            db_path=db_path,
+        )
+
+        assert [r.metric_value for r in records] == [0.0, 1.0, 2.0, 3.0]
+        assert records[0].columns == ("metric_name", "metric_value")
+        with pytest.raises(AttributeError):
+            _ = records[0].tags
+
+    def test_unknown_column_rejected(self, db_path):
+        with pytest.raises(ValueError):
+            query_correlations(["metric_name", "1; DROP TABLE tasks"], db_path=db_path)
+
+    def test_json_columns_decoded_lazily_once(self, db_path, monkeypatch):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        add_correlation(_metric(0, base), db_path=db_path)
+
+        calls = []
+        original = corr_models._loads_json
+
+        def counting_loads(value):
+            calls.append(value)
+            return original(value)
+
+        monkeypatch.setattr(corr_models, "_loads_json", counting_loads)
+
+        record = query_correlations(["correlation_id", "tags"], db_path=db_path)[0]
+        assert calls == []
+        assert record.tags == {"source": "test", "index": "0"}
+        assert record.tags["index"] == "0"
+        assert len(calls) == 1
+
+    def test_record_to_correlation_matches_model_path(self, db_path):
+        base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        add_correlation(_speak(1, "api_test", base), db_path=db_path)
+
+        record = query_correlations(channel_id="api_test", db_path=db_path)[0]
+
+        assert isinstance(record, CorrelationRecord)
+        assert record.columns == CORRELATION_COLUMNS
+        assert record.parsed_timestamp == base + timedelta(seconds=1)
+        assert record.to_correlation() == get_correlation("speak_1", db_path=db_path)
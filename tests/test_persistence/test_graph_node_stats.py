@@ -0,0 +1,139 @@
+"""
+Tests for the materialized graph node statistics.
+
+Tests cover:
+- Trigger maintenance on insert, update, delete and raw SQL writes
+- Counts by type, scope and day, and filtered counts
+- Reconciliation of drifted groups
+- Fallback to graph_nodes when the stats table is absent
+- Database errors surfaced to the caller
+"""
+import sqlite3
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from ciris_engine.logic.persistence.db.core import get_db_connection, initialize_database
+from ciris_engine.logic.persistence.models.graph import (
+    add_graph_node,
+    count_graph_nodes,
+    delete_graph_node,
+    get_graph_node_counts,
+    reconcile_graph_node_stats,
+)
+from ciris_engine.schemas.persistence.tables import GRAPH_NODES_TABLE_V1
+from ciris_engine.schemas.services.graph_core import GraphNode, GraphScope, NodeType
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "stats.db")
+    initialize_database(path)
+    return path
+
+
+@pytest.fixture
+def time_service():
+    service = MagicMock()
+    service.now.return_value = datetime.now(timezone.utc)
+    return service
+
+
+def _node(node_id, node_type=NodeType.CONCEPT, scope=GraphScope.LOCAL):
+    return GraphNode(id=node_id, type=node_type, scope=scope, attributes={})
+
+
+def _actual_counts(db_path):
+    with get_db_connection(db_path=db_path) as conn:
+        return {
+            (row[0], row[1]): row[2]
+            for row in conn.execute("SELECT scope, node_type, COUNT(*) FROM graph_nodes GROUP BY scope, node_type")
+        }
+
+
+class TestTriggerMaintenance:
+    """Every write path keeps the stats exact."""
+
+    def test_model_writes_update_counts(self, db_path, time_service):
+        for i in range(4):
+            add_graph_node(_node(f"c{i}"), time_service, db_path=db_path)
+        add_graph_node(_node("t0", NodeType.TSDB_DATA), time_service, db_path=db_path)
+        add_graph_node(_node("i0", scope=GraphScope.IDENTITY), time_service, db_path=db_path)
+        # Updating an existing node does not change counts
+        add_graph_node(_node("c0"), time_service, db_path=db_path)
+        delete_graph_node("c1", GraphScope.LOCAL, db_path=db_path)
+
+        counts = get_graph_node_counts(db_path=db_path)
+        assert counts.total == 5
+        assert counts.by_type == {"concept": 4, "tsdb_data": 1}
+        assert counts.by_scope == {"local": 4, "identity": 1}
+        assert sum(counts.by_day.values()) == 5
+        assert count_graph_nodes(node_type="tsdb_data", db_path=db_path) == 1
+        assert count_graph_nodes(node_type="concept", scope=GraphScope.LOCAL, db_path=db_path) == 3
+        assert count_graph_nodes(node_type="concept", scope="local", db_path=db_path) == 3
+
+    def test_raw_sql_writes_are_tracked(self, db_path):
+        with get_db_connection(db_path=db_path) as conn:
+            conn.executemany(
+                "INSERT INTO graph_nodes (node_id, scope, node_type, attributes_json, created_at) VALUES (?, 'local', ?, '{}', ?)",
+                [("a", "tsdb_data", "2025-01-01T10:00:00"), ("b", "tsdb_data", "2025-01-02T10:00:00"),
+                 ("c", "concept", "2025-01-02 11:00:00")],
+            )
+            conn.execute("UPDATE graph_nodes SET node_type = 'tsdb_summary' WHERE node_id = 'b'")
+            conn.execute("DELETE FROM graph_nodes WHERE node_id = 'a'")
+            conn.commit()
+
+        counts = get_graph_node_counts(db_path=db_path)
+        assert counts.by_type == {"tsdb_summary": 1, "concept": 1}
+        assert counts.by_day == {"2025-01-02": 2}
+        assert reconcile_graph_node_stats(db_path=db_path) == 0
+
+
+class TestReconciliation:
+    """The reconciliation job repairs drift."""
+
+    def test_repairs_drifted_and_stale_groups(self, db_path, time_service):
+        for i in range(3):
+            add_graph_node(_node(f"c{i}"), time_service, db_path=db_path)
+        with get_db_connection(db_path=db_path) as conn:
+            conn.execute("UPDATE graph_node_stats SET node_count = 42")
+            conn.execute("INSERT INTO graph_node_stats VALUES ('local', 'ghost', '2020-01-01', 7)")
+            conn.commit()
+
+        assert reconcile_graph_node_stats(db_path=db_path) == 2
+        assert get_graph_node_counts(db_path=db_path).by_type == {"concept": 3}
+        assert reconcile_graph_node_stats(db_path=db_path) == 0
+
+    def test_migration_backfills_existing_nodes(self, db_path):
+        # Stats built by the migration match a full count of graph_nodes
+        with get_db_connection(db_path=db_path) as conn:
+            conn.execute(
+                "INSERT INTO graph_nodes (node_id, scope, node_type, created_at) VALUES ('x', 'local', 'agent', '2025-03-01')"
+            )
+            conn.commit()
+
+        counts = get_graph_node_counts(db_path=db_path)
+        assert {("local", t): n for t, n in counts.by_type.items()} == _actual_counts(db_path)
+
+
+class TestFallback:
+    """Databases without the stats table still report counts."""
+
+    def test_counts_without_stats_table(self, tmp_path):
+        path = str(tmp_path / "bare.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(GRAPH_NODES_TABLE_V1)
+        conn.execute("INSERT INTO graph_nodes (node_id, scope, node_type) VALUES ('a', 'local', 'concept')")
+        conn.commit()
+        conn.close()
+
+        assert get_graph_node_counts(db_path=path).total == 1
+        assert count_graph_nodes(node_type="concept", db_path=path) == 1
+
+    def test_unreadable_database_raises(self, tmp_path):
+        path = tmp_path / "corrupt.db"
+        path.write_bytes(b"x" * 4096)
+
+        with pytest.raises(sqlite3.DatabaseError):
+            get_graph_node_counts(db_path=str(path))
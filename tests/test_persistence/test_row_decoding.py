@@ -0,0 +1,140 @@
+"""
+Tests for single-pass task and thought row decoding.
+
+Tests cover:
+- Stored tasks and thoughts decode to the same models with the fast path on and off
+- Rows with bad status, context, outcome or action JSON falling back to per-field recovery
+- Invalid rows raising the same errors either way
+"""
+import json
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import ValidationError
+
+from ciris_engine.logic.persistence.db.core import initialize_database
+from ciris_engine.logic.persistence.models.tasks import add_task, get_task_by_id
+from ciris_engine.logic.persistence.models.thoughts import add_thought, get_thought_by_id
+from ciris_engine.logic.persistence.utils import configure_fast_row_decoding, map_row_to_task, map_row_to_thought
+from ciris_engine.schemas.runtime.enums import TaskStatus, ThoughtStatus
+from ciris_engine.schemas.runtime.models import FinalAction, Task, TaskContext, TaskOutcome, Thought, ThoughtContext
+
+NOW = "2025-01-01T12:00:00+00:00"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "rows.db")
+    initialize_database(path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def fast_decoding():
+    configure_fast_row_decoding(True)
+    yield
+    configure_fast_row_decoding(True)
+
+
+def _per_field(fn, *args, **kwargs):
+    configure_fast_row_decoding(False)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        configure_fast_row_decoding(True)
+
+
+def _assert_same(fast, slow):
+    assert fast == slow
+    assert fast.model_dump_json() == slow.model_dump_json()
+
+
+def _task_row(**overrides):
+    row = {
+        "task_id": "t1", "channel_id": "c1", "description": "d", "status": "active", "priority": 1,
+        "created_at": NOW, "updated_at": NOW, "parent_task_id": None,
+        "context_json": json.dumps({"channel_id": "c1", "correlation_id": "corr", "extra": 1}),
+        "outcome_json": None, "retry_count": 0, "signed_by": None, "signature": None, "signed_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+def _thought_row(**overrides):
+    row = {
+        "thought_id": "th1", "source_task_id": "t1", "channel_id": None, "thought_type": "standard",
+        "status": "pending", "created_at": NOW, "updated_at": NOW, "round_number": 0, "content": "c",
+        "context_json": json.dumps({"task_id": "t1", "correlation_id": "corr", "depth": 2}),
+        "thought_depth": 0, "ponder_notes_json": json.dumps(["note"]), "parent_thought_id": None,
+        "final_action_json": json.dumps({"action_type": "speak", "action_params": {}, "reasoning": "r"}),
+    }
+    row.update(overrides)
+    return row
+
+
+class TestStoredRows:
+    """Rows written through the models decode identically."""
+
+    def test_task_and_thought(self, db_path):
+        now = datetime.now(timezone.utc).isoformat()
+        add_task(Task(
+            task_id="t1", channel_id="c1", description="do it", status=TaskStatus.COMPLETED, priority=3,
+            created_at=now, updated_at=now,
+            context=TaskContext(channel_id="c1", user_id="u1", correlation_id="corr"),
+            outcome=TaskOutcome(status="success", summary="done", actions_taken=["speak"]),
+        ), db_path=db_path)
+        add_thought(Thought(
+            thought_id="th1", source_task_id="t1", channel_id="c1", status=ThoughtStatus.COMPLETED,
+            created_at=now, updated_at=now, round_number=2, content="think", thought_depth=1,
+            context=ThoughtContext(task_id="t1", channel_id="c1", round_number=2, depth=1, correlation_id="corr"),
+            ponder_notes=["a", "b"],
+            final_action=FinalAction(action_type="speak", action_params={"content": "hi"}, reasoning="because"),
+        ), db_path=db_path)
+
+        _assert_same(get_task_by_id("t1", db_path=db_path), _per_field(get_task_by_id, "t1", db_path=db_path))
+        _assert_same(get_thought_by_id("th1", db_path=db_path), _per_field(get_thought_by_id, "th1", db_path=db_path))
+
+
+class TestFallback:
+    """Rows the single pass rejects are recovered field by field, as before."""
+
+    @pytest.mark.parametrize("overrides", [
+        {},
+        {"status": "bogus"},
+        {"outcome_json": json.dumps({"status": "success"})},
+        {"outcome_json": "{}"},
+        {"outcome_json": "not json"},
+    ])
+    def test_task_rows(self, overrides):
+        row = _task_row(**overrides)
+        _assert_same(map_row_to_task(row), _per_field(map_row_to_task, row))
+
+    @pytest.mark.parametrize("context_json", [
+        None, "[]", "not json", json.dumps({"channel_id": "c1"}), json.dumps({"correlation_id": "c", "user_id": 5}),
+    ])
+    def test_task_context_defaults(self, context_json):
+        fast = map_row_to_task(_task_row(context_json=context_json))
+        slow = _per_field(map_row_to_task, _task_row(context_json=context_json))
+        assert fast.context.correlation_id and slow.context.correlation_id
+        assert fast.model_dump(exclude={"context": {"correlation_id"}}) == slow.model_dump(exclude={"context": {"correlation_id"}})
+
+    @pytest.mark.parametrize("overrides", [
+        {},
+        {"status": "bogus"},
+        {"context_json": "{}"},
+        {"context_json": json.dumps({"task_id": "t1", "correlation_id": "corr", "round_number": "x"})},
+        {"ponder_notes_json": "not json"},
+        {"final_action_json": json.dumps({"action_type": "speak"})},
+        {"final_action_json": "[]"},
+    ])
+    def test_thought_rows(self, overrides):
+        row = _thought_row(**overrides)
+        _assert_same(map_row_to_thought(row), _per_field(map_row_to_thought, row))
+
+    def test_invalid_rows_raise_the_same_error(self):
+        row = _task_row(priority=99)
+        with pytest.raises(ValidationError) as fast:
+            map_row_to_task(row)
+        with pytest.raises(ValidationError) as slow:
+            _per_field(map_row_to_task, row)
+        assert fast.value.errors() == slow.value.errors()
@@ -0,0 +1,222 @@
+"""
+Tests for the pluggable JSON serialization layer.
+
+Tests cover:
+- Identical output from the orjson and standard library backends
+- Datetimes, enums, UUIDs, dataclasses and Pydantic models encoded natively
+- Lone surrogates, NaN and out-of-range integers handled alike by both backends
+- Backend selection and fallback when orjson is missing
+- Graph nodes written under one backend read back under the other
+- API responses rendered through the configured backend
+"""
+import json
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from enum import Enum
+from unittest.mock import MagicMock
+from uuid import UUID
+
+import pytest
+from pydantic import BaseModel
+
+from ciris_engine.logic.adapters.api.app import SerializedJSONResponse
+from ciris_engine.logic.persistence.db.core import initialize_database
+from ciris_engine.logic.persistence.models.graph import add_graph_node, get_graph_node
+from ciris_engine.schemas.services.graph_core import GraphNode, GraphScope, NodeType
+from ciris_engine.utils import serialization
+
+BACKENDS = [
+    "json",
+    pytest.param("orjson", marks=pytest.mark.skipif(not serialization.ORJSON_AVAILABLE, reason="orjson not installed")),
+]
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class Point(BaseModel):
+    x: int
+    at: datetime
+
+
+@dataclass
+class Pair:
+    left: int
+    right: str
+
+
+SAMPLE = {
+    "when": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+    "day": date(2025, 1, 2),
+    "color": Color.RED,
+    "id": UUID("12345678-1234-5678-1234-567812345678"),
+    "point": Point(x=1, at=datetime(2025, 1, 2, tzinfo=timezone.utc)),
+    "pair": Pair(left=1, right="r"),
+    "text": "héllo ✓",
+    "nested": [1, 2.5, None, True, {"k": "v"}],
+}
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    yield
+    serialization.configure_json_backend()
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "serialization.db")
+    initialize_database(path)
+    return path
+
+
+@pytest.fixture
+def time_service():
+    service = MagicMock()
+    service.now.return_value = datetime.now(timezone.utc)
+    return service
+
+
+class TestBackends:
+    """Both backends agree on the encoding."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_encodes_rich_types(self, backend):
+        serialization.configure_json_backend(backend)
+        decoded = serialization.loads(serialization.dumps(SAMPLE))
+        assert decoded == {
+            "when": "2025-01-02T03:04:05.678901+00:00",
+            "day": "2025-01-02",
+            "color": "red",
+            "id": "12345678-1234-5678-1234-567812345678",
+            "point": {"x": 1, "at": "2025-01-02T00:00:00Z"},
+            "pair": {"left": 1, "right": "r"},
+            "text": "héllo ✓",
+            "nested": [1, 2.5, None, True, {"k": "v"}],
+        }
+
+    @pytest.mark.skipif(not serialization.ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_backends_produce_identical_text(self):
+        serialization.configure_json_backend("json")
+        stdlib = serialization.dumps(SAMPLE)
+        serialization.configure_json_backend("orjson")
+        assert serialization.dumps(SAMPLE) == stdlib
+        assert serialization.dumps_bytes(SAMPLE) == stdlib.encode("utf-8")
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_non_string_keys(self, backend):
+        serialization.configure_json_backend(backend)
+        assert serialization.loads(serialization.dumps({1: "a"})) == {"1": "a"}
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_integer_range(self, backend):
+        serialization.configure_json_backend(backend)
+        edges = {"low": -(2**63), "high": 2**64 - 1}
+        assert serialization.loads(serialization.dumps(edges)) == edges
+        for value in (2**64, -(2**63) - 1):
+            with pytest.raises(TypeError):
+                serialization.dumps({"nested": [{"n": value}]})
+        with pytest.raises(TypeError):
+            serialization.dumps({"point": Point(x=2**70, at=datetime(2025, 1, 1, tzinfo=timezone.utc))})
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_non_finite_floats_become_null(self, backend):
+        serialization.configure_json_backend(backend)
+        values = {"nan": float("nan"), "inf": [float("inf"), -float("inf")], "ok": 1.5}
+        assert serialization.dumps(values) == '{"nan":null,"inf":[null,null],"ok":1.5}'
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_lone_surrogates_escaped(self, backend):
+        serialization.configure_json_backend(backend)
+        text = serialization.dumps({"a": "x\ud800y", "b": "é"})
+        assert text == '{"a":"x\\ud800y","b":"\\u00e9"}'
+        assert serialization.dumps_bytes({"a": "x\ud800y"}) == b'{"a":"x\\ud800y"}'
+        assert serialization.loads(text) == {"a": "x\ud800y", "b": "é"}
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_reads_stdlib_nan_literals(self, backend):
+        serialization.configure_json_backend(backend)
+        decoded = serialization.loads(json.dumps({"n": float("nan"), "i": 1}))
+        assert math.isnan(decoded["n"]) and decoded["i"] == 1
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_output_is_readable_by_stdlib(self, backend):
+        serialization.configure_json_backend(backend)
+        assert json.loads(serialization.dumps(SAMPLE))["color"] == "red"
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_unserializable_raises_type_error(self, backend):
+        serialization.configure_json_backend(backend)
+        with pytest.raises(TypeError):
+            serialization.dumps({"obj": object()})
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_invalid_json_raises_value_error(self, backend):
+        serialization.configure_json_backend(backend)
+        with pytest.raises(ValueError):
+            serialization.loads("{not json")
+
+
+class TestConfiguration:
+    """Backend selection."""
+
+    def test_default_prefers_orjson(self):
+        expected = "orjson" if serialization.ORJSON_AVAILABLE else "json"
+        assert serialization.configure_json_backend() == expected
+        assert serialization.json_backend() == expected
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            serialization.configure_json_backend("ujson")
+
+    def test_missing_orjson_falls_back(self, monkeypatch):
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+        assert serialization.configure_json_backend("orjson") == "json"
+        assert serialization.json_backend() == "json"
+
+
+class TestGraphNodes:
+    """Stored attributes are backend independent."""
+
+    @pytest.mark.skipif(not serialization.ORJSON_AVAILABLE, reason="orjson not installed")
+    @pytest.mark.parametrize("write,read", [("json", "orjson"), ("orjson", "json")])
+    def test_round_trip_across_backends(self, db_path, time_service, write, read):
+        created = datetime(2025, 1, 2, tzinfo=timezone.utc)
+        node = GraphNode(
+            id="concept_1", type=NodeType.CONCEPT, scope=GraphScope.LOCAL,
+            attributes={"created_at": created, "label": "ünïcode", "tags": ["a", "b"]},
+        )
+        serialization.configure_json_backend(write)
+        add_graph_node(node, time_service, db_path=db_path)
+
+        serialization.configure_json_backend(read)
+        stored = get_graph_node("concept_1", GraphScope.LOCAL, db_path=db_path)
+        assert stored is not None
+        attributes = stored.attributes if isinstance(stored.attributes, dict) else stored.attributes.model_dump()
+        assert attributes["created_at"] == created.isoformat()
+        assert attributes["label"] == "ünïcode"
+        assert attributes["tags"] == ["a", "b"]
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_surrogate_attribute_round_trip(self, db_path, time_service, backend):
+        serialization.configure_json_backend(backend)
+        node = GraphNode(id="concept_2", type=NodeType.CONCEPT, scope=GraphScope.LOCAL,
+                         attributes={"label": "bad\udcffbyte"})
+        add_graph_node(node, time_service, db_path=db_path)
+
+        stored = get_graph_node("concept_2", GraphScope.LOCAL, db_path=db_path)
+        attributes = stored.attributes if isinstance(stored.attributes, dict) else stored.attributes.model_dump()
+        assert attributes["label"] == "bad\udcffbyte"
+
+
+class TestAPIResponses:
+    """FastAPI responses use the configured backend."""
+
+    @pytest.mark.parametrize("backend", BACKENDS)
+    def test_response_body(self, backend):
+        serialization.configure_json_backend(backend)
+        response = SerializedJSONResponse({"data": {"value": 1, "text": "✓"}})
+        assert response.body == '{"data":{"value":1,"text":"✓"}}'.encode("utf-8")
+        assert response.headers["content-type"] == "application/json"
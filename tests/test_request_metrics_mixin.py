@@ -180,7 +180,7 @@ def test_request_metrics_edge_cases():
     assert service.get_response_time_percentile(50) == 0.0
     
     # Test invalid percentile - need to add some data first so it doesn't return early
-    service._response_times.append(100.0)  # Add dummy data
+    service._response_times.record(100.0)  # Add dummy data
     with pytest.raises(ValueError):
         service.get_response_time_percentile(150)
     
@@ -0,0 +1,7 @@
+"""
+CIRIS Micro-benchmarks
+
+Standalone benchmark scripts for hot persistence and runtime paths. Each
+script can be run directly (``python -m tools.benchmarks.<name>``) and
+prints a human-readable table, or JSON with ``--json`` for tracking over time.
+"""
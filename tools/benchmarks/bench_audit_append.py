@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Audit hash chain append benchmark.
+
+Compares the per-entry append path (prepare_entry re-reading the chain tip,
+one signature, one INSERT and one commit per entry) against the group-commit
+AuditChainWriter at several flush batch sizes, with concurrent producers,
+in per-entry and Merkle-root signing modes. Each group-commit case also
+reports how long a full AuditVerifier pass takes over what it wrote.
+
+Usage:
+    python -m tools.benchmarks.bench_audit_append [--entries N] [--producers P] [--json]
+"""
+
+import argparse
+import asyncio
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from tools.benchmarks.common import report
+
+from ciris_engine.logic.audit.hash_chain import AuditHashChain
+from ciris_engine.logic.audit.signature_manager import AuditSignatureManager
+from ciris_engine.logic.audit.verifier import AuditVerifier
+from ciris_engine.logic.audit.writer import AuditChainWriter, SIGNING_MODES
+from ciris_engine.logic.services.graph.audit_service import GraphAuditService
+from ciris_engine.logic.services.lifecycle.time import TimeService
+
+
+def _entries(count: int, prefix: str) -> List[dict]:
+    return [
+        {
+            "event_id": f"{prefix}_{i}",
+            "event_timestamp": "2025-01-01T00:00:00+00:00",
+            "event_type": "bench_event",
+            "originator_id": "bench",
+            "event_summary": "bench_event by bench",
+            "event_payload": f'{{"index": {i}}}',
+        }
+        for i in range(count)
+    ]
+
+
+async def _setup(workdir: Path, name: str) -> tuple:
+    time_service = TimeService()
+    db_path = workdir / f"{name}.db"
+    # Reuse the service's own DDL so the benchmark writes the production schema
+    await GraphAuditService(time_service=time_service, db_path=str(db_path))._init_database()
+    signer = AuditSignatureManager(str(workdir / "keys"), str(db_path), time_service)
+    signer.initialize()
+    return str(db_path), signer, time_service
+
+
+async def _produce(submit, entries: List[dict], producers: int) -> None:
+    async def producer(chunk: List[dict]) -> None:
+        for entry in chunk:
+            await submit(entry)
+
+    await asyncio.gather(*[producer(entries[i::producers]) for i in range(producers)])
+
+
+async def _bench_per_entry(workdir: Path, count: int, producers: int) -> Dict[str, float]:
+    db_path, signer, _ = await _setup(workdir, "per_entry")
+    chain = AuditHashChain(db_path)
+    chain.initialize()
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    lock = asyncio.Lock()
+
+    def write(entry: dict) -> None:
+        prepared = chain.prepare_entry(entry)
+        signature = signer.sign_entry(prepared["entry_hash"])
+        conn.execute(
+            "INSERT INTO audit_log (event_id, event_timestamp, event_type, originator_id, event_summary, "
+            "event_payload, sequence_number, previous_hash, entry_hash, signature, signing_key_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (entry["event_id"], entry["event_timestamp"], entry["event_type"], entry["originator_id"],
+             entry["event_summary"], entry["event_payload"], prepared["sequence_number"],
+             prepared["previous_hash"], prepared["entry_hash"], signature, signer.key_id),
+        )
+        conn.commit()
+
+    async def submit(entry: dict) -> None:
+        async with lock:
+            await asyncio.to_thread(write, entry)
+
+    start = time.perf_counter()
+    await _produce(submit, _entries(count, "per_entry"), producers)
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return {"seconds": elapsed, "entries_per_s": count / elapsed}
+
+
+async def _bench_writer(
+    workdir: Path, count: int, producers: int, batch: int, interval_ms: float, mode: str
+) -> Dict[str, float]:
+    db_path, signer, time_service = await _setup(workdir, f"writer_{mode}_{batch}")
+    writer = AuditChainWriter(db_path, AuditHashChain(db_path), signer, flush_batch_size=batch,
+                              flush_interval_ms=interval_ms, signing_mode=mode)
+    await writer.start()
+
+    start = time.perf_counter()
+    await _produce(writer.submit, _entries(count, f"writer_{batch}"), producers)
+    await writer.flush()
+    elapsed = time.perf_counter() - start
+
+    stats = writer.get_stats()
+    await writer.stop()
+
+    verifier = AuditVerifier(db_path, str(workdir / "keys"), time_service)
+    verifier.initialize()
+    verify_start = time.perf_counter()
+    verification = verifier.verify_complete_chain()
+    verify_s = time.perf_counter() - verify_start
+    return {
+        "seconds": elapsed,
+        "entries_per_s": count / elapsed,
+        "batches": stats.batches_committed,
+        "avg_batch": stats.average_batch_size,
+        "verify_s": verify_s,
+        "valid": verification.valid,
+    }
+
+
+async def _run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        results["per_entry_commit"] = await _bench_per_entry(workdir, args.entries, args.producers)
+        for mode in args.signing_modes:
+            for batch in args.batch_sizes:
+                results[f"{mode}_n{batch}_{args.interval_ms:g}ms"] = await _bench_writer(
+                    workdir, args.entries, args.producers, batch, args.interval_ms, mode
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--producers", type=int, default=8)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--interval-ms", type=float, default=50.0)
+    parser.add_argument("--signing-modes", nargs="+", choices=SIGNING_MODES, default=list(SIGNING_MODES))
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args))
+    report(f"audit chain appends ({args.entries} entries, {args.producers} producers)", results, args.json)
+
+
+if __name__ == "__main__":
+    main()
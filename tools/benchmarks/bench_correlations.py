@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Correlation read-path benchmark.
+
+Compares full ServiceCorrelation decoding (the model path used by
+get_correlations_by_type_and_time) against projected CorrelationRecord
+reads from query_correlations.
+
+Usage:
+    python -m tools.benchmarks.bench_correlations [--rows N] [--json]
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from tools.benchmarks.common import measure, report, temp_database
+
+from ciris_engine.logic.persistence.db.core import get_db_connection
+from ciris_engine.logic.persistence.models.correlations import (
+    get_correlations_by_type_and_time,
+    query_correlations,
+)
+from ciris_engine.schemas.telemetry.core import CorrelationType
+
+
+def _seed(db_path: str, rows: int) -> None:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    params = []
+    for i in range(rows):
+        ts = (base + timedelta(seconds=i)).isoformat()
+        params.append((
+            f"metric_{i}", "telemetry", "telemetry_service", "record_metric",
+            '{"service_type": "telemetry", "method_name": "record", "parameters": {"k": "v"}, '
+            f'"request_timestamp": "{ts}"}}',
+            "completed", ts, ts, "metric_datapoint", ts, "tokens_used", float(i),
+            '{"source": "bench", "handler": "SpeakHandler"}',
+        ))
+    with get_db_connection(db_path) as conn:
+        conn.executemany(
+            "INSERT INTO service_correlations (correlation_id, service_type, handler_name, action_type, "
+            "request_data, status, created_at, updated_at, correlation_type, timestamp, metric_name, "
+            "metric_value, tags) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            params,
+        )
+        conn.commit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    with temp_database() as db_path:
+        _seed(db_path, args.rows)
+        kind = CorrelationType.METRIC_DATAPOINT
+
+        cases = {
+            "full_models": lambda: get_correlations_by_type_and_time(kind, limit=args.rows, db_path=db_path),
+            "records_all_columns": lambda: query_correlations(
+                correlation_type=kind, limit=args.rows, db_path=db_path
+            ),
+            "records_projected": lambda: [
+                (r.metric_name, r.metric_value, r.timestamp)
+                for r in query_correlations(
+                    ["metric_name", "metric_value", "timestamp"],
+                    correlation_type=kind, limit=args.rows, db_path=db_path,
+                )
+            ],
+        }
+        results = {}
+        for name, fn in cases.items():
+            stats = measure(fn, repeat=args.repeat)
+            stats["rows_per_s"] = args.rows / stats["best_s"]
+            results[name] = stats
+
+    report(f"correlation reads ({args.rows} rows)", results, args.json)
+
+
+if __name__ == "__main__":
+    main()
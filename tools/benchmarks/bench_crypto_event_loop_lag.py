@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Event-loop lag under concurrent password logins.
+
+Fires N concurrent logins at APIAuthService.verify_user_password (bcrypt,
+12 rounds) while a probe task sleeps in short ticks on the same event loop
+and records how late each tick wakes up. That lateness is what every other
+conversation, health check and websocket on the loop experiences.
+
+Cases:
+    inline - bcrypt called directly on the event loop (the previous behaviour)
+    pooled - bcrypt on the shared crypto executor at each --workers size
+
+Reports login throughput and latency, and probe lag percentiles.
+
+Usage:
+    python -m tools.benchmarks.bench_crypto_event_loop_lag [--logins N] [--workers 1,2,4] [--json]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Dict, List
+
+from tools.benchmarks.common import report
+
+from ciris_engine.logic.adapters.api.services.auth_service import APIAuthService
+from ciris_engine.logic.telemetry.latency import LatencyHistogram
+from ciris_engine.logic.utils.crypto_executor import configure_crypto_executor
+
+PASSWORD = "correct horse battery staple"
+PROBE_INTERVAL_S = 0.005
+
+
+async def _probe(lag: LatencyHistogram, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + PROBE_INTERVAL_S
+        await asyncio.sleep(PROBE_INTERVAL_S)
+        lag.record(max(0.0, loop.time() - expected) * 1000)
+
+
+async def _run_case(service: APIAuthService, logins: int, inline: bool) -> Dict[str, Any]:
+    if inline:
+        # Bypass the executor to reproduce bcrypt running on the loop
+        async def verify(password: str, password_hash: str) -> bool:
+            return service._verify_password(password, password_hash)
+        service._verify_password_async = verify  # type: ignore[method-assign]
+    else:
+        service.__dict__.pop("_verify_password_async", None)
+
+    lag = LatencyHistogram()
+    login_latency = LatencyHistogram()
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lag, stop))
+    await asyncio.sleep(PROBE_INTERVAL_S * 4)
+
+    async def login() -> bool:
+        start = time.perf_counter()
+        user = await service.verify_user_password("admin", PASSWORD)
+        login_latency.record((time.perf_counter() - start) * 1000)
+        return user is not None
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await probe
+
+    if not all(results):
+        raise RuntimeError("A benchmark login was rejected")
+    lag_summary, login_summary = lag.summary(), login_latency.summary()
+    return {
+        "logins_per_s": logins / elapsed,
+        "login_p50_ms": login_summary.p50_ms,
+        "login_p99_ms": login_summary.p99_ms,
+        "loop_lag_p50_ms": lag_summary.p50_ms,
+        "loop_lag_p99_ms": lag_summary.p99_ms,
+        "loop_lag_max_ms": lag_summary.max_ms,
+        "probe_ticks": lag_summary.count,
+    }
+
+
+async def run_benchmark(logins: int, workers: List[int]) -> Dict[str, Dict[str, Any]]:
+    service = APIAuthService()
+    admin = service.get_user_by_username("admin")
+    assert admin is not None
+    admin.password_hash = service._hash_password(PASSWORD)
+
+    results = {"inline": await _run_case(service, logins, inline=True)}
+    for count in workers:
+        executor = configure_crypto_executor(count)
+        results[f"pooled (workers={count})"] = await _run_case(service, logins, inline=False)
+        stats = executor.get_stats()
+        results[f"pooled (workers={count})"]["peak_queue_depth"] = stats.peak_queue_depth
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=32, help="Concurrent logins per case")
+    parser.add_argument("--workers", default="1,2,4", help="Comma-separated crypto executor sizes")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    workers = [int(count) for count in args.workers.split(",") if count]
+    results = asyncio.run(run_benchmark(args.logins, workers))
+    report(f"event-loop lag under {args.logins} concurrent bcrypt logins", results, args.json)
+
+
+if __name__ == "__main__":
+    main()
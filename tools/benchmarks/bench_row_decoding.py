@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Persistence row decoding benchmark.
+
+Decodes representative task and thought rows with single-pass
+validation enabled ("fast") and disabled ("per_field", nested models built
+one at a time). Rows are fetched once, so only the mapper cost is measured.
+
+Usage:
+    python -m tools.benchmarks.bench_row_decoding [--rows N] [--json]
+"""
+
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from tools.benchmarks.common import measure, report, temp_database
+
+from ciris_engine.logic.persistence.db.core import get_db_connection
+from ciris_engine.logic.persistence.models.tasks import add_task
+from ciris_engine.logic.persistence.models.thoughts import add_thought
+from ciris_engine.logic.persistence.utils import configure_fast_row_decoding, map_row_to_task, map_row_to_thought
+from ciris_engine.schemas.runtime.enums import TaskStatus, ThoughtStatus
+from ciris_engine.schemas.runtime.models import FinalAction, Task, TaskContext, TaskOutcome, Thought, ThoughtContext
+
+
+def _seed(db_path: str, rows: int) -> None:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for i in range(rows):
+        iso = (base + timedelta(seconds=i)).isoformat()
+        add_task(Task(
+            task_id=f"task_{i}", channel_id="bench", description=f"Respond to message {i}",
+            status=TaskStatus.COMPLETED, priority=i % 10, created_at=iso, updated_at=iso,
+            context=TaskContext(channel_id="bench", user_id="user", correlation_id=f"corr_{i}"),
+            outcome=TaskOutcome(status="success", summary="responded", actions_taken=["speak"]),
+        ), db_path=db_path)
+        add_thought(Thought(
+            thought_id=f"thought_{i}", source_task_id=f"task_{i}", channel_id="bench",
+            status=ThoughtStatus.COMPLETED, created_at=iso, updated_at=iso, round_number=i % 5,
+            content="The user greeted me; I should respond politely.", thought_depth=i % 3,
+            context=ThoughtContext(task_id=f"task_{i}", channel_id="bench", round_number=i % 5,
+                                   correlation_id=f"corr_{i}"),
+            ponder_notes=["consider tone"],
+            final_action=FinalAction(action_type="speak", action_params={"content": "Hello!"},
+                                     reasoning="Greeting deserves a reply"),
+        ), db_path=db_path)
+
+
+def _fetch(db_path: str, sql: str) -> list:
+    with get_db_connection(db_path) as conn:
+        return conn.execute(sql).fetchall()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    with temp_database() as db_path:
+        _seed(db_path, args.rows)
+        tasks = _fetch(db_path, "SELECT * FROM tasks")
+        thoughts = _fetch(db_path, "SELECT * FROM thoughts")
+
+    cases = {
+        "tasks": lambda: [map_row_to_task(row) for row in tasks],
+        "thoughts": lambda: [map_row_to_thought(row) for row in thoughts],
+    }
+    results = {}
+    for name, fn in cases.items():
+        for mode, enabled in (("per_field", False), ("fast", True)):
+            configure_fast_row_decoding(enabled)
+            stats = measure(fn, repeat=args.repeat)
+            stats["rows_per_s"] = args.rows / stats["best_s"]
+            results[f"{name}_{mode}"] = stats
+        results[f"{name}_fast"]["speedup"] = results[f"{name}_per_field"]["best_s"] / results[f"{name}_fast"]["best_s"]
+    configure_fast_row_decoding(True)
+
+    report(f"row decoding ({args.rows} rows)", results, args.json)
+
+
+if __name__ == "__main__":
+    main()
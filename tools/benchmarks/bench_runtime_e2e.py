@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+End-to-end runtime throughput benchmark.
+
+Boots a full CIRISRuntime with the API adapter and the mock LLM module in a
+fresh temporary working directory (so every SQLite database, key and log
+file is new), waits for the agent to reach WORK, then drives N concurrent
+synthetic conversations of M messages each through POST /v1/agent/interact.
+Each conversation uses its own API user, and therefore its own channel.
+
+Reports:
+    - thoughts completed per second while the conversations ran
+    - end-to-end message latency percentiles (request sent to reply received)
+    - SQLite statements and connections per completed thought
+    - peak RSS of the process
+
+The mock LLM answers instantly unless --llm-delay-ms / --llm-jitter-ms inject
+a provider-like latency.
+
+Usage:
+    python -m tools.benchmarks.bench_runtime_e2e [--conversations N] [--messages M]
+        [--llm-delay-ms D] [--llm-jitter-ms J] [--json]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import resource
+import secrets
+import shutil
+import socket
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from tools.benchmarks.common import report
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+# Read-only inputs the runtime resolves relative to the working directory
+SHARED_DIRS = ("ciris_templates", "ciris_modular_services")
+
+
+class StatementCounter:
+    """Counts SQLite connections and statements made by the process.
+
+    Wraps ``sqlite3.connect`` so every connection gets a trace callback;
+    connections opened before ``install`` are not seen.
+    """
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.statements = 0
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._original_connect = sqlite3.connect
+
+    def install(self) -> None:
+        original = self._original_connect
+
+        def connect(*args: Any, **kwargs: Any) -> sqlite3.Connection:
+            conn = original(*args, **kwargs)
+            conn.set_trace_callback(self._on_statement)
+            if self.enabled:
+                with self._lock:
+                    self.connections += 1
+            return conn
+
+        sqlite3.connect = connect  # type: ignore[assignment]
+
+    def uninstall(self) -> None:
+        sqlite3.connect = self._original_connect  # type: ignore[assignment]
+
+    def start(self) -> None:
+        with self._lock:
+            self.connections = 0
+            self.statements = 0
+        self.enabled = True
+
+    def stop(self) -> None:
+        self.enabled = False
+
+    def _on_statement(self, _statement: str) -> None:
+        if self.enabled:
+            with self._lock:
+                self.statements += 1
+
+    def query(self, db_path: str, sql: str) -> Any:
+        """Run a bookkeeping query without it being counted."""
+        conn = self._original_connect(db_path)
+        try:
+            return conn.execute(sql).fetchone()[0]
+        finally:
+            conn.close()
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def _wait_until(predicate: Any, timeout: float, what: str) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if await predicate():
+            return
+        await asyncio.sleep(0.2)
+    raise TimeoutError(f"Timed out after {timeout:.0f}s waiting for {what}")
+
+
+async def _conversation(client: Any, api_key: str, index: int, messages: int,
+                        latencies: Any, errors: List[str]) -> None:
+    headers = {"Authorization": f"Bearer {api_key}"}
+    for turn in range(messages):
+        body = {"message": f"Hello from benchmark conversation {index}, message {turn}"}
+        start = time.perf_counter()
+        try:
+            response = await client.post("/v1/agent/interact", json=body, headers=headers)
+        except Exception as e:
+            errors.append(f"conversation {index}: {type(e).__name__}: {e}")
+            continue
+        if response.status_code != 200:
+            errors.append(f"conversation {index}: HTTP {response.status_code}")
+            continue
+        latencies.record((time.perf_counter() - start) * 1000)
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    import httpx
+
+    from ciris_engine.logic.adapters.api.config import APIAdapterConfig
+    from ciris_engine.logic.runtime.ciris_runtime import CIRISRuntime
+    from ciris_engine.logic.runtime.prevent_sideeffects import allow_runtime_creation
+    from ciris_engine.logic.telemetry.latency import LatencyHistogram
+    from ciris_engine.logic.utils.runtime_utils import load_config
+    from ciris_engine.schemas.api.auth import UserRole
+    from ciris_engine.schemas.processors.states import AgentState
+
+    os.environ["CIRIS_MOCK_LLM_DELAY_MS"] = str(args.llm_delay_ms)
+    os.environ["CIRIS_MOCK_LLM_JITTER_MS"] = str(args.llm_jitter_ms)
+    allow_runtime_creation()
+
+    counter = StatementCounter()
+    counter.install()
+    port = _free_port()
+    api_config = APIAdapterConfig()
+    api_config.host = "127.0.0.1"
+    api_config.port = port
+    api_config.interaction_timeout = args.timeout
+
+    config = await load_config(None)
+    db_path = str(Path(config.database.main_db).resolve())
+    runtime = CIRISRuntime(
+        adapter_types=["api"],
+        essential_config=config,
+        startup_channel_id=api_config.get_home_channel_id(api_config.host, port),
+        adapter_configs={"api": api_config},
+        modules=["mock_llm"],
+    )
+
+    boot_start = time.perf_counter()
+    await runtime.initialize()
+    run_task = asyncio.create_task(runtime.run())
+    base_url = f"http://127.0.0.1:{port}"
+
+    async def api_ready() -> bool:
+        try:
+            async with httpx.AsyncClient(base_url=base_url) as probe:
+                return (await probe.get("/v1/system/health")).status_code == 200
+        except httpx.HTTPError:
+            return False
+
+    async def working() -> bool:
+        processor = runtime.agent_processor
+        return bool(processor and processor.state_manager.get_state() == AgentState.WORK)
+
+    try:
+        await _wait_until(api_ready, args.boot_timeout, "the API server")
+        await _wait_until(working, args.boot_timeout, "the WORK state")
+        boot_s = time.perf_counter() - boot_start
+
+        api_adapter = next(a for a in runtime.adapters if hasattr(a, "app"))
+        auth_service = api_adapter.app.state.auth_service
+        api_keys = []
+        for i in range(args.conversations):
+            key = f"ciris_bench_{secrets.token_urlsafe(24)}"
+            auth_service.store_api_key(key, user_id=f"bench_user_{i}", role=UserRole.ADMIN)
+            api_keys.append(key)
+
+        completed_sql = "SELECT COUNT(*) FROM thoughts WHERE status = 'completed'"
+        thoughts_before = counter.query(db_path, completed_sql)
+        latencies = LatencyHistogram()
+        errors: List[str] = []
+
+        counter.start()
+        drive_start = time.perf_counter()
+        limits = httpx.Limits(max_connections=args.conversations)
+        async with httpx.AsyncClient(base_url=base_url, timeout=args.timeout + 5, limits=limits) as client:
+            await asyncio.gather(*(
+                _conversation(client, key, i, args.messages, latencies, errors)
+                for i, key in enumerate(api_keys)
+            ))
+        drive_s = time.perf_counter() - drive_start
+        counter.stop()
+
+        thoughts = counter.query(db_path, completed_sql) - thoughts_before
+        for error in errors[:5]:
+            print(f"Message failed: {error}", file=sys.stderr)
+    finally:
+        runtime.request_shutdown("Benchmark complete")
+        try:
+            await asyncio.wait_for(run_task, timeout=args.boot_timeout)
+        except (asyncio.TimeoutError, Exception) as e:
+            logging.getLogger(__name__).warning(f"Runtime did not shut down cleanly: {e}")
+        counter.uninstall()
+
+    summary = latencies.summary()
+    per_thought = max(thoughts, 1)
+    return {
+        "config": {
+            "conversations": args.conversations,
+            "messages_per_conversation": args.messages,
+            "llm_delay_ms": args.llm_delay_ms,
+            "llm_jitter_ms": args.llm_jitter_ms,
+        },
+        "throughput": {
+            "boot_s": boot_s,
+            "duration_s": drive_s,
+            "messages_ok": summary.count,
+            "messages_failed": len(errors),
+            "thoughts_completed": thoughts,
+            "thoughts_per_s": thoughts / drive_s if drive_s else 0.0,
+            "messages_per_s": summary.count / drive_s if drive_s else 0.0,
+        },
+        "latency_ms": {
+            "mean": summary.mean_ms,
+            "p50": summary.p50_ms,
+            "p95": summary.p95_ms,
+            "p99": summary.p99_ms,
+            "max": summary.max_ms,
+        },
+        "database": {
+            "statements": counter.statements,
+            "connections": counter.connections,
+            "statements_per_thought": counter.statements / per_thought,
+            "connections_per_thought": counter.connections / per_thought,
+        },
+        "process": {
+            "peak_rss_mb": _peak_rss_mb(),
+        },
+    }
+
+
+@contextlib.contextmanager
+def _scratch_workdir(keep: bool) -> Any:
+    """Run inside a temporary directory holding only the shared read-only inputs."""
+    workdir = Path(tempfile.mkdtemp(prefix="ciris_bench_"))
+    for name in SHARED_DIRS:
+        (workdir / name).symlink_to(REPO_ROOT / name, target_is_directory=True)
+    previous = Path.cwd()
+    os.chdir(workdir)
+    try:
+        yield workdir
+    finally:
+        os.chdir(previous)
+        if keep:
+            print(f"Benchmark working directory kept at {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--conversations", type=int, default=4, help="Concurrent conversations")
+    parser.add_argument("--messages", type=int, default=5, help="Messages per conversation")
+    parser.add_argument("--llm-delay-ms", type=float, default=0.0, help="Mock LLM latency per call")
+    parser.add_argument("--llm-jitter-ms", type=float, default=0.0, help="Uniform jitter on the mock LLM latency")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-message interaction timeout (s)")
+    parser.add_argument("--boot-timeout", type=float, default=120.0, help="Startup and shutdown timeout (s)")
+    parser.add_argument("--keep", action="store_true", help="Keep the temporary working directory")
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+    with _scratch_workdir(args.keep):
+        # The runtime prints progress lines; keep stdout for the report
+        with contextlib.redirect_stdout(sys.stderr):
+            results = asyncio.run(run_benchmark(args))
+
+    report(
+        f"runtime end-to-end ({args.conversations} conversations x {args.messages} messages)",
+        results,
+        args.json,
+    )
+
+
+if __name__ == "__main__":
+    main()
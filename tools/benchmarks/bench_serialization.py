@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+JSON serialization benchmark.
+
+Encodes and decodes representative graph node attributes with each JSON
+backend, then writes and reads graph nodes through the persistence layer
+so the per-node cost includes SQLite and model validation.
+
+Usage:
+    python -m tools.benchmarks.bench_serialization [--rows N] [--json]
+"""
+
+import argparse
+import itertools
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from tools.benchmarks.common import measure, report, temp_database
+
+from ciris_engine.logic.persistence.models.graph import add_graph_node, get_graph_nodes_by_ids
+from ciris_engine.schemas.services.graph_core import GraphNode, GraphScope, NodeType
+from ciris_engine.utils import serialization
+
+
+def _attributes(i: int) -> dict:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i)
+    return {
+        "created_at": base,
+        "updated_at": base,
+        "created_by": "bench",
+        "content": f"Observation {i}: the user prefers concise answers",
+        "tags": ["preference", "style", f"batch_{i % 10}"],
+        "metrics": {"confidence": 0.87, "uses": i, "window": [1, 5, 15]},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    backends = [name for name in serialization.JSON_BACKENDS
+                if name != "orjson" or serialization.ORJSON_AVAILABLE]
+    attributes = [_attributes(i) for i in range(args.rows)]
+    time_service = MagicMock()
+    time_service.now.return_value = datetime.now(timezone.utc)
+
+    results = {}
+    for backend in backends:
+        serialization.configure_json_backend(backend)
+        encoded = [serialization.dumps(a) for a in attributes]
+        results[f"encode_{backend}"] = measure(lambda: [serialization.dumps(a) for a in attributes], repeat=args.repeat)
+        results[f"decode_{backend}"] = measure(lambda: [serialization.loads(e) for e in encoded], repeat=args.repeat)
+
+        with temp_database() as db_path:
+            batches = itertools.count()
+
+            def write() -> None:
+                batch = next(batches)
+                for i, attrs in enumerate(attributes):
+                    node = GraphNode(id=f"node_{batch}_{i}", type=NodeType.CONCEPT,
+                                     scope=GraphScope.LOCAL, attributes=attrs)
+                    add_graph_node(node, time_service, db_path=db_path)
+
+            results[f"write_{backend}"] = measure(write, repeat=args.repeat)
+            node_ids = [f"node_0_{i}" for i in range(args.rows)]
+            results[f"read_{backend}"] = measure(
+                lambda: get_graph_nodes_by_ids(node_ids, GraphScope.LOCAL, db_path=db_path), repeat=args.repeat
+            )
+
+    for key, stats in results.items():
+        stats["rows_per_s"] = args.rows / stats["best_s"]
+        if "orjson" in key:
+            baseline = results[key.replace("orjson", "json")]["best_s"]
+            stats["speedup"] = baseline / stats["best_s"]
+    serialization.configure_json_backend()
+
+    report(f"json serialization ({args.rows} nodes)", results, args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+# Add repository root to path so scripts can be run directly
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5, number: int = 1) -> Dict[str, float]:
+    """Run ``fn`` ``number`` times per sample for ``repeat`` samples.
+
+    Returns best/median seconds per call.
+    """
+    samples: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return {"best_s": min(samples), "median_s": statistics.median(samples)}
+
+
+@contextmanager
+def temp_database() -> Iterator[str]:
+    """Yield the path of a freshly initialized temporary CIRIS database."""
+    from ciris_engine.logic.persistence.db.core import initialize_database
+
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        initialize_database(path)
+        yield path
+    finally:
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.unlink(path + suffix)
+            except OSError:
+                pass
+
+
+def report(name: str, results: Dict[str, Dict[str, float]], as_json: bool) -> None:
+    """Print benchmark results as a table or as JSON."""
+    if as_json:
+        print(json.dumps({"benchmark": name, "results": results}, indent=2))
+        return
+    print(f"\n{name}")
+    print("-" * 72)
+    for case, stats in results.items():
+        cols = "  ".join(f"{k}={v:.6f}" if isinstance(v, float) else f"{k}={v}" for k, v in stats.items())
+        print(f"{case:<40} {cols}")
@@ -114,13 +114,22 @@ class DBStatusTool:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Graph nodes count by type
-                cursor.execute("""
-                    SELECT node_type, COUNT(*) as count 
-                    FROM graph_nodes 
-                    GROUP BY node_type 
-                    ORDER BY count DESC
-                """)
+                # Graph nodes count by type, from the materialized stats table when present
+                try:
+                    cursor.execute("""
+                        SELECT node_type, SUM(node_count) as count
+                        FROM graph_node_stats
+                        GROUP BY node_type
+                        HAVING count > 0
+                        ORDER BY count DESC
+                    """)
+                except sqlite3.OperationalError:
+                    cursor.execute("""
+                        SELECT node_type, COUNT(*) as count 
+                        FROM graph_nodes 
+                        GROUP BY node_type 
+                        ORDER BY count DESC
+                    """)
                 status["graph_nodes"]["by_type"] = {row["node_type"]: row["count"] for row in cursor}
                 status["graph_nodes"]["total"] = sum(status["graph_nodes"]["by_type"].values())
                 